@@ -109,6 +109,11 @@ class Settings(BaseSettings):
 
     # NHTSA API
     nhtsa_api_base_url: str = "https://vpic.nhtsa.dot.gov/api"
+    # Requests to NHTSA are spread to this rate (with at most this many in
+    # flight during the recall sweep); recall lists are reused for this long
+    nhtsa_requests_per_second: float = 2.0
+    nhtsa_max_concurrency: int = 4
+    nhtsa_recall_cache_hours: int = 24
 
     # TomTom Places API (optional - falls back to OSM if not configured)
     tomtom_api_key: str = ""  # Empty by default - graceful degradation
@@ -119,10 +124,32 @@ class Settings(BaseSettings):
     # Recall Checking
     recall_check_interval_days: int = 7
 
+    # LiveLink: how often buffered latest telemetry values are written to the database
+    livelink_latest_flush_seconds: float = 5.0
+
+    # Reminders/calendar: km/day and hours/day are averaged over this many days
+    usage_rate_window_days: int = 90
+
     # File Upload Limits
     max_upload_size_mb: int = 10
     max_document_size_mb: int = 25
 
+    # Photo derivative rendering (resized AVIF/WebP/JPEG) runs in this many
+    # worker processes
+    image_derivative_workers: int = 2
+
+    # Document/window sticker OCR runs pages in parallel in this many worker
+    # processes; extracted text is kept for this many distinct files
+    ocr_workers: int = 2
+    ocr_cache_entries: int = 32
+
+    # Full backups: new files are compressed on this many threads (large
+    # files also use as many zstd worker threads) at this zstd level
+    backup_workers: int = 4
+    backup_compression_level: int = 3
+    # Largest full backup accepted by upload (streamed to disk, never buffered)
+    max_backup_upload_gb: int = 100
+
     # Allowed file extensions
     allowed_photo_extensions: set[str] = {".jpg", ".jpeg", ".png", ".webp", ".heic"}
     allowed_attachment_extensions: set[str] = {".jpg", ".jpeg", ".png", ".gif", ".pdf"}
@@ -152,6 +179,11 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 120  # 2 hours
 
+    # Password hashing pool: Argon2id needs ~100 MB per concurrent hash.
+    # Calls beyond workers + queue are rejected with 503.
+    password_hash_workers: int = 2
+    password_hash_queue: int = 16
+
     # JWT Cookie Settings (Security Enhancement v2.10.0)
     jwt_cookie_name: str = "mygarage_token"
     jwt_cookie_httponly: bool = True
@@ -225,6 +257,11 @@ class Settings(BaseSettings):
         """Convert max document size to bytes."""
         return self.max_document_size_mb * 1024 * 1024
 
+    @property
+    def max_backup_upload_bytes(self) -> int:
+        """Convert max backup upload size to bytes."""
+        return self.max_backup_upload_gb * 1024 * 1024 * 1024
+
     @property
     def max_csv_size_bytes(self) -> int:
         """Convert max CSV size to bytes."""
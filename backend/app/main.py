@@ -172,11 +172,49 @@ async def lifespan(app: FastAPI):
 
     await start_mqtt_subscriber()
 
+    # Start the write-behind flusher for latest telemetry values
+    from app.services.telemetry_latest_buffer import latest_buffer
+
+    await latest_buffer.start()
+
+    # Start delivering queued notifications (threshold alerts from ingest)
+    from app.services.notifications.outbox import outbox_worker
+
+    await outbox_worker.start()
+
+    # Fail OCR parse jobs a previous process left unfinished
+    from app.services.ocr_jobs import ocr_job_runner
+
+    await ocr_job_runner.start()
+
     yield
 
-    # Stop MQTT subscriber on shutdown
+    # Stop MQTT subscriber on shutdown, then flush buffered latest values
     await stop_mqtt_subscriber()
+    await latest_buffer.stop()
+    await outbox_worker.stop()
+    await ocr_job_runner.stop()
     stop_scheduler()
+
+    from app.services.vehicle_rollup_service import rollup_refresher
+
+    await rollup_refresher.drain()
+
+    from app.services.notifications.registry import notification_registry
+
+    await notification_registry.close()
+
+    from app.services.password_hashing import password_pool
+
+    password_pool.shutdown()
+
+    from app.services.image_pipeline import image_pipeline
+
+    image_pipeline.shutdown()
+
+    from app.services.ocr_pipeline import ocr_pipeline
+
+    ocr_pipeline.shutdown()
     logger.info("Shutting down MyGarage application...")
 
 
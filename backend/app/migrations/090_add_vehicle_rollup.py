@@ -0,0 +1,80 @@
+"""Add vehicle_rollup table (per-vehicle rollup projection).
+
+Not FATAL: the table is a derived projection. Rows are built lazily on first
+read (and rebuilt by ``python -m app.services.vehicle_rollup_service``), so no
+backfill happens here, and the read paths recompute a vehicle's row whenever
+it is missing.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+
+def _get_fallback_engine():
+    db_path = os.environ.get("DATABASE_PATH")
+    if db_path:
+        return create_engine(f"sqlite:///{db_path}")
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    return create_engine(f"sqlite:///{data_dir / 'mygarage.db'}")
+
+
+def upgrade(engine=None):
+    """Create vehicle_rollup if missing."""
+    if engine is None:
+        engine = _get_fallback_engine()
+
+    with engine.begin() as conn:
+        inspector = inspect(engine)
+        print("Adding vehicle_rollup projection...")
+
+        if "vehicle_rollup" in inspector.get_table_names():
+            print("  → vehicle_rollup already exists, skipping")
+            return
+
+        ts_type = (
+            "TIMESTAMP WITHOUT TIME ZONE" if engine.dialect.name == "postgresql" else "DATETIME"
+        )
+        conn.execute(
+            text(
+                f"""
+                CREATE TABLE vehicle_rollup (
+                    vin VARCHAR(17) PRIMARY KEY REFERENCES vehicles(vin) ON DELETE CASCADE,
+                    service_count INTEGER NOT NULL DEFAULT 0,
+                    fuel_count INTEGER NOT NULL DEFAULT 0,
+                    odometer_count INTEGER NOT NULL DEFAULT 0,
+                    reminder_count INTEGER NOT NULL DEFAULT 0,
+                    document_count INTEGER NOT NULL DEFAULT 0,
+                    note_count INTEGER NOT NULL DEFAULT 0,
+                    photo_count INTEGER NOT NULL DEFAULT 0,
+                    last_service_date DATE,
+                    last_service_description TEXT,
+                    last_fuel_date DATE,
+                    latest_odometer_km NUMERIC(10, 2),
+                    latest_odometer_date DATE,
+                    latest_hours NUMERIC(10, 1),
+                    latest_hours_date DATE,
+                    total_spend NUMERIC(12, 2) NOT NULL DEFAULT 0,
+                    overdue_count INTEGER NOT NULL DEFAULT 0,
+                    upcoming_count INTEGER NOT NULL DEFAULT 0,
+                    next_due_title VARCHAR(200),
+                    next_due_date DATE,
+                    computed_on DATE NOT NULL,
+                    updated_at {ts_type} DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+        )
+        print("  ✓ Created vehicle_rollup table")
+        print("\n✓ Vehicle rollup migration completed successfully")
+
+
+def downgrade():
+    print("Downgrade not supported for vehicle_rollup")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,79 @@
+"""Add notification_outbox table (asynchronous notification delivery).
+
+Not FATAL: a missing table only means alerts raised on the ingest path fail
+to enqueue (logged by the caller); everything else keeps working.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+
+def _get_fallback_engine():
+    db_path = os.environ.get("DATABASE_PATH")
+    if db_path:
+        return create_engine(f"sqlite:///{db_path}")
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    return create_engine(f"sqlite:///{data_dir / 'mygarage.db'}")
+
+
+def upgrade(engine=None):
+    """Create notification_outbox if missing."""
+    if engine is None:
+        engine = _get_fallback_engine()
+
+    with engine.begin() as conn:
+        inspector = inspect(engine)
+        print("Adding notification outbox...")
+
+        if "notification_outbox" in inspector.get_table_names():
+            print("  → notification_outbox already exists, skipping")
+            return
+
+        if engine.dialect.name == "postgresql":
+            id_col = "id SERIAL PRIMARY KEY"
+            ts_type = "TIMESTAMP WITHOUT TIME ZONE"
+        else:
+            id_col = "id INTEGER PRIMARY KEY AUTOINCREMENT"
+            ts_type = "DATETIME"
+        conn.execute(
+            text(
+                f"""
+                CREATE TABLE notification_outbox (
+                    {id_col},
+                    event_type VARCHAR(50) NOT NULL,
+                    service VARCHAR(20),
+                    title VARCHAR(255) NOT NULL,
+                    message TEXT NOT NULL,
+                    priority VARCHAR(10) NOT NULL DEFAULT 'default',
+                    tags JSON,
+                    url VARCHAR(500),
+                    status VARCHAR(10) NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at {ts_type} NOT NULL,
+                    last_error TEXT,
+                    created_at {ts_type} DEFAULT CURRENT_TIMESTAMP NOT NULL,
+                    sent_at {ts_type}
+                )
+                """
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX ix_notification_outbox_status_due "
+                "ON notification_outbox (status, next_attempt_at)"
+            )
+        )
+        print("  ✓ Created notification_outbox table")
+        print("\n✓ Notification outbox migration completed successfully")
+
+
+def downgrade():
+    print("Downgrade not supported for notification_outbox")
+
+
+if __name__ == "__main__":
+    upgrade()
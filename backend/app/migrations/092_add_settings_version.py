@@ -0,0 +1,57 @@
+"""Add settings_version table (cross-worker settings cache invalidation).
+
+Not FATAL: without the table the in-process settings snapshot still
+invalidates on local writes; only edits made by another worker are picked
+up later (on the snapshot's maximum age).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+
+def _get_fallback_engine():
+    db_path = os.environ.get("DATABASE_PATH")
+    if db_path:
+        return create_engine(f"sqlite:///{db_path}")
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    return create_engine(f"sqlite:///{data_dir / 'mygarage.db'}")
+
+
+def upgrade(engine=None):
+    """Create settings_version with its single row if missing."""
+    if engine is None:
+        engine = _get_fallback_engine()
+
+    with engine.begin() as conn:
+        inspector = inspect(engine)
+        print("Adding settings_version counter...")
+
+        if "settings_version" in inspector.get_table_names():
+            print("  → settings_version already exists, skipping")
+            return
+
+        conn.execute(
+            text(
+                """
+                CREATE TABLE settings_version (
+                    id INTEGER PRIMARY KEY,
+                    version INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+        )
+        conn.execute(text("INSERT INTO settings_version (id, version) VALUES (1, 0)"))
+        print("  ✓ Created settings_version table")
+        print("\n✓ Settings version migration completed successfully")
+
+
+def downgrade():
+    print("Downgrade not supported for settings_version")
+
+
+if __name__ == "__main__":
+    upgrade()
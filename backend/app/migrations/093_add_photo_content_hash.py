@@ -0,0 +1,58 @@
+"""Add vehicle_photos.content_hash (content-addressed photo derivatives).
+
+Existing photos keep a NULL hash until ``python -m app.services.image_pipeline``
+backfills it; until then they are served from the original file.
+
+FATAL: VehiclePhoto ORM declares this column; silent skip would 500 on every
+photo read.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+FATAL = True
+
+
+def _get_fallback_engine():
+    db_path = os.environ.get("DATABASE_PATH")
+    if db_path:
+        return create_engine(f"sqlite:///{db_path}")
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    return create_engine(f"sqlite:///{data_dir / 'mygarage.db'}")
+
+
+def upgrade(engine=None) -> None:
+    if engine is None:
+        engine = _get_fallback_engine()
+
+    inspector = inspect(engine)
+    if not inspector.has_table("vehicle_photos"):
+        return
+
+    existing = {col["name"] for col in inspector.get_columns("vehicle_photos")}
+    indexes = {idx["name"] for idx in inspector.get_indexes("vehicle_photos")}
+    with engine.begin() as conn:
+        if "content_hash" in existing:
+            print("✓ vehicle_photos.content_hash already exists")
+        else:
+            conn.execute(text("ALTER TABLE vehicle_photos ADD COLUMN content_hash VARCHAR(64)"))
+            print("✓ Added vehicle_photos.content_hash")
+        if "idx_vehicle_photos_content_hash" not in indexes:
+            conn.execute(
+                text("CREATE INDEX idx_vehicle_photos_content_hash ON vehicle_photos(content_hash)")
+            )
+            print("✓ Created idx_vehicle_photos_content_hash")
+
+    print("✓ Migration 093 (photo content hash) completed")
+
+
+def downgrade() -> None:
+    print("Downgrade not supported — restore from backup")
+
+
+if __name__ == "__main__":
+    upgrade()
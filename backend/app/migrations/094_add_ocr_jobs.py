@@ -0,0 +1,70 @@
+"""Add ocr_jobs table (background document parses).
+
+Not FATAL: a missing table only breaks the insurance parse-jobs endpoints;
+the synchronous parse routes do not touch it.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+
+def _get_fallback_engine():
+    db_path = os.environ.get("DATABASE_PATH")
+    if db_path:
+        return create_engine(f"sqlite:///{db_path}")
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    return create_engine(f"sqlite:///{data_dir / 'mygarage.db'}")
+
+
+def upgrade(engine=None):
+    """Create ocr_jobs if missing."""
+    if engine is None:
+        engine = _get_fallback_engine()
+
+    with engine.begin() as conn:
+        inspector = inspect(engine)
+        print("Adding OCR jobs...")
+
+        if "ocr_jobs" in inspector.get_table_names():
+            print("  → ocr_jobs already exists, skipping")
+            return
+
+        ts_type = (
+            "TIMESTAMP WITHOUT TIME ZONE" if engine.dialect.name == "postgresql" else "DATETIME"
+        )
+        conn.execute(
+            text(
+                f"""
+                CREATE TABLE ocr_jobs (
+                    id VARCHAR(32) PRIMARY KEY,
+                    kind VARCHAR(20) NOT NULL,
+                    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+                    vin VARCHAR(17) REFERENCES vehicles(vin) ON DELETE CASCADE,
+                    cache_key VARCHAR(64) NOT NULL,
+                    status VARCHAR(10) NOT NULL DEFAULT 'queued',
+                    result JSON,
+                    error TEXT,
+                    created_at {ts_type} DEFAULT CURRENT_TIMESTAMP NOT NULL,
+                    started_at {ts_type},
+                    finished_at {ts_type}
+                )
+                """
+            )
+        )
+        conn.execute(
+            text("CREATE INDEX ix_ocr_jobs_owner_cache_key ON ocr_jobs (user_id, kind, cache_key)")
+        )
+        print("  ✓ Created ocr_jobs table")
+        print("\n✓ OCR jobs migration completed successfully")
+
+
+def downgrade():
+    print("Downgrade not supported for ocr_jobs")
+
+
+if __name__ == "__main__":
+    upgrade()
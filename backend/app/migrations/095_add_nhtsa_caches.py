@@ -0,0 +1,94 @@
+"""Add nhtsa_vin_decodes and nhtsa_recall_cache tables (NHTSA response caches).
+
+Not FATAL: missing tables only break NHTSA recall and TSB lookups; the VIN
+decode endpoint does not touch them.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+
+def _get_fallback_engine():
+    db_path = os.environ.get("DATABASE_PATH")
+    if db_path:
+        return create_engine(f"sqlite:///{db_path}")
+    data_dir = Path(os.getenv("DATA_DIR", "/data"))
+    return create_engine(f"sqlite:///{data_dir / 'mygarage.db'}")
+
+
+def upgrade(engine=None):
+    """Create nhtsa_vin_decodes and nhtsa_recall_cache if missing."""
+    if engine is None:
+        engine = _get_fallback_engine()
+
+    with engine.begin() as conn:
+        inspector = inspect(engine)
+        tables = inspector.get_table_names()
+        print("Adding NHTSA caches...")
+
+        ts_type = (
+            "TIMESTAMP WITHOUT TIME ZONE" if engine.dialect.name == "postgresql" else "DATETIME"
+        )
+        pk_type = (
+            "SERIAL PRIMARY KEY"
+            if engine.dialect.name == "postgresql"
+            else "INTEGER PRIMARY KEY AUTOINCREMENT"
+        )
+
+        if "nhtsa_vin_decodes" in tables:
+            print("  → nhtsa_vin_decodes already exists, skipping")
+        else:
+            conn.execute(
+                text(
+                    f"""
+                    CREATE TABLE nhtsa_vin_decodes (
+                        vin VARCHAR(17) PRIMARY KEY,
+                        info JSON NOT NULL,
+                        decoded_at {ts_type} DEFAULT CURRENT_TIMESTAMP NOT NULL
+                    )
+                    """
+                )
+            )
+            print("  ✓ Created nhtsa_vin_decodes table")
+
+        if "nhtsa_recall_cache" in tables:
+            print("  → nhtsa_recall_cache already exists, skipping")
+        else:
+            conn.execute(
+                text(
+                    f"""
+                    CREATE TABLE nhtsa_recall_cache (
+                        id {pk_type},
+                        make VARCHAR(100) NOT NULL,
+                        model VARCHAR(100) NOT NULL,
+                        model_year INTEGER NOT NULL,
+                        results JSON NOT NULL,
+                        etag VARCHAR(200),
+                        last_modified VARCHAR(100),
+                        fetched_at {ts_type} NOT NULL,
+                        checked_at {ts_type} NOT NULL
+                    )
+                    """
+                )
+            )
+            conn.execute(
+                text(
+                    "CREATE UNIQUE INDEX ix_nhtsa_recall_cache_vehicle "
+                    "ON nhtsa_recall_cache (make, model, model_year)"
+                )
+            )
+            print("  ✓ Created nhtsa_recall_cache table")
+
+        print("\n✓ NHTSA caches migration completed successfully")
+
+
+def downgrade():
+    print("Downgrade not supported for NHTSA caches")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -15,7 +15,10 @@ from app.models.livelink_device import LiveLinkDevice
 from app.models.livelink_firmware_cache import LiveLinkFirmwareCache
 from app.models.livelink_parameter import LiveLinkParameter
 from app.models.location_point import LocationPoint
+from app.models.nhtsa_cache import NHTSARecallCache, NHTSAVINDecode
 from app.models.note import Note
+from app.models.notification_outbox import NotificationOutbox
+from app.models.ocr_job import OCRJob
 from app.models.odometer import OdometerRecord
 from app.models.oidc_state import OIDCState
 from app.models.photo import VehiclePhoto
@@ -24,7 +27,7 @@ from app.models.reminder import Reminder
 from app.models.sd_log_ingest_state import SdLogIngestState
 from app.models.service_line_item import ServiceLineItem
 from app.models.service_visit import ServiceVisit
-from app.models.settings import Setting
+from app.models.settings import Setting, SettingsVersion
 from app.models.spot_rental import SpotRental
 from app.models.spot_rental_billing import SpotRentalBilling
 from app.models.supply import Supply, SupplyPurchase, SupplyUsage
@@ -32,6 +35,7 @@ from app.models.tax import TaxRecord
 from app.models.tire import Tire, TireReading
 from app.models.vehicle import TrailerDetails, Vehicle
 from app.models.vehicle_dtc import VehicleDTC
+from app.models.vehicle_rollup import VehicleRollup
 from app.models.vehicle_share import VehicleShare
 from app.models.vehicle_telemetry import (
     TelemetryDailySummary,
@@ -47,6 +51,7 @@ __all__ = [
     # Vehicles
     "Vehicle",
     "TrailerDetails",
+    "VehicleRollup",
     # Maintenance & Records
     "DEFRecord",
     "SpotRental",
@@ -85,8 +90,13 @@ __all__ = [
     "ExternalVehicle",
     # System
     "Setting",
+    "SettingsVersion",
     "AddressBookEntry",
     "CSRFToken",
+    "NHTSARecallCache",
+    "NHTSAVINDecode",
+    "NotificationOutbox",
+    "OCRJob",
     "OIDCState",
     "Vendor",
     "Reminder",
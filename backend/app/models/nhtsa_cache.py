@@ -0,0 +1,64 @@
+"""NHTSA response caches (VIN decodes and recall lists)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class NHTSAVINDecode(Base):
+    """A VIN decoded by vPIC.
+
+    A VIN's make, model and year never change, so rows are kept indefinitely
+    and ``app.services.nhtsa.NHTSAService.decode_vins`` only asks vPIC for
+    VINs without one. ``info`` holds the decoded vehicle info in the shape
+    ``NHTSAService.decode_vin`` returns. Decodes missing make, model or year
+    are not stored, so they are retried.
+    """
+
+    __tablename__ = "nhtsa_vin_decodes"
+
+    vin: Mapped[str] = mapped_column(String(17), primary_key=True)
+    info: Mapped[dict] = mapped_column(JSON, nullable=False)
+    decoded_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<NHTSAVINDecode(vin={self.vin!r})>"
+
+
+class NHTSARecallCache(Base):
+    """The NHTSA recall list of one make/model/year.
+
+    Vehicles sharing a make, model and year share one row. A row younger than
+    ``nhtsa_recall_cache_hours`` (by ``checked_at``) is used as is; an older
+    one is refreshed with a conditional request (``etag``/``last_modified``),
+    and a 304 only moves ``checked_at``.
+    """
+
+    __tablename__ = "nhtsa_recall_cache"
+    __table_args__ = (
+        Index("ix_nhtsa_recall_cache_vehicle", "make", "model", "model_year", unique=True),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    make: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    model_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    results: Mapped[list] = mapped_column(JSON, nullable=False)
+    etag: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    checked_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<NHTSARecallCache(make={self.make!r}, model={self.model!r}, "
+            f"model_year={self.model_year!r})>"
+        )
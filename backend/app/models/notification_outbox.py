@@ -0,0 +1,52 @@
+"""Notification outbox model (pending and delivered notifications)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class NotificationOutbox(Base):
+    """One notification waiting for (or done with) delivery.
+
+    Rows are written in the caller's transaction by
+    ``app.services.notifications.outbox.enqueue_notification`` with
+    ``service`` unset. The outbox worker later fans each such event row out
+    into one row per enabled service and delivers those, so a slow or failing
+    service only ever retries its own row.
+
+    ``status`` is ``pending`` until delivery succeeds (``sent``) or runs out
+    of attempts (``dead``).
+    """
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (Index("ix_notification_outbox_status_due", "status", "next_attempt_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    # NULL until the worker fans the event out to the enabled services
+    service: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+    priority: Mapped[str] = mapped_column(String(10), nullable=False, default="default")
+    tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<NotificationOutbox(id={self.id}, event_type={self.event_type!r}, "
+            f"service={self.service!r}, status={self.status!r})>"
+        )
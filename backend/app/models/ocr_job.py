@@ -0,0 +1,50 @@
+"""OCR job model (background document parses and their results)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class OCRJob(Base):
+    """One document parse submitted to run in the background.
+
+    Created by ``app.services.ocr_jobs.OCRJobRunner.submit_insurance_parse``
+    and polled by the uploader until ``status`` leaves ``queued``/``running``
+    for ``done`` (``result`` holds the parse response) or ``failed``
+    (``error`` holds a user-facing message).
+
+    ``cache_key`` hashes the uploaded bytes together with the parse inputs,
+    so re-submitting the same document returns the existing job instead of
+    parsing it again.
+    """
+
+    __tablename__ = "ocr_jobs"
+    __table_args__ = (Index("ix_ocr_jobs_owner_cache_key", "user_id", "kind", "cache_key"),)
+
+    # uuid4 hex: job ids are handed to clients and must not be guessable
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    user_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
+    )
+    vin: Mapped[str | None] = mapped_column(
+        String(17), ForeignKey("vehicles.vin", ondelete="CASCADE"), nullable=True
+    )
+    cache_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="queued")
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<OCRJob(id={self.id!r}, kind={self.kind!r}, status={self.status!r})>"
@@ -22,6 +22,8 @@ class VehiclePhoto(Base):
     )
     file_path: Mapped[str] = mapped_column(String(255), nullable=False)
     thumbnail_path: Mapped[str | None] = mapped_column(String(255))
+    # SHA-256 of the uploaded bytes; keys the derivative store (image_pipeline)
+    content_hash: Mapped[str | None] = mapped_column(String(64))
     is_main: Mapped[bool] = mapped_column(Boolean, default=False)
     caption: Mapped[str | None] = mapped_column(String(200))
     uploaded_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -32,6 +34,7 @@ class VehiclePhoto(Base):
     __table_args__ = (
         Index("idx_vehicle_photos_vin", "vin"),
         Index("idx_vehicle_photos_main", "is_main"),
+        Index("idx_vehicle_photos_content_hash", "content_hash"),
     )
 
 
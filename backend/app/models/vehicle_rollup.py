@@ -0,0 +1,68 @@
+"""Per-vehicle rollup projection (one row per vehicle)."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class VehicleRollup(Base):
+    """Derived per-vehicle figures read by the dashboard, widgets, family
+    dashboard and calendar.
+
+    A projection, never a source of truth: every column is recomputed from the
+    record tables by ``app.services.vehicle_rollup_service`` shortly after
+    each commit that changes them, and the whole table can be rebuilt from scratch
+    at any time. ``overdue_count``/``upcoming_count`` and the next-due
+    reminder depend on today's date: the table is rebuilt nightly, and a row
+    whose ``computed_on`` is not today is recomputed on read.
+    """
+
+    __tablename__ = "vehicle_rollup"
+
+    vin: Mapped[str] = mapped_column(
+        String(17), ForeignKey("vehicles.vin", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Record counts
+    service_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    fuel_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    odometer_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reminder_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    document_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    note_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    photo_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Latest activity (metric-canonical)
+    last_service_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    last_service_description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    last_fuel_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    latest_odometer_km: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+    latest_odometer_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    latest_hours: Mapped[Decimal | None] = mapped_column(Numeric(10, 1), nullable=True)
+    latest_hours_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+    # Service visits (line items + supplies + fees) + fuel + DEF
+    total_spend: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0.00")
+    )
+
+    # Pending reminders as of computed_on
+    overdue_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    upcoming_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_due_title: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    next_due_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+    computed_on: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<VehicleRollup(vin={self.vin!r}, computed_on={self.computed_on})>"
@@ -63,7 +63,7 @@ from app.schemas.analytics import (
     VendorAnalyticsSummary,
 )
 from app.services import analytics_service
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, get_vehicle_or_403, require_auth
 from app.services.def_service import DEFRecordService
 from app.services.fuel_service import calculate_average_hours_economy
 from app.services.service_visit_service import service_visit_cost_load_options
@@ -871,18 +871,8 @@ async def get_garage_analytics(
     """
     Get comprehensive analytics aggregated across all vehicles in the garage.
     """
-    # Build vehicle query with eager loading
-    query = select(Vehicle).options(
-        # cost_snapshot only — this route never reads a usage's Supply row.
-        selectinload(Vehicle.service_visits)
-        .selectinload(ServiceVisit.line_items)
-        .selectinload(ServiceLineItem.supply_usages),
-        selectinload(Vehicle.service_visits).selectinload(ServiceVisit.vendor),
-        selectinload(Vehicle.fuel_records),
-        selectinload(Vehicle.def_records),
-        selectinload(Vehicle.insurance_policies),
-        selectinload(Vehicle.tax_records),
-    )
+    # Vehicle rows only; costs are summed in SQL, not over loaded relationships
+    query = select(Vehicle)
 
     # Scope to owned + shared vehicles for non-admin users
     if current_user is not None and not current_user.is_admin:
@@ -905,6 +895,10 @@ async def get_garage_analytics(
             vehicle_count=0,
         )
 
+    aggregates = await analytics_service.aggregate_garage_costs(
+        db, [vehicle.vin for vehicle in vehicles]
+    )
+
     # Initialize totals
     total_garage_value = Decimal("0.00")
     total_maintenance = Decimal("0.00")
@@ -914,20 +908,11 @@ async def get_garage_analytics(
     total_detailing = Decimal("0.00")
     total_fuel = Decimal("0.00")
     total_def = Decimal("0.00")
-    total_insurance = Decimal("0.00")
-    total_taxes = Decimal("0.00")
+    total_insurance = aggregates.total_insurance
+    total_taxes = aggregates.total_taxes
 
     vehicle_costs = []
 
-    # Track monthly trends across garage
-    monthly_data: dict[tuple[int, int], dict[str, Any]] = defaultdict(
-        lambda: {
-            "service": Decimal("0.00"),
-            "fuel": Decimal("0.00"),
-            "def": Decimal("0.00"),
-        }
-    )
-
     for vehicle in vehicles:
         vin = vehicle.vin
         vehicle_name = f"{vehicle.year} {vehicle.make} {vehicle.model}"
@@ -935,51 +920,14 @@ async def get_garage_analytics(
         purchase_price = vehicle.purchase_price or Decimal("0.00")
         total_garage_value += purchase_price
 
-        for policy in vehicle.insurance_policies:
-            if policy.premium_amount:
-                total_insurance += policy.premium_amount
-
-        for tax_record in vehicle.tax_records:
-            if tax_record.amount:
-                total_taxes += tax_record.amount
-
-        # Use eager-loaded service visits
-        service_visits = list(vehicle.service_visits)
-        service_visits.sort(key=lambda v: v.date)
-
-        fuel_records = [r for r in vehicle.fuel_records if r.cost is not None]
-        fuel_records.sort(key=lambda r: r.date)
-
-        # Calculate vehicle totals by service category using visit-level costs
-        vehicle_maintenance = Decimal("0.00")
-        vehicle_upgrades = Decimal("0.00")
-        vehicle_inspection = Decimal("0.00")
-        vehicle_collision = Decimal("0.00")
-        vehicle_detailing = Decimal("0.00")
-
-        for visit in service_visits:
-            cost = visit.calculated_total_cost
-            if cost:
-                category = visit.service_category or "Maintenance"
-                if category == "Maintenance":
-                    vehicle_maintenance += cost
-                elif category == "Upgrades":
-                    vehicle_upgrades += cost
-                elif category == "Inspection":
-                    vehicle_inspection += cost
-                elif category == "Collision":
-                    vehicle_collision += cost
-                elif category == "Detailing":
-                    vehicle_detailing += cost
-                else:
-                    vehicle_maintenance += cost
-
-        vehicle_fuel = sum((r.cost for r in fuel_records if r.cost), Decimal("0.00"))
-
-        def_records = [r for r in vehicle.def_records if r.cost is not None]
-        def_records.sort(key=lambda r: r.date)
-
-        vehicle_def = sum((r.cost for r in def_records if r.cost), Decimal("0.00"))
+        sums = aggregates.by_vehicle[vin]
+        vehicle_maintenance = sums["Maintenance"]
+        vehicle_upgrades = sums["Upgrades"]
+        vehicle_inspection = sums["Inspection"]
+        vehicle_collision = sums["Collision"]
+        vehicle_detailing = sums["Detailing"]
+        vehicle_fuel = sums["Fuel"]
+        vehicle_def = sums["DEF"]
 
         vehicle_total = (
             vehicle_maintenance
@@ -1016,23 +964,6 @@ async def get_garage_analytics(
             )
         )
 
-        # Add to monthly trends — service uses visit.calculated_total_cost
-        for visit in service_visits:
-            cost = visit.calculated_total_cost
-            if visit.date and cost:
-                key = (visit.date.year, visit.date.month)
-                monthly_data[key]["service"] += cost
-
-        for record in fuel_records:
-            if record.date and record.cost:
-                key = (record.date.year, record.date.month)
-                monthly_data[key]["fuel"] += record.cost
-
-        for record in def_records:
-            if record.date and record.cost:
-                key = (record.date.year, record.date.month)
-                monthly_data[key]["def"] += record.cost
-
     vehicle_costs.sort(key=lambda x: x.total_cost, reverse=True)
 
     cost_breakdown = []
@@ -1059,7 +990,7 @@ async def get_garage_analytics(
 
     # Create monthly trends (last 12 months)
     monthly_trends = []
-    sorted_months = sorted(monthly_data.items())[-12:]
+    sorted_months = sorted(aggregates.by_month.items())[-12:]
 
     for (year, month), data in sorted_months:
         month_name = f"{calendar.month_abbr[month]} {year}"
@@ -1143,7 +1074,7 @@ async def get_vendor_analytics(
     """Get vendor analysis for a specific vehicle."""
 
     # Verify access (owner, admin, or shared)
-    await get_vehicle_or_403(vin, user, db)
+    await check_vehicle_access(vin, user, db)
 
     # Get service visits with line items + vendor
     visit_result = await db.execute(_load_service_visits_query(vin))
@@ -1204,7 +1135,7 @@ async def get_seasonal_analytics(
     """Get seasonal spending analysis for a specific vehicle."""
 
     # Verify access (owner, admin, or shared)
-    await get_vehicle_or_403(vin, user, db)
+    await check_vehicle_access(vin, user, db)
 
     # Get service visits with line items + vendor
     visit_result = await db.execute(_load_service_visits_query(vin))
@@ -1309,7 +1240,7 @@ async def compare_periods(
     """Compare costs and metrics between two time periods."""
 
     # Verify access (owner, admin, or shared)
-    await get_vehicle_or_403(vin, user, db)
+    await check_vehicle_access(vin, user, db)
 
     # Get service visits with line items + vendor
     visit_result = await db.execute(_load_service_visits_query(vin))
@@ -15,7 +15,7 @@ from app.models.attachment import Attachment
 from app.models.service_visit import ServiceVisit
 from app.models.user import User
 from app.schemas.attachment import AttachmentListResponse, AttachmentResponse
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
 from app.services.file_upload_service import ATTACHMENT_UPLOAD_CONFIG, FileUploadService
 from app.utils.logging_utils import sanitize_for_log
 
@@ -79,7 +79,7 @@ async def view_attachment(
 
         # Verify user has access to the vehicle
         vin = await get_attachment_vin(attachment, db)
-        _ = await get_vehicle_or_403(vin, current_user, db)
+        await check_vehicle_access(vin, current_user, db)
 
         # Check if file exists
         file_path = Path(attachment.file_path)
@@ -124,7 +124,7 @@ async def download_attachment(
 
         # Verify user has access to the vehicle
         vin = await get_attachment_vin(attachment, db)
-        _ = await get_vehicle_or_403(vin, current_user, db)
+        await check_vehicle_access(vin, current_user, db)
 
         # Check if file exists
         file_path = Path(attachment.file_path)
@@ -177,7 +177,7 @@ async def delete_attachment(
 
         # Verify user has write access to the vehicle
         vin = await get_attachment_vin(attachment, db)
-        _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Delete file from disk
         file_path = Path(attachment.file_path)
@@ -237,7 +237,7 @@ async def upload_service_visit_attachment(
             raise HTTPException(status_code=404, detail=f"Service visit {visit_id} not found")
 
         # Verify user has write access to the vehicle
-        _ = await get_vehicle_or_403(service_visit.vin, current_user, db, require_write=True)
+        await check_vehicle_access(service_visit.vin, current_user, db, require_write=True)
 
         # Upload using shared service
         upload_result = await FileUploadService.upload_file(
@@ -308,7 +308,7 @@ async def list_service_visit_attachments(
             raise HTTPException(status_code=404, detail=f"Service visit {visit_id} not found")
 
         # Verify user has access to the vehicle
-        _ = await get_vehicle_or_403(service_visit.vin, current_user, db)
+        await check_vehicle_access(service_visit.vin, current_user, db)
 
         # Get attachments
         result = await db.execute(
@@ -13,7 +13,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.database import get_db
 from app.models.csrf_token import CSRFToken
-from app.models.settings import Setting
 from app.models.user import User
 from app.schemas.user import (
     AdminPasswordReset,
@@ -31,11 +30,12 @@ from app.services.auth import (
     create_access_token,
     get_current_admin_user,
     get_current_user,
-    hash_password,
+    hash_password_async,
     optional_auth,
     require_auth,
-    verify_password,
+    verify_password_async,
 )
+from app.services.settings_service import SettingsService
 from app.utils.datetime_utils import utc_now
 from app.utils.logging_utils import sanitize_for_log
 from app.utils.request_scheme import get_cookie_secure
@@ -90,7 +90,7 @@ async def register(
         )
 
     # Create first user as admin
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     new_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -369,14 +369,16 @@ async def update_password(
 ):
     """Update current user password."""
     # Verify current password
-    if not verify_password(password_update.current_password, current_user.hashed_password):
+    if not await verify_password_async(
+        password_update.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Update password
-    current_user.hashed_password = hash_password(password_update.new_password)
+    current_user.hashed_password = await hash_password_async(password_update.new_password)
     current_user.updated_at = utc_now()
 
     await db.commit()
@@ -442,10 +444,7 @@ async def create_user(
     - show_on_family_dashboard: Whether to show on family dashboard (default: false)
     """
     # Check if multi-user mode is enabled
-    result = await db.execute(select(Setting).where(Setting.key == "multi_user_enabled"))
-    multi_user_setting = result.scalar_one_or_none()
-
-    if multi_user_setting and multi_user_setting.value != "true":
+    if await SettingsService.get_value(db, "multi_user_enabled", "true") != "true":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Multi-user mode is disabled. Enable it in Settings > System to create additional users.",
@@ -468,7 +467,7 @@ async def create_user(
         )
 
     # Create new user (inactive by default, non-admin by default)
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     new_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -706,7 +705,7 @@ async def admin_reset_user_password(
         )
 
     # Update password (validation handled by AdminPasswordReset schema)
-    user.hashed_password = hash_password(password_data.new_password)
+    user.hashed_password = await hash_password_async(password_data.new_password)
     user.updated_at = utc_now()
 
     await db.commit()
@@ -1,20 +1,35 @@
 """Backup API endpoints for settings and full data backup/restore."""
 
 import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db, is_sqlite
+from app.database import engine, get_db, is_sqlite
 from app.models.user import User
 from app.services.auth import get_current_admin_user
 from app.services.backup_service import BackupService
-from app.utils.logging_utils import sanitize_for_log
+from app.services.backup_store import (
+    MANIFEST_SUFFIX,
+    SNAPSHOT_SUFFIX,
+    BackupInProgressError,
+    BackupTooLargeError,
+    current_progress,
+)
+from app.services.parameter_registry import parameter_registry
+from app.services.principal_cache import principal_cache
+from app.services.settings_cache import settings_cache
+from app.services.telemetry_latest_buffer import latest_buffer
+from app.services.vehicle_acl import vehicle_acl
+from app.services.vehicle_rollup_service import rebuild_all_vehicle_rollups
+from app.utils.cache import clear_analytics_cache
 
 router = APIRouter(prefix="/api/backup", tags=["Backup"])
 logger = logging.getLogger(__name__)
@@ -22,6 +37,8 @@ logger = logging.getLogger(__name__)
 # Backup directory configuration
 BACKUP_DIR = settings.data_dir / "backups"
 
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 # SQLite: derive database file path; PostgreSQL: no file path needed
 if is_sqlite:
     DATABASE_PATH: Path | None = Path(settings.database_url.replace("sqlite+aiosqlite:///", ""))
@@ -76,6 +93,9 @@ async def get_stats(
             "full_backups": {
                 "count": len(full_backups),
                 "total_size_mb": round(full_backup_size / 1024 / 1024, 2),
+                # Manifest backups share blobs, so their sizes above overlap;
+                # this is what they take on disk together
+                "blob_store_size_mb": round(backup_service.get_blob_store_size() / 1024 / 1024, 2),
             },
             "backup_directory": str(BACKUP_DIR),
             "wal_mode_enabled": (Path(f"{DATABASE_PATH}-wal").exists() if DATABASE_PATH else False),
@@ -145,7 +165,8 @@ async def create_full_backup(
 ) -> dict[str, Any]:
     """Create a full backup including database and all uploaded files.
 
-    This may take several minutes depending on the size of your data.
+    Only files changed since the last backup are compressed, in a worker
+    thread; ``GET /api/backup/progress`` reports how far the backup is.
 
     Returns:
         Metadata about the created backup file
@@ -159,6 +180,8 @@ async def create_full_backup(
             "message": "Full backup created successfully",
             "backup": backup_info,
         }
+    except BackupInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except PermissionError as e:
         logger.error("Permission denied creating full backup: %s", e)
         raise HTTPException(
@@ -173,6 +196,19 @@ async def create_full_backup(
         raise HTTPException(status_code=500, detail="Error creating backup archive")
 
 
+@router.get("/progress")
+async def get_progress(
+    current_user: User | None = Depends(get_current_admin_user),
+) -> dict[str, Any]:
+    """Progress of the running full backup or restore, or of the last one.
+
+    Returns:
+        ``{"progress": null}`` if none has run since startup
+    """
+    progress = current_progress()
+    return {"progress": progress.as_dict() if progress else None}
+
+
 @router.get("/download/{filename}")
 async def download_backup(
     filename: str, current_user: User | None = Depends(get_current_admin_user)
@@ -192,6 +228,23 @@ async def download_backup(
         if not backup_path.exists():
             raise HTTPException(status_code=404, detail="Backup file not found")
 
+        # Safety snapshots share their files with the live data; they are
+        # restored in place, not downloaded
+        if filename.endswith(SNAPSHOT_SUFFIX):
+            raise HTTPException(
+                status_code=400,
+                detail="Safety snapshots cannot be downloaded. Restore it, then create a backup.",
+            )
+
+        # Manifest backups download as one tar of the manifest and its blobs
+        if filename.endswith(MANIFEST_SUFFIX):
+            bundle_name = filename.removesuffix(MANIFEST_SUFFIX) + ".tar"
+            return StreamingResponse(
+                backup_service.iter_manifest_bundle(filename),
+                media_type="application/x-tar",
+                headers={"Content-Disposition": f'attachment; filename="{bundle_name}"'},
+            )
+
         # Determine media type based on file extension
         if filename.endswith(".json"):
             media_type = "application/json"
@@ -210,6 +263,8 @@ async def download_backup(
         raise
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Backup file not found")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except PermissionError as e:
         logger.error("Permission denied downloading backup: %s", e)
         raise HTTPException(status_code=403, detail="Permission denied: cannot read backup file")
@@ -218,6 +273,28 @@ async def download_backup(
         raise HTTPException(status_code=500, detail="Error reading backup file")
 
 
+async def _reset_after_full_restore(db: AsyncSession) -> None:
+    """Drop what this process holds from the database a full restore replaced.
+
+    Pooled connections still point at the old file and the caches hold its
+    rows. The vehicle rollups are rebuilt from the restored records.
+    """
+    # Release the request's connection too, so the rebuild opens the new file
+    await db.rollback()
+    await engine.dispose()
+    latest_buffer.clear()
+    settings_cache.invalidate()
+    principal_cache.clear()
+    vehicle_acl.clear()
+    parameter_registry.invalidate()
+    await clear_analytics_cache()
+    try:
+        await rebuild_all_vehicle_rollups(db)
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.warning("Could not rebuild vehicle rollups after restore: %s", e)
+
+
 @router.post("/restore/{filename}")
 async def restore_backup(
     filename: str,
@@ -227,7 +304,10 @@ async def restore_backup(
     """Restore settings from a backup file.
 
     This creates a safety backup before restoring.
-    Full backup restore is only supported for SQLite databases.
+    Full backup restore is only supported for SQLite databases; it unpacks
+    into a staging directory that replaces the live data only once complete,
+    and reports its throughput. Afterwards the database connections and
+    in-process caches are dropped and the vehicle rollups are rebuilt.
 
     Args:
         filename: Name of the backup file to restore from
@@ -239,8 +319,9 @@ async def restore_backup(
     try:
         backup_service = get_backup_service()
 
-        # Determine backup type from filename
-        if filename.endswith(".json"):
+        # Determine backup type from filename (manifests end in .json too)
+        is_full = filename.endswith((".tar.gz", MANIFEST_SUFFIX, SNAPSHOT_SUFFIX))
+        if filename.endswith(".json") and not is_full:
             # Settings backup (works on all backends)
             details = await backup_service.restore_settings_backup(filename, db)
 
@@ -249,7 +330,7 @@ async def restore_backup(
                 "message": f"Settings restored successfully from {filename}",
                 "details": details,
             }
-        elif filename.endswith(".tar.gz"):
+        elif is_full:
             # Full backup restore — guard PostgreSQL
             if not is_sqlite:
                 raise HTTPException(
@@ -263,6 +344,7 @@ async def restore_backup(
                 )
 
             details = await backup_service.restore_full_backup(filename)
+            await _reset_after_full_restore(db)
 
             return {
                 "success": True,
@@ -275,6 +357,8 @@ async def restore_backup(
 
     except HTTPException:
         raise
+    except BackupInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -289,99 +373,35 @@ async def restore_backup(
         raise HTTPException(status_code=500, detail="Error restoring backup files")
 
 
-@router.post("/upload")
-async def upload_backup(
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-    current_user: User | None = Depends(get_current_admin_user),
-) -> dict[str, Any]:
-    """Upload and save a backup file.
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
 
-    Args:
-        file: Uploaded backup file
-        db: Database session (for validation)
-
-    Returns:
-        Metadata about the uploaded backup file
-    """
-    from datetime import datetime
 
+async def _save_upload(
+    original_name: str | None, chunks: AsyncIterator[bytes], sha256: str | None
+) -> dict[str, Any]:
     try:
-        backup_service = get_backup_service()
-        backup_service.ensure_backup_dir()
-
         # Validate filename exists
-        if not file.filename:
+        if not original_name:
             raise HTTPException(status_code=400, detail="No filename provided")
 
-        # Validate file type
-        if not (file.filename.endswith(".json") or file.filename.endswith(".tar.gz")):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Must be .json (settings) or .tar.gz (full backup)",
-            )
-
-        # Check file size BEFORE reading into memory to prevent DoS
-        max_backup_size = 100 * 1024 * 1024  # 100MB max for backups
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Seek back to beginning
-
-        if file_size > max_backup_size:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File size exceeds maximum of {max_backup_size // (1024 * 1024)}MB",
-            )
-
-        # Determine backup type and generate standardized filename
-        # This ensures uploaded files appear in the backup list
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        if file.filename.endswith(".json"):
-            backup_type = "settings"
-            safe_filename = f"mygarage-settings-uploaded-{timestamp}.json"
-        else:
-            backup_type = "full"
-            safe_filename = f"mygarage-full-uploaded-{timestamp}.tar.gz"
-
-        backup_path = BACKUP_DIR / safe_filename
-
-        # Now read and validate file content
-        content = await file.read()
-
-        # Validate JSON backups
-        if backup_type == "settings":
-            import json
-
-            try:
-                backup_data = json.loads(content)
-                if "settings" not in backup_data or not isinstance(backup_data["settings"], list):
-                    raise HTTPException(status_code=400, detail="Invalid backup file structure")
-            except json.JSONDecodeError:
-                raise HTTPException(status_code=400, detail="Invalid JSON file")
-
-        # Write to backup directory
-        with open(backup_path, "wb") as f:
-            f.write(content)
-
-        logger.info(
-            "Uploaded backup: %s (original: %s)", safe_filename, sanitize_for_log(file.filename)
-        )
-
-        # Get file stats
-        stat = backup_path.stat()
+        backup_service = get_backup_service()
+        backup_info = await backup_service.receive_upload(original_name, chunks, sha256)
 
         return {
             "success": True,
             "message": "Backup uploaded successfully",
-            "backup": {
-                "filename": safe_filename,
-                "type": backup_type,
-                "size_mb": round(stat.st_size / 1024 / 1024, 4 if backup_type == "settings" else 2),
-                "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            },
+            "backup": backup_info,
         }
     except HTTPException:
         raise
+    except BackupTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except BackupInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except PermissionError as e:
         logger.error("Permission denied uploading backup: %s", e)
         raise HTTPException(
@@ -393,6 +413,53 @@ async def upload_backup(
         raise HTTPException(status_code=500, detail="Error saving backup file")
 
 
+@router.post("/upload")
+async def upload_backup(
+    file: UploadFile = File(...),
+    sha256: str | None = Form(None),
+    current_user: User | None = Depends(get_current_admin_user),
+) -> dict[str, Any]:
+    """Upload and save a backup file.
+
+    Accepts a settings backup (``.json``), a full backup archive
+    (``.tar.gz``) or a downloaded manifest backup bundle (``.tar``). The
+    file is copied to the backup directory in chunks; prefer
+    ``PUT /api/backup/upload/{filename}`` for large full backups, which
+    streams the request body without a multipart copy.
+
+    Args:
+        file: Uploaded backup file
+        sha256: Optional hex SHA-256 of the file; a mismatch rejects the upload
+
+    Returns:
+        Metadata about the uploaded backup file
+    """
+    return await _save_upload(file.filename, _iter_upload(file), sha256)
+
+
+@router.put("/upload/{filename}")
+async def upload_backup_stream(
+    filename: str,
+    request: Request,
+    x_content_sha256: str | None = Header(None),
+    current_user: User | None = Depends(get_current_admin_user),
+) -> dict[str, Any]:
+    """Upload a backup file sent as the raw request body.
+
+    The body is written to disk (or, for a ``.tar`` bundle, unpacked into
+    the blob store) as it arrives, so uploads of any size use constant
+    memory.
+
+    Args:
+        filename: Original name of the file; its extension picks the backup type
+        x_content_sha256: Optional hex SHA-256 of the body; a mismatch rejects the upload
+
+    Returns:
+        Metadata about the uploaded backup file
+    """
+    return await _save_upload(filename, request.stream(), x_content_sha256)
+
+
 @router.delete("/{filename}")
 async def delete_backup(
     filename: str, current_user: User | None = Depends(get_current_admin_user)
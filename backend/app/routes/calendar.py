@@ -7,14 +7,13 @@ from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response
-from sqlalchemy import desc, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.database import get_db
 from app.models import (
     InsurancePolicy,
-    OdometerRecord,
     Reminder,
     ServiceVisit,
     Vehicle,
@@ -24,11 +23,8 @@ from app.models.user import User
 from app.models.vehicle_share import VehicleShare
 from app.schemas.calendar import CalendarEvent, CalendarResponse, CalendarSummary
 from app.services.auth import require_auth
-from app.services.reminder_service import (
-    calculate_hours_driving_rate,
-    calculate_smart_estimated_date,
-    get_current_hours,
-)
+from app.services.reminder_service import calculate_smart_estimated_date
+from app.services.usage_model import get_usage_models
 
 router = APIRouter(prefix="/api", tags=["calendar"])
 
@@ -113,8 +109,12 @@ async def get_calendar_events(
         reminder_result = await db.execute(reminder_query)
         reminders = reminder_result.scalars().all()
 
+        # Current readings and rates for estimates and "until due" figures
+        usage_models = await get_usage_models(db, [r.vin for r in reminders])
+
         for reminder in reminders:
             vehicle = vehicles_dict.get(reminder.vin)
+            usage = usage_models[reminder.vin]
 
             # Determine the event date from reminder fields
             event_date = reminder.due_date
@@ -124,13 +124,17 @@ async def get_calendar_events(
 
             # For mileage-only reminders, estimate date
             if event_date is None and due_mileage_km is not None:
-                event_date = await estimate_date_from_mileage(reminder.vin, due_mileage_km, db)
+                event_date = estimate_usage_due_date(
+                    usage.current_km, due_mileage_km, usage.km_per_day
+                )
                 is_estimated = event_date is not None
 
             # For hours-only reminders, estimate date from the engine-hours
             # accumulation rate (mirrors the mileage branch above).
             if event_date is None and due_hours is not None:
-                event_date = await estimate_date_from_hours(reminder.vin, due_hours, db)
+                event_date = estimate_usage_due_date(
+                    usage.current_hours, due_hours, usage.hours_per_day
+                )
                 is_estimated = event_date is not None
 
             # Skip if no date can be determined
@@ -158,22 +162,12 @@ async def get_calendar_events(
                 status = "on_track"
 
             km_until_due: Decimal | None = None
-            if due_mileage_km is not None:
-                odo_result = await db.execute(
-                    select(OdometerRecord.odometer_km)
-                    .where(OdometerRecord.vin == reminder.vin)
-                    .order_by(OdometerRecord.date.desc())
-                    .limit(1)
-                )
-                current_odometer_km = odo_result.scalar_one_or_none()
-                if current_odometer_km is not None:
-                    km_until_due = due_mileage_km - current_odometer_km
+            if due_mileage_km is not None and usage.current_km is not None:
+                km_until_due = due_mileage_km - usage.current_km
 
             hours_until_due: Decimal | None = None
-            if due_hours is not None:
-                current_hours = await get_current_hours(reminder.vin, db)
-                if current_hours is not None:
-                    hours_until_due = due_hours - current_hours
+            if due_hours is not None and usage.current_hours is not None:
+                hours_until_due = due_hours - usage.current_hours
 
             events.append(
                 CalendarEvent(
@@ -367,109 +361,24 @@ async def get_calendar_events(
     return CalendarResponse(events=events, summary=summary)
 
 
-async def calculate_average_km_per_day(vin: str, db: AsyncSession) -> float | None:
-    """Calculate average km per day for a vehicle based on odometer history."""
-    # Get last 30 days of odometer readings (or all if less than 30 days of data)
-    odometer_query = (
-        select(OdometerRecord)
-        .where(OdometerRecord.vin == vin)
-        .order_by(desc(OdometerRecord.date))
-        .limit(30)
-    )
-
-    result = await db.execute(odometer_query)
-    records = result.scalars().all()
-
-    if len(records) < 2:
-        # Not enough data to calculate average
-        return None
-
-    # Calculate km per day using oldest and newest records
-    oldest = records[-1]
-    newest = records[0]
-
-    days_diff = (newest.date - oldest.date).days
-    km_diff = newest.odometer_km - oldest.odometer_km
-
-    if days_diff == 0 or km_diff < 0:
-        return None
-
-    return float(km_diff) / days_diff
-
-
-async def estimate_date_from_mileage(
-    vin: str, due_mileage_km: Decimal, db: AsyncSession
+def estimate_usage_due_date(
+    current: Decimal | None, target: Decimal, per_day: float | None
 ) -> date | None:
-    """Estimate due date for a mileage-based reminder."""
-    # Get current odometer_km
-    odometer_query = (
-        select(OdometerRecord)
-        .where(OdometerRecord.vin == vin)
-        .order_by(desc(OdometerRecord.date))
-        .limit(1)
-    )
-
-    result = await db.execute(odometer_query)
-    current_record = result.scalar_one_or_none()
+    """Estimate when a mileage or engine-hours target will be reached.
 
-    if not current_record:
-        return None
-
-    current_odometer_km = current_record.odometer_km
-    km_remaining = due_mileage_km - current_odometer_km
-
-    if km_remaining <= 0:
-        # Already past due
-        return date.today()
-
-    # Get average km per day
-    avg_km_per_day = await calculate_average_km_per_day(vin, db)
-
-    if not avg_km_per_day or avg_km_per_day <= 0:
-        # Can't estimate without average
-        return None
-
-    # Calculate estimated days until due
-    days_until_due = int(float(km_remaining) / avg_km_per_day)
-
-    return date.today() + timedelta(days=days_until_due)
-
-
-async def estimate_date_from_hours(vin: str, due_hours: Decimal, db: AsyncSession) -> date | None:
-    """Estimate due date for an hours-based reminder.
-
-    Mirrors ``estimate_date_from_mileage`` above, but reuses the
-    reminder_service helpers instead of a calendar-local rate calculator:
-    the canonical current-hours reading (``get_current_hours``) in place of
-    the odometer, and the 90-day-window engine-hours rate
-    (``calculate_hours_driving_rate``) in place of
-    ``calculate_average_km_per_day``. The actual projection is
-    ``calculate_smart_estimated_date`` — the same formula
-    ``estimate_date_from_mileage`` duplicates inline — called with
-    ``date.max`` as the hard-date ceiling, a no-op cap since a pure
-    ``hours`` reminder has no date to cap against (only ``smart`` reminders
-    have a real hard_date, and those already surface via ``due_date``
-    directly without ever reaching this function).
+    Today when the target is already reached; None without a current reading
+    or a positive accumulation rate. The projection is
+    ``calculate_smart_estimated_date`` with ``date.max`` as a no-op cap: pure
+    mileage/hours reminders have no hard date (smart reminders surface via
+    their ``due_date`` and never get here).
     """
-    current_hours = await get_current_hours(vin, db)
-
-    if current_hours is None:
+    if current is None:
         return None
-
-    hours_remaining = due_hours - current_hours
-
-    if hours_remaining <= 0:
-        # Already past due
+    if target <= current:
         return date.today()
-
-    # Get average engine-hours per day
-    avg_hours_per_day = await calculate_hours_driving_rate(vin, db)
-
-    if not avg_hours_per_day or avg_hours_per_day <= 0:
-        # Can't estimate without a rate
+    if not per_day or per_day <= 0:
         return None
-
-    return calculate_smart_estimated_date(current_hours, due_hours, avg_hours_per_day, date.max)
+    return calculate_smart_estimated_date(current, target, per_day, date.max)
 
 
 @router.get("/calendar/export")
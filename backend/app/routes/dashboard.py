@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from datetime import date as date_type
 from datetime import timedelta
 from decimal import Decimal
@@ -10,15 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models import (
     DEFRecord,
-    Document,
     FuelRecord,
-    Note,
-    OdometerRecord,
     Reminder,
     ServiceVisit,
     Vehicle,
 )
-from app.models.settings import Setting
 from app.models.user import User
 from app.models.vehicle_share import VehicleShare
 from app.schemas.dashboard import (
@@ -28,11 +25,11 @@ from app.schemas.dashboard import (
     VehicleStatistics,
 )
 from app.services.auth import require_auth
-from app.services.fuel_service import calculate_average_hours_economy, compute_full_tank_economy
-from app.services.hours_service import latest_engine_hours_and_date
-from app.services.odometer_service import latest_odometer_km_and_date
-from app.services.reminder_service import is_reminder_overdue
+from app.services.fuel_economy_index import FillUp, load_fill_ups_by_vin, ordered_by_meter
+from app.services.fuel_service import average_hours_economy, compute_full_tank_economy
 from app.services.service_visit_service import service_visit_cost_load_options
+from app.services.settings_service import SettingsService
+from app.services.vehicle_rollup_service import get_vehicle_rollups
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
@@ -41,34 +38,79 @@ PHOTO_DIR = Path("/data/photos")
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
 
-async def calculate_vehicle_stats(
-    db: AsyncSession,
+@dataclass
+class VehicleAggregates:
+    """Everything a dashboard card reads from the database, for one vehicle."""
+
+    service_count: int = 0
+    fuel_count: int = 0
+    odometer_count: int = 0
+    maintenance_count: int = 0
+    document_count: int = 0
+    note_count: int = 0
+    latest_service_date: date_type | None = None
+    latest_fuel_date: date_type | None = None
+    latest_odometer_km: Decimal | None = None
+    latest_odometer_date: date_type | None = None
+    latest_hours: Decimal | None = None
+    overdue_count: int = 0
+    upcoming_count: int = 0
+    fill_ups: list[FillUp] = field(default_factory=list)
+
+
+async def load_vehicle_aggregates(
+    db: AsyncSession, vins: list[str]
+) -> dict[str, VehicleAggregates]:
+    """Load the dashboard card figures of every vin with a fixed number of queries.
+
+    Record counts, latest service/fuel dates, the latest odometer and engine
+    hours readings and the overdue/upcoming reminder counts are the vehicles'
+    ``vehicle_rollup`` rows (one lookup); the fuel history behind the economy
+    figures is one query covering every vin. The statement count does not
+    grow with the number of vehicles or records.
+    """
+    aggregates = {vin: VehicleAggregates() for vin in vins}
+    if not vins:
+        return aggregates
+
+    for vin, rollup in (await get_vehicle_rollups(db, vins)).items():
+        aggregates[vin] = VehicleAggregates(
+            service_count=rollup.service_count,
+            fuel_count=rollup.fuel_count,
+            odometer_count=rollup.odometer_count,
+            maintenance_count=rollup.reminder_count,
+            document_count=rollup.document_count,
+            note_count=rollup.note_count,
+            latest_service_date=rollup.last_service_date,
+            latest_fuel_date=rollup.last_fuel_date,
+            # Same date DESC, id DESC row as the detail-stats helper (R2-B1)
+            latest_odometer_km=rollup.latest_odometer_km,
+            latest_odometer_date=rollup.latest_odometer_date,
+            # Canonical latest engine-hours reading (§1 helper) — NEVER
+            # vehicle.current_hours (R2-H1). Null for a pure-distance vehicle.
+            latest_hours=rollup.latest_hours,
+            # Evaluated against the two readings above, so the displayed
+            # reading and the overdue eval can never disagree (R2-B1, 6b).
+            overdue_count=rollup.overdue_count,
+            upcoming_count=rollup.upcoming_count,
+        )
+
+    for vin, fill_ups in (await load_fill_ups_by_vin(db, vins)).items():
+        aggregates[vin].fill_ups = fill_ups
+
+    return aggregates
+
+
+def calculate_vehicle_stats(
     vehicle: Vehicle,
+    aggregates: VehicleAggregates,
     is_shared_with_me: bool = False,
     shared_by_username: str | None = None,
     share_permission: str | None = None,
     owner_relationship: str | None = None,
     owner_relationship_custom: str | None = None,
 ) -> VehicleStatistics:
-    """Calculate statistics for a single vehicle"""
-
-    # Count records
-    service_count = await db.scalar(
-        select(func.count(ServiceVisit.id)).where(ServiceVisit.vin == vehicle.vin)
-    )
-    fuel_count = await db.scalar(
-        select(func.count(FuelRecord.id)).where(FuelRecord.vin == vehicle.vin)
-    )
-    odometer_count = await db.scalar(
-        select(func.count(OdometerRecord.id)).where(OdometerRecord.vin == vehicle.vin)
-    )
-    maintenance_count = await db.scalar(
-        select(func.count(Reminder.id)).where(Reminder.vin == vehicle.vin)
-    )
-    document_count = await db.scalar(
-        select(func.count(Document.id)).where(Document.vin == vehicle.vin)
-    )
-    note_count = await db.scalar(select(func.count(Note.id)).where(Note.vin == vehicle.vin))
+    """Calculate statistics for a single vehicle from its preloaded aggregates"""
 
     # Count photos from filesystem
     photo_count = 0
@@ -80,66 +122,20 @@ async def calculate_vehicle_stats(
             if photo_file.is_file() and photo_file.suffix.lower() in ALLOWED_EXTENSIONS
         )
 
-    # Get latest service date
-    latest_service = await db.scalar(
-        select(ServiceVisit.date)
-        .where(ServiceVisit.vin == vehicle.vin)
-        .order_by(ServiceVisit.date.desc())
-        .limit(1)
+    # Hours economy from the same engine-hours-ordered fill-ups
+    # calculate_average_hours_economy would load.
+    average_l_per_hr, average_cost_per_hr = average_hours_economy(
+        ordered_by_meter(aggregates.fill_ups, "engine_hours")  # type: ignore[arg-type]
     )
 
-    # Get latest fuel date
-    latest_fuel = await db.scalar(
-        select(FuelRecord.date)
-        .where(FuelRecord.vin == vehicle.vin)
-        .order_by(FuelRecord.date.desc())
-        .limit(1)
-    )
-
-    # Latest odometer reading (km) + its date — one deterministic fetch shared
-    # with detail-stats (date DESC, id DESC tie-break; odometer_service). R2-B1.
-    latest_odometer_km, latest_odometer_date = await latest_odometer_km_and_date(db, vehicle.vin)
-
-    # Canonical latest engine-hours reading (§1 helper) — NEVER vehicle.current_hours
-    # (R2-H1). Null for a pure-distance vehicle (no hours_records rows).
-    latest_hours, _latest_hours_date = await latest_engine_hours_and_date(db, vehicle.vin)
-    average_l_per_hr, average_cost_per_hr = await calculate_average_hours_economy(db, vehicle.vin)
-
-    # Count upcoming and overdue reminders
-    today = date_type.today()
-    pending_reminders_result = await db.execute(
-        select(Reminder).where(Reminder.vin == vehicle.vin, Reminder.status == "pending")
-    )
-    pending_reminders = pending_reminders_result.scalars().all()
-
-    # Reuse the SAME fetched readings for the reminder evaluation so the
-    # displayed reading and the overdue eval can never disagree — and so the
-    # dashboard card and the detail hero agree on a same-date-reading vehicle.
-    # R2-B1 (mileage); Phase 6b extends this to `latest_hours`, already
-    # fetched above for the hours-economy figures — no extra query per
-    # vehicle for the hours-reminder check.
-    current_odometer_km = latest_odometer_km
-    current_engine_hours = latest_hours
-
-    upcoming_count = 0
-    overdue_count = 0
-    for reminder in pending_reminders:
-        if is_reminder_overdue(reminder, current_odometer_km, current_engine_hours, today):
-            overdue_count += 1
-        else:
-            upcoming_count += 1
-
     # Per-full-tank L/100km, anchored to the previous FULL tank with partial
     # fill-ups folded in (issue #113). Ordered by odometer ascending so the
     # last entries are the most recent.
-    fuel_records_result = await db.execute(
-        select(FuelRecord)
-        .where(FuelRecord.vin == vehicle.vin)
-        .where(FuelRecord.odometer_km.isnot(None))
-        .order_by(FuelRecord.odometer_km.asc(), FuelRecord.date.asc())
-    )
-    fuel_records_list = list(fuel_records_result.scalars().all())
-    l_per_100km_values = [value for _, value in compute_full_tank_economy(fuel_records_list)]
+    fuel_records_list = ordered_by_meter(aggregates.fill_ups, "odometer_km")
+    l_per_100km_values = [
+        value
+        for _, value in compute_full_tank_economy(fuel_records_list)  # type: ignore[arg-type]
+    ]
 
     average_l_per_100km: Decimal | None = None
     recent_l_per_100km: Decimal | None = None
@@ -154,8 +150,6 @@ async def calculate_vehicle_stats(
     if vehicle.main_photo:
         # main_photo is stored as "VIN/filename.jpg"
         # Extract just the filename
-        from pathlib import Path
-
         filename = Path(vehicle.main_photo).name
         main_photo_url = f"/api/vehicles/{vehicle.vin}/photos/{filename}"
 
@@ -168,23 +162,23 @@ async def calculate_vehicle_stats(
         main_photo_url=main_photo_url,
         usage_unit=vehicle.usage_unit,
         current_hours=vehicle.current_hours,
-        latest_hours=latest_hours,
+        latest_hours=aggregates.latest_hours,
         average_l_per_hr=average_l_per_hr,
         average_cost_per_hr=average_cost_per_hr,
         secondary_usage_enabled=vehicle.secondary_usage_enabled,
-        total_service_records=service_count or 0,
-        total_fuel_records=fuel_count or 0,
-        total_odometer_records=odometer_count or 0,
-        total_maintenance_items=maintenance_count or 0,
-        total_documents=document_count or 0,
-        total_notes=note_count or 0,
+        total_service_records=aggregates.service_count,
+        total_fuel_records=aggregates.fuel_count,
+        total_odometer_records=aggregates.odometer_count,
+        total_maintenance_items=aggregates.maintenance_count,
+        total_documents=aggregates.document_count,
+        total_notes=aggregates.note_count,
         total_photos=photo_count or 0,
-        latest_service_date=latest_service,
-        latest_fuel_date=latest_fuel,
-        latest_odometer_km=latest_odometer_km,
-        latest_odometer_date=latest_odometer_date,
-        upcoming_maintenance_count=upcoming_count or 0,
-        overdue_maintenance_count=overdue_count or 0,
+        latest_service_date=aggregates.latest_service_date,
+        latest_fuel_date=aggregates.latest_fuel_date,
+        latest_odometer_km=aggregates.latest_odometer_km,
+        latest_odometer_date=aggregates.latest_odometer_date,
+        upcoming_maintenance_count=aggregates.upcoming_count,
+        overdue_maintenance_count=aggregates.overdue_count,
         average_l_per_100km=average_l_per_100km,
         recent_l_per_100km=recent_l_per_100km,
         archived_at=vehicle.archived_at,
@@ -409,11 +403,6 @@ async def get_dashboard(
         )
         owned_vehicles = owned_result.scalars().all()
 
-        # Get stats for owned vehicles
-        for vehicle in owned_vehicles:
-            stats = await calculate_vehicle_stats(db, vehicle)
-            vehicle_stats.append(stats)
-
         # Get shared vehicles
         shared_result = await db.execute(
             select(VehicleShare, Vehicle, User)
@@ -427,11 +416,21 @@ async def get_dashboard(
         )
         shared_rows = shared_result.all()
 
+        # One set of grouped queries for every visible vehicle
+        aggregates = await load_vehicle_aggregates(
+            db,
+            [v.vin for v in owned_vehicles] + [vehicle.vin for _, vehicle, _ in shared_rows],
+        )
+
+        # Get stats for owned vehicles
+        for vehicle in owned_vehicles:
+            vehicle_stats.append(calculate_vehicle_stats(vehicle, aggregates[vehicle.vin]))
+
         # Get stats for shared vehicles
         for share, vehicle, owner in shared_rows:
-            stats = await calculate_vehicle_stats(
-                db,
+            stats = calculate_vehicle_stats(
                 vehicle,
+                aggregates[vehicle.vin],
                 is_shared_with_me=True,
                 shared_by_username=owner.username,
                 share_permission=share.permission,
@@ -449,10 +448,10 @@ async def get_dashboard(
         )
         vehicles = result.scalars().all()
 
-        # Calculate statistics for each vehicle
+        # Calculate statistics for each vehicle from one set of grouped queries
+        aggregates = await load_vehicle_aggregates(db, [v.vin for v in vehicles])
         for vehicle in vehicles:
-            stats = await calculate_vehicle_stats(db, vehicle)
-            vehicle_stats.append(stats)
+            vehicle_stats.append(calculate_vehicle_stats(vehicle, aggregates[vehicle.vin]))
 
     # Calculate garage-wide totals
     total_service = sum(v.total_service_records for v in vehicle_stats)
@@ -464,11 +463,8 @@ async def get_dashboard(
 
     fleet_health = await calculate_fleet_health(db, vehicle_stats)
 
-    multi_user_enabled = False
-    setting_result = await db.execute(select(Setting).where(Setting.key == "multi_user_enabled"))
-    setting = setting_result.scalar_one_or_none()
-    if setting is not None and str(setting.value).lower() in {"1", "true", "yes", "on"}:
-        multi_user_enabled = True
+    multi_user_value = await SettingsService.get_value(db, "multi_user_enabled")
+    multi_user_enabled = multi_user_value.lower() in {"1", "true", "yes", "on"}
 
     return DashboardResponse(
         total_vehicles=len(vehicle_stats),
@@ -19,7 +19,7 @@ from app.schemas.document import (
     DocumentResponse,
     DocumentUpdate,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
 from app.services.file_upload_service import DOCUMENT_UPLOAD_CONFIG, FileUploadService
 from app.utils.logging_utils import sanitize_for_log, sanitize_path_for_log
 
@@ -58,7 +58,7 @@ async def list_documents(
 ) -> DocumentListResponse:
     """List all documents for a vehicle."""
     # Verify vehicle exists and user has access
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Get documents
     result = await db.execute(
@@ -84,7 +84,7 @@ async def upload_document(
 ) -> DocumentResponse:
     """Upload a new document for a vehicle."""
     # Verify vehicle exists and user has write access
-    _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Upload using shared service
     upload_result = await FileUploadService.upload_file(
@@ -120,7 +120,7 @@ async def update_document(
 ) -> DocumentResponse:
     """Update document metadata."""
     # Verify vehicle exists and user has write access
-    _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Get document
     result = await db.execute(
@@ -154,7 +154,7 @@ async def delete_document(
     """Delete a document."""
     try:
         # Verify vehicle exists and user has write access
-        _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Get document
         result = await db.execute(
@@ -198,7 +198,7 @@ async def download_document(
 ) -> FileResponse:
     """Download a document file."""
     # Verify vehicle exists and user has access
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Get document
     result = await db.execute(
@@ -32,7 +32,7 @@ from app.schemas.fuel import (
     FuelRecordUpdate,
     ObcSuggestionResponse,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
 from app.services.fuel_service import FuelRecordService, build_fuel_response
 from app.services.receipt_parse_service import parse_receipt_draft
 
@@ -110,7 +110,7 @@ async def parse_fuel_receipt(
     a ``text`` form field. Returns draft fields only — never writes FuelRecord.
     """
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     if text is not None and len(text) > MAX_RECEIPT_TEXT_CHARS:
         raise HTTPException(
@@ -171,7 +171,7 @@ async def obc_suggestion(
     the button entirely.
     """
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     cutoff = at - OBC_SUGGESTION_WINDOW
     result = await db.execute(
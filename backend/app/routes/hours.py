@@ -16,8 +16,9 @@ from app.schemas.hours import (
     HoursRecordResponse,
     HoursRecordUpdate,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
 from app.services.hours_service import latest_engine_hours_and_date
+from app.utils.cache import invalidate_cache_for_vehicle
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -49,7 +50,7 @@ async def list_hours_records(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db)
+        await check_vehicle_access(vin, current_user, db)
 
         # Get hours records
         result = await db.execute(
@@ -109,7 +110,7 @@ async def get_hours_record(
     """
     vin = vin.upper().strip()
 
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     result = await db.execute(
         select(HoursRecord).where(HoursRecord.id == record_id).where(HoursRecord.vin == vin)
@@ -152,7 +153,7 @@ async def create_hours_record(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Create hours record
         record_dict = record_data.model_dump()
@@ -161,6 +162,7 @@ async def create_hours_record(
 
         db.add(record)
         await db.commit()
+        await invalidate_cache_for_vehicle(vin)
         await db.refresh(record)
 
         logger.info("Created hours record %s for %s", record.id, sanitize_for_log(vin))
@@ -215,7 +217,7 @@ async def update_hours_record(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Get existing record
         result = await db.execute(
@@ -232,6 +234,7 @@ async def update_hours_record(
             setattr(record, field, value)
 
         await db.commit()
+        await invalidate_cache_for_vehicle(vin)
         await db.refresh(record)
 
         logger.info("Updated hours record %s for %s", record_id, sanitize_for_log(vin))
@@ -281,7 +284,7 @@ async def delete_hours_record(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Check if record exists
         result = await db.execute(
@@ -297,6 +300,7 @@ async def delete_hours_record(
             delete(HoursRecord).where(HoursRecord.id == record_id).where(HoursRecord.vin == vin)
         )
         await db.commit()
+        await invalidate_cache_for_vehicle(vin)
 
         logger.info("Deleted hours record %s for %s", record_id, sanitize_for_log(vin))
 
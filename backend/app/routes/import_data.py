@@ -44,7 +44,7 @@ from app.models import (
 )
 from app.models.user import User
 from app.models.vendor import Vendor
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, get_vehicle_or_403, require_auth
 from app.services.fuel_side_effects import (
     apply_fuel_record_side_effects,
     invalidate_cache_for_vehicle,
@@ -255,7 +255,7 @@ async def import_service_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import service records from CSV file (creates ServiceVisit + ServiceLineItem)."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -354,6 +354,7 @@ async def import_service_csv(
             import_result.add_error(row_num, "Invalid service record data")
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
 
     return import_result.to_dict()
 
@@ -369,7 +370,7 @@ async def import_fuel_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import fuel records from CSV file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # No DEF fill-level column is parsed from fuel CSV rows today, so there
     # is nothing to gate here yet. If one is ever added, gate it the same
@@ -487,6 +488,7 @@ async def import_fuel_csv(
             import_result.add_error(row_num, "Invalid fuel record data")
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
 
     return import_result.to_dict()
 
@@ -571,6 +573,7 @@ async def import_def_csv(
             import_result.add_error(row_num, "Invalid DEF record data")
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
 
     return import_result.to_dict()
 
@@ -586,7 +589,7 @@ async def import_odometer_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import odometer records from CSV file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -637,6 +640,7 @@ async def import_odometer_csv(
             import_result.add_error(row_num, "Invalid record data")
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
 
     return import_result.to_dict()
 
@@ -664,7 +668,7 @@ async def import_hours_csv(
     a fuel/service row in the *target* vehicle's tables, so re-establishing
     sync provenance on import would be fabricated.
     """
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -718,6 +722,7 @@ async def import_hours_csv(
             import_result.add_error(row_num, "Invalid hours record data")
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
 
     return import_result.to_dict()
 
@@ -733,7 +738,7 @@ async def import_warranties_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import warranties from CSV file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -804,7 +809,7 @@ async def import_insurance_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import insurance records from CSV file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -872,7 +877,7 @@ async def import_tax_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import tax records from CSV file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -937,7 +942,7 @@ async def import_notes_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Import notes from CSV file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Validate and parse CSV
     csv_data = await validate_csv_upload(file)
@@ -983,7 +988,7 @@ async def import_vehicle_json(
     current_user: User | None = Depends(require_auth),
 ):
     """Import complete vehicle data from JSON file."""
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Check file size BEFORE reading into memory to prevent DoS
     max_import_size = 50 * 1024 * 1024  # 50MB max for import files
@@ -1310,6 +1315,7 @@ async def import_vehicle_json(
             results["errors"].append(f"Note {idx}: could not be imported")
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
 
     metric_keys = (
         "service_records",
@@ -1436,7 +1442,7 @@ async def import_external_fuel_csv(
             detail="Unrecognized CSV format — pass format=fuelio|drivvo|tesla",
         )
     # Re-wrap for the shared helper (it re-reads the upload); parse inline instead.
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     parsed = PARSERS[fmt](csv_data, _parse_options(odometer_unit, decimal_separator))
     return await _persist_parsed_fuel(vin, parsed, skip_duplicates, db)
 
@@ -1484,7 +1490,7 @@ async def _import_third_party_fuel(
 ):
     from app.services.import_adapters import PARSERS
 
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     csv_data = await validate_csv_upload(file)
     parsed = PARSERS[format_name](csv_data, opts)
     return await _persist_parsed_fuel(vin, parsed, skip_duplicates, db)
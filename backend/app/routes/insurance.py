@@ -9,13 +9,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from app.schemas.insurance import (
+    InsuranceParseJob,
     InsurancePolicy,
     InsurancePolicyCreate,
     InsurancePolicyUpdate,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
-from app.services.document_ocr import document_ocr_service
+from app.services.auth import check_vehicle_access, require_auth
+from app.services.document_ocr import build_insurance_parse_response, document_ocr_service
 from app.services.insurance_service import InsuranceService
+from app.services.ocr_jobs import KIND_INSURANCE, ocr_job_runner
 from app.utils.logging_utils import sanitize_for_log
 
 router = APIRouter(prefix="/api", tags=["Insurance"])
@@ -83,6 +85,31 @@ async def delete_insurance_policy(
     return None
 
 
+async def _read_insurance_upload(file: UploadFile) -> bytes:
+    """Validate an uploaded insurance document's type and size and read it."""
+    # Validate file type - now supports images too
+    allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png"}
+    file_ext = (
+        "." + file.filename.lower().split(".")[-1] if file.filename and "." in file.filename else ""
+    )
+    if file_ext not in allowed_extensions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File must be PDF or image (jpg, png). Got: {file_ext}",
+        )
+
+    # Check file size BEFORE reading into memory to prevent DoS
+    max_size = 25 * 1024 * 1024
+    file.file.seek(0, 2)  # Seek to end
+    file_size = file.file.tell()
+    file.file.seek(0)  # Seek back to beginning
+
+    if file_size > max_size:
+        raise HTTPException(status_code=400, detail="File size exceeds 25MB limit")
+
+    return await file.read()
+
+
 @router.post("/vehicles/{vin}/insurance/parse-pdf")
 async def parse_insurance_pdf(
     vin: str,
@@ -105,30 +132,9 @@ async def parse_insurance_pdf(
     User can review and edit before creating the policy.
     """
     # Dry-run OCR parse: persists nothing, so read access is sufficient.
-    await get_vehicle_or_403(vin, current_user, db)  # tripwire: read-only
+    await check_vehicle_access(vin, current_user, db)  # tripwire: read-only
 
-    # Validate file type - now supports images too
-    allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png"}
-    file_ext = (
-        "." + file.filename.lower().split(".")[-1] if file.filename and "." in file.filename else ""
-    )
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File must be PDF or image (jpg, png). Got: {file_ext}",
-        )
-
-    # Check file size BEFORE reading into memory to prevent DoS
-    max_size = 25 * 1024 * 1024
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Seek back to beginning
-
-    if file_size > max_size:
-        raise HTTPException(status_code=400, detail="File size exceeds 25MB limit")
-
-    # Read file content
-    contents = await file.read()
+    contents = await _read_insurance_upload(file)
 
     try:
         # Parse using unified document OCR service
@@ -144,47 +150,7 @@ async def parse_insurance_pdf(
             provider_hint=provider,
         )
 
-        if not parsed_data.get("success"):
-            raise ValueError(parsed_data.get("error", "Failed to extract data"))
-
-        # Sanitize validation warnings to prevent stack trace exposure
-        # Only include safe, user-friendly warning messages
-        raw_warnings = parsed_data.get("validation_warnings", [])
-        safe_warnings = []
-        for warning in raw_warnings:
-            # Filter out any warnings that look like stack traces or internal errors
-            warning_str = str(warning)
-            if not any(
-                indicator in warning_str.lower()
-                for indicator in ["traceback", "exception", "error:", "line ", "file "]
-            ):
-                safe_warnings.append(warning_str)
-
-        # Format response (maintaining backward compatibility)
-        response = {
-            "success": True,
-            "data": {
-                "provider": parsed_data.get("provider"),
-                "policy_number": parsed_data.get("policy_number"),
-                "policy_type": parsed_data.get("policy_type"),
-                "start_date": parsed_data.get("start_date"),
-                "end_date": parsed_data.get("end_date"),
-                "premium_amount": parsed_data.get("premium_amount"),
-                "premium_frequency": parsed_data.get("premium_frequency"),
-                "deductible": parsed_data.get("deductible"),
-                "coverage_limits": parsed_data.get("coverage_limits"),
-                "notes": parsed_data.get("notes"),
-            },
-            "confidence": parsed_data.get("field_confidence", {}),
-            "confidence_score": parsed_data.get("confidence_score", 0),
-            "parser_used": parsed_data.get("parser_name"),
-            "vehicles_found": parsed_data.get("vehicles_found", []),
-            "warnings": safe_warnings,
-        }
-
-        # Add warning if target VIN not found
-        if vin.upper() not in [v.upper() for v in parsed_data.get("vehicles_found", [])]:
-            safe_warnings.append(f"VIN {vin} not found in PDF - using policy-level data")
+        response = build_insurance_parse_response(parsed_data, vin)
 
         logger.info(
             "Successfully parsed document using %s - found %d vehicles, confidence: %.0f%%",
@@ -202,6 +168,51 @@ async def parse_insurance_pdf(
         raise HTTPException(status_code=500, detail="Error reading uploaded document")
 
 
+@router.post(
+    "/vehicles/{vin}/insurance/parse-jobs", response_model=InsuranceParseJob, status_code=202
+)
+async def create_insurance_parse_job(
+    vin: str,
+    file: UploadFile = File(...),
+    provider: str | None = Query(None, description="Optional provider hint"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User | None = Depends(require_auth),
+):
+    """
+    Parse an insurance document in the background.
+
+    Returns a job at once; poll ``GET /api/insurance/parse-jobs/{job_id}``
+    until its status is ``done`` (``result`` is the parse-pdf response) or
+    ``failed``. Submitting the same document again returns the same job.
+    """
+    # Dry-run OCR parse: persists no vehicle data, so read access is sufficient.
+    await check_vehicle_access(vin, current_user, db)  # tripwire: read-only
+
+    contents = await _read_insurance_upload(file)
+    return await ocr_job_runner.submit_insurance_parse(
+        db,
+        user_id=current_user.id if current_user else None,
+        vin=vin,
+        contents=contents,
+        provider_hint=provider,
+    )
+
+
+@router.get("/insurance/parse-jobs/{job_id}", response_model=InsuranceParseJob)
+async def get_insurance_parse_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User | None = Depends(require_auth),
+):
+    """Get the status (and, once done, the result) of a background parse."""
+    job = await ocr_job_runner.get_job(
+        db, job_id, current_user.id if current_user else None, KIND_INSURANCE
+    )
+    if job is None:
+        raise HTTPException(status_code=404, detail="Parse job not found")
+    return job
+
+
 @router.get("/insurance/parsers")
 async def list_insurance_parsers(
     current_user: User | None = Depends(require_auth),
@@ -227,7 +238,7 @@ async def test_parse_insurance_pdf(
     Useful for troubleshooting parsing issues.
     """
     # Dry-run OCR parse: persists nothing, so read access is sufficient.
-    await get_vehicle_or_403(vin, current_user, db)  # tripwire: read-only
+    await check_vehicle_access(vin, current_user, db)  # tripwire: read-only
 
     # Validate file
     allowed_extensions = {".pdf", ".jpg", ".jpeg", ".png"}
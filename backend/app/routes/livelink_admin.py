@@ -15,6 +15,7 @@ from app.schemas.livelink import (
     DeviceCommandResponse,
     DeviceFirmwareStatus,
     FirmwareInfoResponse,
+    LatestBufferStatusResponse,
     LiveLinkDeviceListResponse,
     LiveLinkDeviceResponse,
     LiveLinkDeviceUpdate,
@@ -40,8 +41,10 @@ from app.services.auth import (
 from app.services.dtc_service import DTCService
 from app.services.firmware_service import FirmwareService
 from app.services.livelink_service import LiveLinkService
+from app.services.parameter_registry import parameter_registry
 from app.services.sd_backfill_service import SdBackfillService
 from app.services.settings_service import SettingsService
+from app.services.telemetry_latest_buffer import latest_buffer
 from app.services.telemetry_service import TelemetryService
 from app.utils.request_scheme import get_external_base_url
 
@@ -78,17 +81,12 @@ async def get_livelink_settings(
     service = LiveLinkService(db)
 
     # Check if global token exists
-    token_hash = await SettingsService.get(db, "livelink_global_token_hash")
-    has_global_token = bool(token_hash and token_hash.value)
+    has_global_token = bool(await SettingsService.get_value(db, "livelink_global_token_hash"))
 
     # Build ingestion URL. Absolute — a dongle is configured with this by
     # copy-paste and cannot resolve a relative path (#129).
-    configured = await SettingsService.get(db, "app_base_url")
-    base_url = (
-        configured.value.strip().rstrip("/")
-        if configured and configured.value and configured.value.strip()
-        else get_external_base_url(request)
-    )
+    configured = (await SettingsService.get_value(db, "app_base_url")).strip()
+    base_url = configured.rstrip("/") if configured else get_external_base_url(request)
     ingestion_url = f"{base_url}/api/v1/livelink/ingest"
 
     return LiveLinkSettingsResponse(
@@ -507,6 +505,7 @@ async def update_parameter(
         param.storage_interval_seconds = updates.storage_interval_seconds
 
     await db.commit()
+    parameter_registry.invalidate()
     await db.refresh(param)
 
     return LiveLinkParameterResponse.model_validate(param)
@@ -841,6 +840,26 @@ async def test_mqtt_connection(
         )
 
 
+# =============================================================================
+# Telemetry Buffer Monitoring
+# =============================================================================
+
+
+@router.get("/telemetry/buffer", response_model=LatestBufferStatusResponse)
+async def get_latest_buffer_status(
+    current_user: User | None = Depends(get_current_admin_user),
+):
+    """
+    Get the latest-value write-behind buffer status.
+
+    Reports dirty (unflushed) entry count and flush lag for monitoring.
+
+    **Security:**
+    - Requires authentication
+    """
+    return LatestBufferStatusResponse(**latest_buffer.status)
+
+
 # =============================================================================
 # SD-Card Backfill Endpoints (admin-only)
 # =============================================================================
@@ -915,7 +934,4 @@ async def _get_device_for_owner_or_404(db: AsyncSession, device_id: str, current
 
 async def _get_bool_setting(db: AsyncSession, key: str, default: bool = False) -> bool:
     """Get a boolean setting value."""
-    setting = await SettingsService.get(db, key)
-    if not setting or not setting.value:
-        return default
-    return setting.value.lower() in ("true", "1", "yes")
+    return await SettingsService.get_bool(db, key, default)
@@ -4,7 +4,10 @@ import csv
 import io
 import json
 import logging
-from datetime import datetime
+import math
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
@@ -16,6 +19,7 @@ from app.models.livelink_device import LiveLinkDevice
 from app.models.user import User
 from app.models.vehicle import Vehicle
 from app.schemas.drive_session import (
+    DriveSessionColumnarDetailResponse,
     DriveSessionDetailResponse,
     DriveSessionListResponse,
     DriveSessionResponse,
@@ -28,6 +32,9 @@ from app.schemas.dtc import (
     VehicleDTCUpdate,
 )
 from app.schemas.telemetry import (
+    TelemetryBucketDataPoint,
+    TelemetryColumnarResponse,
+    TelemetryDataPoint,
     TelemetryLatestValue,
     TelemetryQueryResponse,
     TelemetrySeriesResponse,
@@ -43,6 +50,7 @@ from app.schemas.torque import (
     TorqueSourceListResponse,
     TorqueSourceResponse,
     TripListResponse,
+    TripPointsColumnarResponse,
     TripPointsResponse,
     TripSummary,
 )
@@ -50,10 +58,12 @@ from app.services.auth import get_vehicle_for_owner_or_403, get_vehicle_or_403,
 from app.services.dtc_service import DTCService
 from app.services.livelink_service import LiveLinkService
 from app.services.location_service import LocationService
+from app.services.parameter_registry import ParameterDefinition
 from app.services.session_service import SessionService
 from app.services.settings_service import SettingsService
-from app.services.telemetry_service import TelemetryService
+from app.services.telemetry_service import TelemetryBucket, TelemetryService
 from app.services.torque_service import TorqueService
+from app.utils.columnar import SERIES_FORMATS, ColumnarJSONResponse, epoch_ms
 from app.utils.csv_safe import sanitize_csv_row
 from app.utils.datetime_utils import utc_now
 from app.utils.request_scheme import get_external_base_url
@@ -75,9 +85,9 @@ async def _integration_base_url(request: Request, db: AsyncSession) -> str:
     back to the WiCAN ingest endpoint and got 405 (that one is POST-only;
     Torque sends GET).
     """
-    configured = await SettingsService.get(db, "app_base_url")
-    if configured and configured.value and configured.value.strip():
-        return configured.value.strip().rstrip("/")
+    configured = (await SettingsService.get_value(db, "app_base_url")).strip()
+    if configured:
+        return configured.rstrip("/")
     return get_external_base_url(request)
 
 
@@ -137,7 +147,7 @@ async def get_vehicle_livelink_status(
 
     # Get latest telemetry values
     latest_values = await telemetry_service.get_latest_values(vin)
-    all_params = await telemetry_service.get_all_parameters()
+    all_params = await telemetry_service.get_parameter_definitions()
 
     # Build latest values with thresholds
     latest_with_thresholds = []
@@ -204,19 +214,133 @@ async def get_vehicle_livelink_status(
 # =============================================================================
 
 
-@router.get("/telemetry", response_model=TelemetryQueryResponse)
+# Upper bound on points per parameter for downsampled queries
+MAX_TELEMETRY_POINTS = 5000
+
+
+@dataclass
+class _SeriesColumns:
+    """One parameter's series as parallel lists, before it is rendered."""
+
+    timestamps: list[datetime] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)
+    # Per-bucket extremes (downsampled series only)
+    mins: list[float] | None = None
+    maxs: list[float] | None = None
+    min_value: float | None = None
+    max_value: float | None = None
+    avg_value: float | None = None
+
+
+def _raw_columns(series: _SeriesColumns) -> _SeriesColumns:
+    values = series.values
+    if values:
+        series.min_value = min(values)
+        series.max_value = max(values)
+        series.avg_value = sum(values) / len(values)
+    return series
+
+
+def _bucket_columns(buckets: list[TelemetryBucket]) -> _SeriesColumns:
+    samples = sum(b.sample_count for b in buckets)
+    return _SeriesColumns(
+        timestamps=[b.timestamp for b in buckets],
+        values=[b.avg_value for b in buckets],
+        mins=[b.min_value for b in buckets],
+        maxs=[b.max_value for b in buckets],
+        min_value=min(b.min_value for b in buckets),
+        max_value=max(b.max_value for b in buckets),
+        avg_value=sum(b.avg_value * b.sample_count for b in buckets) / samples,
+    )
+
+
+def _columnar_series(
+    columns_by_key: dict[str, _SeriesColumns], all_params: dict[str, ParameterDefinition]
+) -> list[dict]:
+    """Series as parallel arrays: epoch-ms ``t`` and value ``v`` (plus bucket ``min``/``max``)."""
+    series = []
+    for param_key, columns in columns_by_key.items():
+        param = all_params.get(param_key)
+        series.append(
+            {
+                "param_key": param_key,
+                "display_name": param.display_name if param else param_key,
+                "unit": param.unit if param else None,
+                "t": [epoch_ms(ts) for ts in columns.timestamps],
+                "v": columns.values,
+                "min": columns.mins,
+                "max": columns.maxs,
+                "min_value": columns.min_value,
+                "max_value": columns.max_value,
+                "avg_value": columns.avg_value,
+            }
+        )
+    return series
+
+
+def _point_series(
+    columns_by_key: dict[str, _SeriesColumns], all_params: dict[str, ParameterDefinition]
+) -> list[TelemetrySeriesResponse]:
+    series = []
+    for param_key, columns in columns_by_key.items():
+        param = all_params.get(param_key)
+        if columns.mins is None or columns.maxs is None:
+            data = [
+                TelemetryDataPoint(timestamp=ts, value=value)
+                for ts, value in zip(columns.timestamps, columns.values, strict=True)
+            ]
+        else:
+            data = [
+                TelemetryBucketDataPoint(timestamp=ts, value=value, min_value=low, max_value=high)
+                for ts, value, low, high in zip(
+                    columns.timestamps, columns.values, columns.mins, columns.maxs, strict=True
+                )
+            ]
+        series.append(
+            TelemetrySeriesResponse(
+                param_key=param_key,
+                display_name=param.display_name if param else param_key,
+                unit=param.unit if param else None,
+                data=data,
+                min_value=columns.min_value,
+                max_value=columns.max_value,
+                avg_value=columns.avg_value,
+            )
+        )
+    return series
+
+
+def _check_series_format(format: str) -> str:
+    format = format.lower()
+    if format not in SERIES_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be points or columnar")
+    return format
+
+
+@router.get("/telemetry", response_model=TelemetryQueryResponse | TelemetryColumnarResponse)
 async def get_vehicle_telemetry(
     vin: str,
     start: datetime = Query(..., description="Start of time range"),
     end: datetime = Query(..., description="End of time range"),
     param_keys: str | None = Query(None, description="Comma-separated parameter keys"),
     limit: int = Query(10000, ge=1, le=100000, description="Max data points per parameter"),
+    max_points: int | None = Query(
+        None, ge=10, le=MAX_TELEMETRY_POINTS, description="Downsample to about this many points"
+    ),
+    interval_seconds: int | None = Query(None, ge=1, description="Downsampling bucket width"),
+    format: str = Query("points", description="points or columnar (parallel arrays)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth),
 ):
     """
     Get historical telemetry data for a vehicle.
 
+    With ``max_points`` or ``interval_seconds`` the readings are bucketed in
+    the database (avg/min/max per bucket) instead of returned raw. Ranges
+    starting before the raw retention window (whose raw readings have been
+    pruned) are always served from the daily summaries, one bucket per day or
+    wider.
+
     **Path Parameters:**
     - **vin**: Vehicle VIN
 
@@ -224,13 +348,19 @@ async def get_vehicle_telemetry(
     - **start**: Start timestamp (required)
     - **end**: End timestamp (required)
     - **param_keys**: Comma-separated list of parameter keys (optional, all if not specified)
-    - **limit**: Maximum data points per parameter (default 10000)
+    - **limit**: Maximum raw data points (default 10000)
+    - **max_points**: Downsample to about this many points per parameter
+    - **interval_seconds**: Downsample to buckets of this width (the wider of
+      this and the ``max_points`` width wins)
+    - **format**: 'points' (one object per point, default) or 'columnar'
+      (per series: epoch-ms ``t`` and value ``v`` arrays)
 
     **Security:**
     - Requires authentication
     """
     await verify_vehicle_access(db, vin, current_user)
     vin = vin.upper().strip()
+    format = _check_series_format(format)
 
     telemetry_service = TelemetryService(db)
 
@@ -239,50 +369,68 @@ async def get_vehicle_telemetry(
     if param_keys:
         keys_list = [k.strip() for k in param_keys.split(",") if k.strip()]
 
-    # Query telemetry
-    telemetry_data = await telemetry_service.get_telemetry_range(
-        vin=vin,
-        start=start,
-        end=end,
-        param_keys=keys_list,
-        limit=limit,
-    )
-
-    # Group by param_key and calculate stats
-    all_params = await telemetry_service.get_all_parameters()
-    series_by_key: dict[str, list] = {}
-
-    for point in telemetry_data:
-        if point.param_key not in series_by_key:
-            series_by_key[point.param_key] = []
-        series_by_key[point.param_key].append({"timestamp": point.timestamp, "value": point.value})
-
-    # Build response series
-    series = []
-    total_points = 0
-    for param_key, data_points in series_by_key.items():
-        param = all_params.get(param_key)
-        values = [p["value"] for p in data_points]
-
-        series.append(
-            TelemetrySeriesResponse(
-                param_key=param_key,
-                display_name=param.display_name if param else param_key,
-                unit=param.unit if param else None,
-                data=data_points,
-                min_value=min(values) if values else None,
-                max_value=max(values) if values else None,
-                avg_value=sum(values) / len(values) if values else None,
-            )
+    span_seconds = max((end - start).total_seconds(), 1.0)
+    retention_days = await LiveLinkService(db).get_retention_days()
+    start_utc = start.astimezone(UTC).replace(tzinfo=None) if start.tzinfo else start
+    daily = start_utc < utc_now() - timedelta(days=retention_days)
+    columns_by_key: dict[str, _SeriesColumns] = {}
+    if daily or max_points or interval_seconds:
+        bucket_seconds: int | None = max(
+            interval_seconds or 1,
+            math.ceil(span_seconds / (max_points or MAX_TELEMETRY_POINTS)),
+        )
+        if daily:
+            # Whole days: daily summaries cannot be split
+            bucket_seconds = math.ceil(bucket_seconds / 86400) * 86400
+        buckets_by_key = await telemetry_service.get_bucketed_series(
+            vin, start, end, bucket_seconds, param_keys=keys_list, daily=daily
+        )
+        for param_key, buckets in buckets_by_key.items():
+            columns_by_key[param_key] = _bucket_columns(buckets)
+        resolution = "daily" if daily else "bucketed"
+    else:
+        bucket_seconds = None
+        resolution = "raw"
+        remaining = limit
+        async for page in telemetry_service.iter_telemetry_range(
+            vin=vin, start=start, end=end, param_keys=keys_list
+        ):
+            for row in page[:remaining]:
+                columns = columns_by_key.get(row.param_key)
+                if columns is None:
+                    columns = columns_by_key[row.param_key] = _SeriesColumns()
+                columns.timestamps.append(row.timestamp)
+                columns.values.append(row.value)
+            remaining -= len(page)
+            if remaining <= 0:
+                break
+        for columns in columns_by_key.values():
+            _raw_columns(columns)
+
+    all_params = await telemetry_service.get_parameter_definitions()
+    total_points = sum(len(columns.values) for columns in columns_by_key.values())
+
+    if format == "columnar":
+        return ColumnarJSONResponse(
+            {
+                "vin": vin,
+                "start": start,
+                "end": end,
+                "series": _columnar_series(columns_by_key, all_params),
+                "total_points": total_points,
+                "resolution": resolution,
+                "bucket_seconds": bucket_seconds,
+            }
         )
-        total_points += len(data_points)
 
     return TelemetryQueryResponse(
         vin=vin,
         start=start,
         end=end,
-        series=series,
+        series=_point_series(columns_by_key, all_params),
         total_points=total_points,
+        resolution=resolution,
+        bucket_seconds=bucket_seconds,
     )
 
 
@@ -336,10 +484,14 @@ async def list_vehicle_sessions(
     )
 
 
-@router.get("/sessions/{session_id}", response_model=DriveSessionDetailResponse)
+@router.get(
+    "/sessions/{session_id}",
+    response_model=DriveSessionDetailResponse | DriveSessionColumnarDetailResponse,
+)
 async def get_session_detail(
     vin: str,
     session_id: int,
+    format: str = Query("points", description="points or columnar (adds telemetry series)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth),
 ):
@@ -350,11 +502,17 @@ async def get_session_detail(
     - **vin**: Vehicle VIN
     - **session_id**: Session ID
 
+    **Query Parameters:**
+    - **format**: 'points' (default) or 'columnar', which adds the session's
+      telemetry as columnar series, bucketed to at most a few thousand points
+      per parameter
+
     **Security:**
     - Requires authentication
     """
     await verify_vehicle_access(db, vin, current_user)
     vin = vin.upper().strip()
+    format = _check_series_format(format)
 
     session_service = SessionService(db)
     session = await session_service.get_session(session_id)
@@ -370,17 +528,11 @@ async def get_session_detail(
 
     # Get parameters recorded during session
     if session.started_at and session.ended_at:
-        telemetry_data = await telemetry_service.get_telemetry_range(
-            vin=vin,
-            start=session.started_at,
-            end=session.ended_at,
-            limit=1,  # Just need to know what params exist
+        parameters_recorded = await telemetry_service.get_param_keys_in_range(
+            vin, session.started_at, session.ended_at
         )
-        parameters_recorded = list({t.param_key for t in telemetry_data})
-        data_points_count = len(
-            await telemetry_service.get_telemetry_range(
-                vin=vin, start=session.started_at, end=session.ended_at
-            )
+        data_points_count = await telemetry_service.count_telemetry_range(
+            vin, session.started_at, session.ended_at
         )
     else:
         parameters_recorded = []
@@ -391,7 +543,7 @@ async def get_session_detail(
     dtcs_appeared = []
     dtcs_cleared = []
 
-    return DriveSessionDetailResponse(
+    detail = DriveSessionDetailResponse(
         id=session.id,
         vin=session.vin,
         device_id=session.device_id,
@@ -417,6 +569,24 @@ async def get_session_detail(
         dtcs_appeared=dtcs_appeared,
         dtcs_cleared=dtcs_cleared,
     )
+    if format == "points":
+        return detail
+
+    series: list[dict] = []
+    bucket_seconds = None
+    if session.started_at and session.ended_at and data_points_count:
+        span_seconds = max((session.ended_at - session.started_at).total_seconds(), 1.0)
+        bucket_seconds = math.ceil(span_seconds / MAX_TELEMETRY_POINTS)
+        buckets_by_key = await telemetry_service.get_bucketed_series(
+            vin, session.started_at, session.ended_at, bucket_seconds
+        )
+        series = _columnar_series(
+            {key: _bucket_columns(buckets) for key, buckets in buckets_by_key.items()},
+            await telemetry_service.get_parameter_definitions(),
+        )
+    return ColumnarJSONResponse(
+        {**detail.model_dump(mode="json"), "series": series, "bucket_seconds": bucket_seconds}
+    )
 
 
 # =============================================================================
@@ -589,23 +759,46 @@ async def clear_dtc(
 # =============================================================================
 
 
+_EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _csv_chunk(rows: list[list]) -> str:
+    """Render rows as one CSV text chunk."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerows(rows)
+    return output.getvalue()
+
+
 @router.get("/export/telemetry")
 async def export_telemetry(
     vin: str,
     start: datetime = Query(..., description="Start of export range"),
     end: datetime = Query(..., description="End of export range"),
-    format: str = Query("csv", description="Export format: csv or json"),
+    format: str = Query("csv", description="Export format: csv, json or ndjson"),
+    layout: str = Query(
+        "long", description="CSV layout: long (one row per value) or wide (one column per param)"
+    ),
     param_keys: str | None = Query(None, description="Comma-separated parameter keys"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth),
 ):
     """
-    Export telemetry data as CSV or JSON.
+    Export telemetry data as CSV, JSON or NDJSON.
+
+    Rows are read in keyset-paginated pages and written to the response as
+    they are fetched, so memory stays flat and the range is never truncated.
 
     **Query Parameters:**
     - **start**: Start timestamp
     - **end**: End timestamp
-    - **format**: 'csv' or 'json' (default csv)
+    - **format**: 'csv', 'json' or 'ndjson' (default csv)
+    - **layout**: 'long' or 'wide' (CSV only; wide has one row per timestamp
+      and one column per parameter)
     - **param_keys**: Comma-separated parameter keys (optional)
 
     **Security:**
@@ -614,54 +807,102 @@ async def export_telemetry(
     await verify_vehicle_access(db, vin, current_user)
     vin = vin.upper().strip()
 
+    format = format.lower()
+    layout = layout.lower()
+    if format not in _EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be csv, json or ndjson")
+    if layout not in ("long", "wide"):
+        raise HTTPException(status_code=400, detail="layout must be long or wide")
+    if layout == "wide" and format != "csv":
+        raise HTTPException(status_code=400, detail="The wide layout is only available for CSV")
+
     telemetry_service = TelemetryService(db)
 
     keys_list = None
     if param_keys:
-        keys_list = [k.strip() for k in param_keys.split(",") if k.strip()]
+        keys_list = list(dict.fromkeys(k.strip() for k in param_keys.split(",") if k.strip()))
 
-    telemetry_data = await telemetry_service.get_telemetry_range(
-        vin=vin,
-        start=start,
-        end=end,
-        param_keys=keys_list,
-        limit=100000,
+    pages = telemetry_service.iter_telemetry_range(
+        vin=vin, start=start, end=end, param_keys=keys_list
     )
 
-    if format.lower() == "json":
-        # JSON export
-        export_data = [
-            {
-                "timestamp": t.timestamp.isoformat(),
-                "param_key": t.param_key,
-                "value": t.value,
-            }
-            for t in telemetry_data
-        ]
-
-        return StreamingResponse(
-            iter([json.dumps(export_data, indent=2)]),
-            media_type="application/json",
-            headers={
-                "Content-Disposition": f"attachment; filename=telemetry_{vin}_{start.date()}_{end.date()}.json"
-            },
-        )
+    async def stream_json() -> AsyncIterator[str]:
+        first = True
+        yield "["
+        async for page in pages:
+            for row in page:
+                item = {
+                    "timestamp": row.timestamp.isoformat(),
+                    "param_key": row.param_key,
+                    "value": row.value,
+                }
+                yield ("\n" if first else ",\n") + json.dumps(item)
+                first = False
+        yield "\n]\n"
+
+    async def stream_ndjson() -> AsyncIterator[str]:
+        async for page in pages:
+            yield "".join(
+                json.dumps(
+                    {
+                        "timestamp": row.timestamp.isoformat(),
+                        "param_key": row.param_key,
+                        "value": row.value,
+                    }
+                )
+                + "\n"
+                for row in page
+            )
 
-    # CSV export
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["timestamp", "param_key", "value"])
+    async def stream_csv() -> AsyncIterator[str]:
+        yield _csv_chunk([["timestamp", "param_key", "value"]])
+        async for page in pages:
+            # param_key is device-supplied -> sanitize against CSV formula injection.
+            yield _csv_chunk(
+                [
+                    sanitize_csv_row([row.timestamp.isoformat(), row.param_key, row.value])
+                    for row in page
+                ]
+            )
 
-    for t in telemetry_data:
-        # param_key is device-supplied -> sanitize against CSV formula injection.
-        writer.writerow(sanitize_csv_row([t.timestamp.isoformat(), t.param_key, t.value]))
+    async def stream_wide_csv(columns: list[str]) -> AsyncIterator[str]:
+        position = {key: i for i, key in enumerate(columns)}
+        yield _csv_chunk([sanitize_csv_row(["timestamp", *columns])])
+        # Rows arrive ordered by timestamp, so one line is complete as soon as
+        # the next timestamp shows up
+        current: datetime | None = None
+        values: list = []
+        async for page in pages:
+            lines = []
+            for row in page:
+                if row.timestamp != current:
+                    if current is not None:
+                        lines.append([current.isoformat(), *values])
+                    current = row.timestamp
+                    values = [""] * len(columns)
+                # A key first recorded after the header was written has no column
+                column = position.get(row.param_key)
+                if column is not None:
+                    values[column] = row.value
+            yield _csv_chunk(lines)
+        if current is not None:
+            yield _csv_chunk([[current.isoformat(), *values]])
+
+    if format == "json":
+        body = stream_json()
+    elif format == "ndjson":
+        body = stream_ndjson()
+    elif layout == "wide":
+        columns = keys_list or await telemetry_service.get_param_keys_in_range(vin, start, end)
+        body = stream_wide_csv(columns)
+    else:
+        body = stream_csv()
 
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+        body,
+        media_type=_EXPORT_MEDIA_TYPES[format],
         headers={
-            "Content-Disposition": f"attachment; filename=telemetry_{vin}_{start.date()}_{end.date()}.csv"
+            "Content-Disposition": f"attachment; filename=telemetry_{vin}_{start.date()}_{end.date()}.{format}"
         },
     )
 
@@ -793,13 +1034,17 @@ async def get_trips(
     return TripListResponse(trips=[TripSummary(**t) for t in trips])
 
 
-@router.get("/trips/{session_id}/points", response_model=TripPointsResponse)
+@router.get(
+    "/trips/{session_id}/points",
+    response_model=TripPointsResponse | TripPointsColumnarResponse,
+)
 async def get_trip_points(
     vin: str,
     session_id: int,
+    format: str = Query("points", description="points or columnar (parallel arrays)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth),
-) -> TripPointsResponse:
+):
     """
     Get a trip's GPS points as an ordered polyline (for map rendering).
 
@@ -807,11 +1052,16 @@ async def get_trip_points(
     - **vin**: Vehicle VIN
     - **session_id**: Drive session ID
 
+    **Query Parameters:**
+    - **format**: 'points' (one object per point, default) or 'columnar'
+      (parallel arrays, epoch-ms timestamps)
+
     **Security:**
     - Requires authentication
     """
     await verify_vehicle_access(db, vin, current_user)
     vin = vin.upper().strip()
+    format = _check_series_format(format)
 
     session_service = SessionService(db)
     session = await session_service.get_session(session_id)
@@ -823,6 +1073,20 @@ async def get_trip_points(
         raise HTTPException(status_code=404, detail="Session does not belong to this vehicle")
 
     points = await LocationService(db).get_trip_points(vin, session_id)
+    if format == "columnar":
+        return ColumnarJSONResponse(
+            {
+                "session_id": session_id,
+                "id": [p.id for p in points],
+                "t": [epoch_ms(p.timestamp) for p in points],
+                "latitude": [float(p.latitude) for p in points],
+                "longitude": [float(p.longitude) for p in points],
+                "speed": [float(p.speed) if p.speed is not None else None for p in points],
+                "heading": [float(p.heading) if p.heading is not None else None for p in points],
+                "altitude": [float(p.altitude) if p.altitude is not None else None for p in points],
+            }
+        )
+
     return TripPointsResponse(
         session_id=session_id,
         points=[
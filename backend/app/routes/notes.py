@@ -15,7 +15,7 @@ from app.schemas.note import (
     NoteResponse,
     NoteUpdate,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
 
 router = APIRouter(prefix="/api/vehicles", tags=["notes"])
 
@@ -28,7 +28,7 @@ async def list_notes(
 ) -> NoteListResponse:
     """List all notes for a vehicle."""
     # Verify vehicle exists and user has access
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Get notes sorted by date descending (newest first)
     result = await db.execute(select(Note).where(Note.vin == vin).order_by(Note.date.desc()))
@@ -49,7 +49,7 @@ async def create_note(
 ) -> NoteResponse:
     """Create a new note for a vehicle."""
     # Verify vehicle exists and user has write access
-    _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Create note
     note = Note(
@@ -75,7 +75,7 @@ async def get_note(
 ) -> NoteResponse:
     """Get a specific note."""
     # Verify vehicle exists and user has access
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     result = await db.execute(select(Note).where(Note.id == note_id, Note.vin == vin))
     note = result.scalar_one_or_none()
@@ -95,7 +95,7 @@ async def update_note(
 ) -> NoteResponse:
     """Update a note."""
     # Verify vehicle exists and user has write access
-    _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Get note
     result = await db.execute(select(Note).where(Note.id == note_id, Note.vin == vin))
@@ -126,7 +126,7 @@ async def delete_note(
 ) -> None:
     """Delete a note."""
     # Verify vehicle exists and user has write access
-    _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Get note
     result = await db.execute(select(Note).where(Note.id == note_id, Note.vin == vin))
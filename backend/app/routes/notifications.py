@@ -19,8 +19,7 @@ router = APIRouter(prefix="/api/notifications", tags=["Notifications"])
 
 async def _get_setting(db: AsyncSession, key: str, default: str = "") -> str:
     """Get a setting value."""
-    setting = await SettingsService.get(db, key)
-    return setting.value if setting and setting.value else default
+    return await SettingsService.get_value(db, key, default)
 
 
 async def _get_setting_bool(db: AsyncSession, key: str, default: bool = False) -> bool:
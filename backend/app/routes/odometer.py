@@ -16,7 +16,8 @@ from app.schemas.odometer import (
     OdometerRecordResponse,
     OdometerRecordUpdate,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
+from app.utils.cache import invalidate_cache_for_vehicle
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -48,7 +49,7 @@ async def list_odometer_records(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db)
+        await check_vehicle_access(vin, current_user, db)
 
         # Get odometer records
         result = await db.execute(
@@ -114,7 +115,7 @@ async def get_odometer_record(
     """
     vin = vin.upper().strip()
 
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     result = await db.execute(
         select(OdometerRecord)
@@ -155,7 +156,7 @@ async def create_odometer_record(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Create odometer record
         record_dict = record_data.model_dump()
@@ -164,6 +165,7 @@ async def create_odometer_record(
 
         db.add(record)
         await db.commit()
+        await invalidate_cache_for_vehicle(vin)
         await db.refresh(record)
 
         logger.info("Created odometer record %s for %s", record.id, sanitize_for_log(vin))
@@ -218,7 +220,7 @@ async def update_odometer_record(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Get existing record
         result = await db.execute(
@@ -237,6 +239,7 @@ async def update_odometer_record(
             setattr(record, field, value)
 
         await db.commit()
+        await invalidate_cache_for_vehicle(vin)
         await db.refresh(record)
 
         logger.info("Updated odometer record %s for %s", record_id, sanitize_for_log(vin))
@@ -286,7 +289,7 @@ async def delete_odometer_record(
     vin = vin.upper().strip()
 
     try:
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Check if record exists
         result = await db.execute(
@@ -306,6 +309,7 @@ async def delete_odometer_record(
             .where(OdometerRecord.vin == vin)
         )
         await db.commit()
+        await invalidate_cache_for_vehicle(vin)
 
         logger.info("Deleted odometer record %s for %s", record_id, sanitize_for_log(vin))
 
@@ -1,10 +1,12 @@
 """Vehicle photo management API endpoints."""
 
+import asyncio
 import logging
 from pathlib import Path
+from typing import Literal
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import FileResponse, Response
 from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,8 +16,9 @@ from app.database import get_db
 from app.models.photo import VehiclePhoto
 from app.models.user import User
 from app.schemas.photo import PhotoUpdate
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, get_vehicle_or_403, require_auth
 from app.services.file_upload_service import PHOTO_UPLOAD_CONFIG, FileUploadService
+from app.services.image_pipeline import content_hash, pick_variant, release_derivatives
 from app.services.photo_service import PhotoService
 from app.utils.logging_utils import sanitize_for_log
 from app.utils.path_validation import sanitize_filename, validate_path_within_base
@@ -26,6 +29,34 @@ router = APIRouter(prefix="/api/vehicles", tags=["Photos"])
 
 PHOTO_DIR = settings.photos_dir
 
+# `private` because access is auth-gated (don't let CF cache for other users).
+# Photos are user-uploaded immutables — the filename includes the upload
+# token (derivatives: the content hash), so a URL identifies one file forever.
+PHOTO_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def _cached_file_response(
+    request: Request,
+    path: Path,
+    etag: str | None = None,
+    media_type: str | None = None,
+    vary_accept: bool = False,
+) -> Response:
+    """Serve an immutable photo file, answering a matching If-None-Match with 304."""
+    if etag is None:
+        stat = path.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"Cache-Control": PHOTO_CACHE_CONTROL, "ETag": etag}
+    if vary_accept:
+        headers["Vary"] = "Accept"
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
 
 @router.post("/{vin}/photos", status_code=201)
 async def upload_vehicle_photo(
@@ -64,25 +95,21 @@ async def upload_vehicle_photo(
         # Child-record write -> write-share required (D-4).
         vehicle = await get_vehicle_or_403(vin, current_user, db, require_write=True)
 
-        # Upload using shared service
-        upload_result = await FileUploadService.upload_file(
-            file, PHOTO_UPLOAD_CONFIG, subdirectory=vin
-        )
-
-        # Create database record
-        relative_photo_path = str(upload_result.file_path.relative_to(settings.photos_dir))
-        relative_thumb_path = None
-        if upload_result.thumbnail_path:
-            relative_thumb_path = str(upload_result.thumbnail_path.relative_to(settings.photos_dir))
+        contents = await FileUploadService.validate_upload(file, PHOTO_UPLOAD_CONFIG)
+        digest = await asyncio.to_thread(content_hash, contents)
 
+        # Every upload is its own photo; identical bytes share derivatives
+        relative_photo_path, relative_thumb_path = await PhotoService.save_upload(
+            contents, digest, vin, file.filename
+        )
         photo_record = VehiclePhoto(
             vin=vin,
             file_path=relative_photo_path,
             thumbnail_path=relative_thumb_path,
+            content_hash=digest,
             is_main=set_as_main,
             caption=(caption.strip() if caption else None),
         )
-
         db.add(photo_record)
         await db.flush()
 
@@ -93,7 +120,7 @@ async def upload_vehicle_photo(
                 .where(VehiclePhoto.vin == vin, VehiclePhoto.id != photo_record.id)
                 .values(is_main=False)
             )
-            vehicle.main_photo = relative_photo_path
+            vehicle.main_photo = photo_record.file_path
 
         await db.commit()
         await db.refresh(photo_record)
@@ -138,12 +165,20 @@ async def upload_vehicle_photo(
 async def get_vehicle_photo(
     vin: str,
     filename: str,
+    request: Request,
+    size: Literal["sm", "md", "lg"] | None = Query(
+        None, description="Resized rendition (480/1280/2048 px); the original if omitted"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth),
 ):
     """
     Get a vehicle photo by filename.
 
+    With ``size``, serves the rendered derivative in the best format the
+    client accepts (AVIF, WebP, else JPEG). Photos without derivatives yet
+    fall back to the original. Supports ``If-None-Match`` revalidation.
+
     **Security:**
     - Users can only view photos for their own vehicles
     - Admin users can view photos for all vehicles
@@ -158,7 +193,7 @@ async def get_vehicle_photo(
     safe_filename = sanitize_filename(filename)
 
     # Check vehicle ownership (raises 403 if unauthorized)
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Get photo path
     file_path = PHOTO_DIR / vin / safe_filename
@@ -167,22 +202,34 @@ async def get_vehicle_photo(
     if file_path.suffix.lower() not in settings.allowed_photo_extensions:
         raise HTTPException(status_code=400, detail="Invalid file type")
 
+    if size is not None:
+        digest = await db.scalar(
+            select(VehiclePhoto.content_hash).where(
+                VehiclePhoto.vin == vin, VehiclePhoto.file_path == f"{vin}/{safe_filename}"
+            )
+        )
+        variant = pick_variant(digest, size, request.headers.get("accept", "")) if digest else None
+        if variant is not None:
+            variant_path, media_type = variant
+            return _cached_file_response(
+                request,
+                variant_path,
+                etag=f'"{digest}-{variant_path.name}"',
+                media_type=media_type,
+                vary_accept=True,
+            )
+
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Photo not found")
 
-    # `private` because access is auth-gated (don't let CF cache for other users).
-    # Photos are user-uploaded immutables — the filename includes the upload
-    # token, so the URL identifies a single concrete file forever.
-    return FileResponse(
-        file_path,
-        headers={"Cache-Control": "private, max-age=31536000, immutable"},
-    )
+    return _cached_file_response(request, file_path)
 
 
 @router.get("/{vin}/photos/thumbnails/{filename}")
 async def get_vehicle_thumbnail(
     vin: str,
     filename: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_auth),
 ):
@@ -203,16 +250,13 @@ async def get_vehicle_thumbnail(
     safe_filename = sanitize_filename(filename)
 
     # Check vehicle ownership (raises 403 if unauthorized)
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     thumb_path = PHOTO_DIR / vin / "thumbnails" / safe_filename
     if not thumb_path.exists():
         raise HTTPException(status_code=404, detail="Thumbnail not found")
 
-    return FileResponse(
-        thumb_path,
-        headers={"Cache-Control": "private, max-age=31536000, immutable"},
-    )
+    return _cached_file_response(request, thumb_path)
 
 
 @router.get("/{vin}/photos")
@@ -231,7 +275,7 @@ async def list_vehicle_photos(
     vin = vin.upper().strip()
 
     # Check vehicle ownership (raises 403 if unauthorized)
-    _ = await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Note: Legacy photo hydration now runs via migration 014_hydrate_legacy_photos.py
     # No need to hydrate on every request
@@ -325,6 +369,10 @@ async def delete_vehicle_photo(
             await db.execute(delete(VehiclePhoto).where(VehiclePhoto.id == photo_record.id))
         await db.commit()
 
+        # Derivatives are shared by content hash; drop them with the last user
+        if photo_record:
+            await release_derivatives(db, photo_record.content_hash)
+
         logger.info(
             "Deleted photo for %s: %s",
             sanitize_for_log(vin),
@@ -10,7 +10,7 @@ from app.models.user import User
 from app.schemas.reminder import ReminderCreate, ReminderResponse, ReminderUpdate
 from app.schemas.reminder_pack import ApplyReminderPackRequest, ReminderPackSummary
 from app.services import reminder_pack_service, reminder_service
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ async def list_reminders(
 ):
     """List reminders for a vehicle, optionally filtered by status."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
     return await reminder_service.list_reminders(vin, db, status)
 
 
@@ -48,7 +48,7 @@ async def create_reminder(
 ):
     """Create a new reminder for a vehicle."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     reminder = await reminder_service.create_reminder(vin, data, db)
     await db.commit()
     await db.refresh(reminder)
@@ -64,7 +64,7 @@ async def apply_reminder_pack(
 ):
     """Apply a built-in reminder pack to a vehicle (creates pending reminders)."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     created = await reminder_pack_service.apply_pack(vin, body.pack_id, db)
     await db.commit()
     return created
@@ -80,7 +80,7 @@ async def update_reminder(
 ):
     """Update a reminder (content only — use /done or /dismiss for status)."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     reminder = await reminder_service._get_reminder_or_404(reminder_id, vin, db)
     await reminder_service.update_reminder(reminder, data, db)
     await db.commit()
@@ -97,7 +97,7 @@ async def delete_reminder(
 ):
     """Delete a reminder."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     reminder = await reminder_service._get_reminder_or_404(reminder_id, vin, db)
     await db.delete(reminder)
     await db.commit()
@@ -113,7 +113,7 @@ async def mark_done(
 ):
     """Mark a reminder as done."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     reminder = await reminder_service._get_reminder_or_404(reminder_id, vin, db)
     reminder.status = "done"
     await db.commit()
@@ -130,7 +130,7 @@ async def dismiss(
 ):
     """Mark a reminder as dismissed."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
     reminder = await reminder_service._get_reminder_or_404(reminder_id, vin, db)
     reminder.status = "dismissed"
     await db.commit()
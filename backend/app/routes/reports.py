@@ -15,7 +15,7 @@ from app.models import (
 )
 from app.models.service_visit import ServiceVisit
 from app.models.user import User
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, get_vehicle_or_403, require_auth
 from app.services.service_visit_service import service_visit_cost_load_options
 from app.utils.csv_safe import sanitize_csv_row
 from app.utils.pdf_generator import PDFReportGenerator
@@ -286,7 +286,7 @@ async def download_service_history_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Export service history to CSV."""
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Parse dates
     start_dt = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else None
@@ -356,7 +356,7 @@ async def download_all_records_csv(
     current_user: User | None = Depends(require_auth),
 ):
     """Export all maintenance records to CSV."""
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Create CSV
     output = StringIO()
@@ -17,6 +17,9 @@ from app.models.settings import Setting
 from app.models.user import User
 from app.models.vehicle import Vehicle
 from app.schemas.settings import (
+    AnalyticsCacheStatsResponse,
+    PasswordHashingStatsResponse,
+    ScheduledJobStatsResponse,
     SettingCreate,
     SettingResponse,
     SettingsBatchUpdate,
@@ -26,8 +29,10 @@ from app.schemas.settings import (
 )
 from app.services.auth import get_current_admin_user
 from app.services.oidc import MASKED_SECRET_PLACEHOLDER, display_mask_secret
+from app.services.password_hashing import password_pool
 from app.services.settings_init import SENSITIVE_SETTING_KEYS
 from app.services.settings_service import SettingsService
+from app.utils.cache import cache
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -691,3 +696,29 @@ async def get_system_info(
         database_size_mb=database_size_mb,
         uptime_seconds=round(uptime_seconds, 0),
     )
+
+
+@router.get("/system/cache", response_model=AnalyticsCacheStatsResponse)
+async def get_analytics_cache_stats(
+    current_user: User | None = Depends(get_current_admin_user),
+):
+    """Get analytics cache hit/miss/eviction statistics (admin only)."""
+    return AnalyticsCacheStatsResponse(**cache.get_stats())
+
+
+@router.get("/system/password-hashing", response_model=PasswordHashingStatsResponse)
+async def get_password_hashing_stats(
+    current_user: User | None = Depends(get_current_admin_user),
+):
+    """Get running, queued and rejected password hash counts (admin only)."""
+    return PasswordHashingStatsResponse(**password_pool.stats)
+
+
+@router.get("/system/jobs", response_model=ScheduledJobStatsResponse)
+async def get_scheduled_job_stats(
+    current_user: User | None = Depends(get_current_admin_user),
+):
+    """Get the duration and row counts of each sweep's latest run (admin only)."""
+    from app.tasks.scheduled import job_stats
+
+    return ScheduledJobStatsResponse(jobs=job_stats)
@@ -15,7 +15,8 @@ from app.schemas.spot_rental_billing import (
     SpotRentalBillingResponse,
     SpotRentalBillingUpdate,
 )
-from app.services.auth import get_vehicle_or_403, require_auth
+from app.services.auth import check_vehicle_access, require_auth
+from app.utils.cache import invalidate_cache_for_vehicle
 
 router = APIRouter(prefix="/api/vehicles", tags=["spot-rental-billings"])
 
@@ -32,7 +33,7 @@ async def list_billings(
 ) -> SpotRentalBillingListResponse:
     """List all billing entries for a spot rental."""
     # Gate vehicle access first (read is sufficient for listing).
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     # Verify spot rental exists and belongs to this vehicle
     result = await db.execute(
@@ -71,7 +72,7 @@ async def create_billing(
 ) -> SpotRentalBillingResponse:
     """Create a new billing entry for a spot rental."""
     # Creating a billing entry is a child-record write -> write-share required.
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Verify spot rental exists and belongs to this vehicle
     result = await db.execute(
@@ -102,6 +103,7 @@ async def create_billing(
 
     db.add(billing)
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
     await db.refresh(billing)
 
     return SpotRentalBillingResponse.model_validate(billing)
@@ -121,7 +123,7 @@ async def update_billing(
 ) -> SpotRentalBillingResponse:
     """Update a billing entry."""
     # Updating a billing entry is a child-record write -> write-share required.
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Verify billing exists and belongs to the right rental
     result = await db.execute(
@@ -143,6 +145,7 @@ async def update_billing(
         setattr(billing, field, value)
 
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
     await db.refresh(billing)
 
     return SpotRentalBillingResponse.model_validate(billing)
@@ -161,7 +164,7 @@ async def delete_billing(
 ) -> None:
     """Delete a billing entry."""
     # Deleting a billing entry is a child-record write -> write-share required.
-    await get_vehicle_or_403(vin, current_user, db, require_write=True)
+    await check_vehicle_access(vin, current_user, db, require_write=True)
 
     # Verify billing exists and belongs to the right rental
     result = await db.execute(
@@ -179,3 +182,4 @@ async def delete_billing(
 
     await db.delete(billing)
     await db.commit()
+    await invalidate_cache_for_vehicle(vin)
@@ -30,6 +30,7 @@ from app.schemas.vehicle import (
     VehicleUpdate,
 )
 from app.services.auth import (
+    check_vehicle_access,
     get_vehicle_for_owner_or_403,
     get_vehicle_or_403,
     require_auth,
@@ -284,7 +285,7 @@ async def get_vehicle_detail_stats(
     Requires READ access to the vehicle (owner, admin, or a read/write share).
     Returns 404 if the vehicle does not exist, 403 if the caller lacks access.
     """
-    await get_vehicle_or_403(vin, current_user, db)  # 404/403 gate before any vin-filtered query
+    await check_vehicle_access(vin, current_user, db)  # 404/403 gate before any vin-filtered query
     return await _vehicle_detail_stats(db, vin)
 
 
@@ -395,7 +396,7 @@ async def get_trailer_details(
     vin = vin.upper().strip()
 
     # Check vehicle ownership first
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
 
     result = await db.execute(select(TrailerDetails).where(TrailerDetails.vin == vin))
     trailer = result.scalar_one_or_none()
@@ -424,7 +425,7 @@ async def create_trailer_details(
 
     try:
         # Child-record write -> write-share required (D-4).
-        _ = await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Check if trailer details already exist
         result = await db.execute(select(TrailerDetails).where(TrailerDetails.vin == vin))
@@ -488,7 +489,7 @@ async def update_trailer_details(
 
     try:
         # Child-record write -> write-share required (D-4).
-        await get_vehicle_or_403(vin, current_user, db, require_write=True)
+        await check_vehicle_access(vin, current_user, db, require_write=True)
 
         # Get existing trailer details
         result = await db.execute(select(TrailerDetails).where(TrailerDetails.vin == vin))
@@ -541,7 +542,7 @@ async def list_towed_trailers(
 ):
     """List trailer vehicles paired to this tow vehicle via TrailerDetails.tow_vehicle_vin."""
     vin = vin.upper().strip()
-    await get_vehicle_or_403(vin, current_user, db)
+    await check_vehicle_access(vin, current_user, db)
     result = await db.execute(
         select(Vehicle)
         .join(TrailerDetails, TrailerDetails.vin == Vehicle.vin)
@@ -67,8 +67,7 @@ async def require_webhook_token(db: AsyncSession, provided_token: str | None) ->
     endpoint wrapper runs, so a 401 raised from here would bypass the rate limit
     and leave the shared secret brute-forceable at full request rate.
     """
-    setting = await SettingsService.get(db, "webhook_ingest_token")
-    expected = (setting.value or "").strip() if setting else ""
+    expected = (await SettingsService.get_value(db, "webhook_ingest_token")).strip()
     if not expected:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -228,6 +227,7 @@ async def webhook_odometer(
     db.add(reading)
     await db.commit()
     await db.refresh(reading)
+    await invalidate_cache_for_vehicle(vehicle.vin)
     return {"id": reading.id, "vin": reading.vin, "odometer_km": str(reading.odometer_km)}
 
 
@@ -344,8 +344,7 @@ async def webhook_telegram(
     # unauthenticated caller cannot probe the instance's configuration.
     await require_webhook_token(db, request.headers.get("X-Webhook-Token"))
 
-    inbound = await SettingsService.get(db, "telegram_inbound_enabled")
-    if not inbound or (inbound.value or "").lower() != "true":
+    if (await SettingsService.get_value(db, "telegram_inbound_enabled")).lower() != "true":
         raise HTTPException(status_code=403, detail="Telegram inbound is disabled")
 
     message = update.message or {}
@@ -354,8 +353,7 @@ async def webhook_telegram(
     chat_id = chat.get("id")
 
     # Restrict to the configured notification chat when set.
-    chat_setting = await SettingsService.get(db, "telegram_chat_id")
-    configured_chat = (chat_setting.value or "").strip() if chat_setting else ""
+    configured_chat = (await SettingsService.get_value(db, "telegram_chat_id")).strip()
     if configured_chat and str(chat_id) != configured_chat:
         raise HTTPException(status_code=403, detail="Chat not authorized")
 
@@ -4,6 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.schemas.telemetry import TelemetryColumnarSeries
+
 # =============================================================================
 # Drive Session Schemas
 # =============================================================================
@@ -80,6 +82,15 @@ class DriveSessionDetailResponse(DriveSessionResponse):
     )
 
 
+class DriveSessionColumnarDetailResponse(DriveSessionDetailResponse):
+    """Session detail with the session's telemetry as columnar series (``format=columnar``)."""
+
+    series: list[TelemetryColumnarSeries] = Field(
+        default_factory=list, description="Session telemetry, bucketed per parameter"
+    )
+    bucket_seconds: int | None = Field(None, description="Bucket width of the series")
+
+
 # =============================================================================
 # Session Query Schemas
 # =============================================================================
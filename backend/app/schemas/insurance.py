@@ -52,3 +52,18 @@ class InsurancePolicy(InsurancePolicyBase):
 
     class Config:
         from_attributes = True
+
+
+class InsuranceParseJob(BaseModel):
+    """Background insurance document parse (poll until done or failed)."""
+
+    id: str
+    status: str = Field(..., description="queued, running, done or failed")
+    result: dict | None = Field(None, description="The parse-pdf response once done")
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
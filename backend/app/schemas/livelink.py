@@ -270,6 +270,24 @@ class MQTTStatusResponse(BaseModel):
     messages_processed: int = Field(0, description="Total messages processed since start")
 
 
+class LatestBufferStatusResponse(BaseModel):
+    """Schema for the latest-value write-behind buffer status."""
+
+    running: bool = Field(False, description="Whether the periodic flush task is running")
+    flush_interval_seconds: float = Field(..., description="Seconds between flushes")
+    tracked_vehicles: int = Field(0, description="Vehicles with values held in memory")
+    tracked_entries: int = Field(0, description="Latest values held in memory")
+    dirty_entries: int = Field(0, description="Values not yet written to the database")
+    flush_lag_seconds: float = Field(0.0, description="Age of the oldest unflushed value")
+    flushes: int = Field(0, description="Successful flushes since start")
+    rows_flushed: int = Field(0, description="Rows written since start")
+    flush_errors: int = Field(0, description="Failed flushes since start")
+    last_flush_at: datetime | None = Field(None, description="Time of the last successful flush")
+    last_flush_duration_ms: float | None = Field(
+        None, description="Duration of the last successful flush"
+    )
+
+
 class MQTTTestResult(BaseModel):
     """Schema for MQTT connection test result."""
 
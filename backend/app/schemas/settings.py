@@ -1,6 +1,7 @@
 """Settings Pydantic schemas for validation and serialization."""
 
 import datetime as dt
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -72,3 +73,32 @@ class SystemInfoResponse(BaseModel):
     total_vehicles: int
     database_size_mb: float
     uptime_seconds: float
+
+
+class PasswordHashingStatsResponse(BaseModel):
+    """Schema for password hashing pool statistics."""
+
+    running: int
+    queued: int
+    rejected: int
+
+
+class ScheduledJobStatsResponse(BaseModel):
+    """Schema for the latest run of each scheduled notification sweep."""
+
+    jobs: dict[str, dict[str, Any]]
+
+
+class AnalyticsCacheStatsResponse(BaseModel):
+    """Schema for analytics cache statistics."""
+
+    total_entries: int
+    active_entries: int
+    expired_entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    expirations: int
+    invalidations: int
@@ -58,13 +58,35 @@ class TelemetryDataPoint(BaseModel):
     value: float
 
 
+class TelemetryBucketDataPoint(TelemetryDataPoint):
+    """A downsampled point: bucket start, bucket average and bucket extremes."""
+
+    min_value: float = Field(..., description="Bucket minimum")
+    max_value: float = Field(..., description="Bucket maximum")
+
+
 class TelemetrySeriesResponse(BaseModel):
     """Schema for a single parameter's time series."""
 
     param_key: str
     display_name: str | None
     unit: str | None
-    data: list[TelemetryDataPoint]
+    data: list[TelemetryBucketDataPoint | TelemetryDataPoint]
+    min_value: float | None = Field(None, description="Minimum value in range")
+    max_value: float | None = Field(None, description="Maximum value in range")
+    avg_value: float | None = Field(None, description="Average value in range")
+
+
+class TelemetryColumnarSeries(BaseModel):
+    """A parameter's time series as parallel arrays (``format=columnar``)."""
+
+    param_key: str
+    display_name: str | None
+    unit: str | None
+    t: list[int] = Field(..., description="Timestamps, epoch milliseconds (UTC)")
+    v: list[float] = Field(..., description="Values (bucket averages when downsampled)")
+    min: list[float] | None = Field(None, description="Bucket minimums (downsampled only)")
+    max: list[float] | None = Field(None, description="Bucket maximums (downsampled only)")
     min_value: float | None = Field(None, description="Minimum value in range")
     max_value: float | None = Field(None, description="Maximum value in range")
     avg_value: float | None = Field(None, description="Average value in range")
@@ -88,6 +110,24 @@ class TelemetryQueryResponse(BaseModel):
     end: datetime
     series: list[TelemetrySeriesResponse]
     total_points: int = Field(0, description="Total data points returned")
+    resolution: str = Field(
+        "raw", description="raw, bucketed (raw readings) or daily (daily summaries)"
+    )
+    bucket_seconds: int | None = Field(None, description="Bucket width when downsampled")
+
+
+class TelemetryColumnarResponse(BaseModel):
+    """Schema for telemetry query response with columnar series."""
+
+    vin: str
+    start: datetime
+    end: datetime
+    series: list[TelemetryColumnarSeries]
+    total_points: int = Field(0, description="Total data points returned")
+    resolution: str = Field(
+        "raw", description="raw, bucketed (raw readings) or daily (daily summaries)"
+    )
+    bucket_seconds: int | None = Field(None, description="Bucket width when downsampled")
 
 
 # =============================================================================
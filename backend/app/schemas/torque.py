@@ -59,6 +59,22 @@ class TripPointsResponse(BaseModel):
     )
 
 
+class TripPointsColumnarResponse(BaseModel):
+    """Schema for GET .../livelink/trips/{session_id}/points?format=columnar.
+
+    The same points as ``TripPointsResponse``, as parallel arrays.
+    """
+
+    session_id: int = Field(..., description="Drive session ID")
+    id: list[int] = Field(default_factory=list, description="Location point IDs")
+    t: list[int] = Field(default_factory=list, description="Timestamps, epoch milliseconds (UTC)")
+    latitude: list[float] = Field(default_factory=list, description="Latitude (decimal degrees)")
+    longitude: list[float] = Field(default_factory=list, description="Longitude (decimal degrees)")
+    speed: list[float | None] = Field(default_factory=list, description="Speed (km/h)")
+    heading: list[float | None] = Field(default_factory=list, description="Heading (degrees)")
+    altitude: list[float | None] = Field(default_factory=list, description="Altitude (metres)")
+
+
 class LastLocationResponse(BaseModel):
     """Schema for GET .../livelink/location/last."""
 
@@ -11,6 +11,7 @@ from app.services.analytics_service.fuel import (
     calculate_hours_economy_with_pandas,
     calculate_propane_costs,
 )
+from app.services.analytics_service.garage import aggregate_garage_costs
 from app.services.analytics_service.patterns import (
     calculate_seasonal_patterns,
     calculate_vendor_analysis,
@@ -22,6 +23,7 @@ from app.services.analytics_service.trends import (
 )
 
 __all__ = [
+    "aggregate_garage_costs",
     "calculate_fuel_economy_with_pandas",
     "calculate_hours_economy_with_pandas",
     "calculate_monthly_aggregation",
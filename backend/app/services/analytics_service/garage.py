@@ -0,0 +1,163 @@
+"""Garage-wide cost aggregation in SQL.
+
+The garage analytics page used to eager-load every vehicle with its whole
+service, fuel, DEF, insurance and tax history and sum Decimals in Python.
+These queries return one row per vehicle and category and one row per day
+and cost type instead, so memory scales with the number of vehicles and
+dates rather than the number of records.
+
+A visit's cost is computed exactly like ``ServiceVisit.calculated_total_cost``:
+Σ line-item cost + Σ supply-usage cost snapshot + tax + shop supplies + misc
+fees. Visits without a service category count as Maintenance.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import DEFRecord, FuelRecord, ServiceVisit
+from app.models.insurance import InsurancePolicy
+from app.models.service_line_item import ServiceLineItem
+from app.models.supply import SupplyUsage
+from app.models.tax import TaxRecord
+
+CENT = Decimal("0.01")
+
+SERVICE_CATEGORIES = ("Maintenance", "Upgrades", "Inspection", "Collision", "Detailing")
+
+
+def _money(value: Any) -> Decimal:
+    """Normalize a SQL sum to a 2-place Decimal (SQLite sums come back as floats)."""
+    if value is None:
+        return Decimal("0.00")
+    return Decimal(str(value)).quantize(CENT)
+
+
+@dataclass
+class GarageCostAggregates:
+    """Summed costs for a set of vehicles."""
+
+    # vin -> category -> amount (Maintenance, Upgrades, ..., Fuel, DEF)
+    by_vehicle: dict[str, dict[str, Decimal]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(lambda: Decimal("0.00")))
+    )
+    # (year, month) -> {"service", "fuel", "def"} -> amount
+    by_month: dict[tuple[int, int], dict[str, Decimal]] = field(
+        default_factory=lambda: defaultdict(
+            lambda: {"service": Decimal("0.00"), "fuel": Decimal("0.00"), "def": Decimal("0.00")}
+        )
+    )
+    total_insurance: Decimal = Decimal("0.00")
+    total_taxes: Decimal = Decimal("0.00")
+
+
+def visit_costs(vins: list[str]):
+    """Subquery of (vin, date, category, cost) for every service visit of ``vins``."""
+    line_totals = (
+        select(
+            ServiceLineItem.visit_id.label("visit_id"),
+            func.sum(ServiceLineItem.cost).label("amount"),
+        )
+        .join(ServiceVisit, ServiceVisit.id == ServiceLineItem.visit_id)
+        .where(ServiceVisit.vin.in_(vins))
+        .group_by(ServiceLineItem.visit_id)
+        .subquery()
+    )
+    supply_totals = (
+        select(
+            ServiceLineItem.visit_id.label("visit_id"),
+            func.sum(SupplyUsage.cost_snapshot).label("amount"),
+        )
+        .join(SupplyUsage, SupplyUsage.service_line_item_id == ServiceLineItem.id)
+        .join(ServiceVisit, ServiceVisit.id == ServiceLineItem.visit_id)
+        .where(ServiceVisit.vin.in_(vins))
+        .group_by(ServiceLineItem.visit_id)
+        .subquery()
+    )
+    cost = (
+        func.coalesce(line_totals.c.amount, 0)
+        + func.coalesce(supply_totals.c.amount, 0)
+        + func.coalesce(ServiceVisit.tax_amount, 0)
+        + func.coalesce(ServiceVisit.shop_supplies, 0)
+        + func.coalesce(ServiceVisit.misc_fees, 0)
+    )
+    return (
+        select(
+            ServiceVisit.vin.label("vin"),
+            ServiceVisit.date.label("date"),
+            func.coalesce(ServiceVisit.service_category, "Maintenance").label("category"),
+            cost.label("cost"),
+        )
+        .outerjoin(line_totals, line_totals.c.visit_id == ServiceVisit.id)
+        .outerjoin(supply_totals, supply_totals.c.visit_id == ServiceVisit.id)
+        .where(ServiceVisit.vin.in_(vins))
+        .subquery()
+    )
+
+
+async def aggregate_garage_costs(db: AsyncSession, vins: list[str]) -> GarageCostAggregates:
+    """Sum service, fuel, DEF, insurance and tax costs for ``vins`` in SQL.
+
+    Runs three statements regardless of how many records the vehicles have:
+    per-vehicle sums by category, per-day sums by cost type (folded into
+    months), and the insurance/tax totals.
+    """
+    aggregates = GarageCostAggregates()
+    if not vins:
+        return aggregates
+
+    visits = visit_costs(vins)
+
+    # Per vehicle: service by category, fuel, DEF
+    per_vehicle = union_all(
+        select(visits.c.vin, visits.c.category, func.sum(visits.c.cost)).group_by(
+            visits.c.vin, visits.c.category
+        ),
+        select(FuelRecord.vin, literal("Fuel"), func.sum(FuelRecord.cost))
+        .where(FuelRecord.vin.in_(vins))
+        .group_by(FuelRecord.vin),
+        select(DEFRecord.vin, literal("DEF"), func.sum(DEFRecord.cost))
+        .where(DEFRecord.vin.in_(vins))
+        .group_by(DEFRecord.vin),
+    )
+    for vin, category, amount in (await db.execute(per_vehicle)).all():
+        if category not in SERVICE_CATEGORIES and category not in ("Fuel", "DEF"):
+            category = "Maintenance"
+        aggregates.by_vehicle[vin][category] += _money(amount)
+
+    # Per month: summed per day in SQL (Date-column grouping is identical on
+    # SQLite and PostgreSQL, no EXTRACT/strftime) and folded into months here.
+    # Only non-zero costs open a month, as the trend chart expects.
+    def _daily(kind: str, date_col, cost_col, where):
+        return (
+            select(literal(kind), date_col, func.sum(cost_col))
+            .where(*where, cost_col.isnot(None), cost_col != 0)
+            .group_by(date_col)
+        )
+
+    per_day = union_all(
+        _daily("service", visits.c.date, visits.c.cost, ()),
+        _daily("fuel", FuelRecord.date, FuelRecord.cost, (FuelRecord.vin.in_(vins),)),
+        _daily("def", DEFRecord.date, DEFRecord.cost, (DEFRecord.vin.in_(vins),)),
+    )
+    for kind, day, amount in (await db.execute(per_day)).all():
+        aggregates.by_month[(day.year, day.month)][kind] += _money(amount)
+
+    totals = (
+        await db.execute(
+            select(
+                select(func.sum(InsurancePolicy.premium_amount))
+                .where(InsurancePolicy.vin.in_(vins))
+                .scalar_subquery(),
+                select(func.sum(TaxRecord.amount)).where(TaxRecord.vin.in_(vins)).scalar_subquery(),
+            )
+        )
+    ).one()
+    aggregates.total_insurance = _money(totals[0])
+    aggregates.total_taxes = _money(totals[1])
+
+    return aggregates
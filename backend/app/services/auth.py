@@ -2,6 +2,8 @@
 
 # pyright: reportAssignmentType=false
 
+import secrets
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -17,9 +19,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
+from app.models.csrf_token import CSRFToken
 from app.models.user import User
 from app.models.vehicle import Vehicle
 from app.schemas.user import TokenData
+from app.services.password_hashing import PasswordHashingBusyError, password_pool
+from app.services.principal_cache import CachedPrincipal, principal_cache
+from app.utils.datetime_utils import utc_now
 
 # HTTP Bearer token
 security = HTTPBearer(auto_error=False)
@@ -105,6 +111,44 @@ def hash_password(password: str) -> str:
     return ph.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the bounded hashing pool, off the event loop.
+
+    Raises 503 when the pool is saturated.
+    """
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """``hash_password`` on the bounded hashing pool, off the event loop.
+
+    Raises 503 when the pool is saturated.
+    """
+    return await _run_hashing(hash_password, password)
+
+
+async def _run_hashing[T](fn: Callable[..., T], *args: str) -> T:
+    try:
+        return await password_pool.run(fn, *args)
+    except PasswordHashingBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in requests in progress, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+_jwt_key_cache: tuple[str, OctKey] | None = None
+
+
+def _jwt_key() -> OctKey:
+    """Return the JWT signing key, importing it only when the secret changes."""
+    global _jwt_key_cache
+    if _jwt_key_cache is None or _jwt_key_cache[0] != settings.secret_key:
+        _jwt_key_cache = (settings.secret_key, OctKey.import_key(settings.secret_key))
+    return _jwt_key_cache[1]
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -113,10 +157,10 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     else:
         expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
 
-    to_encode.update({"exp": expire, "iat": datetime.now(UTC)})
+    # jti identifies the login session (principal cache key)
+    to_encode.update({"exp": expire, "iat": datetime.now(UTC), "jti": secrets.token_hex(8)})
     header = {"alg": settings.algorithm}
-    key = OctKey.import_key(settings.secret_key)
-    return jwt.encode(header, to_encode, key)
+    return jwt.encode(header, to_encode, _jwt_key())
 
 
 async def get_current_user(
@@ -124,7 +168,20 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db),
     token: str | None = Depends(get_token_from_request),
 ) -> User:
-    """Get the current authenticated user from JWT token (cookie or header)."""
+    """Get the current authenticated user from JWT token (cookie or header).
+
+    Also runs the CSRF check that ``CSRFProtectionMiddleware`` deferred to
+    the request's dependencies.
+    """
+    user, principal = await _authenticate(request, db, token)
+    await _verify_csrf(request, db, user, principal)
+    return user
+
+
+async def _authenticate(
+    request: Request, db: AsyncSession, token: str | None
+) -> tuple[User, CachedPrincipal | None]:
+    """Resolve the token's user, from the principal cache when possible."""
     import logging
 
     logger = logging.getLogger(__name__)
@@ -144,8 +201,7 @@ async def get_current_user(
     logger.debug("Processing authentication token")
 
     try:
-        key = OctKey.import_key(settings.secret_key)
-        claims = jwt.decode(token, key).claims
+        claims = jwt.decode(token, _jwt_key()).claims
 
         # Explicitly validate expiration (defense-in-depth)
         exp = claims.get("exp")
@@ -174,11 +230,20 @@ async def get_current_user(
         logger.error("JWT decode error: %s", e)
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == token_data.user_id))
-    user = result.scalar_one_or_none()
+    # Tokens issued before jti was added are keyed by their issue time
+    jti = str(claims.get("jti") or f"iat:{claims.get('iat')}")
+    principal = principal_cache.get(token_data.user_id, jti)
+    if principal is not None:
+        user = principal.attach(db)
+    else:
+        generation = principal_cache.generation(token_data.user_id)
+        result = await db.execute(select(User).where(User.id == token_data.user_id))
+        user = result.scalar_one_or_none()
 
-    if user is None:
-        raise credentials_exception
+        if user is None:
+            raise credentials_exception
+
+        principal = principal_cache.put(jti, user, generation)
 
     if not user.is_active:
         raise HTTPException(
@@ -186,7 +251,49 @@ async def get_current_user(
             detail="User account is inactive",
         )
 
-    return user
+    return user, principal
+
+
+async def _verify_csrf(
+    request: Request, db: AsyncSession, user: User, principal: CachedPrincipal | None
+) -> None:
+    """Check the X-CSRF-Token of a state-changing request against ``user``.
+
+    The middleware only flags requests that need the check; it runs here so
+    it can use the request's session and the already-resolved user.
+    """
+    if not getattr(request.state, "csrf_required", False):
+        return
+    if getattr(request.state, "csrf_validated_user_id", None) == user.id:
+        return
+    if await get_auth_mode(db) == "none":
+        return
+
+    csrf_token = getattr(request.state, "csrf_token", None)
+    if not csrf_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="CSRF token missing. Include X-CSRF-Token header with your request.",
+        )
+
+    if principal is None or not principal.csrf_token_valid(csrf_token):
+        result = await db.execute(
+            select(CSRFToken.expires_at).where(
+                CSRFToken.token == csrf_token,
+                CSRFToken.user_id == user.id,
+                CSRFToken.expires_at > utc_now(),
+            )
+        )
+        expires_at = result.scalar_one_or_none()
+        if expires_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid or expired CSRF token. Please login again.",
+            )
+        if principal is not None:
+            principal.csrf_tokens[csrf_token] = expires_at
+
+    request.state.csrf_validated_user_id = user.id
 
 
 async def get_optional_user(
@@ -202,12 +309,15 @@ async def get_optional_user(
     if not token:
         return None
 
-    # Token provided - validate it using get_current_user
+    # Token provided - a bad token means anonymous, but a failed CSRF check
+    # still rejects the request
     try:
-        return await get_current_user(request, db, token)
+        user, principal = await _authenticate(request, db, token)
     except HTTPException:
         # Invalid token - return None instead of raising
         return None
+    await _verify_csrf(request, db, user, principal)
+    return user
 
 
 async def get_current_active_user(
@@ -272,13 +382,13 @@ async def authenticate_user(db: AsyncSession, username: str, password: str) -> U
         logger.warning("Password login attempted for OIDC-only user: %s", username)
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
 
     # Auto-migrate legacy bcrypt hashes to Argon2
     if not user.hashed_password.startswith("$argon2"):
         logger.info("Auto-migrating password hash to Argon2 for user: %s", username)
-        user.hashed_password = hash_password(password)
+        user.hashed_password = await hash_password_async(password)
         await db.commit()
 
     return user
@@ -298,23 +408,18 @@ async def get_current_user_optional(
         return None
 
     try:
-        return await get_current_user(request, db, token)
+        user, principal = await _authenticate(request, db, token)
     except HTTPException:
         return None
+    await _verify_csrf(request, db, user, principal)
+    return user
 
 
 async def get_auth_mode(db: AsyncSession) -> str:
-    """Get the current authentication mode from settings."""
-    from app.models.settings import Setting
-
-    result = await db.execute(select(Setting).where(Setting.key == "auth_mode"))
-    auth_mode_setting = result.scalar_one_or_none()
+    """Get the current authentication mode from settings (default 'local')."""
+    from app.services.settings_service import SettingsService
 
-    if auth_mode_setting and auth_mode_setting.value:
-        return auth_mode_setting.value.lower()
-
-    # Default to 'local' if not set
-    return "local"
+    return (await SettingsService.get_value(db, "auth_mode", "local")).lower()
 
 
 async def optional_auth(
@@ -337,9 +442,11 @@ async def optional_auth(
         return None
 
     try:
-        return await get_current_user(request, db, token)
+        user, principal = await _authenticate(request, db, token)
     except HTTPException:
         return None
+    await _verify_csrf(request, db, user, principal)
+    return user
 
 
 async def require_auth(
@@ -363,13 +470,17 @@ async def require_auth(
     return await get_current_user(request, db, token)
 
 
-async def get_vehicle_or_403(
+async def check_vehicle_access(
     vin: str,
     current_user: User | None,
     db: AsyncSession,
     require_write: bool = False,
-) -> Vehicle:
-    """Get vehicle if user has access (owner, admin, or shared), else raise 403.
+) -> None:
+    """Raise unless the user may access the vehicle (owner, admin, or shared).
+
+    Same decision as :func:`get_vehicle_or_403`, answered from the in-memory
+    ACL index without loading the vehicle; use it when the handler does not
+    need the ``Vehicle`` row.
 
     Args:
         vin: Vehicle VIN
@@ -377,55 +488,78 @@ async def get_vehicle_or_403(
         db: Database session
         require_write: If True, requires write permission for shared vehicles
 
-    Returns:
-        Vehicle object if user has access
-
     Raises:
         HTTPException 404: Vehicle not found
         HTTPException 403: User does not have access to this vehicle
     """
-    from app.models.vehicle import Vehicle
-    from app.models.vehicle_share import VehicleShare
+    from app.services.vehicle_acl import vehicle_acl
 
-    result = await db.execute(select(Vehicle).where(Vehicle.vin == vin))
-    vehicle = result.scalar_one_or_none()
+    acl = await vehicle_acl.get(db, vin)
 
-    if not vehicle:
+    if acl is None:
         raise HTTPException(status_code=404, detail="Vehicle not found")
 
     # If auth is disabled (auth_mode='none'), allow access to all vehicles
     if current_user is None:
-        return vehicle
+        return
 
     # Admin users can access all vehicles
     if current_user.is_admin:
-        return vehicle
+        return
 
     # Check if vehicle belongs to user (owner has full access)
-    if hasattr(vehicle, "user_id") and vehicle.user_id == current_user.id:
-        return vehicle
+    if acl.owner_id == current_user.id:
+        return
 
     # Check if user has share access
-    share_result = await db.execute(
-        select(VehicleShare).where(
-            VehicleShare.vehicle_vin == vin,
-            VehicleShare.user_id == current_user.id,
-        )
-    )
-    share = share_result.scalar_one_or_none()
+    permission = acl.shares.get(current_user.id)
 
-    if share:
+    if permission is not None:
         # User has share access
-        if require_write and share.permission != "write":
+        if require_write and permission != "write":
             raise HTTPException(
                 status_code=403,
                 detail="Write permission required for this action",
             )
-        return vehicle
+        return
 
     raise HTTPException(status_code=403, detail="Not authorized to access this vehicle")
 
 
+async def get_vehicle_or_403(
+    vin: str,
+    current_user: User | None,
+    db: AsyncSession,
+    require_write: bool = False,
+) -> Vehicle:
+    """Get vehicle if user has access (owner, admin, or shared), else raise 403.
+
+    The access decision comes from :func:`check_vehicle_access`; the vehicle
+    itself is loaded only once access is granted.
+
+    Args:
+        vin: Vehicle VIN
+        current_user: Current authenticated user (None if auth_mode='none')
+        db: Database session
+        require_write: If True, requires write permission for shared vehicles
+
+    Returns:
+        Vehicle object if user has access
+
+    Raises:
+        HTTPException 404: Vehicle not found
+        HTTPException 403: User does not have access to this vehicle
+    """
+    await check_vehicle_access(vin, current_user, db, require_write=require_write)
+
+    vehicle = await db.get(Vehicle, vin)
+
+    if not vehicle:
+        raise HTTPException(status_code=404, detail="Vehicle not found")
+
+    return vehicle
+
+
 async def get_vehicle_for_owner_or_403(
     vin: str,
     current_user: User | None,
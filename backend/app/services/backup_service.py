@@ -1,13 +1,25 @@
-"""Backup service for settings and full data backups."""
+"""Backup service for settings and full data backups.
 
+Full backups are written as manifests over a content-addressed blob store
+(see ``app.services.backup_store``); older ``.tar.gz`` full backups can still
+be listed, downloaded and restored.
+"""
+
+import asyncio
+import contextlib
 import json
 import logging
 import os
+import re
 import shutil
 import sqlite3
 import subprocess
 import tarfile
 import tempfile
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path, PurePosixPath
 from typing import Any
@@ -15,11 +27,40 @@ from urllib.parse import unquote, urlparse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings as app_settings
+from app.services.backup_store import (
+    BLOB_DIRNAME,
+    MANIFEST_SUFFIX,
+    MANIFEST_VERSION,
+    SNAPSHOT_SUFFIX,
+    SNAPSHOT_SUMMARY,
+    BackupProgress,
+    BlobStore,
+    ChunkPipe,
+    FileCloner,
+    exclusive_run,
+    import_bundle,
+    iter_bundle,
+    list_manifests,
+    read_manifest,
+    referenced_digests,
+    store_idle,
+    write_manifest,
+)
+from app.services.image_pipeline import STORE_DIRNAME
 from app.services.settings_service import SettingsService
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Staging directories of a restore in progress start with this
+_RESTORE_PREFIX = ".restore-"
+
+# Settings backups are parsed in memory once uploaded
+_MAX_SETTINGS_UPLOAD_BYTES = 100 * 1024 * 1024
+
 
 class BackupService:
     """Service for creating and managing backups."""
@@ -34,6 +75,8 @@ class BackupService:
         data_dir: Path,
         database_url: str | None = None,
         is_sqlite: bool = True,
+        workers: int | None = None,
+        compression_level: int | None = None,
     ):
         """Initialize backup service.
 
@@ -43,17 +86,30 @@ class BackupService:
             data_dir: Path to data directory containing photos, documents, etc.
             database_url: Database connection URL (needed for pg_dump)
             is_sqlite: Whether the database is SQLite
+            workers: Threads compressing new files (default ``backup_workers``)
+            compression_level: zstd level (default ``backup_compression_level``)
         """
         self.backup_dir = backup_dir
         self.database_path = database_path
         self.data_dir = data_dir
         self.database_url = database_url
         self.is_sqlite = is_sqlite
+        self.workers = max(1, workers or app_settings.backup_workers)
+        self.compression_level = compression_level or app_settings.backup_compression_level
 
     def ensure_backup_dir(self):
         """Ensure backup directory exists."""
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def blob_store(self) -> BlobStore:
+        """The content-addressed store shared by every full-backup manifest."""
+        return BlobStore(
+            self.backup_dir / BLOB_DIRNAME,
+            level=self.compression_level,
+            threads=self.workers,
+        )
+
     def _parse_pg_url(self) -> dict[str, str]:
         """Parse PostgreSQL connection parameters from the database URL.
 
@@ -230,6 +286,54 @@ class BackupService:
                         }
                     )
 
+                # Manifest backups: the size is the data the backup restores,
+                # most of which is shared with other manifests in the store
+                for manifest_path in list_manifests(self.backup_dir):
+                    stat = manifest_path.stat()
+                    try:
+                        summary = read_manifest(manifest_path).get("summary", {})
+                    except ValueError as e:
+                        logger.warning("Skipping unreadable manifest %s: %s", manifest_path.name, e)
+                        continue
+                    total_bytes = summary.get("total_bytes", 0)
+                    backups.append(
+                        {
+                            "filename": manifest_path.name,
+                            "type": "full",
+                            "format": "manifest",
+                            "size_mb": round(total_bytes / 1024 / 1024, 2),
+                            "size_bytes": total_bytes,
+                            "files": summary.get("files", 0),
+                            "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                            "is_safety": "safety" in manifest_path.name.lower(),
+                        }
+                    )
+
+                # Safety snapshots: files cloned from the live data, so most
+                # of their size is shared with it
+                for snapshot_dir in self.backup_dir.glob(f"mygarage-full-*{SNAPSHOT_SUFFIX}"):
+                    try:
+                        with open(snapshot_dir / SNAPSHOT_SUMMARY) as fh:
+                            summary = json.load(fh)
+                    except (OSError, ValueError) as e:
+                        logger.warning("Skipping unreadable snapshot %s: %s", snapshot_dir.name, e)
+                        continue
+                    total_bytes = summary.get("total_bytes", 0)
+                    backups.append(
+                        {
+                            "filename": snapshot_dir.name,
+                            "type": "full",
+                            "format": "snapshot",
+                            "size_mb": round(total_bytes / 1024 / 1024, 2),
+                            "size_bytes": total_bytes,
+                            "files": summary.get("files", 0),
+                            "created": datetime.fromtimestamp(
+                                snapshot_dir.stat().st_mtime
+                            ).isoformat(),
+                            "is_safety": "safety" in snapshot_dir.name.lower(),
+                        }
+                    )
+
         except Exception as e:
             logger.error("Error listing backup files: %s", e)
 
@@ -292,72 +396,359 @@ class BackupService:
     async def create_full_backup(self) -> dict[str, Any]:
         """Create a full backup including database and all uploaded files.
 
-        For SQLite: archives the .db, -wal, and -shm files.
-        For PostgreSQL: runs pg_dump and archives the dump file.
+        Writes a manifest over the blob store. For SQLite the database is a
+        consistent Online-Backup-API snapshot; for PostgreSQL a pg_dump.
+        Only files whose contents are not in the store yet are compressed.
+        The work runs in a worker thread; its progress is published through
+        ``backup_store.current_progress``.
 
         Returns:
             Metadata about created backup
+
+        Raises:
+            BackupInProgressError: If a backup or restore is already running
         """
         self.ensure_backup_dir()
 
-        # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        filename = f"mygarage-full-{timestamp}.tar.gz"
-        backup_path = self.backup_dir / filename
+        filename = f"mygarage-full-{timestamp}{MANIFEST_SUFFIX}"
+
+        def _run() -> dict[str, Any]:
+            with exclusive_run("backup", filename) as progress:
+                backup_info = self._write_manifest_backup(filename, progress)
+                self._prune_unreferenced_blobs()
+                return backup_info
+
+        return await asyncio.to_thread(_run)
+
+    def _write_manifest_backup(
+        self, filename: str, progress: BackupProgress, note: str | None = None
+    ) -> dict[str, Any]:
+        """Store the database and data files and write their manifest.
+
+        Files whose size and mtime match the newest manifest, and whose blob
+        is still stored, are referenced without being read. The caller holds
+        the store (``exclusive_run``).
+        """
+        store = self.blob_store
+        started = time.monotonic()
+        previous = self._previous_entries()
 
         logger.info("Creating full backup: %s", filename)
 
-        # Create tar.gz archive
-        with tarfile.open(backup_path, "w:gz") as tar:
+        progress.phase = "scanning"
+        files = list(self._iter_data_files())
+        progress.files_total += len(files)
+        progress.bytes_total += sum(st.st_size for _, _, st in files)
+
+        entries: list[dict[str, Any]] = []
+        progress.phase = "database"
+        with tempfile.TemporaryDirectory() as tmpdir:
             if self.is_sqlite and self.database_path:
-                # SQLite: archive a consistent Online-Backup-API snapshot, not
-                # the live file. The snapshot is self-contained, so no -wal or
-                # -shm members are needed (restore still accepts them from
-                # older archives).
+                # Same consistent-snapshot rule as tar backups: never the live
+                # file, and no -wal/-shm entries
+                db_name = "mygarage.db"
+                db_file: Path | None = Path(tmpdir) / db_name
                 if self.database_path.exists():
-                    with tempfile.TemporaryDirectory() as tmpdir:
-                        snapshot_path = Path(tmpdir) / "mygarage.db"
-                        self._snapshot_sqlite(snapshot_path)
-                        tar.add(snapshot_path, arcname="mygarage.db")
-                    logger.info("Added database snapshot to backup: %s", self.database_path)
+                    self._snapshot_sqlite(db_file)
+                else:
+                    db_file = None
             else:
-                # PostgreSQL: run pg_dump to temp file, add to archive
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    dump_path = Path(tmpdir) / "mygarage.pgdump"
-                    self._pg_dump(dump_path)
-                    tar.add(dump_path, arcname="mygarage.pgdump")
-                    logger.info("Added PostgreSQL dump to backup")
-
-            # Add photos directory if it exists
-            photos_dir = self.data_dir / "photos"
-            if photos_dir.exists() and any(photos_dir.iterdir()):
-                tar.add(photos_dir, arcname="photos")
-                logger.info("Added photos directory to backup")
-
-            # Add documents directory if it exists
-            documents_dir = self.data_dir / "documents"
-            if documents_dir.exists() and any(documents_dir.iterdir()):
-                tar.add(documents_dir, arcname="documents")
-                logger.info("Added documents directory to backup")
-
-            # Add attachments directory if it exists
-            attachments_dir = self.data_dir / "attachments"
-            if attachments_dir.exists() and any(attachments_dir.iterdir()):
-                tar.add(attachments_dir, arcname="attachments")
-                logger.info("Added attachments directory to backup")
-
-        logger.info("Created full backup: %s", filename)
-
-        # Get file stats
-        stat = backup_path.stat()
+                db_name = "mygarage.pgdump"
+                db_file = Path(tmpdir) / db_name
+                self._pg_dump(db_file)
+
+            if db_file is not None:
+                size = db_file.stat().st_size
+                progress.files_total += 1
+                progress.bytes_total += size
+                digest, written = store.store_file(db_file)
+                entries.append({"path": db_name, "sha256": digest, "size": size})
+                progress.advance(size, written)
+
+        def _store(item: tuple[str, Path, os.stat_result]) -> dict[str, Any] | None:
+            arcname, path, st = item
+            known = previous.get(arcname)
+            if (
+                known is not None
+                and known["size"] == st.st_size
+                and known.get("mtime_ns") == st.st_mtime_ns
+                and store.has(known["sha256"])
+            ):
+                digest, written = known["sha256"], 0
+            else:
+                try:
+                    digest, written = store.store_file(path)
+                except FileNotFoundError:
+                    # Deleted since the scan
+                    progress.advance(st.st_size)
+                    return None
+            progress.advance(st.st_size, written)
+            return {
+                "path": arcname,
+                "sha256": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
 
+        progress.phase = "files"
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backup") as pool:
+            entries.extend(entry for entry in pool.map(_store, files) if entry is not None)
+
+        progress.phase = "manifest"
+        summary = {
+            "files": len(entries),
+            "total_bytes": sum(entry["size"] for entry in entries),
+            "new_blobs": progress.new_blobs,
+            "new_blob_bytes": progress.bytes_written,
+            "duration_seconds": round(time.monotonic() - started, 2),
+        }
+        manifest: dict[str, Any] = {
+            "version": MANIFEST_VERSION,
+            "type": "full",
+            "created": datetime.now().isoformat(),
+            "database": "sqlite" if self.is_sqlite else "postgresql",
+            "summary": summary,
+            "entries": entries,
+        }
+        if note:
+            manifest["note"] = note
+        manifest_path = self.backup_dir / filename
+        write_manifest(manifest_path, manifest)
+
+        logger.info(
+            "Created full backup: %s (%d files, %d new blobs, %.1f MB written, %.1fs)",
+            filename,
+            summary["files"],
+            summary["new_blobs"],
+            summary["new_blob_bytes"] / 1024 / 1024,
+            summary["duration_seconds"],
+        )
+
+        stat = manifest_path.stat()
         return {
             "filename": filename,
             "type": "full",
-            "size_mb": round(stat.st_size / 1024 / 1024, 2),
+            "format": "manifest",
+            "size_mb": round(summary["total_bytes"] / 1024 / 1024, 2),
             "created": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            **summary,
+        }
+
+    def _iter_data_files(self) -> Iterator[tuple[str, Path, os.stat_result]]:
+        """Regular files under the data roots as ``(archive name, path, stat)``.
+
+        Photo derivatives are regenerable and left out, as in tar backups.
+        """
+        for root_name in sorted(self._SAFE_DIR_ROOTS):
+            root = self.data_dir / root_name
+            if not root.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                current = Path(dirpath)
+                if current == self.data_dir / "photos":
+                    dirnames[:] = [d for d in dirnames if d != STORE_DIRNAME]
+                if current == root:
+                    dirnames[:] = [d for d in dirnames if not d.startswith(_RESTORE_PREFIX)]
+                dirnames.sort()
+                for name in sorted(filenames):
+                    path = current / name
+                    try:
+                        if path.is_symlink() or not path.is_file():
+                            continue
+                        st = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield path.relative_to(self.data_dir).as_posix(), path, st
+
+    def _previous_entries(self) -> dict[str, dict[str, Any]]:
+        """Entries of the newest readable manifest, by path."""
+        for manifest_path in reversed(list_manifests(self.backup_dir)):
+            try:
+                return {entry["path"]: entry for entry in read_manifest(manifest_path)["entries"]}
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable manifest %s: %s", manifest_path.name, e)
+        return {}
+
+    def _prune_unreferenced_blobs(self) -> None:
+        """Delete blobs no manifest references. The caller holds the store."""
+        try:
+            referenced = referenced_digests(self.backup_dir)
+        except RuntimeError as e:
+            logger.warning("Skipping backup blob pruning: %s", e)
+            return
+        removed, freed = self.blob_store.prune(referenced)
+        if removed:
+            logger.info(
+                "Pruned %d unreferenced backup blobs (%.1f MB)", removed, freed / 1024 / 1024
+            )
+
+    def get_blob_store_size(self) -> int:
+        """Bytes used by the blob store on disk."""
+        return self.blob_store.disk_usage()
+
+    def iter_manifest_bundle(self, filename: str) -> Iterator[bytes]:
+        """Stream a manifest backup and its blobs as one tar for download.
+
+        Raises:
+            FileNotFoundError: If the manifest does not exist
+            ValueError: If it is not a readable manifest
+        """
+        manifest_path = self.validate_filename(filename)
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Backup file not found: {filename}")
+        read_manifest(manifest_path)
+        return iter_bundle(manifest_path, self.blob_store)
+
+    async def receive_upload(
+        self,
+        original_name: str,
+        chunks: AsyncIterator[bytes],
+        expected_sha256: str | None = None,
+    ) -> dict[str, Any]:
+        """Save an uploaded backup as it arrives, without buffering it.
+
+        Settings (``.json``) and archive (``.tar.gz``) uploads are written
+        to a ``.part`` file that is renamed into place once complete. A
+        ``.tar`` bundle (a downloaded manifest backup) is unpacked straight
+        into the blob store and becomes a manifest backup. When
+        ``expected_sha256`` is given, the upload is only kept if its bytes
+        hash to it. Disk writes happen in a worker thread.
+
+        Args:
+            original_name: Filename the client uploaded
+            chunks: The upload's bytes
+            expected_sha256: Hex SHA-256 the client computed, if any
+
+        Returns:
+            Metadata about the saved backup, including upload throughput
+
+        Raises:
+            ValueError: If the file type, content or checksum is invalid
+            BackupTooLargeError: If the upload exceeds the size limit
+            BackupInProgressError: If a bundle arrives while a backup or restore runs
+        """
+        if expected_sha256 is not None:
+            expected_sha256 = expected_sha256.strip().lower()
+            if not re.fullmatch(r"[0-9a-f]{64}", expected_sha256):
+                raise ValueError("Invalid SHA-256 checksum")
+
+        self.ensure_backup_dir()
+        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        if original_name.endswith(".json"):
+            backup_type = "settings"
+            filename = f"mygarage-settings-uploaded-{timestamp}.json"
+            pipe = ChunkPipe(max_bytes=_MAX_SETTINGS_UPLOAD_BYTES)
+        elif original_name.endswith(".tar.gz"):
+            backup_type = "full"
+            filename = f"mygarage-full-uploaded-{timestamp}.tar.gz"
+            pipe = ChunkPipe(max_bytes=app_settings.max_backup_upload_bytes)
+        elif original_name.endswith(".tar"):
+            backup_type = "full"
+            filename = f"mygarage-full-uploaded-{timestamp}{MANIFEST_SUFFIX}"
+            pipe = ChunkPipe(max_bytes=app_settings.max_backup_upload_bytes)
+        else:
+            raise ValueError(
+                "Invalid file type. Must be .json (settings), .tar.gz or .tar (full backup)"
+            )
+
+        if filename.endswith(MANIFEST_SUFFIX):
+            consumer = self._receive_bundle
+        else:
+            consumer = self._receive_file
+
+        started = time.monotonic()
+        worker = asyncio.create_task(asyncio.to_thread(consumer, pipe, filename, expected_sha256))
+        try:
+            async for chunk in chunks:
+                if not await asyncio.to_thread(pipe.feed, chunk):
+                    break  # the worker failed; its error is raised below
+            await asyncio.to_thread(pipe.finish)
+            size_bytes = await worker
+        except BaseException:
+            pipe.stop()
+            await asyncio.wait([worker])
+            if not worker.cancelled():
+                worker.exception()  # reported through the error being raised
+            raise
+
+        duration = time.monotonic() - started
+        logger.info(
+            "Uploaded backup: %s (original: %s), %.1f MB in %.1fs",
+            filename,
+            sanitize_for_log(original_name),
+            pipe.size / 1024 / 1024,
+            duration,
+        )
+        return {
+            "filename": filename,
+            "type": backup_type,
+            "size_mb": round(size_bytes / 1024 / 1024, 4 if backup_type == "settings" else 2),
+            "size_bytes": size_bytes,
+            "sha256": pipe.sha256.hexdigest(),
+            "created": datetime.now().isoformat(),
+            "duration_seconds": round(duration, 2),
+            "throughput_mb_s": round(pipe.size / 1024 / 1024 / duration, 1) if duration else 0.0,
         }
 
+    @staticmethod
+    def _check_upload_digest(pipe: ChunkPipe, expected_sha256: str | None) -> None:
+        if expected_sha256 and pipe.sha256.hexdigest() != expected_sha256:
+            raise ValueError("Upload checksum mismatch: the file was corrupted in transit")
+
+    def _receive_file(self, pipe: ChunkPipe, filename: str, expected_sha256: str | None) -> int:
+        """Write an upload to ``<filename>.part``, then verify and rename it into place."""
+        target = self.backup_dir / filename
+        part = target.with_name(f".{filename}.part")
+        try:
+            with open(part, "wb") as fh:
+                shutil.copyfileobj(pipe, fh, _COPY_CHUNK_SIZE)
+            self._check_upload_digest(pipe, expected_sha256)
+
+            if filename.endswith(".json"):
+                try:
+                    with open(part, "rb") as fh:
+                        backup_data = json.load(fh)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    raise ValueError("Invalid JSON file") from e
+                if not isinstance(backup_data, dict) or not isinstance(
+                    backup_data.get("settings"), list
+                ):
+                    raise ValueError("Invalid backup file structure")
+
+            os.replace(part, target)
+            return pipe.size
+        except BaseException:
+            pipe.stop()
+            part.unlink(missing_ok=True)
+            raise
+
+    def _receive_bundle(self, pipe: ChunkPipe, filename: str, expected_sha256: str | None) -> int:
+        """Unpack an uploaded bundle into the blob store and write its manifest.
+
+        Blobs already in the store are not written again. If the bundle
+        turns out to be bad, blobs it added are pruned again.
+        """
+        try:
+            with exclusive_run("upload", filename) as progress:
+                try:
+                    manifest = import_bundle(pipe, self.blob_store, progress)
+                    # Drain the tar padding, so the checksum covers every byte
+                    while pipe.read(_COPY_CHUNK_SIZE):
+                        pass
+                    self._check_upload_digest(pipe, expected_sha256)
+                    self._validate_member_names([entry["path"] for entry in manifest["entries"]])
+                    write_manifest(self.backup_dir / filename, manifest)
+                except BaseException:
+                    self._prune_unreferenced_blobs()
+                    raise
+        except BaseException:
+            pipe.stop()
+            raise
+        return manifest.get("summary", {}).get(
+            "total_bytes", sum(entry["size"] for entry in manifest["entries"])
+        )
+
     async def restore_settings_backup(
         self, filename: str, db: AsyncSession, create_safety: bool = True
     ) -> dict[str, Any]:
@@ -457,20 +848,28 @@ class BackupService:
     async def restore_full_backup(
         self, filename: str, create_safety: bool = True
     ) -> dict[str, Any]:
-        """Restore from a full backup file (SQLite only).
+        """Restore from a full backup (SQLite only).
 
         WARNING: This will overwrite the current database and all files!
         PostgreSQL restore is not supported via API — use pg_restore directly.
 
+        Manifests, ``.tar.gz`` archives and safety snapshots are unpacked
+        into a staging directory next to the live data, which is only
+        swapped in (by rename) once everything has been unpacked and
+        verified; a bad backup leaves the live data untouched. The safety
+        copy is a ``.snapshot`` directory (see ``_write_safety_snapshot``).
+        Runs in a worker thread.
+
         Args:
             filename: Name of backup file to restore
             create_safety: Whether to create a safety backup first
 
         Returns:
-            Details about restore operation
+            Details about restore operation, including its throughput
 
         Raises:
             RuntimeError: If called on a PostgreSQL database
+            BackupInProgressError: If a backup or restore is already running
         """
         if not self.is_sqlite:
             raise RuntimeError(
@@ -478,98 +877,229 @@ class BackupService:
                 "Use pg_restore during a maintenance window."
             )
 
-        backup_path = self.backup_dir / filename
+        return await asyncio.to_thread(self._restore_full, filename, create_safety)
 
-        if not backup_path.exists():
+    def _restore_full(self, filename: str, create_safety: bool) -> dict[str, Any]:
+        source = self.validate_filename(filename)
+        if not source.exists():
             raise FileNotFoundError(f"Backup file not found: {filename}")
 
-        # Create safety backup of current database first if requested
-        safety_filename = None
-        if create_safety and self.database_path:
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-            safety_filename = f"mygarage-full-safety-{timestamp}.tar.gz"
-            safety_path = self.backup_dir / safety_filename
-
-            logger.info("Creating safety backup: %s", safety_filename)
-
-            with tarfile.open(safety_path, "w:gz") as tar:
-                if self.database_path.exists():
-                    # Same consistent-snapshot rule as create_full_backup — the
-                    # safety copy is the last line of defense during a restore.
-                    with tempfile.TemporaryDirectory() as tmpdir:
-                        snapshot_path = Path(tmpdir) / "mygarage.db"
-                        self._snapshot_sqlite(snapshot_path)
-                        tar.add(snapshot_path, arcname="mygarage.db")
-
-                # Also backup current files
-                for dir_name in ["photos", "documents", "attachments"]:
-                    dir_path = self.data_dir / dir_name
-                    if dir_path.exists() and any(dir_path.iterdir()):
-                        tar.add(dir_path, arcname=dir_name)
-
-            logger.info("Created safety backup: %s", safety_filename)
-
-        # Extract backup
-        logger.info("Restoring full backup from: %s", sanitize_for_log(filename))
-
-        with tarfile.open(backup_path, "r:gz") as tar:
-            members = tar.getmembers()
-            self._validate_backup_members(members)
-
-            # Clear existing directories only after validation succeeds
-            for dir_name in self._SAFE_DIR_ROOTS:
-                target_dir = self.data_dir / dir_name
-                if target_dir.exists():
-                    shutil.rmtree(target_dir)
-                target_dir.mkdir(parents=True, exist_ok=True)
-
-            for member in members:
-                normalized_parts = self._normalize_member_parts(member.name)
-                if not normalized_parts:
-                    continue
-
-                normalized_name = "/".join(normalized_parts)
-                root = normalized_parts[0]
-
-                if normalized_name in self._SAFE_FILE_ENTRIES:
-                    destination_root = (
-                        self.database_path.parent if self.database_path else self.data_dir
-                    )
-                elif root in self._SAFE_DIR_ROOTS:
-                    destination_root = self.data_dir
+        with exclusive_run("restore", filename) as progress:
+            self._remove_restore_leftovers()
+            staging = self._make_staging()
+            try:
+                logger.info("Restoring full backup from: %s", sanitize_for_log(filename))
+                progress.phase = "staging"
+                if filename.endswith(MANIFEST_SUFFIX):
+                    restored = self._stage_manifest(source, staging, progress)
+                elif filename.endswith(SNAPSHOT_SUFFIX):
+                    restored = self._stage_snapshot(source, staging, progress)
                 else:
-                    continue
+                    restored = self._stage_archive(source, staging, progress)
 
-                self._safe_extract_member(
-                    tar,
-                    member,
-                    destination_root,
-                    normalized_parts,
-                )
+                safety_filename = None
+                if create_safety and self.database_path:
+                    progress.phase = "safety"
+                    timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+                    safety_filename = f"mygarage-full-safety-{timestamp}{SNAPSHOT_SUFFIX}"
+                    self._write_safety_snapshot(safety_filename)
 
-            # WAL hygiene: snapshot-style archives carry a self-contained
-            # mygarage.db with no wal/shm members. Any live sidecars that the
-            # archive did not overwrite belong to the PRE-restore database —
-            # left in place, SQLite would replay the old WAL over the freshly
-            # restored file on next open.
-            if self.database_path:
-                extracted_names = {"/".join(self._normalize_member_parts(m.name)) for m in members}
-                for suffix in ("-wal", "-shm"):
-                    if f"mygarage.db{suffix}" in extracted_names:
-                        continue
-                    stale = Path(str(self.database_path) + suffix)
-                    if stale.exists():
-                        stale.unlink()
-                        logger.info("Removed stale sidecar from previous database: %s", stale)
-
-        logger.info("Successfully restored full backup from %s", sanitize_for_log(filename))
+                progress.phase = "swapping"
+                self._swap_in(staging, restored)
+            finally:
+                for path in staging.values():
+                    shutil.rmtree(path, ignore_errors=True)
+
+        stats = progress.as_dict()
+        logger.info(
+            "Successfully restored full backup from %s: %d files, %.1f MB in %.1fs (%.1f MB/s)",
+            sanitize_for_log(filename),
+            stats["files_done"],
+            stats["bytes_done"] / 1024 / 1024,
+            stats["elapsed_seconds"],
+            stats["throughput_mb_s"],
+        )
 
         return {
             "safety_backup": safety_filename,
             "source_backup": filename,
+            "files_restored": stats["files_done"],
+            "bytes_restored": stats["bytes_done"],
+            "duration_seconds": stats["elapsed_seconds"],
+            "throughput_mb_s": stats["throughput_mb_s"],
             "message": "Full backup restored successfully. Application restart may be required.",
         }
 
+    def _stage_manifest(
+        self, source: Path, staging: dict[str, Path], progress: BackupProgress
+    ) -> set[str]:
+        """Decompress a manifest's blobs into staging, verifying each file's SHA-256.
+
+        Every entry is validated and every blob checked for presence before
+        anything is written. Files get their recorded mtime back, so the
+        next backup recognises them as unchanged.
+        """
+        entries = read_manifest(source)["entries"]
+        self._validate_member_names([entry["path"] for entry in entries])
+
+        store = self.blob_store
+        missing = sum(1 for entry in entries if not store.has(entry["sha256"]))
+        if missing:
+            raise ValueError(f"Backup is incomplete: {missing} file(s) missing from the store")
+
+        progress.files_total = len(entries)
+        progress.bytes_total = sum(entry["size"] for entry in entries)
+        restored: set[str] = set()
+        for entry in entries:
+            parts = self._normalize_member_parts(entry["path"])
+            target = self._staged_path(staging, parts)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            store.extract_to(entry["sha256"], target)
+            if "mtime_ns" in entry:
+                os.utime(target, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            restored.add("/".join(parts))
+            progress.advance(entry["size"])
+        return restored
+
+    def _stage_archive(
+        self, source: Path, staging: dict[str, Path], progress: BackupProgress
+    ) -> set[str]:
+        """Unpack a ``.tar.gz`` archive into staging in one streaming pass.
+
+        Each member is validated as it is reached; a bad member fails the
+        restore before the live data is touched.
+        """
+        restored: set[str] = set()
+        try:
+            with tarfile.open(source, "r|gz") as tar:
+                for member in tar:
+                    self._validate_member_names([member.name])
+                    parts = self._normalize_member_parts(member.name)
+                    target = self._staged_path(staging, parts)
+                    if member.isdir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    if not member.isfile():
+                        raise ValueError(f"Unsupported entry in backup archive: {member.name}")
+
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    extracted = tar.extractfile(member)
+                    if extracted is None:
+                        raise ValueError(f"Failed to read {member.name} from archive")
+                    with extracted, open(target, "wb") as dest_file:
+                        shutil.copyfileobj(extracted, dest_file, _COPY_CHUNK_SIZE)
+                    os.utime(target, (member.mtime, member.mtime))
+                    restored.add("/".join(parts))
+                    progress.files_total += 1
+                    progress.bytes_total += member.size
+                    progress.advance(member.size)
+        except (tarfile.TarError, EOFError) as e:
+            raise ValueError(f"Invalid backup archive: {e}") from e
+        return restored
+
+    def _stage_snapshot(
+        self, source: Path, staging: dict[str, Path], progress: BackupProgress
+    ) -> set[str]:
+        """Clone a safety snapshot's files into staging.
+
+        The database is copied (it is written in place once live); data
+        files are cloned like when the snapshot was taken.
+        """
+        files: list[tuple[list[str], Path]] = []
+        for dirpath, dirnames, filenames in os.walk(source):
+            current = Path(dirpath)
+            dirnames.sort()
+            for name in sorted(filenames):
+                parts = list((current / name).relative_to(source).parts)
+                normalized = "/".join(parts)
+                if normalized in self._SAFE_FILE_ENTRIES or parts[0] in self._SAFE_DIR_ROOTS:
+                    files.append((parts, current / name))
+
+        self._validate_member_names(["/".join(parts) for parts, _ in files])
+        progress.files_total = len(files)
+        progress.bytes_total = sum(path.stat().st_size for _, path in files)
+
+        cloner = FileCloner()
+        restored: set[str] = set()
+        for parts, path in files:
+            target = self._staged_path(staging, parts)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            size = path.stat().st_size
+            if "/".join(parts) in self._SAFE_FILE_ENTRIES:
+                shutil.copy2(path, target)
+            else:
+                cloner.clone(path, target)
+            restored.add("/".join(parts))
+            progress.advance(size)
+        return restored
+
+    def _write_safety_snapshot(self, name: str) -> None:
+        """Snapshot the live database and data files into ``<backup_dir>/<name>``.
+
+        The database is written with the Online Backup API; data files are
+        cloned with ``FileCloner`` instead of being recompressed, so the
+        snapshot costs seconds and only the space of files the restore
+        replaces. It is written under a temp name and renamed into place.
+        """
+        self.ensure_backup_dir()
+        target = self.backup_dir / name
+        tmp = self.backup_dir / f".{name}.tmp"
+        started = time.monotonic()
+        cloner = FileCloner()
+        files = total_bytes = 0
+        tmp.mkdir()
+        try:
+            if self.database_path and self.database_path.exists():
+                self._snapshot_sqlite(tmp / "mygarage.db")
+            for arcname, path, st in self._iter_data_files():
+                dst = tmp / arcname
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    cloner.clone(path, dst)
+                except FileNotFoundError:
+                    continue
+                files += 1
+                total_bytes += st.st_size
+            with open(tmp / SNAPSHOT_SUMMARY, "w") as fh:
+                json.dump(
+                    {
+                        "created": datetime.now().isoformat(),
+                        "files": files,
+                        "total_bytes": total_bytes,
+                        "clones": cloner.counts,
+                    },
+                    fh,
+                )
+            os.rename(tmp, target)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        logger.info(
+            "Created safety snapshot %s: %d files (%s) in %.1fs",
+            name,
+            files,
+            ", ".join(f"{count} {kind}" for kind, count in cloner.counts.items() if count),
+            time.monotonic() - started,
+        )
+
+    def _stale_sidecars(self, restored_names: set[str]) -> list[Path]:
+        """Live -wal/-shm files the restore does not replace.
+
+        Snapshot-style backups carry a self-contained mygarage.db with no
+        wal/shm entries. Any live sidecars left behind belong to the
+        PRE-restore database — left in place, SQLite would replay the old
+        WAL over the freshly restored file on next open.
+        """
+        if not self.database_path:
+            return []
+        return [
+            stale
+            for suffix in ("-wal", "-shm")
+            if f"mygarage.db{suffix}" not in restored_names
+            and (stale := Path(str(self.database_path) + suffix)).exists()
+        ]
+
     def validate_filename(self, filename: str) -> Path:
         """Validate and sanitize filename to prevent path traversal.
 
@@ -586,8 +1116,8 @@ class BackupService:
         safe_name = os.path.basename(filename)
 
         # Check file extension
-        if not (safe_name.endswith(".json") or safe_name.endswith(".tar.gz")):
-            raise ValueError("Invalid file type. Must be .json or .tar.gz")
+        if not safe_name.endswith((".json", ".tar.gz", SNAPSHOT_SUFFIX)):
+            raise ValueError(f"Invalid file type. Must be .json, .tar.gz or {SNAPSHOT_SUFFIX}")
 
         # Check for suspicious patterns
         if ".." in safe_name or "/" in safe_name or "\\" in safe_name:
@@ -625,10 +1155,20 @@ class BackupService:
             raise FileNotFoundError(f"Backup file not found: {filename}")
 
         # Delete the file
-        backup_path.unlink()
+        if backup_path.is_dir():
+            shutil.rmtree(backup_path)
+        else:
+            backup_path.unlink()
 
         logger.info("Deleted backup: %s", sanitize_for_log(filename))
 
+        # Blobs only this manifest referenced go with it; a running backup
+        # prunes them when it finishes
+        if filename.endswith(MANIFEST_SUFFIX):
+            with store_idle() as idle:
+                if idle:
+                    self._prune_unreferenced_blobs()
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
@@ -641,14 +1181,14 @@ class BackupService:
         parts = [str(part) for part in path.parts if part not in ("", ".")]
         return parts
 
-    def _validate_backup_members(self, members: list[tarfile.TarInfo]) -> None:
-        """Ensure every tar entry stays within the expected directories."""
-        for member in members:
-            parts = self._normalize_member_parts(member.name)
+    def _validate_member_names(self, names: list[str]) -> None:
+        """Ensure every archive or manifest path stays within the expected directories."""
+        for name in names:
+            parts = self._normalize_member_parts(name)
             if not parts:
                 raise ValueError("Invalid member name in backup archive")
             if any(part == ".." for part in parts):
-                raise ValueError(f"Unsafe relative path detected: {member.name}")
+                raise ValueError(f"Unsafe relative path detected: {name}")
 
             normalized_name = "/".join(parts)
             root = parts[0]
@@ -659,30 +1199,119 @@ class BackupService:
             if root in self._SAFE_DIR_ROOTS:
                 continue
 
-            raise ValueError(f"Unexpected entry in backup archive: {member.name}")
+            raise ValueError(f"Unexpected entry in backup archive: {name}")
 
-    def _safe_extract_member(
-        self,
-        tar: tarfile.TarFile,
-        member: tarfile.TarInfo,
-        destination_root: Path,
-        target_parts: list[str],
-    ) -> None:
-        """Safely extract member to destination ensuring it stays inside root."""
-        destination_root = destination_root.resolve()
-        target_path = destination_root.joinpath(*target_parts).resolve()
-
-        if not str(target_path).startswith(str(destination_root)):
-            raise ValueError(f"Unsafe extraction path for {member.name}")
-
-        if member.isdir():
-            target_path.mkdir(parents=True, exist_ok=True)
-            return
+    def _make_staging(self) -> dict[str, Path]:
+        """Create a restore's staging directories, keyed by data root ("" for the database).
+
+        Each sits on the file system of what it replaces so the swap is a
+        rename. A data root that is a mount point cannot be renamed, so it
+        is staged inside itself and swapped by its contents instead.
+        """
+        token = uuid.uuid4().hex[:12]
+        db_dir = self.database_path.parent if self.database_path else self.data_dir
+        staging = {"": db_dir / f"{_RESTORE_PREFIX}{token}-db"}
+        for root in sorted(self._SAFE_DIR_ROOTS):
+            live = self.data_dir / root
+            if os.path.ismount(live):
+                staging[root] = live / f"{_RESTORE_PREFIX}{token}"
+            else:
+                staging[root] = self.data_dir / f"{_RESTORE_PREFIX}{token}-{root}"
+        for path in staging.values():
+            path.mkdir(parents=True)
+        return staging
 
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        extracted = tar.extractfile(member)
-        if extracted is None:
-            raise ValueError(f"Failed to read {member.name} from archive")
+    def _remove_restore_leftovers(self) -> None:
+        """Delete staging directories left behind by an interrupted restore.
+
+        ``*-old`` directories are kept: they hold the live data a swap had
+        moved aside, and after an interrupted swap they may be its only copy.
+        """
+        db_dir = self.database_path.parent if self.database_path else self.data_dir
+        parents = {db_dir, self.data_dir, *(self.data_dir / root for root in self._SAFE_DIR_ROOTS)}
+        for parent in parents:
+            if parent.is_dir():
+                for leftover in parent.glob(f"{_RESTORE_PREFIX}*"):
+                    if leftover.name.endswith("-old"):
+                        logger.warning(
+                            "Keeping pre-restore data from an interrupted restore: %s", leftover
+                        )
+                        continue
+                    logger.warning("Removing leftover restore directory: %s", leftover)
+                    shutil.rmtree(leftover, ignore_errors=True)
+
+    def _staged_path(self, staging: dict[str, Path], parts: list[str]) -> Path:
+        """Where a validated entry is unpacked, ensuring it stays inside its staging dir."""
+        normalized_name = "/".join(parts)
+        if normalized_name in self._SAFE_FILE_ENTRIES:
+            base, relative = staging[""], parts
+        else:
+            base, relative = staging[parts[0]], parts[1:]
+        target = base.joinpath(*relative)
+        if not target.resolve().is_relative_to(base.resolve()):
+            raise ValueError(f"Unsafe extraction path for {normalized_name}")
+        return target
+
+    def _swap_in(self, staging: dict[str, Path], restored: set[str]) -> None:
+        """Replace the live data roots and database with the staged ones.
+
+        Each data root is swapped with two renames (live aside, staged into
+        place). The database files are swapped last the same way, and live
+        -wal/-shm sidecars the restore does not replace are moved aside with
+        them. If any rename fails, every rename done so far is undone. Photo
+        derivatives are carried over: they are keyed by content hash, so
+        they stay valid for whichever photos are restored.
+        """
+        undo: list[tuple[Path, Path]] = []
+        aside: list[Path] = []
+
+        def _rename(src: Path, dst: Path) -> None:
+            os.rename(src, dst)
+            undo.append((src, dst))
+
+        try:
+            for root in sorted(self._SAFE_DIR_ROOTS):
+                live = self.data_dir / root
+                staged = staging[root]
+                keep = STORE_DIRNAME if root == "photos" else None
+                if staged.parent == live:
+                    old = live / f"{staged.name}-old"
+                    old.mkdir()
+                    aside.append(old)
+                    for child in list(live.iterdir()):
+                        if child not in (staged, old) and child.name != keep:
+                            _rename(child, old / child.name)
+                    for child in list(staged.iterdir()):
+                        if not (live / child.name).exists():
+                            _rename(child, live / child.name)
+                    continue
 
-        with extracted, open(target_path, "wb") as dest_file:
-            shutil.copyfileobj(extracted, dest_file)
+                if keep and (live / keep).is_dir() and not (staged / keep).exists():
+                    _rename(live / keep, staged / keep)
+                if live.exists():
+                    old = staged.with_name(f"{staged.name}-old")
+                    _rename(live, old)
+                    aside.append(old)
+                _rename(staged, live)
+
+            staged = staging[""]
+            db_dir = staged.parent
+            old = staged.with_name(f"{staged.name}-old")
+            old.mkdir()
+            aside.append(old)
+            for stale in self._stale_sidecars(restored):
+                _rename(stale, old / stale.name)
+            for name in sorted(restored & self._SAFE_FILE_ENTRIES):
+                if (db_dir / name).exists():
+                    _rename(db_dir / name, old / name)
+                _rename(staged / name, db_dir / name)
+        except OSError:
+            for src, dst in reversed(undo):
+                os.rename(dst, src)
+            for old in aside:
+                with contextlib.suppress(OSError):
+                    old.rmdir()
+            raise
+
+        for old in aside:
+            shutil.rmtree(old, ignore_errors=True)
@@ -44,12 +44,12 @@ class DEFRecordService:
         Returns:
             Tuple of (DEF record responses, total count)
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            _ = await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(DEFRecord)
@@ -81,10 +81,10 @@ class DEFRecordService:
 
     async def get_def_record(self, vin: str, record_id: int, current_user: User) -> DEFRecord:
         """Get a specific DEF record by ID."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         result = await self.db.execute(
             select(DEFRecord).where(DEFRecord.id == record_id).where(DEFRecord.vin == vin)
@@ -241,12 +241,12 @@ class DEFRecordService:
 
     async def delete_def_record(self, vin: str, record_id: int, current_user: User) -> None:
         """Delete a DEF record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(DEFRecord).where(DEFRecord.id == record_id).where(DEFRecord.vin == vin)
@@ -291,10 +291,10 @@ class DEFRecordService:
 
         Conservative approach: returns None when data is insufficient.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         # Get all DEF records ordered by date
         result = await self.db.execute(
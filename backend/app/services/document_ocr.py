@@ -6,7 +6,6 @@ and routes to the appropriate parser based on document type.
 
 import asyncio
 import logging
-import os
 from pathlib import Path
 from typing import Any
 
@@ -15,12 +14,10 @@ from app.services.document_parsers import (
     DocumentType,
     get_parser_for_document,
 )
+from app.services.ocr_pipeline import PADDLEOCR_ENABLED, ocr_pipeline
 
 logger = logging.getLogger(__name__)
 
-# Check if PaddleOCR is enabled
-PADDLEOCR_ENABLED = os.getenv("ENABLE_PADDLEOCR", "false").lower() == "true"
-
 
 class DocumentOCRService:
     """Unified service for extracting data from documents using OCR."""
@@ -28,7 +25,6 @@ class DocumentOCRService:
     def __init__(self):
         """Initialize the OCR service."""
         self.supported_formats = {".pdf", ".jpg", ".jpeg", ".png"}
-        self._paddleocr = None
 
     async def extract_insurance_data(
         self,
@@ -163,214 +159,12 @@ class DocumentOCRService:
         if path.suffix.lower() not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {path.suffix}")
 
-        if path.suffix.lower() == ".pdf":
-            return await self._extract_text_from_pdf(file_path)
-        else:
-            return await self._extract_text_from_image(file_path)
+        contents = await asyncio.to_thread(path.read_bytes)
+        return await ocr_pipeline.extract_text(contents, is_pdf=path.suffix.lower() == ".pdf")
 
     async def extract_text_from_bytes(self, file_bytes: bytes, is_pdf: bool = True) -> str:
         """Extract text from raw bytes. Public: the receipt parser needs it."""
-        if is_pdf:
-            return await self._extract_text_from_pdf_bytes(file_bytes)
-        else:
-            return await self._ocr_image_bytes(file_bytes)
-
-    async def _extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from a PDF file using PyMuPDF."""
-        try:
-            import fitz  # PyMuPDF
-
-            text_content = []
-            with fitz.open(file_path) as doc:
-                for page in doc:
-                    text_content.append(page.get_text())
-
-            full_text = "\n".join(text_content)
-
-            # If PDF has minimal text, it might be a scanned image
-            if len(full_text.strip()) < 100:
-                logger.info("PDF appears to be scanned, attempting OCR")
-                return await self._ocr_pdf(file_path)
-
-            return full_text
-
-        except ImportError:
-            logger.warning("PyMuPDF not installed, falling back to OCR")
-            return await self._ocr_pdf(file_path)
-        except Exception as e:
-            logger.error("Error extracting text from PDF: %s", e)
-            return ""
-
-    async def _extract_text_from_pdf_bytes(self, pdf_bytes: bytes) -> str:
-        """Extract text from PDF bytes."""
-        try:
-            import fitz  # PyMuPDF
-
-            text_content = []
-            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-                for page in doc:
-                    text_content.append(page.get_text())
-
-            full_text = "\n".join(text_content)
-
-            # If PDF has minimal text, OCR it
-            if len(full_text.strip()) < 100:
-                logger.info("PDF appears to be scanned, attempting OCR")
-                return await self._ocr_pdf_bytes(pdf_bytes)
-
-            return full_text
-
-        except ImportError:
-            logger.error("PyMuPDF not installed - cannot extract text from PDF")
-            return ""
-        except Exception as e:
-            logger.error("Error extracting text from PDF bytes: %s", e)
-            return ""
-
-    async def _ocr_pdf(self, file_path: str) -> str:
-        """OCR a PDF by converting to images first."""
-        try:
-            import fitz  # PyMuPDF
-
-            text_content = []
-            with fitz.open(file_path) as doc:
-                for _page_num, page in enumerate(doc):
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-                    img_data = pix.tobytes("png")
-                    text = await self._ocr_image_bytes(img_data)
-                    if text:
-                        text_content.append(text)
-
-            return "\n".join(text_content)
-        except Exception as e:
-            logger.error("Error OCR-ing PDF: %s", e)
-            return ""
-
-    async def _ocr_pdf_bytes(self, pdf_bytes: bytes) -> str:
-        """OCR a PDF from bytes."""
-        try:
-            import fitz
-
-            text_content = []
-            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-                for page in doc:
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-                    img_data = pix.tobytes("png")
-                    text = await self._ocr_image_bytes(img_data)
-                    if text:
-                        text_content.append(text)
-
-            return "\n".join(text_content)
-        except Exception as e:
-            logger.error("Error OCR-ing PDF bytes: %s", e)
-            return ""
-
-    async def _extract_text_from_image(self, file_path: str) -> str:
-        """Extract text from an image file using OCR."""
-        if PADDLEOCR_ENABLED:
-            try:
-                text = await self._paddleocr_extract(file_path)
-                if text:
-                    return text
-            except Exception as e:
-                logger.warning("PaddleOCR failed, falling back to Tesseract: %s", e)
-
-        # Fallback to Tesseract (offload CPU-intensive OCR to thread pool)
-        try:
-            import pytesseract
-            from PIL import Image
-
-            image = await asyncio.to_thread(Image.open, file_path)
-            text = await asyncio.to_thread(pytesseract.image_to_string, image)
-            return str(text)
-        except ImportError:
-            logger.warning("PIL or pytesseract not installed")
-            return ""
-        except Exception as e:
-            logger.error("Error extracting text from image: %s", e)
-            return ""
-
-    async def _ocr_image_bytes(self, img_bytes: bytes) -> str:
-        """OCR image from bytes."""
-        if PADDLEOCR_ENABLED:
-            try:
-                text = await self._paddleocr_extract_bytes(img_bytes)
-                if text:
-                    return text
-            except Exception as e:
-                logger.warning("PaddleOCR bytes failed: %s", e)
-
-        # Fallback to Tesseract (offload CPU-intensive OCR to thread pool)
-        try:
-            import io
-
-            import pytesseract
-            from PIL import Image
-
-            image = Image.open(io.BytesIO(img_bytes))
-            return str(await asyncio.to_thread(pytesseract.image_to_string, image))
-        except Exception as e:
-            logger.error("Error OCR-ing image bytes: %s", e)
-            return ""
-
-    async def _paddleocr_extract(self, file_path: str) -> str:
-        """Extract text using PaddleOCR."""
-        try:
-            if self._paddleocr is None:
-                from paddleocr import PaddleOCR
-
-                self._paddleocr = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
-
-            result = self._paddleocr.ocr(file_path, cls=True)
-
-            lines = []
-            for line in result:
-                if line:
-                    for word_info in line:
-                        if word_info and len(word_info) > 1:
-                            text = word_info[1][0]
-                            lines.append(text)
-
-            return "\n".join(lines)
-
-        except ImportError:
-            logger.warning("PaddleOCR not installed")
-            return ""
-        except Exception as e:
-            logger.error("PaddleOCR extraction failed: %s", e)
-            return ""
-
-    async def _paddleocr_extract_bytes(self, img_bytes: bytes) -> str:
-        """Extract text from image bytes using PaddleOCR."""
-        try:
-            import io
-
-            import numpy as np
-            from PIL import Image
-
-            if self._paddleocr is None:
-                from paddleocr import PaddleOCR
-
-                self._paddleocr = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
-
-            image = Image.open(io.BytesIO(img_bytes))
-            img_array = np.array(image)
-
-            result = self._paddleocr.ocr(img_array, cls=True)
-
-            lines = []
-            for line in result:
-                if line:
-                    for word_info in line:
-                        if word_info and len(word_info) > 1:
-                            text = word_info[1][0]
-                            lines.append(text)
-
-            return "\n".join(lines)
-
-        except Exception as e:
-            logger.error("PaddleOCR bytes extraction failed: %s", e)
-            return ""
+        return await ocr_pipeline.extract_text(file_bytes, is_pdf)
 
     @staticmethod
     def list_available_insurance_parsers() -> list[dict[str, Any]]:
@@ -412,5 +206,58 @@ class DocumentOCRService:
         return status
 
 
+def build_insurance_parse_response(parsed_data: dict[str, Any], vin: str) -> dict[str, Any]:
+    """Shape ``extract_insurance_data`` output into the parse-pdf API response.
+
+    Shared by the synchronous parse route and background parse jobs.
+
+    Raises:
+        ValueError: If extraction did not succeed
+    """
+    if not parsed_data.get("success"):
+        raise ValueError(parsed_data.get("error", "Failed to extract data"))
+
+    # Sanitize validation warnings to prevent stack trace exposure
+    # Only include safe, user-friendly warning messages
+    raw_warnings = parsed_data.get("validation_warnings", [])
+    safe_warnings = []
+    for warning in raw_warnings:
+        # Filter out any warnings that look like stack traces or internal errors
+        warning_str = str(warning)
+        if not any(
+            indicator in warning_str.lower()
+            for indicator in ["traceback", "exception", "error:", "line ", "file "]
+        ):
+            safe_warnings.append(warning_str)
+
+    # Format response (maintaining backward compatibility)
+    response = {
+        "success": True,
+        "data": {
+            "provider": parsed_data.get("provider"),
+            "policy_number": parsed_data.get("policy_number"),
+            "policy_type": parsed_data.get("policy_type"),
+            "start_date": parsed_data.get("start_date"),
+            "end_date": parsed_data.get("end_date"),
+            "premium_amount": parsed_data.get("premium_amount"),
+            "premium_frequency": parsed_data.get("premium_frequency"),
+            "deductible": parsed_data.get("deductible"),
+            "coverage_limits": parsed_data.get("coverage_limits"),
+            "notes": parsed_data.get("notes"),
+        },
+        "confidence": parsed_data.get("field_confidence", {}),
+        "confidence_score": parsed_data.get("confidence_score", 0),
+        "parser_used": parsed_data.get("parser_name"),
+        "vehicles_found": parsed_data.get("vehicles_found", []),
+        "warnings": safe_warnings,
+    }
+
+    # Add warning if target VIN not found
+    if vin.upper() not in [v.upper() for v in parsed_data.get("vehicles_found", [])]:
+        safe_warnings.append(f"VIN {vin} not found in PDF - using policy-level data")
+
+    return response
+
+
 # Singleton instance
 document_ocr_service = DocumentOCRService()
@@ -5,28 +5,23 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
 from pathlib import Path
 
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.odometer import OdometerRecord
-from app.models.reminder import Reminder
-from app.models.service_visit import ServiceVisit
 from app.models.user import User
 from app.models.vehicle import Vehicle
+from app.models.vehicle_rollup import VehicleRollup
 from app.schemas.family import (
     FamilyDashboardResponse,
     FamilyMemberData,
     FamilyMemberUpdateRequest,
     FamilyVehicleSummary,
 )
-from app.services.hours_service import latest_engine_hours_and_date
-from app.services.reminder_service import is_reminder_overdue
+from app.services.vehicle_rollup_service import get_vehicle_rollups
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -121,13 +116,14 @@ class FamilyDashboardService:
             .order_by(Vehicle.nickname)
         )
         vehicles = result.scalars().all()
+        rollups = await get_vehicle_rollups(self.db, [v.vin for v in vehicles])
 
         vehicle_summaries: list[FamilyVehicleSummary] = []
         member_overdue = 0
         member_upcoming = 0
 
         for vehicle in vehicles:
-            summary = await self._build_vehicle_summary(vehicle)
+            summary = self._build_vehicle_summary(vehicle, rollups[vehicle.vin])
             vehicle_summaries.append(summary)
             member_overdue += summary.overdue_maintenance
             # Count upcoming maintenance (not overdue)
@@ -148,63 +144,14 @@ class FamilyDashboardService:
             family_dashboard_order=user.family_dashboard_order,
         )
 
-    async def _build_vehicle_summary(self, vehicle: Vehicle) -> FamilyVehicleSummary:
-        """Build a vehicle summary with service and maintenance schedule info."""
-        today = date.today()
-
-        # Get last service visit with line items.
-        # NB: this loads line_items only (reads line-item scalars below). If you ever
-        # read a visit-level COST property here (subtotal / parts_supplies_cost /
-        # calculated_total_cost), also `.selectinload(ServiceLineItem.supply_usages)`
-        # — the cost property traverses supply_usages and will MissingGreenlet on a
-        # shallow load (see service_visit_service.service_visit_cost_load_options).
-        last_service_result = await self.db.execute(
-            select(ServiceVisit)
-            .options(selectinload(ServiceVisit.line_items))
-            .where(ServiceVisit.vin == vehicle.vin)
-            .order_by(ServiceVisit.date.desc())
-            .limit(1)
-        )
-        last_service = last_service_result.scalar_one_or_none()
-
-        # Get current odometer (km) for schedule status calculations
-        odometer_result = await self.db.execute(
-            select(OdometerRecord.odometer_km)
-            .where(OdometerRecord.vin == vehicle.vin)
-            .order_by(OdometerRecord.date.desc())
-            .limit(1)
-        )
-        current_odometer_km = odometer_result.scalar_one_or_none()
-
-        # Canonical latest engine-hours reading (§1 helper) for schedule
-        # status calculations — fetched ONCE per vehicle here, mirroring
-        # current_odometer_km above, and reused for every pending reminder's
-        # overdue evaluation below rather than re-queried per reminder.
-        current_hours, _current_hours_date = await latest_engine_hours_and_date(
-            self.db, vehicle.vin
-        )
-
-        # Get pending reminders for this vehicle
-        reminder_result = await self.db.execute(
-            select(Reminder).where(Reminder.vin == vehicle.vin, Reminder.status == "pending")
-        )
-        reminders = list(reminder_result.scalars().all())
-
-        # Calculate overdue and upcoming counts from reminders
-        overdue_count = 0
-        next_maintenance_description: str | None = None
-        next_maintenance_due: str | None = None
-        soonest_due_date: date | None = None
-
-        for reminder in reminders:
-            if is_reminder_overdue(reminder, current_odometer_km, current_hours, today):
-                overdue_count += 1
-            elif reminder.due_date:
-                if soonest_due_date is None or reminder.due_date < soonest_due_date:
-                    soonest_due_date = reminder.due_date
-                    next_maintenance_description = reminder.title
-                    next_maintenance_due = reminder.due_date.isoformat()
+    def _build_vehicle_summary(
+        self, vehicle: Vehicle, rollup: VehicleRollup
+    ) -> FamilyVehicleSummary:
+        """Build a vehicle summary with service and maintenance schedule info.
 
+        Last service, overdue count and the soonest-dated reminder that is not
+        yet overdue all come from the vehicle's rollup row.
+        """
         # Build photo URL from raw DB path (e.g. "VIN/photo.jpg" -> "/api/vehicles/{vin}/photos/photo.jpg")
         main_photo_url: str | None = None
         if vehicle.main_photo:
@@ -218,15 +165,13 @@ class FamilyDashboardService:
             make=vehicle.make,
             model=vehicle.model,
             main_photo=main_photo_url,
-            last_service_date=last_service.date if last_service else None,
-            last_service_description=(
-                last_service.line_items[0].description
-                if last_service and last_service.line_items
-                else (last_service.notes if last_service else None)
+            last_service_date=rollup.last_service_date,
+            last_service_description=rollup.last_service_description,
+            next_maintenance_description=rollup.next_due_title,
+            next_maintenance_due=(
+                rollup.next_due_date.isoformat() if rollup.next_due_date else None
             ),
-            next_maintenance_description=next_maintenance_description,
-            next_maintenance_due=next_maintenance_due,
-            overdue_maintenance=overdue_count,
+            overdue_maintenance=rollup.overdue_count,
         )
 
     async def update_member_display(
@@ -325,8 +325,8 @@ PHOTO_UPLOAD_CONFIG = FileUploadConfig(
     generate_unique_name=True,
     verify_magic_bytes=True,
     strict_magic_bytes=True,
-    create_thumbnail=True,
-    thumbnail_size=(512, 512),
+    # Decoding, thumbnail and resized derivatives: PhotoService.save_upload
+    create_thumbnail=False,
 )
 
 ATTACHMENT_UPLOAD_CONFIG = FileUploadConfig(
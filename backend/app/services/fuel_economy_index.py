@@ -0,0 +1,279 @@
+"""Per-vehicle index of per-fill-up fuel economy (L/100km and L/hr).
+
+``FuelRecordService.list_fuel_records`` used to load a vehicle's whole
+fill-up history on both axes for every page, only to annotate the rows on
+that page. The index holds a lightweight snapshot of every fill-up, ordered
+along each axis, together with the figure of every full-tank endpoint:
+
+- It is built once per vehicle with a column-only query and kept in the
+  analytics cache under the vehicle's VIN, so every write path that already
+  calls ``invalidate_cache_for_vehicle`` (imports, webhooks, restores) drops
+  it and the next read rebuilds it.
+- ``FuelRecordService`` patches it in place instead: an insert, edit or
+  delete re-scores only the endpoints whose interval the change touches —
+  the endpoint closing the interval the record sits in and, when the record
+  is itself an endpoint, the one after it.
+
+Scoring goes through ``calculate_l_per_100km`` / ``calculate_hours_economy``
+with the same accumulate-partials-since-the-previous-endpoint rule as
+``compute_full_tank_economy`` / ``compute_full_tank_hours_economy``, with
+hauling tanks kept as endpoints (the per-record display rule), so the figures
+are identical to a full rescan.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.fuel import FuelRecord
+from app.services.fuel_service import calculate_hours_economy, calculate_l_per_100km
+from app.utils.cache import cache
+
+# Every fuel write path invalidates the vehicle explicitly; like the analytics
+# results, the TTL only bounds how long an index built by a read racing a
+# write can linger.
+INDEX_TTL_SECONDS = 600
+
+
+@dataclass(slots=True)
+class FillUp:
+    """The columns of a fuel record that economy scoring reads."""
+
+    id: int
+    date: date
+    odometer_km: Decimal | None
+    engine_hours: Decimal | None
+    liters: Decimal | None
+    cost: Decimal | None
+    is_full_tank: bool
+    missed_fillup: bool
+    is_hauling: bool
+
+    @classmethod
+    def from_record(cls, record: FuelRecord) -> FillUp:
+        return cls(
+            id=record.id,
+            date=record.date,
+            odometer_km=record.odometer_km,
+            engine_hours=record.engine_hours,
+            liters=record.liters,
+            cost=record.cost,
+            is_full_tank=bool(record.is_full_tank),
+            missed_fillup=bool(record.missed_fillup),
+            is_hauling=bool(record.is_hauling),
+        )
+
+
+def _score_distance(
+    record: FillUp, previous: FillUp | None, liters: Decimal, _cost: Decimal
+) -> Decimal | None:
+    return calculate_l_per_100km(record, previous, liters)  # type: ignore[arg-type]
+
+
+def _score_hours(
+    record: FillUp, previous: FillUp | None, liters: Decimal, cost: Decimal
+) -> Decimal | None:
+    figure = calculate_hours_economy(record, previous, liters, cost)  # type: ignore[arg-type]
+    return figure[0] if figure is not None else None
+
+
+class _Axis:
+    """Fill-ups ordered along one meter (odometer or engine hours)."""
+
+    def __init__(self, attr: str, score: Callable[..., Decimal | None]) -> None:
+        self._attr = attr
+        self._score = score
+        self._keys: list[tuple] = []
+        self._entries: list[FillUp] = []
+        self.figures: dict[int, Decimal] = {}
+
+    def _key(self, fill_up: FillUp) -> tuple | None:
+        value = getattr(fill_up, self._attr)
+        if value is None:
+            return None
+        # Same order as the rescans (meter, then date), with the id as a
+        # deterministic tie-break
+        return (value, fill_up.date, fill_up.id)
+
+    def load(self, fill_ups: Iterable[FillUp]) -> None:
+        pairs = sorted(
+            (key, fill_up) for fill_up in fill_ups if (key := self._key(fill_up)) is not None
+        )
+        self._keys = [key for key, _ in pairs]
+        self._entries = [fill_up for _, fill_up in pairs]
+        self.figures = {}
+        self._rescore(0, len(self._entries))
+
+    def insert(self, fill_up: FillUp) -> None:
+        key = self._key(fill_up)
+        if key is None:
+            return
+        pos = bisect_left(self._keys, key)
+        self._keys.insert(pos, key)
+        self._entries.insert(pos, fill_up)
+        self._rescore(pos, pos)
+
+    def remove(self, fill_up: FillUp) -> None:
+        key = self._key(fill_up)
+        if key is None:
+            return
+        pos = bisect_left(self._keys, key)
+        if pos == len(self._keys) or self._keys[pos] != key:
+            return
+        del self._keys[pos]
+        del self._entries[pos]
+        self.figures.pop(fill_up.id, None)
+        # Nothing sits at `pos - 1` any more; re-score up to the first endpoint
+        # at or after the gap
+        self._rescore(pos, pos - 1)
+
+    def _rescore(self, lo: int, hi: int) -> None:
+        """Re-score the endpoints whose interval touches positions ``lo..hi``.
+
+        Starts at the endpoint before ``lo`` (the anchor) and stops after the
+        first endpoint past ``hi``; endpoints further on are anchored after the
+        change and keep their figures.
+        """
+        entries = self._entries
+        start = min(lo, len(entries)) - 1
+        while start >= 0 and not entries[start].is_full_tank:
+            start -= 1
+        previous = entries[start] if start >= 0 else None
+
+        liters_since = Decimal(0)
+        cost_since = Decimal(0)
+        for pos in range(start + 1, len(entries)):
+            fill_up = entries[pos]
+            if fill_up.liters is not None:
+                liters_since += fill_up.liters
+            if fill_up.cost is not None:
+                cost_since += fill_up.cost
+            if not fill_up.is_full_tank:
+                continue
+
+            value = self._score(fill_up, previous, liters_since, cost_since)
+            if value is None:
+                self.figures.pop(fill_up.id, None)
+            else:
+                self.figures[fill_up.id] = value
+
+            previous = fill_up
+            liters_since = Decimal(0)
+            cost_since = Decimal(0)
+            if pos > hi:
+                break
+
+
+class FuelEconomyIndex:
+    """Per-fill-up L/100km and L/hr for one vehicle, patchable per record."""
+
+    def __init__(self, fill_ups: Iterable[FillUp] = ()) -> None:
+        self._fill_ups = {fill_up.id: fill_up for fill_up in fill_ups}
+        self._distance = _Axis("odometer_km", _score_distance)
+        self._hours = _Axis("engine_hours", _score_hours)
+        self._distance.load(self._fill_ups.values())
+        self._hours.load(self._fill_ups.values())
+
+    def l_per_100km(self, record_id: int) -> Decimal | None:
+        return self._distance.figures.get(record_id)
+
+    def l_per_hr(self, record_id: int) -> Decimal | None:
+        return self._hours.figures.get(record_id)
+
+    def upsert(self, record: FuelRecord) -> None:
+        """Add or replace one fill-up and re-score the intervals it touches."""
+        self.remove(record.id)
+        fill_up = FillUp.from_record(record)
+        self._fill_ups[fill_up.id] = fill_up
+        self._distance.insert(fill_up)
+        self._hours.insert(fill_up)
+
+    def remove(self, record_id: int) -> None:
+        """Drop one fill-up and re-score the intervals around the gap."""
+        fill_up = self._fill_ups.pop(record_id, None)
+        if fill_up is None:
+            return
+        self._distance.remove(fill_up)
+        self._hours.remove(fill_up)
+
+
+def _cache_key(vin: str) -> str:
+    return f"fuel_economy_index:{vin}"
+
+
+async def peek_fuel_economy_index(vin: str) -> FuelEconomyIndex | None:
+    """Return the vehicle's index if one is cached, without building it."""
+    return await cache.get(_cache_key(vin))
+
+
+async def store_fuel_economy_index(vin: str, index: FuelEconomyIndex) -> None:
+    """Cache an index under the vehicle's VIN (dropped by its invalidation)."""
+    await cache.set(_cache_key(vin), index, INDEX_TTL_SECONDS, vin=vin)
+
+
+async def load_fill_ups_by_vin(db: AsyncSession, vins: list[str]) -> dict[str, list[FillUp]]:
+    """Every meter-bearing fill-up of ``vins``, grouped by vin, in one column-only query."""
+    if not vins:
+        return {}
+    result = await db.execute(
+        select(
+            FuelRecord.vin,
+            FuelRecord.id,
+            FuelRecord.date,
+            FuelRecord.odometer_km,
+            FuelRecord.engine_hours,
+            FuelRecord.liters,
+            FuelRecord.cost,
+            FuelRecord.is_full_tank,
+            FuelRecord.missed_fillup,
+            FuelRecord.is_hauling,
+        )
+        .where(FuelRecord.vin.in_(vins))
+        .where(or_(FuelRecord.odometer_km.isnot(None), FuelRecord.engine_hours.isnot(None)))
+    )
+    fill_ups: dict[str, list[FillUp]] = {}
+    for row in result.all():
+        fill_ups.setdefault(row.vin, []).append(
+            FillUp(
+                id=row.id,
+                date=row.date,
+                odometer_km=row.odometer_km,
+                engine_hours=row.engine_hours,
+                liters=row.liters,
+                cost=row.cost,
+                is_full_tank=bool(row.is_full_tank),
+                missed_fillup=bool(row.missed_fillup),
+                is_hauling=bool(row.is_hauling),
+            )
+        )
+    return fill_ups
+
+
+def ordered_by_meter(fill_ups: Iterable[FillUp], attr: str) -> list[FillUp]:
+    """Fill-ups bearing ``attr`` ("odometer_km" or "engine_hours"), in rescan order.
+
+    Meter ascending, then date, with the id as a deterministic tie-break --
+    the order ``compute_full_tank_economy`` / ``compute_full_tank_hours_economy``
+    expect.
+    """
+    return sorted(
+        (fill_up for fill_up in fill_ups if getattr(fill_up, attr) is not None),
+        key=lambda fill_up: (getattr(fill_up, attr), fill_up.date, fill_up.id),
+    )
+
+
+async def get_fuel_economy_index(db: AsyncSession, vin: str) -> FuelEconomyIndex:
+    """Return the vehicle's index, building it with one column-only query."""
+    index = await peek_fuel_economy_index(vin)
+    if index is not None:
+        return index
+
+    fill_ups = await load_fill_ups_by_vin(db, [vin])
+    index = FuelEconomyIndex(fill_ups.get(vin, ()))
+    await store_fuel_economy_index(vin, index)
+    return index
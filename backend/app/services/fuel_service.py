@@ -10,6 +10,7 @@ frontend UnitFormatter.
 import logging
 from datetime import date as date_type
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
 from sqlalchemy import delete, func, select
@@ -27,6 +28,9 @@ from app.utils.hours_sync import sync_hours_from_record
 from app.utils.logging_utils import sanitize_for_log
 from app.utils.odometer_sync import sync_odometer_from_record
 
+if TYPE_CHECKING:
+    from app.services.fuel_economy_index import FuelEconomyIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -229,7 +233,9 @@ def compute_full_tank_economy(
     fill-up since the previous endpoint and folds them — plus the endpoint's own
     fill — into that interval's numerator (issue #113). This is the single
     source of truth for the per-record, vehicle-average, and dashboard surfaces
-    so they can't drift apart.
+    so they can't drift apart; the per-record fuel log reads it through
+    :mod:`app.services.fuel_economy_index`, which applies the same rules
+    incrementally.
 
     Endpoint rules:
     - A missed fill-up (amount unknown) is still an endpoint: it anchors the
@@ -439,9 +445,19 @@ async def calculate_average_hours_economy(
         .where(FuelRecord.engine_hours.isnot(None))
         .order_by(FuelRecord.engine_hours.asc(), FuelRecord.date.asc())
     )
-    all_records = list(result.scalars().all())
+    return average_hours_economy(list(result.scalars().all()), exclude_hauling)
 
-    figures = compute_full_tank_hours_economy(all_records, exclude_hauling)
+
+def average_hours_economy(
+    records_asc: list[FuelRecord], exclude_hauling: bool = True
+) -> tuple[Decimal | None, Decimal | None]:
+    """The averaging half of :func:`calculate_average_hours_economy`.
+
+    ``records_asc`` is every ``engine_hours``-bearing fill-up for one vehicle,
+    ordered by ``engine_hours`` ascending; for callers that already hold them
+    (the dashboard loads the whole fleet's fill-ups in one query).
+    """
+    figures = compute_full_tank_hours_economy(records_asc, exclude_hauling)
     if not figures:
         return None, None
 
@@ -475,29 +491,36 @@ class FuelRecordService:
         )
         return calculate_l_per_100km(record, prev_record, interval_liters)
 
-    async def _hours_economy_for(self, vin: str, record: FuelRecord) -> Decimal | None:
-        """L/hr for a single just-written/read full-tank record.
-
-        Scores the record through the same O(n) accumulator the list and
-        average paths use (``compute_full_tank_hours_economy`` — the single
-        source of truth) so the per-record figure can't drift from the
-        vehicle average. Only ``l_per_hr`` surfaces per record (cost/hr is an
-        aggregate-only figure). Returns None for partial fill-ups, records with
-        no ``engine_hours``, and un-anchorable records.
+    async def _refresh_economy_index(
+        self,
+        vin: str,
+        upsert: FuelRecord | None = None,
+        removed_id: int | None = None,
+    ) -> FuelEconomyIndex:
+        """Invalidate the vehicle's cached analytics, carrying its economy index over.
+
+        Called after a committed write. A cached index is patched for just the
+        written (or deleted) record instead of being dropped with the rest of
+        the vehicle's entries; an uncached one is built from the table, which
+        already includes the change.
         """
-        if record.engine_hours is None or not record.is_full_tank:
-            return None
-        result = await self.db.execute(
-            select(FuelRecord)
-            .where(FuelRecord.vin == vin)
-            .where(FuelRecord.engine_hours.isnot(None))
-            .order_by(FuelRecord.engine_hours.asc(), FuelRecord.date.asc())
+        from app.services.fuel_economy_index import (
+            get_fuel_economy_index,
+            peek_fuel_economy_index,
+            store_fuel_economy_index,
         )
-        all_asc = list(result.scalars().all())
-        for scored, l_per_hr, _cost_per_hr in compute_full_tank_hours_economy(all_asc):
-            if scored.id == record.id:
-                return l_per_hr
-        return None
+
+        index = await peek_fuel_economy_index(vin)
+        await invalidate_cache_for_vehicle(vin)
+        if index is None:
+            return await get_fuel_economy_index(self.db, vin)
+
+        if upsert is not None:
+            index.upsert(upsert)
+        if removed_id is not None:
+            index.remove(removed_id)
+        await store_fuel_economy_index(vin, index)
+        return index
 
     async def list_fuel_records(
         self,
@@ -514,12 +537,12 @@ class FuelRecordService:
         pure-distance vehicle, mirroring how the distance average is ``None``
         for a pure-hours one.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            _ = await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(FuelRecord)
@@ -530,38 +553,21 @@ class FuelRecordService:
             )
             records = result.scalars().all()
 
-            # Per-record economy for every full tank, computed once over the
-            # whole ordered sequence so partial fill-ups fold into the next full
-            # tank (issue #113). Hauling tanks stay as endpoints here — the
+            # Per-record L/100km and L/hr come from the vehicle's economy index
+            # (built once, then patched per write) rather than a rescan of the
+            # whole history on every page. Partial fill-ups fold into the next
+            # full tank (issue #113) and hauling tanks stay as endpoints — the
             # per-record display shows a figure for each full fill-up.
-            all_asc_result = await self.db.execute(
-                select(FuelRecord)
-                .where(FuelRecord.vin == vin)
-                .where(FuelRecord.odometer_km.isnot(None))
-                .order_by(FuelRecord.odometer_km.asc(), FuelRecord.date.asc())
-            )
-            all_asc = list(all_asc_result.scalars().all())
-            economy_by_id = {r.id: value for r, value in compute_full_tank_economy(all_asc)}
+            from app.services.fuel_economy_index import get_fuel_economy_index
 
-            # Per-record hours economy, computed the same way over the hours
-            # axis (ordered by engine_hours) so both dimensions stay parallel.
-            hours_asc_result = await self.db.execute(
-                select(FuelRecord)
-                .where(FuelRecord.vin == vin)
-                .where(FuelRecord.engine_hours.isnot(None))
-                .order_by(FuelRecord.engine_hours.asc(), FuelRecord.date.asc())
-            )
-            hours_asc = list(hours_asc_result.scalars().all())
-            hours_economy_by_id = {
-                r.id: l_per_hr for r, l_per_hr, _ in compute_full_tank_hours_economy(hours_asc)
-            }
+            index = await get_fuel_economy_index(self.db, vin)
 
             station_names = await resolve_station_names(self.db, list(records))
             responses = [
                 _fuel_response(
                     record,
-                    economy_by_id.get(record.id),
-                    hours_economy_by_id.get(record.id),
+                    index.l_per_100km(record.id),
+                    index.l_per_hr(record.id),
                     station_names.get(record.id),
                 )
                 for record in records
@@ -595,10 +601,10 @@ class FuelRecordService:
         self, vin: str, record_id: int, current_user: User
     ) -> tuple[FuelRecord, Decimal | None, Decimal | None]:
         """Get a specific fuel record with L/100km and L/hr."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         result = await self.db.execute(
             select(FuelRecord).where(FuelRecord.id == record_id).where(FuelRecord.vin == vin)
@@ -608,10 +614,12 @@ class FuelRecordService:
         if not record:
             raise HTTPException(status_code=404, detail=f"Fuel record {record_id} not found")
 
+        from app.services.fuel_economy_index import get_fuel_economy_index
+
         value = await self._economy_for(vin, record)
-        hours_value = await self._hours_economy_for(vin, record)
+        index = await get_fuel_economy_index(self.db, vin)
 
-        return record, value, hours_value
+        return record, value, index.l_per_hr(record.id)
 
     async def create_fuel_record(
         self, vin: str, record_data: FuelRecordCreate, current_user: User
@@ -741,7 +749,8 @@ class FuelRecordService:
             await self.db.refresh(record)
 
             value = await self._economy_for(vin, record)
-            hours_value = await self._hours_economy_for(vin, record)
+            index = await self._refresh_economy_index(vin, upsert=record)
+            hours_value = index.l_per_hr(record.id)
 
             logger.info(
                 "Created fuel record %s for %s (L/100km: %s)",
@@ -750,8 +759,6 @@ class FuelRecordService:
                 value,
             )
 
-            await invalidate_cache_for_vehicle(vin)
-
             return record, value, hours_value
 
         except HTTPException:
@@ -940,12 +947,11 @@ class FuelRecordService:
             await self.db.refresh(record)
 
             value = await self._economy_for(vin, record)
-            hours_value = await self._hours_economy_for(vin, record)
+            index = await self._refresh_economy_index(vin, upsert=record)
+            hours_value = index.l_per_hr(record.id)
 
             logger.info("Updated fuel record %s for %s", record_id, sanitize_for_log(vin))
 
-            await invalidate_cache_for_vehicle(vin)
-
             return record, value, hours_value
 
         except HTTPException:
@@ -971,12 +977,12 @@ class FuelRecordService:
 
     async def delete_fuel_record(self, vin: str, record_id: int, current_user: User) -> None:
         """Delete a fuel record and any linked DEF auto-synced record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(FuelRecord).where(FuelRecord.id == record_id).where(FuelRecord.vin == vin)
@@ -1009,7 +1015,7 @@ class FuelRecordService:
 
             logger.info("Deleted fuel record %s for %s", record_id, sanitize_for_log(vin))
 
-            await invalidate_cache_for_vehicle(vin)
+            await self._refresh_economy_index(vin, removed_id=record_id)
 
         except HTTPException:
             raise
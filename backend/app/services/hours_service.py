@@ -10,11 +10,14 @@ keep consistent (``vehicles.current_hours`` is retired as a read source).
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import HoursRecord
 
+# Canonical "current hours" order, shared by the single-vin and per-vin helpers
+_LATEST_ORDER = (HoursRecord.engine_hours.desc(), HoursRecord.date.desc(), HoursRecord.id.desc())
+
 
 async def latest_engine_hours_and_date(
     db: AsyncSession, vin: str
@@ -35,11 +38,7 @@ async def latest_engine_hours_and_date(
         await db.execute(
             select(HoursRecord.engine_hours, HoursRecord.date)
             .where(HoursRecord.vin == vin)
-            .order_by(
-                HoursRecord.engine_hours.desc(),
-                HoursRecord.date.desc(),
-                HoursRecord.id.desc(),
-            )
+            .order_by(*_LATEST_ORDER)
             .limit(1)
         )
     ).first()
@@ -48,6 +47,43 @@ async def latest_engine_hours_and_date(
     return row[0], row[1]
 
 
+async def latest_engine_hours_and_date_by_vin(
+    db: AsyncSession, vins: list[str]
+) -> dict[str, tuple[Decimal, date]]:
+    """Per-vin :func:`latest_engine_hours_and_date` for many vehicles in one query.
+
+    Ranks each vin's readings with ROW_NUMBER() over the same ``engine_hours
+    DESC, date DESC, id DESC`` order and keeps the first, so every vin resolves
+    to the same canonical reading. Vins without a reading are absent from the
+    result.
+    """
+    if not vins:
+        return {}
+    rows = await db.execute(latest_engine_hours_by_vin_query(vins))
+    return {vin: (engine_hours, reading_date) for vin, engine_hours, reading_date in rows.all()}
+
+
+def latest_engine_hours_by_vin_query(vins: list[str]) -> Select:
+    """``(vin, engine_hours, date)`` of each vin's canonical reading, one row per vin.
+
+    The statement behind :func:`latest_engine_hours_and_date_by_vin`, exposed
+    for callers that execute on a sync session (the vehicle rollup refresh).
+    """
+    ranked = (
+        select(
+            HoursRecord.vin,
+            HoursRecord.engine_hours,
+            HoursRecord.date,
+            func.row_number()
+            .over(partition_by=HoursRecord.vin, order_by=_LATEST_ORDER)
+            .label("rank"),
+        )
+        .where(HoursRecord.vin.in_(vins))
+        .subquery()
+    )
+    return select(ranked.c.vin, ranked.c.engine_hours, ranked.c.date).where(ranked.c.rank == 1)
+
+
 async def set_manual_current_hours(
     db: AsyncSession,
     vin: str,
@@ -0,0 +1,229 @@
+"""Photo derivative pipeline and content-addressed derivative store.
+
+Uploads used to be decoded with Pillow on the event loop (the decodability
+check) and got a single 512 px JPEG thumbnail; anything larger than a
+thumbnail meant downloading the full-resolution original.
+
+Every photo now gets ``sm``/``md``/``lg`` derivatives (480/1280/2048 px
+longest edge, never upscaled) in AVIF when Pillow supports it, WebP, and a
+JPEG fallback, plus the legacy thumbnail. Decoding and encoding run in a
+process pool of ``image_derivative_workers`` processes, so neither the event
+loop nor the GIL is held while a photo is processed.
+
+Derivatives are stored by the SHA-256 of the uploaded bytes::
+
+    <photos_dir>/.derivatives/<hash[:2]>/<hash>/{sm,md,lg}.{avif,webp,jpg}
+                                               thumb.jpg
+                                               manifest.json
+
+so identical uploads (the same photo on two vehicles, a re-upload) are
+rendered once, and concurrent uploads of the same bytes share one render.
+``vehicle_photos.content_hash`` links a photo to its directory; the directory
+is removed when the last photo using it is deleted. Derivatives are
+regenerable and are left out of backups.
+
+``python -m app.services.image_pipeline`` backfills hashes and derivatives
+for photos uploaded before this existed (or after a restore) and removes
+derivative sets no photo references any more.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.photo import VehiclePhoto
+from app.utils.image_derivatives import (
+    FORMAT_MEDIA_TYPES,
+    MANIFEST_NAME,
+    THUMBNAIL_NAME,
+    InvalidImageError,
+    render_derivatives,
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = ".derivatives"
+
+
+def content_hash(contents: bytes) -> str:
+    """SHA-256 hex digest identifying an upload in the store."""
+    return hashlib.sha256(contents).hexdigest()
+
+
+def derivative_dir(digest: str) -> Path:
+    """Store directory for one content hash."""
+    return settings.photos_dir / STORE_DIRNAME / digest[:2] / digest
+
+
+def thumbnail_for(digest: str) -> Path:
+    """The rendered legacy thumbnail for one content hash."""
+    return derivative_dir(digest) / THUMBNAIL_NAME
+
+
+def pick_variant(digest: str, size: str, accept: str) -> tuple[Path, str] | None:
+    """Best stored derivative the client accepts, as ``(path, media_type)``.
+
+    AVIF and WebP are served only when the ``Accept`` header lists them;
+    JPEG is always acceptable. Returns None when nothing is rendered yet.
+    """
+    directory = derivative_dir(digest)
+    for ext, media_type in FORMAT_MEDIA_TYPES.items():
+        if ext != "jpg" and media_type not in accept:
+            continue
+        path = directory / f"{size}.{ext}"
+        if path.is_file():
+            return path, media_type
+    return None
+
+
+class ImagePipeline:
+    """Process pool that renders derivatives, one render per content hash."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._inflight: dict[str, asyncio.Future[dict]] = {}
+
+    async def ensure_derivatives(self, contents: bytes, digest: str) -> None:
+        """Render derivatives for ``contents`` unless the store already has them.
+
+        Raises:
+            InvalidImageError: If the bytes are not a decodable image
+        """
+        target = derivative_dir(digest)
+        if await asyncio.to_thread((target / MANIFEST_NAME).exists):
+            return
+
+        future = self._inflight.get(digest)
+        if future is None:
+            if self._executor is None:
+                # spawn: forking a process that runs an event loop and
+                # threads can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            loop = asyncio.get_running_loop()
+            future = asyncio.ensure_future(
+                loop.run_in_executor(self._executor, render_derivatives, contents, str(target))
+            )
+            self._inflight[digest] = future
+            future.add_done_callback(lambda _: self._inflight.pop(digest, None))
+        await asyncio.shield(future)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (lifespan shutdown); restarted on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+async def release_derivatives(db: AsyncSession, digest: str | None) -> None:
+    """Remove a hash's derivatives once no photo row references it.
+
+    Call after the referencing row has been deleted (flushed or committed).
+    """
+    if not digest:
+        return
+    remaining = await db.scalar(
+        select(func.count()).select_from(VehiclePhoto).where(VehiclePhoto.content_hash == digest)
+    )
+    if not remaining:
+        await asyncio.to_thread(shutil.rmtree, derivative_dir(digest), True)
+
+
+# -----------------------------------------------------------------------------
+# Backfill
+# -----------------------------------------------------------------------------
+
+
+async def backfill_derivatives(db: AsyncSession) -> tuple[int, int]:
+    """Hash and render every photo that has no derivatives yet.
+
+    Covers photos uploaded before the pipeline existed and stores emptied by
+    a restore. Returns ``(rendered, skipped)``; photos whose original file is
+    missing or undecodable are skipped and logged.
+    """
+    photos = list((await db.execute(select(VehiclePhoto).order_by(VehiclePhoto.id))).scalars())
+    pending = [
+        photo
+        for photo in photos
+        if not photo.content_hash
+        or not (derivative_dir(photo.content_hash) / MANIFEST_NAME).exists()
+    ]
+
+    async def _backfill_one(photo: VehiclePhoto) -> bool:
+        path = settings.photos_dir / photo.file_path
+        try:
+            contents = await asyncio.to_thread(path.read_bytes)
+            digest = content_hash(contents)
+            await image_pipeline.ensure_derivatives(contents, digest)
+        except (OSError, InvalidImageError) as e:
+            logger.warning("Skipping derivatives for photo %s (%s): %s", photo.id, path, e)
+            return False
+        photo.content_hash = digest
+        return True
+
+    rendered = skipped = 0
+    # Keep every worker busy without reading all originals into memory at once
+    batch_size = image_pipeline.max_workers * 2
+    for start in range(0, len(pending), batch_size):
+        results = await asyncio.gather(
+            *(_backfill_one(photo) for photo in pending[start : start + batch_size])
+        )
+        await db.commit()
+        rendered += sum(results)
+        skipped += len(results) - sum(results)
+    return rendered, skipped
+
+
+async def prune_derivatives(db: AsyncSession) -> int:
+    """Remove store directories no photo references; returns how many.
+
+    Vehicle deletes cascade to their photo rows without going through
+    ``release_derivatives``.
+    """
+    store = settings.photos_dir / STORE_DIRNAME
+    if not store.is_dir():
+        return 0
+    referenced = set(
+        (
+            await db.execute(
+                select(VehiclePhoto.content_hash).where(VehiclePhoto.content_hash.is_not(None))
+            )
+        ).scalars()
+    )
+    removed = 0
+    for directory in store.glob("??/*"):
+        if directory.is_dir() and directory.name not in referenced:
+            await asyncio.to_thread(shutil.rmtree, directory, True)
+            removed += 1
+    return removed
+
+
+async def _main() -> None:
+    from app.database import AsyncSessionLocal, engine
+
+    async with AsyncSessionLocal() as db:
+        rendered, skipped = await backfill_derivatives(db)
+        pruned = await prune_derivatives(db)
+    await engine.dispose()
+    image_pipeline.shutdown()
+    print(f"✓ Rendered derivatives for {rendered} photo(s), skipped {skipped}")
+    print(f"✓ Removed {pruned} unreferenced derivative set(s)")
+
+
+# Global pipeline instance
+image_pipeline = ImagePipeline(settings.image_derivative_workers)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
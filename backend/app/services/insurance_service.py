@@ -35,12 +35,12 @@ class InsuranceService:
         Returns:
             List of insurance policy responses.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(InsurancePolicyModel)
@@ -63,10 +63,10 @@ class InsuranceService:
 
     async def get_policy(self, vin: str, policy_id: int, current_user: User) -> InsurancePolicy:
         """Get a specific insurance policy by ID."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         result = await self.db.execute(
             select(InsurancePolicyModel).where(
@@ -84,12 +84,12 @@ class InsuranceService:
         self, vin: str, data: InsurancePolicyCreate, current_user: User
     ) -> InsurancePolicy:
         """Create a new insurance policy."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             policy_dict = data.model_dump()
             policy_dict["vin"] = vin
@@ -134,12 +134,12 @@ class InsuranceService:
         current_user: User,
     ) -> InsurancePolicy:
         """Update an existing insurance policy."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(InsurancePolicyModel).where(
@@ -191,12 +191,12 @@ class InsuranceService:
 
     async def delete_policy(self, vin: str, policy_id: int, current_user: User) -> None:
         """Delete an insurance policy."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(InsurancePolicyModel).where(
@@ -99,12 +99,12 @@ class LiveLinkService:
 
     async def validate_global_token(self, token: str) -> bool:
         """Validate a token against the stored global token hash."""
-        stored_hash = await SettingsService.get(self.db, "livelink_global_token_hash")
-        if not stored_hash or not stored_hash.value:
+        stored_hash = await SettingsService.get_value(self.db, "livelink_global_token_hash")
+        if not stored_hash:
             return False
 
         provided_hash = self.hash_token(token)
-        return secrets.compare_digest(provided_hash, stored_hash.value)
+        return secrets.compare_digest(provided_hash, stored_hash)
 
     async def generate_device_token(self, device_id: str) -> str | None:
         """Generate and store a per-device API token.
@@ -498,33 +498,27 @@ class LiveLinkService:
 
     async def is_enabled(self) -> bool:
         """Check if LiveLink is globally enabled."""
-        setting = await SettingsService.get(self.db, "livelink_enabled")
-        return setting is not None and setting.value == "true"
+        return await SettingsService.get_value(self.db, "livelink_enabled") == "true"
 
     async def get_session_timeout_minutes(self) -> int:
         """Get session timeout in minutes."""
-        setting = await SettingsService.get(self.db, "livelink_session_timeout_minutes")
-        return int(setting.value) if setting and setting.value else 5
+        return await SettingsService.get_int(self.db, "livelink_session_timeout_minutes", 5)
 
     async def get_device_offline_timeout_minutes(self) -> int:
         """Get device offline timeout in minutes."""
-        setting = await SettingsService.get(self.db, "livelink_device_offline_timeout_minutes")
-        return int(setting.value) if setting and setting.value else 15
+        return await SettingsService.get_int(self.db, "livelink_device_offline_timeout_minutes", 15)
 
     async def get_retention_days(self) -> int:
         """Get telemetry retention period in days."""
-        setting = await SettingsService.get(self.db, "livelink_telemetry_retention_days")
-        return int(setting.value) if setting and setting.value else 90
+        return await SettingsService.get_int(self.db, "livelink_telemetry_retention_days", 90)
 
     async def get_alert_cooldown_minutes(self) -> int:
         """Get alert cooldown period in minutes."""
-        setting = await SettingsService.get(self.db, "livelink_alert_cooldown_minutes")
-        return int(setting.value) if setting and setting.value else 30
+        return await SettingsService.get_int(self.db, "livelink_alert_cooldown_minutes", 30)
 
     async def get_session_grace_period_seconds(self) -> int:
         """Get session grace period in seconds (0 = disabled)."""
-        setting = await SettingsService.get(self.db, "livelink_session_grace_period_seconds")
-        return int(setting.value) if setting and setting.value else 60
+        return await SettingsService.get_int(self.db, "livelink_session_grace_period_seconds", 60)
 
     async def set_pending_offline(self, device_id: str) -> None:
         """Mark a device as pending offline (grace period started)."""
@@ -127,30 +127,23 @@ class MQTTSubscriber:
     async def _get_config(self) -> dict[str, Any] | None:
         """Get MQTT configuration from settings."""
         async with AsyncSessionLocal() as db:
-            enabled = await SettingsService.get(db, "livelink_mqtt_enabled")
-            if not enabled or enabled.value != "true":
+            if await SettingsService.get_value(db, "livelink_mqtt_enabled") != "true":
                 return None
 
-            broker_host = await SettingsService.get(db, "livelink_mqtt_broker_host")
-            if not broker_host or not broker_host.value:
+            broker_host = await SettingsService.get_value(db, "livelink_mqtt_broker_host")
+            if not broker_host:
                 logger.error("MQTT enabled but no broker host configured")
                 return None
 
-            broker_port = await SettingsService.get(db, "livelink_mqtt_broker_port")
-            username = await SettingsService.get(db, "livelink_mqtt_username")
-            password = await SettingsService.get(db, "livelink_mqtt_password")
-            topic_prefix = await SettingsService.get(db, "livelink_mqtt_topic_prefix")
-            use_tls = await SettingsService.get(db, "livelink_mqtt_use_tls")
-
             return {
-                "host": broker_host.value,
-                "port": int(broker_port.value) if broker_port and broker_port.value else 1883,
-                "username": username.value if username and username.value else None,
-                "password": password.value if password and password.value else None,
-                "topic_prefix": topic_prefix.value
-                if topic_prefix and topic_prefix.value
-                else "wican",
-                "use_tls": use_tls and use_tls.value == "true",
+                "host": broker_host,
+                "port": await SettingsService.get_int(db, "livelink_mqtt_broker_port", 1883),
+                "username": await SettingsService.get_value(db, "livelink_mqtt_username") or None,
+                "password": await SettingsService.get_value(db, "livelink_mqtt_password") or None,
+                "topic_prefix": await SettingsService.get_value(
+                    db, "livelink_mqtt_topic_prefix", "wican"
+                ),
+                "use_tls": await SettingsService.get_value(db, "livelink_mqtt_use_tls") == "true",
             }
 
     async def _run(self) -> None:
@@ -1,20 +1,87 @@
-"""NHTSA (National Highway Traffic Safety Administration) API service."""
+"""NHTSA (National Highway Traffic Safety Administration) API service.
 
+VIN decodes and recall lists are cached in the database
+(``app.models.nhtsa_cache``): a VIN is decoded once, uncached VINs are decoded
+in batches through vPIC's ``DecodeVINValuesBatch`` endpoint, and vehicles
+sharing a make/model/year share one recall list, refreshed with a conditional
+request once it is older than ``nhtsa_recall_cache_hours``.
+
+Every request waits for a token from a process-wide bucket refilled at
+``nhtsa_requests_per_second``, and one service instance keeps at most
+``nhtsa_max_concurrency`` requests in flight.
+"""
+
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import Any
+from urllib.parse import urlencode
 
 import httpx
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.constants.fuel import FuelTypeEnum, normalize_fuel_type, split_combined_fuel_type
 from app.exceptions import SSRFProtectionError
+from app.models.nhtsa_cache import NHTSARecallCache, NHTSAVINDecode
+from app.utils.datetime_utils import utc_now
 from app.utils.logging_utils import sanitize_for_log
 from app.utils.url_validation import validate_nhtsa_url
 from app.utils.vin import validate_vin
 
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+# vPIC's batch decode accepts at most 50 VINs per request
+DECODE_BATCH_SIZE = 50
+
+DEFAULT_RECALLS_API_URL = "https://api.nhtsa.gov/recalls"
+
+# (make, model, model year) — the key NHTSA recalls are listed by
+RecallVehicle = tuple[str, str, int]
+
+
+class TokenBucket:
+    """Spreads requests to ``rate`` per second, allowing bursts of ``burst``.
+
+    ``acquire`` takes a token, or reserves the next one and sleeps until it
+    is due, so concurrent callers are spaced ``1 / rate`` apart. Not locked:
+    the read-modify-write has no await in it.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+# Shared by every NHTSAService: the limit is NHTSA's, not per caller
+rate_limiter = TokenBucket(settings.nhtsa_requests_per_second)
+
+
+@dataclass
+class _RecallFetch:
+    """Outcome of one recall list request; ``results`` is None on a 304."""
+
+    results: list[dict[str, Any]] | None
+    etag: str | None
+    last_modified: str | None
+
 
 class NHTSAService:
     """Service for interacting with NHTSA vPIC API.
@@ -25,7 +92,13 @@ class NHTSAService:
         - Blocks private IPs, localhost, and cloud metadata endpoints
     """
 
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Optionally share ``client`` across calls (it is not closed here).
+
+        Without one, each call opens its own client.
+        """
+        self._client = client
+        self._slots = asyncio.Semaphore(settings.nhtsa_max_concurrency)
         base_url = settings.nhtsa_api_base_url
 
         # SECURITY: Validate base URL against SSRF attacks (CWE-918)
@@ -43,7 +116,23 @@ class NHTSAService:
             self.base_url = "https://vpic.nhtsa.dot.gov/api"
             logger.warning("Using fallback NHTSA URL: %s", self.base_url)
 
-        self.timeout = 30.0
+        self.timeout = REQUEST_TIMEOUT_SECONDS
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None:
+            yield self._client
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
+
+    async def _send(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send one request once a concurrency slot and a rate token are free."""
+        async with self._slots:
+            await rate_limiter.acquire()
+            return await client.request(method, url, **kwargs)
 
     async def decode_vin(self, vin: str) -> dict[str, Any]:
         """
@@ -70,10 +159,10 @@ class NHTSAService:
 
         logger.info("Decoding VIN: %s", sanitize_for_log(vin))
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._http() as client:
             try:
                 # codeql[py/partial-ssrf] - self.base_url validated in __init__ by validate_nhtsa_url
-                response = await client.get(url)
+                response = await self._send(client, "GET", url)
                 response.raise_for_status()
                 data = response.json()
 
@@ -220,144 +309,302 @@ class NHTSAService:
         except ValueError, TypeError:
             return None
 
-    async def get_vehicle_recalls(self, vin: str, db: AsyncSession) -> list[dict[str, Any]]:
+    async def decode_vins(self, vins: Iterable[str], db: AsyncSession) -> dict[str, dict[str, Any]]:
+        """Decoded vehicle info per VIN, from the decode cache or vPIC.
+
+        Cached VINs are read in one query; the rest are decoded through the
+        batch endpoint, up to ``DECODE_BATCH_SIZE`` per request, and the
+        decodes that name a make, model and year are added to the cache
+        (flushed, not committed). VINs that cannot be decoded, or whose batch
+        request fails, are absent; a failed batch is logged and leaves the
+        other batches' decodes in place.
         """
-        Get recalls for a specific VIN from NHTSA.
+        wanted = list(dict.fromkeys(vin.upper().strip() for vin in vins))
+        if not wanted:
+            return {}
+
+        rows = await db.scalars(select(NHTSAVINDecode).where(NHTSAVINDecode.vin.in_(wanted)))
+        decoded = {row.vin: row.info for row in rows}
+        missing = [vin for vin in wanted if vin not in decoded]
+        if not missing:
+            return decoded
+
+        batches = [
+            missing[start : start + DECODE_BATCH_SIZE]
+            for start in range(0, len(missing), DECODE_BATCH_SIZE)
+        ]
+        async with self._http() as client:
+            results = await asyncio.gather(
+                *(self._decode_batch(client, batch) for batch in batches),
+                return_exceptions=True,
+            )
 
-        Note: NHTSA does not provide a direct VIN-to-recalls API endpoint.
-        This method first decodes the VIN to get make/model/year, then
-        queries recalls by those parameters.
+        failed = 0
+        for batch, infos in zip(batches, results, strict=True):
+            if isinstance(infos, httpx.HTTPError | ValueError):
+                failed += 1
+                logger.error(
+                    "NHTSA batch decode of %d VIN(s) failed: %s",
+                    len(batch),
+                    sanitize_for_log(infos),
+                )
+                continue
+            if isinstance(infos, BaseException):
+                raise infos
+            for info in infos:
+                vin = str(info.get("vin", "")).upper()
+                if vin not in batch or not all(info.get(k) for k in ("make", "model", "year")):
+                    continue
+                decoded[vin] = info
+                await db.merge(NHTSAVINDecode(vin=vin, info=info))
+        await db.flush()
 
-        Args:
-            vin: The 17-character VIN
-            db: Database session for fetching settings
+        logger.info(
+            "Decoded %d of %d uncached VIN(s) in %d batch request(s), %d failed",
+            sum(1 for vin in missing if vin in decoded),
+            len(missing),
+            len(batches),
+            failed,
+        )
+        return decoded
+
+    async def _decode_batch(
+        self, client: httpx.AsyncClient, vins: list[str]
+    ) -> list[dict[str, Any]]:
+        """Decode up to ``DECODE_BATCH_SIZE`` VINs with one vPIC request."""
+        url = f"{self.base_url}/vehicles/DecodeVINValuesBatch/"
+        # codeql[py/partial-ssrf] - self.base_url validated in __init__ by validate_nhtsa_url
+        response = await self._send(
+            client, "POST", url, data={"format": "json", "data": ";".join(vins)}
+        )
+        response.raise_for_status()
+        try:
+            results = response.json()["Results"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid NHTSA response: {e}")
+        return [self._extract_vehicle_info(result) for result in results]
 
-        Returns:
-            List of recall dictionaries
+    async def _decode_for_lookup(self, vin: str, db: AsyncSession, purpose: str) -> RecallVehicle:
+        """(make, model, year) of ``vin`` for a recall or TSB lookup.
 
         Raises:
-            ValueError: If VIN is invalid or vehicle info cannot be decoded
+            ValueError: If the VIN is invalid or cannot be decoded
         """
-        # First, decode the VIN to get make/model/year
+        is_valid, error_msg = validate_vin(vin)
+        if not is_valid:
+            raise ValueError(f"Could not decode VIN to fetch {purpose}: Invalid VIN: {error_msg}")
         try:
-            vehicle_info = await self.decode_vin(vin)
+            decoded = await self.decode_vins([vin], db)
         except Exception as e:
             logger.error(
                 "Failed to decode VIN %s: %s",
                 sanitize_for_log(vin),
                 sanitize_for_log(e),
             )
-            raise ValueError(f"Could not decode VIN to fetch recalls: {str(e)}")
-
-        # Extract make, model, and year
-        make = vehicle_info.get("make")
-        model = vehicle_info.get("model")
-        year = vehicle_info.get("year")
+            raise ValueError(f"Could not decode VIN to fetch {purpose}: {str(e)}")
 
-        if not all([make, model, year]):
-            logger.warning(
-                "Incomplete vehicle info for VIN %s: make=%s, model=%s, year=%s",
-                sanitize_for_log(vin),
-                sanitize_for_log(make),
-                sanitize_for_log(model),
-                year,
-            )
+        info = decoded.get(vin.upper().strip())
+        if info is None:
+            logger.warning("Incomplete vehicle info for VIN %s", sanitize_for_log(vin))
             raise ValueError("Could not determine vehicle make, model, and year from VIN")
+        return info["make"], info["model"], info["year"]
 
-        # Get recalls API URL from settings
-        from sqlalchemy import select
-
+    async def _api_base(self, db: AsyncSession, key: str, default: str, label: str) -> str:
+        """An NHTSA API base URL from settings, or ``default`` if it fails SSRF checks."""
         from app.models.settings import Setting
 
-        result = await db.execute(select(Setting).where(Setting.key == "nhtsa_recalls_api_url"))
+        result = await db.execute(select(Setting).where(Setting.key == key))
         setting = result.scalar_one_or_none()
-        recalls_api_base = setting.value if setting else "https://api.nhtsa.gov/recalls"
+        api_base = setting.value if setting else default
 
-        # SECURITY: Validate recalls API base URL against SSRF attacks
+        # SECURITY: Validate API base URL against SSRF attacks
         try:
-            validate_nhtsa_url(recalls_api_base)
+            validate_nhtsa_url(api_base)
         except (SSRFProtectionError, ValueError) as e:
             logger.error(
-                "SSRF protection blocked recalls API URL: %s - %s",
-                sanitize_for_log(recalls_api_base),
+                "SSRF protection blocked %s API URL: %s - %s",
+                label,
+                sanitize_for_log(api_base),
                 sanitize_for_log(e),
             )
             # Use safe default if validation fails
-            recalls_api_base = "https://api.nhtsa.gov/recalls"
-            logger.warning("Using fallback recalls API URL: %s", recalls_api_base)
+            api_base = default
+            logger.warning("Using fallback %s API URL: %s", label, api_base)
+        return api_base
+
+    async def get_recalls_by_vehicle(
+        self, vehicles: Iterable[RecallVehicle], db: AsyncSession
+    ) -> dict[RecallVehicle, list[dict[str, Any]]]:
+        """Recall lists for each distinct (make, model, year), through the recall cache.
+
+        Lists checked within ``nhtsa_recall_cache_hours`` are returned as
+        cached. Older or missing ones are requested concurrently, the stale
+        ones conditionally; a failed request falls back to the cached list
+        (or none). Cache rows are flushed, not committed.
+        """
+        wanted = set(vehicles)
+        if not wanted:
+            return {}
+
+        rows = {
+            (row.make, row.model, row.model_year): row
+            for row in await db.scalars(
+                select(NHTSARecallCache).where(
+                    tuple_(
+                        NHTSARecallCache.make,
+                        NHTSARecallCache.model,
+                        NHTSARecallCache.model_year,
+                    ).in_(wanted)
+                )
+            )
+        }
+        now = utc_now()
+        fresh_after = now - timedelta(hours=settings.nhtsa_recall_cache_hours)
+        stale = [key for key in wanted if key not in rows or rows[key].checked_at < fresh_after]
 
-        # Query NHTSA recalls API by make/model/year
-        # URL parameters should be properly encoded
-        from urllib.parse import urlencode
+        if stale:
+            api_base = await self._api_base(
+                db, "nhtsa_recalls_api_url", DEFAULT_RECALLS_API_URL, "recalls"
+            )
+            async with self._http() as client:
+                fetches = await asyncio.gather(
+                    *(self._fetch_recalls(client, api_base, key, rows.get(key)) for key in stale)
+                )
+            for key, fetch in zip(stale, fetches, strict=True):
+                if fetch is None:
+                    continue
+                row = rows.get(key)
+                if row is None:
+                    row = NHTSARecallCache(make=key[0], model=key[1], model_year=key[2])
+                    db.add(row)
+                    rows[key] = row
+                if fetch.results is not None:
+                    row.results = fetch.results
+                    row.etag = fetch.etag
+                    row.last_modified = fetch.last_modified
+                    row.fetched_at = now
+                row.checked_at = now
+            await db.flush()
 
+        logger.info(
+            "Recall lists for %d vehicle type(s): %d cached, %d requested",
+            len(wanted),
+            len(wanted) - len(stale),
+            len(stale),
+        )
+        return {key: rows[key].results if key in rows else [] for key in wanted}
+
+    async def _fetch_recalls(
+        self,
+        client: httpx.AsyncClient,
+        api_base: str,
+        vehicle: RecallVehicle,
+        cached: NHTSARecallCache | None,
+    ) -> _RecallFetch | None:
+        """Request one recall list; None when the request fails."""
+        make, model, year = vehicle
         params = {"make": make, "model": model, "modelYear": year}
-        recalls_url = f"{recalls_api_base}/recallsByVehicle?{urlencode(params)}"
+        recalls_url = f"{api_base}/recallsByVehicle?{urlencode(params)}"
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
 
         logger.info(
-            "Fetching recalls for %s %s %s (VIN: %s)",
+            "Fetching recalls for %s %s %s",
             year,
             sanitize_for_log(make),
             sanitize_for_log(model),
-            sanitize_for_log(vin),
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                # codeql[py/partial-ssrf] - recalls_api_base validated by validate_nhtsa_url above
-                response = await client.get(recalls_url)
-                response.raise_for_status()
-                data = response.json()
+        try:
+            # codeql[py/partial-ssrf] - api_base validated by validate_nhtsa_url in _api_base
+            response = await self._send(client, "GET", recalls_url, headers=headers)
+            if response.status_code == 304 and cached is not None:
+                return _RecallFetch(None, cached.etag, cached.last_modified)
+            response.raise_for_status()
+            recalls = response.json().get("results", [])
+        except httpx.TimeoutException:
+            logger.error(
+                "NHTSA recalls API timeout for %s %s %s",
+                year,
+                sanitize_for_log(make),
+                sanitize_for_log(model),
+            )
+            return None
+        except httpx.ConnectError as e:
+            logger.error(
+                "Cannot connect to NHTSA recalls API for %s %s %s: %s",
+                year,
+                sanitize_for_log(make),
+                sanitize_for_log(model),
+                sanitize_for_log(e),
+            )
+            return None
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "NHTSA recalls API error for %s %s %s: %s",
+                year,
+                sanitize_for_log(make),
+                sanitize_for_log(model),
+                sanitize_for_log(e),
+            )
+            return None
+        except ValueError as e:
+            logger.error(
+                "Error parsing NHTSA recalls response for %s %s %s: %s",
+                year,
+                sanitize_for_log(make),
+                sanitize_for_log(model),
+                sanitize_for_log(e),
+            )
+            return None
 
-                # Extract recalls from the response
-                recalls = data.get("results", [])
+        logger.info(
+            "Found %s recall(s) for %s %s %s",
+            len(recalls),
+            year,
+            sanitize_for_log(make),
+            sanitize_for_log(model),
+        )
+        return _RecallFetch(
+            recalls, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
 
-                logger.info(
-                    "Found %s recall(s) for %s %s %s",
-                    len(recalls),
-                    year,
-                    sanitize_for_log(make),
-                    sanitize_for_log(model),
-                )
+    async def get_vehicle_recalls(self, vin: str, db: AsyncSession) -> list[dict[str, Any]]:
+        """
+        Get recalls for a specific VIN from NHTSA.
 
-                return recalls
+        Note: NHTSA does not provide a direct VIN-to-recalls API endpoint.
+        This method decodes the VIN (through the decode cache) to get
+        make/model/year, then reads the recall list for those (through the
+        recall cache).
 
-            except httpx.TimeoutException:
-                logger.error(
-                    "NHTSA recalls API timeout for %s %s %s",
-                    year,
-                    sanitize_for_log(make),
-                    sanitize_for_log(model),
-                )
-                return []  # Intentional fallback: don't break UI for timeout
-            except httpx.ConnectError as e:
-                logger.error(
-                    "Cannot connect to NHTSA recalls API for %s %s %s: %s",
-                    year,
-                    sanitize_for_log(make),
-                    sanitize_for_log(model),
-                    sanitize_for_log(e),
-                )
-                return []  # Intentional fallback: don't break UI for connection issues
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "NHTSA recalls API error for %s %s %s: %s",
-                    year,
-                    sanitize_for_log(make),
-                    sanitize_for_log(model),
-                    sanitize_for_log(e),
-                )
-                return []  # Intentional fallback: return empty list on API error
+        Args:
+            vin: The 17-character VIN
+            db: Database session for fetching settings and the caches
+
+        Returns:
+            List of recall dictionaries
+
+        Raises:
+            ValueError: If VIN is invalid or vehicle info cannot be decoded
+        """
+        vehicle = await self._decode_for_lookup(vin, db, "recalls")
+        return (await self.get_recalls_by_vehicle([vehicle], db))[vehicle]
 
     async def get_vehicle_tsbs(self, vin: str, db: AsyncSession) -> list[dict[str, Any]]:
         """
         Get Technical Service Bulletins (TSBs) for a specific VIN from NHTSA.
 
         Similar to recalls, NHTSA does not provide a direct VIN-to-TSB endpoint.
-        This method decodes the VIN first, then queries TSBs by make/model/year.
+        This method decodes the VIN first (through the decode cache), then
+        queries TSBs by make/model/year.
 
         Args:
             vin: The 17-character VIN
-            db: Database session for fetching settings
+            db: Database session for fetching settings and the decode cache
 
         Returns:
             List of TSB dictionaries
@@ -365,57 +612,13 @@ class NHTSAService:
         Raises:
             ValueError: If VIN is invalid or vehicle info cannot be decoded
         """
-        # First, decode the VIN to get make/model/year
-        try:
-            vehicle_info = await self.decode_vin(vin)
-        except Exception as e:
-            logger.error(
-                "Failed to decode VIN %s: %s",
-                sanitize_for_log(vin),
-                sanitize_for_log(e),
-            )
-            raise ValueError(f"Could not decode VIN to fetch TSBs: {str(e)}")
-
-        # Extract make, model, and year
-        make = vehicle_info.get("make")
-        model = vehicle_info.get("model")
-        year = vehicle_info.get("year")
+        make, model, year = await self._decode_for_lookup(vin, db, "TSBs")
 
-        if not all([make, model, year]):
-            logger.warning(
-                "Incomplete vehicle info for VIN %s: make=%s, model=%s, year=%s",
-                sanitize_for_log(vin),
-                sanitize_for_log(make),
-                sanitize_for_log(model),
-                year,
-            )
-            raise ValueError("Could not determine vehicle make, model, and year from VIN")
-
-        # Get TSB API URL from settings (if configured)
-        from sqlalchemy import select
-
-        from app.models.settings import Setting
-
-        result = await db.execute(select(Setting).where(Setting.key == "nhtsa_tsb_api_url"))
-        setting = result.scalar_one_or_none()
-        tsb_api_base = setting.value if setting else "https://api.nhtsa.gov/products/vehicle/tsbs"
-
-        # SECURITY: Validate TSB API base URL against SSRF attacks
-        try:
-            validate_nhtsa_url(tsb_api_base)
-        except (SSRFProtectionError, ValueError) as e:
-            logger.error(
-                "SSRF protection blocked TSB API URL: %s - %s",
-                sanitize_for_log(tsb_api_base),
-                sanitize_for_log(e),
-            )
-            # Use safe default if validation fails
-            tsb_api_base = "https://api.nhtsa.gov/products/vehicle/tsbs"
-            logger.warning("Using fallback TSB API URL: %s", tsb_api_base)
+        tsb_api_base = await self._api_base(
+            db, "nhtsa_tsb_api_url", "https://api.nhtsa.gov/products/vehicle/tsbs", "TSB"
+        )
 
         # Query NHTSA TSB API by make/model/year
-        from urllib.parse import urlencode
-
         params = {"make": make, "model": model, "modelYear": year}
         tsb_url = f"{tsb_api_base}?{urlencode(params)}"
 
@@ -427,10 +630,10 @@ class NHTSAService:
             sanitize_for_log(vin),
         )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._http() as client:
             try:
-                # codeql[py/partial-ssrf] - tsb_api_base validated by validate_nhtsa_url above
-                response = await client.get(tsb_url)
+                # codeql[py/partial-ssrf] - tsb_api_base validated by validate_nhtsa_url in _api_base
+                response = await self._send(client, "GET", tsb_url)
                 response.raise_for_status()
                 data = response.json()
 
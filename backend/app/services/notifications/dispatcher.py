@@ -7,15 +7,7 @@ from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.notifications.base import NotificationService
-from app.services.notifications.discord import DiscordNotificationService
-from app.services.notifications.email import EmailNotificationService
-from app.services.notifications.gotify import GotifyNotificationService
-from app.services.notifications.matrix import MatrixNotificationService
-from app.services.notifications.ntfy import NtfyNotificationService
-from app.services.notifications.pushover import PushoverNotificationService
-from app.services.notifications.slack import SlackNotificationService
-from app.services.notifications.telegram import TelegramNotificationService
-from app.services.settings_service import SettingsService
+from app.services.notifications.registry import notification_registry
 from app.utils.units import UnitConverter
 
 logger = logging.getLogger(__name__)
@@ -76,6 +68,85 @@ EVENT_TAGS_MAP = {
 }
 
 
+def format_livelink_threshold_alert(
+    vehicle_name: str,
+    parameter_name: str,
+    value: float,
+    threshold_type: str,
+    threshold_value: float,
+    unit: str | None = None,
+) -> tuple[str, str]:
+    """Build the (title, message) of a LiveLink threshold alert.
+
+    Shared by ``notify_livelink_threshold_alert`` and the ingest path, which
+    enqueues the alert into the notification outbox instead of dispatching.
+    """
+    unit_str = f" {unit}" if unit else ""
+    direction = "exceeded maximum" if threshold_type == "max" else "dropped below minimum"
+    return (
+        f"Threshold Alert: {vehicle_name}",
+        f"{parameter_name} {direction} ({value:.1f}{unit_str} vs threshold {threshold_value:.1f}{unit_str}).",
+    )
+
+
+def format_recall_detected(vehicle_name: str, recall_count: int) -> tuple[str, str]:
+    """Build the (title, message) of a new-recalls notice."""
+    return (
+        f"Recall Alert: {vehicle_name}",
+        f"{recall_count} new recall(s) detected for {vehicle_name}. Please review and take appropriate action.",
+    )
+
+
+def format_insurance_expiring(
+    vehicle_name: str, policy_name: str, days_until_expiry: int
+) -> tuple[str, str]:
+    """Build the (title, message) of an insurance expiry notice."""
+    return (
+        f"Insurance Expiring: {vehicle_name}",
+        f"Insurance policy '{policy_name}' for {vehicle_name} expires in {days_until_expiry} day(s).",
+    )
+
+
+def format_warranty_expiring(
+    vehicle_name: str, warranty_name: str, days_until_expiry: int
+) -> tuple[str, str]:
+    """Build the (title, message) of a warranty expiry notice."""
+    return (
+        f"Warranty Expiring: {vehicle_name}",
+        f"Warranty '{warranty_name}' for {vehicle_name} expires in {days_until_expiry} day(s).",
+    )
+
+
+def format_odometer_milestone(vehicle_name: str, milestone: int) -> tuple[str, str]:
+    """Build the (title, message) of an odometer milestone notice."""
+    return (
+        f"Milestone Reached: {vehicle_name}",
+        f"Congratulations! {vehicle_name} has reached {milestone:,} miles!",
+    )
+
+
+def format_def_low(
+    vehicle_name: str,
+    vin: str,
+    percent: Decimal,
+    remaining_liters: Decimal,
+    as_of_date: date,
+) -> tuple[str, str]:
+    """Build the (title, message) of a DEF low-level notice.
+
+    Shows the remaining volume in both liters and gallons (Decimal-precise
+    conversion via UnitConverter) plus the as-of date of the underlying
+    reading, so staleness is visible rather than silently gated.
+    """
+    remaining_gallons = UnitConverter.liters_to_gallons(remaining_liters)
+    return (
+        f"DEF Low: {vehicle_name}",
+        f"DEF level for {vehicle_name} ({vin}) is at {percent:.1f}% "
+        f"({remaining_liters:.2f} L / {remaining_gallons:.2f} gal remaining), "
+        f"as of {as_of_date.isoformat()}.",
+    )
+
+
 class NotificationDispatcher:
     """Routes notifications to enabled services with priority-based retry."""
 
@@ -94,24 +165,24 @@ class NotificationDispatcher:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _get_setting(self, key: str, default: str = "") -> str:
-        """Get a setting value."""
-        setting = await SettingsService.get(self.db, key)
-        return setting.value if setting and setting.value else default
+    async def get_setting(self, key: str, default: str = "") -> str:
+        """Get a setting value from the notification settings snapshot."""
+        config = await notification_registry.get(self.db)
+        return config.values.get(key) or default
 
     async def _get_setting_bool(self, key: str, default: bool = False) -> bool:
         """Get a boolean setting value."""
-        value = await self._get_setting(key, str(default).lower())
+        value = await self.get_setting(key, str(default).lower())
         return value.lower() in ("true", "1", "yes")
 
-    async def _get_setting_int(self, key: str, default: int = 0) -> int:
+    async def get_setting_int(self, key: str, default: int = 0) -> int:
         """Get an integer setting value."""
         try:
-            return int(await self._get_setting(key, str(default)))
+            return int(await self.get_setting(key, str(default)))
         except ValueError:
             return default
 
-    async def _is_event_enabled(self, event_type: str) -> bool:
+    async def is_event_enabled(self, event_type: str) -> bool:
         """Check if an event type is enabled in settings."""
         if event_type not in EVENT_SETTINGS_MAP:
             # Unknown event type - allow by default
@@ -120,7 +191,7 @@ class NotificationDispatcher:
         _, event_key = EVENT_SETTINGS_MAP[event_type]
 
         # Check if notifications are enabled at all (any service)
-        any_service_enabled = await self._has_any_service_enabled()
+        any_service_enabled = await self.has_any_service_enabled()
         if not any_service_enabled:
             return False
 
@@ -128,7 +199,7 @@ class NotificationDispatcher:
         event_enabled = await self._get_setting_bool(event_key, default=True)
         return event_enabled
 
-    async def _has_any_service_enabled(self) -> bool:
+    async def has_any_service_enabled(self) -> bool:
         """Check if at least one notification service is enabled."""
         services = [
             "ntfy_enabled",
@@ -145,82 +216,14 @@ class NotificationDispatcher:
                 return True
         return False
 
-    async def _get_enabled_services(self) -> list[NotificationService]:
-        """Get list of enabled and configured notification services."""
-        services: list[NotificationService] = []
-
-        # Check ntfy
-        if await self._get_setting_bool("ntfy_enabled", default=False):
-            server = await self._get_setting("ntfy_server")
-            topic = await self._get_setting("ntfy_topic", default="mygarage")
-            api_key = await self._get_setting("ntfy_token")
-            if server and topic:
-                services.append(NtfyNotificationService(server, topic, api_key))
-
-        # Check gotify
-        if await self._get_setting_bool("gotify_enabled", default=False):
-            server = await self._get_setting("gotify_server")
-            token = await self._get_setting("gotify_token")
-            if server and token:
-                services.append(GotifyNotificationService(server, token))
-
-        # Check pushover
-        if await self._get_setting_bool("pushover_enabled", default=False):
-            user_key = await self._get_setting("pushover_user_key")
-            api_token = await self._get_setting("pushover_api_token")
-            if user_key and api_token:
-                services.append(PushoverNotificationService(user_key, api_token))
-
-        # Check slack
-        if await self._get_setting_bool("slack_enabled", default=False):
-            webhook_url = await self._get_setting("slack_webhook_url")
-            if webhook_url:
-                services.append(SlackNotificationService(webhook_url))
-
-        # Check discord
-        if await self._get_setting_bool("discord_enabled", default=False):
-            webhook_url = await self._get_setting("discord_webhook_url")
-            if webhook_url:
-                services.append(DiscordNotificationService(webhook_url))
-
-        # Check matrix
-        if await self._get_setting_bool("matrix_enabled", default=False):
-            homeserver = await self._get_setting("matrix_homeserver")
-            access_token = await self._get_setting("matrix_access_token")
-            room_id = await self._get_setting("matrix_room_id")
-            if homeserver and access_token and room_id:
-                services.append(MatrixNotificationService(homeserver, access_token, room_id))
-
-        # Check telegram
-        if await self._get_setting_bool("telegram_enabled", default=False):
-            bot_token = await self._get_setting("telegram_bot_token")
-            chat_id = await self._get_setting("telegram_chat_id")
-            if bot_token and chat_id:
-                services.append(TelegramNotificationService(bot_token, chat_id))
-
-        # Check email
-        if await self._get_setting_bool("email_enabled", default=False):
-            smtp_host = await self._get_setting("email_smtp_host")
-            smtp_port = await self._get_setting_int("email_smtp_port", default=587)
-            smtp_user = await self._get_setting("email_smtp_user")
-            smtp_password = await self._get_setting("email_smtp_password")
-            from_address = await self._get_setting("email_from")
-            to_address = await self._get_setting("email_to")
-            use_tls = await self._get_setting_bool("email_smtp_tls", default=True)
-            if smtp_host and smtp_user and smtp_password and from_address and to_address:
-                services.append(
-                    EmailNotificationService(
-                        smtp_host,
-                        smtp_port,
-                        smtp_user,
-                        smtp_password,
-                        from_address,
-                        to_address,
-                        use_tls,
-                    )
-                )
+    async def get_enabled_services(self) -> list[NotificationService]:
+        """Get list of enabled and configured notification services.
 
-        return services
+        The instances are shared and long-lived (see
+        ``app.services.notifications.registry``); callers must not close them.
+        """
+        config = await notification_registry.get(self.db)
+        return list(config.services)
 
     async def dispatch(
         self,
@@ -248,12 +251,12 @@ class NotificationDispatcher:
         results: dict[str, bool] = {}
 
         # Check if event enabled
-        if not await self._is_event_enabled(event_type):
+        if not await self.is_event_enabled(event_type):
             logger.debug("Event type '%s' is disabled", event_type)
             return results
 
         # Get enabled services
-        services = await self._get_enabled_services()
+        services = await self.get_enabled_services()
         if not services:
             logger.debug("No notification services enabled")
             return results
@@ -263,8 +266,8 @@ class NotificationDispatcher:
         final_tags = tags or EVENT_TAGS_MAP.get(event_type, [])
 
         # Load global retry settings once
-        max_attempts = await self._get_setting_int("notification_retry_attempts", default=3)
-        base_delay = float(await self._get_setting("notification_retry_delay", default="2.0"))
+        max_attempts = await self.get_setting_int("notification_retry_attempts", default=3)
+        base_delay = float(await self.get_setting("notification_retry_delay", default="2.0"))
 
         # Send to all enabled services
         for service in services:
@@ -297,8 +300,6 @@ class NotificationDispatcher:
             except Exception as e:
                 logger.error("Error sending to %s: %s", service.service_name, e)
                 results[service.service_name] = False
-            finally:
-                await service.close()
 
         return results
 
@@ -311,10 +312,11 @@ class NotificationDispatcher:
         url: str | None = None,
     ) -> dict[str, bool]:
         """Send notification about new recalls detected."""
+        title, message = format_recall_detected(vehicle_name, recall_count)
         return await self.dispatch(
             event_type="recall_detected",
-            title=f"Recall Alert: {vehicle_name}",
-            message=f"{recall_count} new recall(s) detected for {vehicle_name}. Please review and take appropriate action.",
+            title=title,
+            message=message,
             url=url,
         )
 
@@ -356,10 +358,11 @@ class NotificationDispatcher:
         url: str | None = None,
     ) -> dict[str, bool]:
         """Send notification about expiring insurance."""
+        title, message = format_insurance_expiring(vehicle_name, policy_name, days_until_expiry)
         return await self.dispatch(
             event_type="insurance_expiring",
-            title=f"Insurance Expiring: {vehicle_name}",
-            message=f"Insurance policy '{policy_name}' for {vehicle_name} expires in {days_until_expiry} day(s).",
+            title=title,
+            message=message,
             url=url,
         )
 
@@ -371,10 +374,11 @@ class NotificationDispatcher:
         url: str | None = None,
     ) -> dict[str, bool]:
         """Send notification about expiring warranty."""
+        title, message = format_warranty_expiring(vehicle_name, warranty_name, days_until_expiry)
         return await self.dispatch(
             event_type="warranty_expiring",
-            title=f"Warranty Expiring: {vehicle_name}",
-            message=f"Warranty '{warranty_name}' for {vehicle_name} expires in {days_until_expiry} day(s).",
+            title=title,
+            message=message,
             url=url,
         )
 
@@ -385,11 +389,11 @@ class NotificationDispatcher:
         url: str | None = None,
     ) -> dict[str, bool]:
         """Send notification about odometer milestone."""
-        formatted_milestone = f"{milestone:,}"
+        title, message = format_odometer_milestone(vehicle_name, milestone)
         return await self.dispatch(
             event_type="odometer_milestone",
-            title=f"Milestone Reached: {vehicle_name}",
-            message=f"Congratulations! {vehicle_name} has reached {formatted_milestone} miles!",
+            title=title,
+            message=message,
             url=url,
         )
 
@@ -438,12 +442,13 @@ class NotificationDispatcher:
         url: str | None = None,
     ) -> dict[str, bool]:
         """Send notification when telemetry value exceeds threshold."""
-        unit_str = f" {unit}" if unit else ""
-        direction = "exceeded maximum" if threshold_type == "max" else "dropped below minimum"
+        title, message = format_livelink_threshold_alert(
+            vehicle_name, parameter_name, value, threshold_type, threshold_value, unit
+        )
         return await self.dispatch(
             event_type="livelink_threshold_alert",
-            title=f"Threshold Alert: {vehicle_name}",
-            message=f"{parameter_name} {direction} ({value:.1f}{unit_str} vs threshold {threshold_value:.1f}{unit_str}).",
+            title=title,
+            message=message,
             url=url,
         )
 
@@ -472,19 +477,6 @@ class NotificationDispatcher:
         remaining_liters: Decimal,
         as_of_date: date,
     ) -> dict[str, bool]:
-        """Send notification when DEF (Diesel Exhaust Fluid) level is low.
-
-        Shows the remaining volume in both liters and gallons (Decimal-precise
-        conversion via UnitConverter) plus the as-of date of the underlying
-        reading, so staleness is visible rather than silently gated.
-        """
-        remaining_gallons = UnitConverter.liters_to_gallons(remaining_liters)
-        return await self.dispatch(
-            event_type="def_low",
-            title=f"DEF Low: {vehicle_name}",
-            message=(
-                f"DEF level for {vehicle_name} ({vin}) is at {percent:.1f}% "
-                f"({remaining_liters:.2f} L / {remaining_gallons:.2f} gal remaining), "
-                f"as of {as_of_date.isoformat()}."
-            ),
-        )
+        """Send notification when DEF (Diesel Exhaust Fluid) level is low."""
+        title, message = format_def_low(vehicle_name, vin, percent, remaining_liters, as_of_date)
+        return await self.dispatch(event_type="def_low", title=title, message=message)
@@ -0,0 +1,348 @@
+"""Persistent notification outbox and its delivery worker.
+
+Alerts raised inside a write transaction (LiveLink threshold breaches on the
+MQTT and HTTPS ingest paths) used to call ``NotificationDispatcher.dispatch``
+directly, which walks every enabled service in turn and, for high-priority
+events, sleeps between ``send_with_retry`` attempts, all while the ingest
+transaction is open. Instead:
+
+- ``enqueue_notification`` adds one ``notification_outbox`` row to the
+  caller's session. It commits or rolls back with the caller's transaction
+  and costs a single INSERT; no settings are read and nothing is sent.
+- ``outbox_worker`` (started by the lifespan hook) polls the table. It fans
+  each new event row out into one row per enabled service (dropping events
+  whose toggle is off or that have no service to go to), then delivers the
+  due rows with every service running concurrently. Sends to one service are
+  spaced by its minimum interval; a failed send is retried with exponential
+  backoff, and a row that runs out of attempts is dead-lettered
+  (``status="dead"``, ``last_error`` kept for inspection).
+
+Delivery is at-least-once: a claimed row is leased for
+``CLAIM_LEASE_SECONDS``, so if the process dies mid-send the row becomes due
+again once the lease expires.
+
+The scheduler sweeps (service reminders, expiring documents, odometer
+milestones, DEF levels, recalls) queue their notices here as well, in the
+transaction that stamps their dedup columns or inserts the new rows.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database import AsyncSessionLocal
+from app.models.notification_outbox import NotificationOutbox
+from app.services.notifications.base import NotificationService
+from app.services.notifications.dispatcher import (
+    EVENT_PRIORITY_MAP,
+    EVENT_TAGS_MAP,
+    NotificationDispatcher,
+)
+from app.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+# How often the worker looks for new or due rows
+POLL_INTERVAL_SECONDS = 2.0
+
+# Event rows fanned out / service rows claimed per pass
+BATCH_SIZE = 50
+
+# A claimed row is not picked up again for this long (well above any
+# service's send timeout)
+CLAIM_LEASE_SECONDS = 120
+
+# Upper bound for the exponential retry backoff
+MAX_BACKOFF_SECONDS = 15 * 60
+
+# Sent and dead-lettered rows are pruned once they are this old
+RETENTION_DAYS = 7
+PRUNE_INTERVAL_SECONDS = 3600.0
+
+# Minimum spacing between two sends to the same service, in seconds. Chat
+# webhooks rate limit per channel (Discord ~5 per 2s, Slack and Telegram ~1
+# per second); self-hosted services are not throttled.
+SERVICE_MIN_INTERVAL_SECONDS = {
+    "discord": 0.5,
+    "slack": 1.0,
+    "telegram": 1.0,
+    "matrix": 0.5,
+    "pushover": 0.5,
+    "email": 1.0,
+}
+
+
+def enqueue_notification(
+    db: AsyncSession,
+    event_type: str,
+    title: str,
+    message: str,
+    priority: str | None = None,
+    tags: list[str] | None = None,
+    url: str | None = None,
+) -> NotificationOutbox:
+    """Queue a notification for delivery by the outbox worker.
+
+    Only adds the row to ``db``; the caller's commit makes it visible to the
+    worker, and a rollback discards it together with whatever raised it.
+    Arguments mirror ``NotificationDispatcher.dispatch``.
+    """
+    row = NotificationOutbox(
+        event_type=event_type,
+        title=title,
+        message=message,
+        priority=priority or EVENT_PRIORITY_MAP.get(event_type, "default"),
+        tags=tags or EVENT_TAGS_MAP.get(event_type, []),
+        url=url,
+        status="pending",
+        attempts=0,
+        next_attempt_at=utc_now(),
+    )
+    db.add(row)
+    return row
+
+
+def _due(now: datetime):
+    return (
+        NotificationOutbox.status == "pending",
+        NotificationOutbox.next_attempt_at <= now,
+    )
+
+
+class NotificationOutboxWorker:
+    """Background task delivering ``notification_outbox`` rows."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None) -> None:
+        self._session_factory = session_factory or AsyncSessionLocal
+        self._task: asyncio.Task | None = None
+        self._interval = 0.0
+        self._run_lock = asyncio.Lock()
+        # service name -> monotonic time of its last send
+        self._last_send: dict[str, float] = {}
+        self._last_prune = 0.0
+
+    async def run_once(self) -> int:
+        """Fan out new events and attempt every due row once.
+
+        Returns the number of rows delivered successfully.
+        """
+        async with self._run_lock, self._session_factory() as db:
+            now = utc_now()
+            if time.monotonic() - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+                await self._prune(db, now)
+
+            events = (
+                await db.scalars(
+                    select(NotificationOutbox)
+                    .where(NotificationOutbox.service.is_(None), *_due(now))
+                    .order_by(NotificationOutbox.id)
+                    .limit(BATCH_SIZE)
+                )
+            ).all()
+            if not events:
+                has_due = await db.scalar(
+                    select(NotificationOutbox.id)
+                    .where(NotificationOutbox.service.is_not(None), *_due(now))
+                    .limit(1)
+                )
+                if has_due is None:
+                    await db.commit()
+                    return 0
+
+            dispatcher = NotificationDispatcher(db)
+            services = {s.service_name: s for s in await dispatcher.get_enabled_services()}
+            if events:
+                await self._fan_out(db, dispatcher, events, list(services), now)
+            rows = await self._claim(db, now)
+            max_attempts = await dispatcher.get_setting_int(
+                "notification_retry_attempts", default=3
+            )
+            base_delay = float(
+                await dispatcher.get_setting("notification_retry_delay", default="2.0")
+            )
+            # End the read transaction before any network I/O
+            await db.commit()
+            if not rows:
+                return 0
+
+            by_service: dict[str, list[NotificationOutbox]] = defaultdict(list)
+            for row in rows:
+                by_service[row.service].append(row)
+            outcomes = await asyncio.gather(
+                *(
+                    self._deliver(name, services.get(name), group)
+                    for name, group in by_service.items()
+                )
+            )
+
+            now = utc_now()
+            sent = 0
+            for results in outcomes:
+                for row, error in results:
+                    if error is None:
+                        row.status = "sent"
+                        row.sent_at = now
+                        row.last_error = None
+                        sent += 1
+                    elif row.service not in services or row.attempts >= max_attempts:
+                        row.status = "dead"
+                        row.last_error = error
+                        logger.warning(
+                            "Notification %s to %s dead-lettered after %d attempt(s): %s",
+                            row.id,
+                            row.service,
+                            row.attempts,
+                            error,
+                        )
+                    else:
+                        multiplier = NotificationDispatcher.SERVICE_RETRY_MULTIPLIERS.get(
+                            row.service, 1.0
+                        )
+                        backoff = min(
+                            base_delay * multiplier * 2 ** (row.attempts - 1), MAX_BACKOFF_SECONDS
+                        )
+                        row.next_attempt_at = now + timedelta(seconds=backoff)
+                        row.last_error = error
+            await db.commit()
+            return sent
+
+    async def _fan_out(
+        self,
+        db: AsyncSession,
+        dispatcher: NotificationDispatcher,
+        events: list[NotificationOutbox],
+        service_names: list[str],
+        now: datetime,
+    ) -> None:
+        """Replace each event row with one row per service that should get it."""
+        enabled: dict[str, bool] = {}
+        for event in events:
+            if event.event_type not in enabled:
+                enabled[event.event_type] = bool(service_names) and (
+                    await dispatcher.is_event_enabled(event.event_type)
+                )
+            if enabled[event.event_type]:
+                db.add_all(
+                    NotificationOutbox(
+                        event_type=event.event_type,
+                        service=name,
+                        title=event.title,
+                        message=event.message,
+                        priority=event.priority,
+                        tags=event.tags,
+                        url=event.url,
+                        status="pending",
+                        attempts=0,
+                        next_attempt_at=now,
+                    )
+                    for name in service_names
+                )
+            else:
+                logger.debug("Dropping '%s' notification: disabled", event.event_type)
+            await db.delete(event)
+        await db.flush()
+
+    async def _claim(self, db: AsyncSession, now: datetime) -> list[NotificationOutbox]:
+        """Lease up to BATCH_SIZE due service rows and count the attempt."""
+        due_ids = (
+            await db.scalars(
+                select(NotificationOutbox.id)
+                .where(NotificationOutbox.service.is_not(None), *_due(now))
+                .order_by(NotificationOutbox.id)
+                .limit(BATCH_SIZE)
+            )
+        ).all()
+        if not due_ids:
+            return []
+        # Re-check due-ness in the UPDATE so a concurrent worker can't claim
+        # the same rows
+        result = await db.scalars(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(due_ids), *_due(now))
+            .values(
+                attempts=NotificationOutbox.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=CLAIM_LEASE_SECONDS),
+            )
+            .returning(NotificationOutbox)
+            .execution_options(populate_existing=True)
+        )
+        return sorted(result.all(), key=lambda row: row.id)
+
+    async def _deliver(
+        self,
+        name: str,
+        service: NotificationService | None,
+        rows: list[NotificationOutbox],
+    ) -> list[tuple[NotificationOutbox, str | None]]:
+        """Send one service's rows in order; returns (row, error or None)."""
+        if service is None:
+            return [(row, f"{name} is no longer enabled") for row in rows]
+
+        min_interval = SERVICE_MIN_INTERVAL_SECONDS.get(name, 0.0)
+        results: list[tuple[NotificationOutbox, str | None]] = []
+        for row in rows:
+            wait = self._last_send.get(name, 0.0) + min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_send[name] = time.monotonic()
+            try:
+                ok = await service.send(
+                    title=row.title,
+                    message=row.message,
+                    priority=row.priority,
+                    tags=row.tags,
+                    url=row.url,
+                )
+                results.append((row, None if ok else "send returned failure"))
+            except Exception as e:
+                logger.warning("[%s] Notification %s failed: %s", name, row.id, e)
+                results.append((row, str(e) or type(e).__name__))
+        return results
+
+    async def _prune(self, db: AsyncSession, now: datetime) -> None:
+        await db.execute(
+            delete(NotificationOutbox).where(
+                NotificationOutbox.status.in_(("sent", "dead")),
+                NotificationOutbox.created_at < now - timedelta(days=RETENTION_DAYS),
+            )
+        )
+        await db.commit()
+        self._last_prune = time.monotonic()
+
+    async def start(self, interval_seconds: float | None = None) -> None:
+        """Start the polling task."""
+        if self._task and not self._task.done():
+            return
+        self._interval = interval_seconds or POLL_INTERVAL_SECONDS
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("Notification outbox worker started (every %.1fs)", self._interval)
+
+    async def stop(self) -> None:
+        """Stop the polling task. Undelivered rows stay queued for next start."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Notification outbox worker stopped")
+
+    async def _run_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Notification outbox pass failed: %s", e)
+
+
+# Global worker instance
+outbox_worker = NotificationOutboxWorker()
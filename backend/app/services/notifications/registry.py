@@ -0,0 +1,218 @@
+"""Process-wide registry of configured notification services.
+
+Every dispatch used to read its settings one key at a time (up to ~30
+``SettingsService.get`` queries for the enabled checks, event toggle, service
+configuration and retry settings) and then build a fresh service object per
+enabled service, each opening and tearing down its own ``httpx.AsyncClient``.
+A burst of alerts (a recall sweep, the morning reminder run) therefore paid
+for every lookup and a new TLS connection on every message.
+
+Instead, the notification settings are taken from the process-wide settings
+snapshot (``app.services.settings_cache``) and one long-lived service object
+(with a keep-alive HTTP client) is kept per configured service. Whenever the
+settings snapshot is reloaded the notification keys are compared, and the
+services are rebuilt only if one of them actually changed. Replaced services
+may still be mid-send, so they are closed at a later rebuild once they have
+been retired for ``RETIRE_GRACE_SECONDS``, or on shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.notifications.base import NotificationService
+from app.services.notifications.discord import DiscordNotificationService
+from app.services.notifications.email import EmailNotificationService
+from app.services.notifications.gotify import GotifyNotificationService
+from app.services.notifications.matrix import MatrixNotificationService
+from app.services.notifications.ntfy import NtfyNotificationService
+from app.services.notifications.pushover import PushoverNotificationService
+from app.services.notifications.slack import SlackNotificationService
+from app.services.notifications.telegram import TelegramNotificationService
+from app.services.settings_cache import settings_cache
+
+logger = logging.getLogger(__name__)
+
+# Replaced services may still be mid-send; they are closed at a later
+# rebuild once they have been retired for this long (or on shutdown)
+RETIRE_GRACE_SECONDS = 60.0
+
+# Every notification setting starts with one of these (service configuration,
+# event toggles such as notify_recalls, notification_retry_*)
+NOTIFICATION_KEY_PREFIXES = (
+    "ntfy_",
+    "gotify_",
+    "pushover_",
+    "slack_",
+    "discord_",
+    "matrix_",
+    "telegram_",
+    "email_",
+    "notify_",
+    "notification_",
+)
+
+
+def setting_bool(values: Mapping[str, str], key: str, default: bool = False) -> bool:
+    """Read a boolean setting from a snapshot."""
+    value = values.get(key)
+    if not value:
+        return default
+    return value.lower() in ("true", "1", "yes")
+
+
+def setting_int(values: Mapping[str, str], key: str, default: int = 0) -> int:
+    """Read an integer setting from a snapshot."""
+    try:
+        return int(values.get(key) or default)
+    except ValueError:
+        return default
+
+
+def build_services(values: Mapping[str, str]) -> list[NotificationService]:
+    """Build every enabled and fully configured service from a snapshot."""
+    services: list[NotificationService] = []
+
+    if setting_bool(values, "ntfy_enabled"):
+        server = values.get("ntfy_server")
+        topic = values.get("ntfy_topic") or "mygarage"
+        if server and topic:
+            services.append(NtfyNotificationService(server, topic, values.get("ntfy_token")))
+
+    if setting_bool(values, "gotify_enabled"):
+        server = values.get("gotify_server")
+        token = values.get("gotify_token")
+        if server and token:
+            services.append(GotifyNotificationService(server, token))
+
+    if setting_bool(values, "pushover_enabled"):
+        user_key = values.get("pushover_user_key")
+        api_token = values.get("pushover_api_token")
+        if user_key and api_token:
+            services.append(PushoverNotificationService(user_key, api_token))
+
+    if setting_bool(values, "slack_enabled"):
+        webhook_url = values.get("slack_webhook_url")
+        if webhook_url:
+            services.append(SlackNotificationService(webhook_url))
+
+    if setting_bool(values, "discord_enabled"):
+        webhook_url = values.get("discord_webhook_url")
+        if webhook_url:
+            services.append(DiscordNotificationService(webhook_url))
+
+    if setting_bool(values, "matrix_enabled"):
+        homeserver = values.get("matrix_homeserver")
+        access_token = values.get("matrix_access_token")
+        room_id = values.get("matrix_room_id")
+        if homeserver and access_token and room_id:
+            services.append(MatrixNotificationService(homeserver, access_token, room_id))
+
+    if setting_bool(values, "telegram_enabled"):
+        bot_token = values.get("telegram_bot_token")
+        chat_id = values.get("telegram_chat_id")
+        if bot_token and chat_id:
+            services.append(TelegramNotificationService(bot_token, chat_id))
+
+    if setting_bool(values, "email_enabled"):
+        smtp_host = values.get("email_smtp_host")
+        smtp_user = values.get("email_smtp_user")
+        smtp_password = values.get("email_smtp_password")
+        from_address = values.get("email_from")
+        to_address = values.get("email_to")
+        if smtp_host and smtp_user and smtp_password and from_address and to_address:
+            services.append(
+                EmailNotificationService(
+                    smtp_host,
+                    setting_int(values, "email_smtp_port", default=587),
+                    smtp_user,
+                    smtp_password,
+                    from_address,
+                    to_address,
+                    setting_bool(values, "email_smtp_tls", default=True),
+                )
+            )
+
+    return services
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationConfig:
+    """One snapshot of the notification settings and the services built from it.
+
+    ``values`` holds only keys with a non-empty value.
+    """
+
+    values: Mapping[str, str]
+    services: tuple[NotificationService, ...]
+
+
+class NotificationRegistry:
+    """Notification configuration derived from the settings snapshot."""
+
+    def __init__(self) -> None:
+        self._config: NotificationConfig | None = None
+        # The settings snapshot the config was derived from
+        self._source: Mapping[str, str | None] | None = None
+        # (monotonic retire time, service) awaiting close
+        self._retired: list[tuple[float, NotificationService]] = []
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncSession) -> NotificationConfig:
+        """Return the current configuration, rebuilding it if settings changed."""
+        snapshot = await settings_cache.get_all(db)
+        if self._config is not None and snapshot is self._source:
+            return self._config
+
+        async with self._lock:
+            # Another task may have rebuilt while we waited for the lock
+            if self._config is None or snapshot is not self._source:
+                await self._refresh(snapshot)
+            assert self._config is not None
+            return self._config
+
+    async def _refresh(self, snapshot: Mapping[str, str | None]) -> None:
+        values = {
+            key: value
+            for key, value in snapshot.items()
+            if value and key.startswith(NOTIFICATION_KEY_PREFIXES)
+        }
+        self._source = snapshot
+        if self._config is not None and values == self._config.values:
+            return
+
+        await self._close_retired(RETIRE_GRACE_SECONDS)
+        if self._config is not None:
+            retired_at = time.monotonic()
+            self._retired.extend((retired_at, service) for service in self._config.services)
+        self._config = NotificationConfig(values, tuple(build_services(values)))
+        logger.debug("Built %d notification service(s)", len(self._config.services))
+
+    async def _close_retired(self, min_age: float = 0.0) -> None:
+        now = time.monotonic()
+        keep: list[tuple[float, NotificationService]] = []
+        for retired_at, service in self._retired:
+            if now - retired_at < min_age:
+                keep.append((retired_at, service))
+                continue
+            try:
+                await service.close()
+            except Exception as e:
+                logger.warning("Error closing %s client: %s", service.service_name, e)
+        self._retired = keep
+
+    async def close(self) -> None:
+        """Close every service client (lifespan shutdown)."""
+        if self._config is not None:
+            self._retired.extend((0.0, service) for service in self._config.services)
+            self._config = None
+            self._source = None
+        await self._close_retired()
+
+
+# Global registry instance
+notification_registry = NotificationRegistry()
@@ -0,0 +1,176 @@
+"""Background document parses with persistent status (``ocr_jobs``).
+
+A scanned insurance policy can take a minute to OCR even with its pages
+spread over the OCR pool (``app.services.ocr_pipeline``), which is longer
+than a browser or reverse proxy should hold a request open. The parse-jobs
+endpoints instead:
+
+- ``OCRJobRunner.submit_insurance_parse`` records a ``queued`` job, starts
+  the parse as an in-process task and returns at once with the job id.
+- The uploader polls the job until it is ``done`` (``result`` holds the same
+  response the synchronous parse-pdf route returns) or ``failed``.
+
+Uploads are held in memory only while their job runs, so jobs interrupted by
+a restart cannot resume; ``start`` (lifespan startup) fails them with a
+message asking for the document again, and prunes finished jobs past
+``RETENTION_DAYS``. Submitting the same document with the same inputs again
+returns the existing job instead of parsing it twice.
+"""
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database import AsyncSessionLocal
+from app.models.ocr_job import OCRJob
+from app.services.document_ocr import build_insurance_parse_response, document_ocr_service
+from app.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+KIND_INSURANCE = "insurance"
+
+# Parses running at once; further jobs wait as ``queued`` (the pool already
+# caps CPU, this caps uploads held in memory)
+MAX_RUNNING_JOBS = 2
+
+# Finished jobs are kept this long for polling and re-submission
+RETENTION_DAYS = 7
+
+INTERRUPTED_ERROR = "Parsing was interrupted by a restart; please upload the document again"
+
+
+def _cache_key(contents: bytes, *inputs: str | None) -> str:
+    digest = hashlib.sha256(contents)
+    for value in inputs:
+        digest.update(b"\0" + (value or "").encode())
+    return digest.hexdigest()
+
+
+def _owned_by(user_id: int | None):
+    return OCRJob.user_id.is_(None) if user_id is None else OCRJob.user_id == user_id
+
+
+class OCRJobRunner:
+    """Runs submitted parses as tasks and records their outcome."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None) -> None:
+        self._session_factory = session_factory or AsyncSessionLocal
+        self._tasks: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(MAX_RUNNING_JOBS)
+
+    async def submit_insurance_parse(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int | None,
+        vin: str,
+        contents: bytes,
+        provider_hint: str | None,
+    ) -> OCRJob:
+        """Queue an insurance document parse; returns the (possibly existing) job."""
+        cache_key = _cache_key(contents, vin.upper(), provider_hint)
+        existing = await db.scalar(
+            select(OCRJob)
+            .where(
+                _owned_by(user_id),
+                OCRJob.kind == KIND_INSURANCE,
+                OCRJob.cache_key == cache_key,
+                OCRJob.status != "failed",
+            )
+            .order_by(OCRJob.created_at.desc())
+            .limit(1)
+        )
+        if existing is not None:
+            return existing
+
+        job = OCRJob(
+            id=uuid.uuid4().hex,
+            kind=KIND_INSURANCE,
+            user_id=user_id,
+            vin=vin,
+            cache_key=cache_key,
+            status="queued",
+        )
+        db.add(job)
+        await db.commit()
+
+        async def _parse() -> dict[str, Any]:
+            parsed = await document_ocr_service.extract_insurance_data(
+                file_bytes=contents, target_vin=vin, provider_hint=provider_hint
+            )
+            return build_insurance_parse_response(parsed, vin)
+
+        task = asyncio.create_task(self._run(job.id, _parse))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def get_job(
+        self, db: AsyncSession, job_id: str, user_id: int | None, kind: str
+    ) -> OCRJob | None:
+        """The job if it exists, is of ``kind`` and belongs to ``user_id``."""
+        return await db.scalar(
+            select(OCRJob).where(OCRJob.id == job_id, OCRJob.kind == kind, _owned_by(user_id))
+        )
+
+    async def _run(self, job_id: str, parse: Callable[[], Awaitable[dict[str, Any]]]) -> None:
+        async with self._slots, self._session_factory() as db:
+            job = await db.get(OCRJob, job_id)
+            if job is None:
+                return
+            job.status = "running"
+            job.started_at = utc_now()
+            await db.commit()
+
+            try:
+                job.result = await parse()
+                job.status = "done"
+            except ValueError as e:
+                logger.info("OCR job %s could not parse the document: %s", job_id, e)
+                job.status = "failed"
+                job.error = "Invalid insurance document format"
+            except Exception:
+                logger.exception("OCR job %s failed", job_id)
+                job.status = "failed"
+                job.error = "Error reading uploaded document"
+            job.finished_at = utc_now()
+            await db.commit()
+
+    async def drain(self) -> None:
+        """Wait for every running or queued job to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def start(self) -> None:
+        """Fail jobs a previous process left unfinished and prune old ones."""
+        async with self._session_factory() as db:
+            now = utc_now()
+            interrupted = await db.execute(
+                update(OCRJob)
+                .where(OCRJob.status.in_(("queued", "running")))
+                .values(status="failed", error=INTERRUPTED_ERROR, finished_at=now)
+            )
+            await db.execute(
+                delete(OCRJob).where(OCRJob.created_at < now - timedelta(days=RETENTION_DAYS))
+            )
+            await db.commit()
+        if interrupted.rowcount:
+            logger.warning("Failed %d OCR job(s) interrupted by a restart", interrupted.rowcount)
+
+    async def stop(self) -> None:
+        """Cancel running jobs (they are failed on the next start)."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+# Global runner instance
+ocr_job_runner = OCRJobRunner()
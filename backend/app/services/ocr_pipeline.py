@@ -0,0 +1,145 @@
+"""Parallel, off-loop text extraction for uploaded documents.
+
+Insurance PDFs, receipts and window stickers used to be read with PyMuPDF on
+the event loop, and scanned PDFs were rasterised and OCR'd one page after
+another, so a 12-page scan held every other request for the whole run.
+
+Extraction now runs in a process pool of ``ocr_workers`` processes: the
+text layer is read in a worker, and when a PDF turns out to be scanned its
+pages are OCR'd concurrently, one task per page. Text is cached in memory
+by the SHA-256 of the uploaded bytes (``ocr_cache_entries`` files, least
+recently used evicted first), so parsing the same document again, or the
+dry-run followed by the real parse, skips OCR entirely; concurrent requests
+for the same bytes share one extraction.
+
+Long parses can also run as background jobs (``app.services.ocr_jobs``).
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import settings
+from app.utils.ocr_engine import ocr_image, ocr_pdf_page, pdf_text_layer
+
+logger = logging.getLogger(__name__)
+
+# Check if PaddleOCR is enabled
+PADDLEOCR_ENABLED = os.getenv("ENABLE_PADDLEOCR", "false").lower() == "true"
+
+# A PDF whose text layer is shorter than this is treated as scanned
+MIN_TEXT_LAYER_CHARS = 100
+
+
+class OCRPipeline:
+    """Process pool that extracts document text, one extraction per file hash."""
+
+    def __init__(self, max_workers: int, cache_entries: int) -> None:
+        self.max_workers = max_workers
+        self.cache_entries = cache_entries
+        self._executor: ProcessPoolExecutor | None = None
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def extract_text(self, contents: bytes, is_pdf: bool = True) -> str:
+        """Text of a PDF (text layer, else OCR of every page) or an image (OCR).
+
+        Returns an empty string when nothing could be extracted: a corrupt
+        file, or no OCR engine installed for a scanned document.
+        """
+        key = f"{'pdf' if is_pdf else 'image'}:{hashlib.sha256(contents).hexdigest()}"
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._extract_and_cache(key, contents, is_pdf))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _extract_and_cache(self, key: str, contents: bytes, is_pdf: bool) -> str:
+        text = await (self._extract_pdf(contents) if is_pdf else self._ocr(ocr_image, contents))
+        # Empty results are not cached: installing an OCR engine should take
+        # effect without a restart
+        if text.strip():
+            self._cache[key] = text
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return text
+
+    async def _extract_pdf(self, pdf_bytes: bytes) -> str:
+        try:
+            text, page_count = await self._submit(pdf_text_layer, pdf_bytes)
+        except ImportError:
+            logger.error("PyMuPDF not installed - cannot extract text from PDF")
+            return ""
+        except Exception as e:
+            logger.error("Error extracting text from PDF: %s", e)
+            return ""
+
+        if len(text.strip()) >= MIN_TEXT_LAYER_CHARS:
+            return text
+
+        logger.info("PDF appears to be scanned, OCR-ing %d page(s)", page_count)
+        pages = await asyncio.gather(
+            *(self._ocr(ocr_pdf_page, pdf_bytes, index) for index in range(page_count))
+        )
+        return "\n".join(page for page in pages if page) or text
+
+    async def _ocr(self, func, *args) -> str:
+        try:
+            return await self._submit(func, *args, PADDLEOCR_ENABLED)
+        except ImportError as e:
+            logger.warning("OCR engine not installed: %s", e)
+            return ""
+        except Exception as e:
+            logger.error("Error OCR-ing document: %s", e)
+            return ""
+
+    async def _submit(self, func, *args):
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and threads
+            # can deadlock the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache size and hit/miss counters."""
+        return {
+            "workers": self.max_workers,
+            "cached": len(self._cache),
+            "inflight": len(self._inflight),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def clear(self) -> None:
+        """Drop cached text and reset the counters."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (lifespan shutdown); restarted on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global pipeline instance
+ocr_pipeline = OCRPipeline(settings.ocr_workers, settings.ocr_cache_entries)
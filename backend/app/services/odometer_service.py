@@ -3,11 +3,14 @@
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import OdometerRecord
 
+# "Latest" reading order, shared by the single-vin and per-vin helpers
+_LATEST_ORDER = (OdometerRecord.date.desc(), OdometerRecord.id.desc())
+
 
 async def latest_odometer_km_and_date(
     db: AsyncSession, vin: str
@@ -26,10 +29,48 @@ async def latest_odometer_km_and_date(
         await db.execute(
             select(OdometerRecord.odometer_km, OdometerRecord.date)
             .where(OdometerRecord.vin == vin)
-            .order_by(OdometerRecord.date.desc(), OdometerRecord.id.desc())
+            .order_by(*_LATEST_ORDER)
             .limit(1)
         )
     ).first()
     if row is None:
         return None, None
     return row[0], row[1]
+
+
+async def latest_odometer_km_and_date_by_vin(
+    db: AsyncSession, vins: list[str]
+) -> dict[str, tuple[Decimal, date]]:
+    """Per-vin :func:`latest_odometer_km_and_date` for many vehicles in one query.
+
+    Ranks each vin's readings with ROW_NUMBER() over the same ``date DESC,
+    id DESC`` order and keeps the first, so every vin resolves to the same row
+    the single-vin helper picks. Vins without a reading are absent from the
+    result.
+    """
+    if not vins:
+        return {}
+    rows = await db.execute(latest_odometer_by_vin_query(vins))
+    return {vin: (odometer_km, reading_date) for vin, odometer_km, reading_date in rows.all()}
+
+
+def latest_odometer_by_vin_query(vins: list[str] | None = None) -> Select:
+    """``(vin, odometer_km, date)`` of each vin's latest reading, one row per vin.
+
+    The statement behind :func:`latest_odometer_km_and_date_by_vin`, exposed
+    for callers that execute on a sync session (the vehicle rollup refresh)
+    or join it as a subquery (the milestone sweep, which passes no ``vins``
+    to rank every vehicle's readings).
+    """
+    ranked = select(
+        OdometerRecord.vin,
+        OdometerRecord.odometer_km,
+        OdometerRecord.date,
+        func.row_number()
+        .over(partition_by=OdometerRecord.vin, order_by=_LATEST_ORDER)
+        .label("rank"),
+    )
+    if vins is not None:
+        ranked = ranked.where(OdometerRecord.vin.in_(vins))
+    ranked = ranked.subquery()
+    return select(ranked.c.vin, ranked.c.odometer_km, ranked.c.date).where(ranked.c.rank == 1)
@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.oidc_pending_link import OIDCPendingLink
 from app.models.settings import Setting
 from app.models.user import User
-from app.services.auth import verify_password
+from app.services.auth import verify_password_async
 from app.utils.datetime_utils import utc_now
 from app.utils.logging_utils import sanitize_for_log
 
@@ -202,7 +202,7 @@ async def validate_and_consume_pending_link(
         )
 
     # Verify password
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         # Increment attempt count
         pending_link.attempt_count += 1
         await db.commit()
@@ -0,0 +1,154 @@
+"""Process-wide registry of LiveLink parameter definitions.
+
+Every ingest frame (MQTT and HTTPS), every threshold check and every
+``/telemetry`` query needs the same small set of parameter definitions
+(class, unit, storage interval, thresholds, archive_only). Loading them with a
+``SELECT * FROM livelink_parameters`` each time is the dominant read on the
+ingest hot path, so they are held here and reloaded only when stale.
+
+Staleness is tracked two ways:
+
+- A local version stamp, bumped by ``invalidate()``. Writers in this process
+  (the admin parameter routes, auto-registration of new keys) call it after
+  changing a row, so the next reader reloads.
+- A cheap table fingerprint (row count + newest created_at/updated_at),
+  re-checked at most every ``FINGERPRINT_CHECK_SECONDS``. This is how other
+  Granian workers notice an edit made in a different process.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.livelink_parameter import LiveLinkParameter
+
+logger = logging.getLogger(__name__)
+
+# How often a worker re-checks the table fingerprint for edits made elsewhere
+FINGERPRINT_CHECK_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterDefinition:
+    """Immutable snapshot of the LiveLinkParameter fields read on hot paths.
+
+    Deliberately excludes warning_last_notified_at — the cooldown stamp is
+    written by ingest itself and must always be read from the row.
+    """
+
+    param_key: str
+    display_name: str | None
+    unit: str | None
+    param_class: str | None
+    category: str | None
+    warning_min: float | None
+    warning_max: float | None
+    show_on_dashboard: bool
+    archive_only: bool
+    storage_interval_seconds: int
+
+    @classmethod
+    def from_model(cls, param: LiveLinkParameter) -> ParameterDefinition:
+        """Snapshot a LiveLinkParameter row."""
+        return cls(
+            param_key=param.param_key,
+            display_name=param.display_name,
+            unit=param.unit,
+            param_class=param.param_class,
+            category=param.category,
+            warning_min=param.warning_min,
+            warning_max=param.warning_max,
+            show_on_dashboard=bool(param.show_on_dashboard),
+            archive_only=bool(param.archive_only),
+            storage_interval_seconds=param.storage_interval_seconds or 0,
+        )
+
+
+class ParameterRegistry:
+    """In-memory, version-stamped cache of parameter definitions."""
+
+    def __init__(self) -> None:
+        self._definitions: dict[str, ParameterDefinition] = {}
+        self._version = 0
+        self._loaded_version = -1
+        self._fingerprint: tuple[int, datetime | None, datetime | None] | None = None
+        self._fingerprint_checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        """Current local version stamp."""
+        return self._version
+
+    def invalidate(self) -> None:
+        """Mark the registry stale so the next reader reloads from the database."""
+        self._version += 1
+
+    async def get_all(self, db: AsyncSession) -> dict[str, ParameterDefinition]:
+        """Return all definitions keyed by param_key.
+
+        The returned dict is shared — callers that need to add entries must
+        copy it first.
+        """
+        await self._ensure_fresh(db)
+        return self._definitions
+
+    async def get(self, db: AsyncSession, param_key: str) -> ParameterDefinition | None:
+        """Return one definition, or None if the key is not registered."""
+        await self._ensure_fresh(db)
+        return self._definitions.get(param_key)
+
+    async def _ensure_fresh(self, db: AsyncSession) -> None:
+        if self._loaded_version == self._version and not self._fingerprint_due():
+            return
+
+        async with self._lock:
+            # Another task may have reloaded while we waited for the lock
+            if self._loaded_version != self._version:
+                await self._load(db)
+            elif self._fingerprint_due():
+                self._fingerprint_checked_at = time.monotonic()
+                if await self._read_fingerprint(db) != self._fingerprint:
+                    await self._load(db)
+
+    def _fingerprint_due(self) -> bool:
+        return time.monotonic() - self._fingerprint_checked_at >= FINGERPRINT_CHECK_SECONDS
+
+    async def _read_fingerprint(
+        self, db: AsyncSession
+    ) -> tuple[int, datetime | None, datetime | None]:
+        result = await db.execute(
+            select(
+                func.count(LiveLinkParameter.id),
+                func.max(LiveLinkParameter.created_at),
+                func.max(LiveLinkParameter.updated_at),
+            )
+        )
+        row = result.first()
+        if not row:
+            return (0, None, None)
+        return (row[0] or 0, row[1], row[2])
+
+    async def _load(self, db: AsyncSession) -> None:
+        version = self._version
+        result = await db.execute(select(LiveLinkParameter))
+        self._definitions = {
+            p.param_key: ParameterDefinition.from_model(p) for p in result.scalars().all()
+        }
+        self._fingerprint = await self._read_fingerprint(db)
+        self._fingerprint_checked_at = time.monotonic()
+        self._loaded_version = version
+        logger.debug(
+            "Loaded %d LiveLink parameter definitions (version %d)",
+            len(self._definitions),
+            version,
+        )
+
+
+# Global registry instance
+parameter_registry = ParameterRegistry()
@@ -0,0 +1,77 @@
+"""Bounded worker pool for password hashing.
+
+Argon2id with ``memory_cost=102400`` takes ~100 MB and hundreds of
+milliseconds per hash (legacy bcrypt checks are similarly slow by design).
+Run inline in an async handler, each login, registration or password change
+froze the event loop, and with it MQTT ingest and every other request.
+
+Hashes run here instead, on a dedicated thread pool of
+``password_hash_workers`` threads. At most ``password_hash_queue`` further
+calls may wait for a thread; beyond that the call fails immediately with
+``PasswordHashingBusyError`` rather than queueing more memory-hungry work, and the
+auth helpers turn that into a 503 with ``Retry-After``. ``stats`` reports
+in-flight, queued and rejected counts.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class PasswordHashingPool:
+    """Thread pool with a hard cap on running plus waiting hash calls."""
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._rejected = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Running, queued and rejected hash calls."""
+        return {
+            "running": min(self._pending, self.max_workers),
+            "queued": max(0, self._pending - self.max_workers),
+            "rejected": self._rejected,
+        }
+
+    async def run[T](self, fn: Callable[..., T], *args: object) -> T:
+        """Run ``fn(*args)`` on the pool, or raise ``PasswordHashingBusyError``."""
+        if self._pending >= self.max_workers + self.max_queue:
+            self._rejected += 1
+            logger.warning(
+                "Password hashing saturated (%d running, %d queued); rejecting request",
+                self.max_workers,
+                self.max_queue,
+            )
+            raise PasswordHashingBusyError
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (lifespan shutdown); restarted on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global pool instance
+password_pool = PasswordHashingPool(settings.password_hash_workers, settings.password_hash_queue)
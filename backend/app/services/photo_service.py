@@ -2,8 +2,9 @@
 
 # pyright: reportOptionalMemberAccess=false
 
+import asyncio
 import logging
-from io import BytesIO
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -12,48 +13,46 @@ from PIL import Image, ImageOps, UnidentifiedImageError
 
 from app.config import settings
 from app.models.photo import VehiclePhoto
+from app.services.file_upload_service import FileUploadService
+from app.services.image_pipeline import InvalidImageError, image_pipeline, thumbnail_for
+from app.utils.image_derivatives import DERIVATIVE_SIZES, HEIF_SUPPORTED
 from app.utils.path_validation import validate_path_within_base
 
 logger = logging.getLogger(__name__)
 
-HEIF_SUPPORTED = False
-try:
-    import pillow_heif  # type: ignore
-
-    pillow_heif.register_heif_opener()
-    HEIF_SUPPORTED = True
-except Exception:  # pragma: no cover - optional dependency
-    pass
-
-IMAGE_FORMAT_MAP = {
-    ".jpg": "JPEG",
-    ".jpeg": "JPEG",
-    ".png": "PNG",
-    ".webp": "WEBP",
-}
-
 THUMBNAIL_SIZE = (512, 512)
 PHOTO_DIR = settings.photos_dir
 
 
+def _write_original(
+    contents: bytes, file_path: Path, rendered_thumbnail: Path, thumbnail_path: Path
+) -> None:
+    """Write the upload and copy its rendered thumbnail (sync helper for thread pool)."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(contents)
+    thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(rendered_thumbnail, thumbnail_path)
+
+
 class PhotoService:
     """Service for managing vehicle photos."""
 
     @staticmethod
-    def save_image_with_thumbnail(
-        contents: bytes,
-        destination_dir: Path,
-        unique_id: str,
-        original_extension: str,
+    async def save_upload(
+        contents: bytes, digest: str, vin: str, original_filename: str
     ) -> tuple[str, str]:
         """
-        Persist the uploaded image and a thumbnail, returning relative paths.
+        Render the upload's derivatives, then persist it with a thumbnail.
+
+        Decoding and resizing run in the image pipeline's worker processes;
+        identical bytes already in the derivative store are not re-rendered.
+        Nothing is written for an undecodable image.
 
         Args:
-            contents: Image file bytes
-            destination_dir: Directory to save the image
-            unique_id: Unique identifier for the file
-            original_extension: Original file extension
+            contents: Validated image file bytes
+            digest: ``content_hash(contents)``
+            vin: Vehicle VIN (destination subdirectory)
+            original_filename: Uploaded filename (for the extension)
 
         Returns:
             Tuple of (relative_photo_path, relative_thumbnail_path)
@@ -61,53 +60,35 @@ class PhotoService:
         Raises:
             HTTPException: If image format is invalid or not supported
         """
-        extension = original_extension.lower()
-        if extension == ".heic":
-            if not HEIF_SUPPORTED:
-                raise HTTPException(
-                    status_code=415,
-                    detail="HEIC images are not supported on this server (pillow-heif missing)",
-                )
-            extension = ".jpg"
+        if Path(original_filename).suffix.lower() == ".heic" and not HEIF_SUPPORTED:
+            raise HTTPException(
+                status_code=415,
+                detail="HEIC images are not supported on this server (pillow-heif missing)",
+            )
 
         try:
-            image = Image.open(BytesIO(contents))
-            image = ImageOps.exif_transpose(image)
-        except UnidentifiedImageError:
+            await image_pipeline.ensure_derivatives(contents, digest)
+        except InvalidImageError as e:
+            logger.warning("Rejected undecodable image upload: %s", e)
             raise HTTPException(status_code=400, detail="Invalid image file")
 
-        image_format = IMAGE_FORMAT_MAP.get(extension, image.format or "PNG")
-        filename = f"{unique_id}{extension}"
-        file_path = destination_dir / filename
-
-        # Validate path is within allowed directory
-        validated_path = validate_path_within_base(file_path, PHOTO_DIR, raise_error=True)
+        photo_dir = settings.photos_dir
+        filename = FileUploadService.generate_unique_filename(original_filename)
+        file_path = photo_dir / vin / filename
+        thumbnail_path = photo_dir / vin / "thumbnails" / f"{Path(filename).stem}_thumb.jpg"
 
-        image_to_save = image.copy()
-        if image_format in ("JPEG", "WEBP") and image_to_save.mode in ("RGBA", "P"):
-            image_to_save = image_to_save.convert("RGB")
-
-        destination_dir.mkdir(parents=True, exist_ok=True)
-        image_to_save.save(validated_path, format=image_format, quality=92)
-
-        thumbnail_dir = destination_dir / "thumbnails"
-        thumbnail_dir.mkdir(parents=True, exist_ok=True)
-        thumbnail_filename = f"{unique_id}_thumb.jpg"
-        thumbnail_path = thumbnail_dir / thumbnail_filename
-
-        # Validate thumbnail path is within allowed directory
+        # Validate paths are within allowed directory
+        validated_path = validate_path_within_base(file_path, photo_dir, raise_error=True)
         validated_thumb_path = validate_path_within_base(
-            thumbnail_path, PHOTO_DIR, raise_error=True
+            thumbnail_path, photo_dir, raise_error=True
         )
 
-        thumb = image.copy()
-        thumb.thumbnail(THUMBNAIL_SIZE)
-        if thumb.mode in ("RGBA", "P"):
-            thumb = thumb.convert("RGB")
-        thumb.save(validated_thumb_path, format="JPEG", quality=85)
+        await asyncio.to_thread(
+            _write_original, contents, validated_path, thumbnail_for(digest), validated_thumb_path
+        )
 
-        relative_photo_path = str(file_path.relative_to(PHOTO_DIR))
-        relative_thumbnail_path = str(thumbnail_path.relative_to(PHOTO_DIR))
+        relative_photo_path = str(file_path.relative_to(photo_dir))
+        relative_thumbnail_path = str(thumbnail_path.relative_to(photo_dir))
         return relative_photo_path, relative_thumbnail_path
 
     @staticmethod
@@ -166,12 +147,21 @@ class PhotoService:
             thumbnail_url = f"/api/vehicles/{vin}/photos/thumbnails/{thumb_name}"
             thumbnail_path = photo.thumbnail_path
 
+        # Resized renditions; the format is negotiated from Accept when served
+        variants = None
+        if photo.content_hash:
+            variants = {
+                size: f"/api/vehicles/{vin}/photos/{filename}?size={size}"
+                for size in DERIVATIVE_SIZES
+            }
+
         return {
             "id": photo.id,
             "filename": filename,
             "path": f"/api/vehicles/{vin}/photos/{filename}",
             "thumbnail_url": thumbnail_url,
             "thumbnail_path": thumbnail_path,
+            "variants": variants,
             "file_path": photo.file_path,
             "size": size,
             "is_main": photo.is_main,
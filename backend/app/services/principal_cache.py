@@ -0,0 +1,182 @@
+"""Short-lived cache of authenticated principals.
+
+Every authenticated request used to re-load its user with ``SELECT ... FROM
+users WHERE id = ?``, and every mutating request also looked its CSRF token up
+in a second session. Both answers are stable for the life of a login session,
+so they are cached here per ``(user_id, jti)``:
+
+- the user's column values, re-attached to the request's session with
+  ``Session.merge(load=False)`` (no SELECT), so routes still get a normal
+  persistent ``User`` they can modify and commit;
+- the CSRF tokens already validated for that login session, with their expiry.
+
+Entries live for ``PRINCIPAL_TTL_SECONDS``. Session hooks drop them sooner:
+a committed ORM write to a ``User`` (deactivation, demotion, password or
+profile change) evicts that user's entries, and deleting CSRF tokens (logout,
+login cleanup) or a bulk UPDATE/DELETE on ``users`` clears the cache. Only raw
+SQL writes wait for the TTL.
+
+A write can commit (and evict) while a request is still loading the user row
+it changes. Evictions therefore bump a per-user generation; the loader reads
+the generation before its query and ``put`` only stores under that same
+generation, so a pre-commit snapshot is never cached.
+"""
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cache
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, make_transient_to_detached
+
+from app.models.csrf_token import CSRFToken
+from app.models.user import User
+from app.utils.datetime_utils import utc_now
+
+# Upper bound on how long a cached principal is trusted
+PRINCIPAL_TTL_SECONDS = 30.0
+
+# Entries beyond this are evicted oldest-first
+MAX_ENTRIES = 1024
+
+# session.info keys: user ids written / whether to clear everything on commit
+_USERS_KEY = "principal_cache_users"
+_CLEAR_KEY = "principal_cache_clear"
+
+
+@cache
+def _user_columns() -> tuple[str, ...]:
+    # Resolved on first use; inspecting the mapper at import time would
+    # configure every mapper before all models are imported
+    return tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+@dataclass(slots=True)
+class CachedPrincipal:
+    """Column values of one user plus the CSRF tokens checked for one login."""
+
+    user_id: int
+    values: Mapping[str, Any]
+    expires_at: float
+    csrf_tokens: dict[str, datetime] = field(default_factory=dict)
+
+    def attach(self, db: AsyncSession) -> User:
+        """Return the user as a persistent instance of ``db`` without a SELECT."""
+        user = User(**self.values)
+        make_transient_to_detached(user)
+        return db.sync_session.merge(user, load=False)
+
+    def csrf_token_valid(self, token: str) -> bool:
+        expires_at = self.csrf_tokens.get(token)
+        return expires_at is not None and expires_at > utc_now()
+
+
+class PrincipalCache:
+    """In-memory ``(user_id, jti) -> CachedPrincipal`` map with a TTL."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[int, str], CachedPrincipal] = {}
+        # Bumped per user by invalidate_user() and for every user by clear()
+        self._generations: dict[int, int] = {}
+        self._epoch = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters (for tests and monitoring)."""
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._entries)}
+
+    def get(self, user_id: int, jti: str) -> CachedPrincipal | None:
+        entry = self._entries.get((user_id, jti))
+        if entry is None or entry.expires_at <= time.monotonic():
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+
+    def generation(self, user_id: int) -> tuple[int, int]:
+        """Token to read before loading a user and hand to :meth:`put`."""
+        return self._epoch, self._generations.get(user_id, 0)
+
+    def put(self, jti: str, user: User, generation: tuple[int, int]) -> CachedPrincipal | None:
+        """Cache a freshly loaded user.
+
+        Returns None if the user can't be snapshotted, or if it was evicted
+        since ``generation`` was read (the loaded row may predate that write).
+        """
+        loaded = inspect(user).dict
+        columns = _user_columns()
+        if any(key not in loaded for key in columns):
+            return None
+        if self.generation(user.id) != generation:
+            return None
+        if len(self._entries) >= MAX_ENTRIES:
+            self._evict()
+        entry = CachedPrincipal(
+            user_id=user.id,
+            values={key: loaded[key] for key in columns},
+            expires_at=time.monotonic() + PRINCIPAL_TTL_SECONDS,
+        )
+        self._entries[(user.id, jti)] = entry
+        return entry
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached login session of one user."""
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[key]
+        while len(self._entries) >= MAX_ENTRIES:
+            # dicts keep insertion order, so the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_principals(session: Session, flush_context: Any) -> None:
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            session.info.setdefault(_USERS_KEY, set()).add(obj.id)
+        elif isinstance(obj, CSRFToken) and obj in session.deleted:
+            session.info[_CLEAR_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_principals(state: ORMExecuteState) -> None:
+    if (state.is_update or state.is_delete) and (
+        state.bind_mapper is not None and state.bind_mapper.class_ in (User, CSRFToken)
+    ):
+        state.session.info[_CLEAR_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    user_ids = session.info.pop(_USERS_KEY, None)
+    if session.info.pop(_CLEAR_KEY, None):
+        principal_cache.clear()
+    elif user_ids:
+        for user_id in user_ids:
+            principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_USERS_KEY, None)
+    session.info.pop(_CLEAR_KEY, None)
+
+
+# Global cache instance
+principal_cache = PrincipalCache()
@@ -45,12 +45,12 @@ class RecallService:
         Returns:
             RecallListResponse with recalls, total, active_count, resolved_count.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             query = select(Recall).where(Recall.vin == vin)
 
@@ -98,12 +98,12 @@ class RecallService:
         Returns:
             RecallListResponse with all recalls including newly fetched ones.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             # Fetch recalls from NHTSA
             nhtsa_service = NHTSAService()
@@ -227,12 +227,12 @@ class RecallService:
         Returns:
             RecallResponse for the newly created recall.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             db_recall = Recall(
                 vin=vin,
@@ -296,12 +296,12 @@ class RecallService:
         Returns:
             RecallResponse for the requested recall.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(Recall).where(Recall.id == recall_id, Recall.vin == vin)
@@ -342,12 +342,12 @@ class RecallService:
         Returns:
             RecallResponse for the updated recall.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(Recall).where(Recall.id == recall_id, Recall.vin == vin)
@@ -417,12 +417,12 @@ class RecallService:
             recall_id: Recall record ID.
             current_user: Authenticated user.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(Recall).where(Recall.id == recall_id, Recall.vin == vin)
@@ -31,8 +31,7 @@ _DRAFT_KEYS = (
 
 
 async def _setting(db: AsyncSession, key: str, default: str = "") -> str:
-    row = await SettingsService.get(db, key)
-    return (row.value if row and row.value is not None else default) or default
+    return await SettingsService.get_value(db, key, default)
 
 
 async def _enabled(db: AsyncSession) -> bool:
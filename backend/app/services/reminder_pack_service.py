@@ -16,7 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.reminder import ReminderCreate, ReminderResponse
 from app.schemas.reminder_pack import ReminderPackDetail, ReminderPackSummary
 from app.services import reminder_service
-from app.services.reminder_service import get_current_hours, get_current_mileage
+from app.services.usage_model import get_usage_model
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -138,8 +138,9 @@ async def apply_pack(
     """
     pack = get_pack(pack_id)
     today = date.today()
-    current_km = await get_current_mileage(vin, db)
-    current_hours = await get_current_hours(vin, db)
+    usage = await get_usage_model(db, vin)
+    current_km = usage.current_km
+    current_hours = usage.current_hours
 
     created: list[ReminderResponse] = []
     for item in pack.reminders:
@@ -180,6 +181,6 @@ async def apply_pack(
 
         reminder = await reminder_service.create_reminder(vin, data, db)
         await db.flush()
-        created.append(await reminder_service.enrich_with_estimate(reminder, db))
+        created.append(await reminder_service.enrich_with_estimate(reminder, db, usage))
 
     return created
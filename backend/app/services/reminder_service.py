@@ -5,7 +5,7 @@ from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.hours import HoursRecord
@@ -15,6 +15,7 @@ from app.models.service_line_item import ServiceLineItem
 from app.models.service_visit import ServiceVisit
 from app.schemas.reminder import ReminderCreate, ReminderResponse, ReminderUpdate
 from app.services.hours_service import latest_engine_hours_and_date
+from app.services.usage_model import UsageModel, get_usage_model, get_usage_models
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -294,31 +295,40 @@ async def update_reminder(reminder: Reminder, data: ReminderUpdate, db: AsyncSes
     return reminder
 
 
-async def enrich_with_estimate(reminder: Reminder, db: AsyncSession) -> ReminderResponse:
-    """Build ReminderResponse, computing estimated_due_date for smart type.
+def estimate_smart_due_date(reminder: Reminder, usage: UsageModel) -> date | None:
+    """Projected due date of a smart reminder from the vehicle's usage model.
 
     A smart reminder targets exactly one of ``due_mileage_km``/``due_hours``
     (enforced by ``validate_reminder_state``); branch on which is set and
     project from the matching accumulation rate (km/day or hours/day), both
-    fed through the same ``calculate_smart_estimated_date`` formula.
+    fed through the same ``calculate_smart_estimated_date`` formula. None
+    when there is no reading or rate to project from.
+    """
+    rate: float | None = None
+    current: Decimal | None = None
+    target: Decimal | None = None
+    if reminder.due_mileage_km is not None:
+        rate, current, target = usage.km_per_day, usage.current_km, reminder.due_mileage_km
+    elif reminder.due_hours is not None:
+        rate, current, target = usage.hours_per_day, usage.current_hours, reminder.due_hours
+    if rate and current and target and reminder.due_date:
+        return calculate_smart_estimated_date(current, target, rate, reminder.due_date)
+    return None
+
+
+async def enrich_with_estimate(
+    reminder: Reminder, db: AsyncSession, usage: UsageModel | None = None
+) -> ReminderResponse:
+    """Build ReminderResponse, computing estimated_due_date for smart type.
+
+    Pass the vehicle's ``usage`` model when it is already loaded (listing a
+    vehicle's reminders); otherwise it is fetched (or served from cache).
     """
     response = ReminderResponse.model_validate(reminder)
     if reminder.reminder_type == "smart" and reminder.status == "pending":
-        rate: float | None = None
-        current: Decimal | None = None
-        target: Decimal | None = None
-        if reminder.due_mileage_km is not None:
-            rate = await calculate_driving_rate(reminder.vin, db)
-            current = await get_current_mileage(reminder.vin, db)
-            target = reminder.due_mileage_km
-        elif reminder.due_hours is not None:
-            rate = await calculate_hours_driving_rate(reminder.vin, db)
-            current = await get_current_hours(reminder.vin, db)
-            target = reminder.due_hours
-        if rate and current and target and reminder.due_date:
-            response.estimated_due_date = calculate_smart_estimated_date(
-                current, target, rate, reminder.due_date
-            )
+        if usage is None:
+            usage = await get_usage_model(db, reminder.vin)
+        response.estimated_due_date = estimate_smart_due_date(reminder, usage)
     return response
 
 
@@ -334,42 +344,47 @@ async def list_reminders(
     result = await db.execute(query)
     reminders = result.scalars().all()
 
-    responses = []
-    for r in reminders:
-        responses.append(await enrich_with_estimate(r, db))
-    return responses
+    # One usage model for every smart estimate on the page
+    usage = await get_usage_model(db, vin) if reminders else None
+    return [await enrich_with_estimate(r, db, usage) for r in reminders]
+
 
+async def check_due_reminders(db: AsyncSession) -> tuple[int, int]:
+    """Scheduler entry point. Queue notifications for due pending reminders.
 
-async def check_due_reminders(db: AsyncSession) -> None:
-    """Scheduler entry point. Check pending reminders and send notifications.
+    Pending reminders past the 24h dedup cooldown are loaded in one query and
+    their vehicles' usage in four grouped queries (:func:`get_usage_models`).
+    Due reminders are queued in the notification outbox in the same
+    transaction that stamps ``last_notified_at``; the outbox worker delivers
+    them.
 
-    Dedup: skip if last_notified_at < 24h ago.
+    Returns the number of reminders checked and the number queued.
     """
-    from app.services.notifications.dispatcher import NotificationDispatcher
+    from app.services.notifications.outbox import enqueue_notification
 
     now = datetime.now(UTC)
     today = date.today()
 
-    # Get all pending reminders
-    result = await db.execute(select(Reminder).where(Reminder.status == "pending"))
+    # Reminder.last_notified_at is a plain (non-tz-aware) DateTime column —
+    # SQLite's bind processor drops tzinfo on write, so stored values are
+    # naive UTC. Compare against a naive cutoff.
+    cooldown_cutoff = (now - NOTIFICATION_COOLDOWN).replace(tzinfo=None)
+    result = await db.execute(
+        select(Reminder).where(
+            Reminder.status == "pending",
+            or_(
+                Reminder.last_notified_at.is_(None),
+                Reminder.last_notified_at <= cooldown_cutoff,
+            ),
+        )
+    )
     reminders = result.scalars().all()
 
-    dispatcher = NotificationDispatcher(db)
+    usage_models = await get_usage_models(db, [r.vin for r in reminders])
+    queued = 0
 
     for reminder in reminders:
-        # Dedup check. Reminder.last_notified_at is a plain (non-tz-aware)
-        # DateTime column — SQLite's bind processor silently drops tzinfo on
-        # write, so a value round-tripped through the DB comes back naive
-        # even though it was always written as UTC. Re-attach UTC before
-        # comparing against the aware `now`, or a naive/aware subtraction
-        # raises TypeError on the very next scheduler tick after a reminder
-        # has ever been notified once.
-        last_notified_at = reminder.last_notified_at
-        if last_notified_at is not None and last_notified_at.tzinfo is None:
-            last_notified_at = last_notified_at.replace(tzinfo=UTC)
-        if last_notified_at and (now - last_notified_at) < NOTIFICATION_COOLDOWN:
-            continue
-
+        usage = usage_models[reminder.vin]
         should_notify = False
 
         # Date-based check
@@ -379,14 +394,12 @@ async def check_due_reminders(db: AsyncSession) -> None:
 
         # Mileage-based check
         if reminder.reminder_type in ("mileage", "both") and reminder.due_mileage_km:
-            latest_odometer_km = await get_current_mileage(reminder.vin, db)
-            if latest_odometer_km and latest_odometer_km >= reminder.due_mileage_km:
+            if usage.current_km and usage.current_km >= reminder.due_mileage_km:
                 should_notify = True
 
         # Hours-based check
         if reminder.reminder_type == "hours" and reminder.due_hours:
-            current_hours = await get_current_hours(reminder.vin, db)
-            if current_hours and current_hours >= reminder.due_hours:
+            if usage.current_hours and usage.current_hours >= reminder.due_hours:
                 should_notify = True
 
         # Smart: check estimated date or the tracked usage target (exactly
@@ -394,14 +407,12 @@ async def check_due_reminders(db: AsyncSession) -> None:
         if reminder.reminder_type == "smart":
             # Check mileage
             if reminder.due_mileage_km:
-                latest_odometer_km = await get_current_mileage(reminder.vin, db)
-                if latest_odometer_km and latest_odometer_km >= reminder.due_mileage_km:
+                if usage.current_km and usage.current_km >= reminder.due_mileage_km:
                     should_notify = True
 
             # Check hours
             if reminder.due_hours:
-                current_hours = await get_current_hours(reminder.vin, db)
-                if current_hours and current_hours >= reminder.due_hours:
+                if usage.current_hours and usage.current_hours >= reminder.due_hours:
                     should_notify = True
 
             # Check date (hard cap)
@@ -410,44 +421,28 @@ async def check_due_reminders(db: AsyncSession) -> None:
 
             # Check estimated date (within 7 days), branching on whichever
             # target is set.
-            if not should_notify and reminder.due_date:
-                rate: float | None = None
-                current: Decimal | None = None
-                target: Decimal | None = None
-                if reminder.due_mileage_km:
-                    rate = await calculate_driving_rate(reminder.vin, db)
-                    current = await get_current_mileage(reminder.vin, db)
-                    target = reminder.due_mileage_km
-                elif reminder.due_hours:
-                    rate = await calculate_hours_driving_rate(reminder.vin, db)
-                    current = await get_current_hours(reminder.vin, db)
-                    target = reminder.due_hours
-                if rate and current and target:
-                    est = calculate_smart_estimated_date(current, target, rate, reminder.due_date)
-                    if (est - today).days <= 7:
-                        should_notify = True
+            if not should_notify:
+                est = estimate_smart_due_date(reminder, usage)
+                if est is not None and (est - today).days <= 7:
+                    should_notify = True
 
         if should_notify:
-            try:
-                await dispatcher.dispatch(
-                    event_type="reminder_due",
-                    title=f"Reminder Due: {reminder.title}",
-                    message=_build_reminder_message(reminder),
-                )
-                reminder.last_notified_at = now
-                logger.info(
-                    "Sent reminder notification for reminder %s (vin=%s)",
-                    reminder.id,
-                    sanitize_for_log(reminder.vin),
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to send reminder notification %s: %s",
-                    reminder.id,
-                    sanitize_for_log(e),
-                )
+            enqueue_notification(
+                db,
+                event_type="reminder_due",
+                title=f"Reminder Due: {reminder.title}",
+                message=_build_reminder_message(reminder),
+            )
+            reminder.last_notified_at = now
+            queued += 1
+            logger.info(
+                "Queued reminder notification for reminder %s (vin=%s)",
+                reminder.id,
+                sanitize_for_log(reminder.vin),
+            )
 
     await db.commit()
+    return len(reminders), queued
 
 
 def _build_reminder_message(reminder: Reminder) -> str:
@@ -88,13 +88,13 @@ class ServiceVisitService:
         Raises:
             HTTPException: 404 if vehicle not found, 403 if not authorized
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
             # Check vehicle ownership
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             # Get visits with line items, supply usages, and vendor
             result = await self.db.execute(
@@ -141,10 +141,10 @@ class ServiceVisitService:
         Raises:
             HTTPException: 404 if not found, 403 if not authorized
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         result = await self.db.execute(
             select(ServiceVisit)
@@ -176,12 +176,12 @@ class ServiceVisitService:
         Raises:
             HTTPException: 404 if vehicle not found, 403 if not authorized
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             # Auto-derive service_category from first line item's category
             first_cat = next((i.category for i in visit_data.line_items if i.category), None)
@@ -343,12 +343,12 @@ class ServiceVisitService:
         Raises:
             HTTPException: 404 if not found, 403 if not authorized
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             visit = await self.get_service_visit(vin, visit_id, current_user)
 
             update_data = visit_data.model_dump(exclude_unset=True)
@@ -557,12 +557,12 @@ class ServiceVisitService:
             HTTPException: 404 if not found, 403 if not authorized
         """
         from app.models.odometer import OdometerRecord
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             visit = await self.get_service_visit(vin, visit_id, current_user)
 
             # Phase 4b: delete the auto-synced odometer row(s) for this visit
@@ -633,12 +633,12 @@ class ServiceVisitService:
         Returns:
             Created ServiceLineItem object
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             visit = await self.get_service_visit(vin, visit_id, current_user)
 
             line_item = ServiceLineItem(
@@ -717,12 +717,12 @@ class ServiceVisitService:
             line_item_id: Line item ID
             current_user: The authenticated user
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             await self.get_service_visit(vin, visit_id, current_user)
 
             result = await self.db.execute(
@@ -307,15 +307,22 @@ class SessionService:
 
     async def _get_current_odometer(self, vin: str) -> float | None:
         """Get the current odometer reading from latest telemetry."""
-        # Look for ODOMETER parameter in latest values
         from app.models.vehicle_telemetry import VehicleTelemetryLatest
+        from app.services.telemetry_latest_buffer import latest_buffer
+
+        odometer_keys = ["ODOMETER", "odometer", "ODO", "DISTANCE"]
+
+        # An odometer value ingested since the last buffer flush is newer than the table
+        pending = latest_buffer.get_pending(vin)
+        for key in odometer_keys:
+            if key in pending:
+                return pending[key].value
 
+        # Look for ODOMETER parameter in latest values
         result = await self.db.execute(
             select(VehicleTelemetryLatest.value)
             .where(VehicleTelemetryLatest.vin == vin)
-            .where(
-                VehicleTelemetryLatest.param_key.in_(["ODOMETER", "odometer", "ODO", "DISTANCE"])
-            )
+            .where(VehicleTelemetryLatest.param_key.in_(odometer_keys))
             .limit(1)
         )
         row = result.first()
@@ -0,0 +1,174 @@
+"""Process-wide snapshot of the settings table.
+
+``SettingsService.get`` is one SELECT per key, and settings are read on the
+hottest paths: ``get_auth_mode`` on every authenticated request and in the
+CSRF middleware, the LiveLink helpers on every ingest frame, the MQTT
+subscriber's config. The table is small and rarely written, so every row is
+held here as a ``key -> value`` snapshot and read through the typed
+``SettingsService.get_value``/``get_bool``/``get_int`` accessors.
+
+Staleness is tracked three ways:
+
+- Session hooks watch every ORM write to ``settings`` (flushed objects and
+  bulk UPDATE/DELETE statements). The writing transaction also bumps the
+  ``settings_version`` counter, and once it commits the local snapshot is
+  invalidated, so the next reader reloads.
+- Other Granian workers compare ``settings_version`` against the version
+  their snapshot was loaded at, at most every ``VERSION_CHECK_SECONDS``.
+- A snapshot older than ``MAX_SNAPSHOT_AGE_SECONDS`` is reloaded regardless,
+  which covers raw SQL writes that bypass the ORM.
+
+A session holding flushed but uncommitted settings writes reads straight
+from the table instead, so it always sees its own changes.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.database import is_sqlite
+from app.models.settings import Setting, SettingsVersion
+
+if is_sqlite:
+    from sqlalchemy.dialects.sqlite import insert as dialect_insert
+else:
+    from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# How often a worker compares settings_version for writes made elsewhere
+VERSION_CHECK_SECONDS = 2.0
+
+# Reload at least this often even when no write was seen
+MAX_SNAPSHOT_AGE_SECONDS = 300.0
+
+# session.info key marking a transaction that has written settings
+_DIRTY_KEY = "settings_cache_dirty"
+
+
+class SettingsCache:
+    """In-memory, version-stamped copy of every setting."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, str | None] | None = None
+        self._version = 0
+        self._loaded_version = -1
+        self._db_version: int | None = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self._loads = 0
+
+    @property
+    def loads(self) -> int:
+        """Number of snapshot loads so far (for tests and monitoring)."""
+        return self._loads
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next reader reloads it."""
+        self._version += 1
+
+    async def get_all(self, db: AsyncSession) -> Mapping[str, str | None]:
+        """Return the snapshot. Treat it as read-only; it is shared."""
+        if self._values is None or self._needs_check():
+            async with self._lock:
+                # Another task may have reloaded while we waited for the lock
+                if self._values is None or self._loaded_version != self._version:
+                    await self._load(db)
+                elif self._needs_check():
+                    await self._check(db)
+        assert self._values is not None
+        return self._values
+
+    async def get(self, db: AsyncSession, key: str) -> str | None:
+        """Return one setting's value, or None when unset.
+
+        Reads the table directly while ``db`` has uncommitted settings writes.
+        """
+        if db.sync_session.info.get(_DIRTY_KEY):
+            result = await db.execute(select(Setting.value).where(Setting.key == key))
+            return result.scalar_one_or_none()
+        return (await self.get_all(db)).get(key)
+
+    def _needs_check(self) -> bool:
+        now = time.monotonic()
+        return (
+            self._loaded_version != self._version
+            or now - self._checked_at >= VERSION_CHECK_SECONDS
+            or now - self._loaded_at >= MAX_SNAPSHOT_AGE_SECONDS
+        )
+
+    async def _check(self, db: AsyncSession) -> None:
+        if time.monotonic() - self._loaded_at >= MAX_SNAPSHOT_AGE_SECONDS:
+            await self._load(db)
+            return
+        self._checked_at = time.monotonic()
+        if await _read_db_version(db) != self._db_version:
+            await self._load(db)
+
+    async def _load(self, db: AsyncSession) -> None:
+        version = self._version
+        # Version first: a write committed between the two reads shows up as
+        # a mismatch on the next check rather than being missed
+        db_version = await _read_db_version(db)
+        result = await db.execute(select(Setting.key, Setting.value))
+        self._values = {key: value for key, value in result.all()}
+        self._db_version = db_version
+        self._loaded_version = version
+        self._loaded_at = self._checked_at = time.monotonic()
+        self._loads += 1
+        logger.debug("Loaded %d settings (version %s)", len(self._values), db_version)
+
+
+async def _read_db_version(db: AsyncSession) -> int:
+    result = await db.execute(select(SettingsVersion.version).where(SettingsVersion.id == 1))
+    return result.scalar_one_or_none() or 0
+
+
+def _bump_version(session: Session) -> None:
+    """Mark this transaction as a settings write and bump settings_version."""
+    if session.info.get(_DIRTY_KEY):
+        return
+    session.info[_DIRTY_KEY] = True
+    stmt = dialect_insert(SettingsVersion).values(id=1, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"], set_={"version": SettingsVersion.version + 1}
+    )
+    session.connection().execute(stmt)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_settings(session: Session, flush_context: Any) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Setting):
+            _bump_version(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_settings(state: ORMExecuteState) -> None:
+    if (state.is_update or state.is_delete or state.is_insert) and (
+        state.bind_mapper is not None and state.bind_mapper.class_ is Setting
+    ):
+        _bump_version(state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, None):
+        settings_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
+
+
+# Global cache instance
+settings_cache = SettingsCache()
@@ -6,6 +6,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.settings import Setting
+from app.services.settings_cache import settings_cache
 
 
 class SettingsService:
@@ -23,6 +24,29 @@ class SettingsService:
         result = await db.execute(select(Setting).where(Setting.key == key))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_value(db: AsyncSession, key: str, default: str = "") -> str:
+        """Return a setting's value from the snapshot cache (``default`` if unset/empty)."""
+        value = await settings_cache.get(db, key)
+        return value if value else default
+
+    @staticmethod
+    async def get_bool(db: AsyncSession, key: str, default: bool = False) -> bool:
+        """Return a boolean setting ("true", "1" or "yes", case-insensitive)."""
+        value = await settings_cache.get(db, key)
+        if not value:
+            return default
+        return value.lower() in ("true", "1", "yes")
+
+    @staticmethod
+    async def get_int(db: AsyncSession, key: str, default: int = 0) -> int:
+        """Return an integer setting (``default`` if unset or not a number)."""
+        value = await settings_cache.get(db, key)
+        try:
+            return int(value) if value else default
+        except ValueError:
+            return default
+
     @staticmethod
     async def set(
         db: AsyncSession,
@@ -17,6 +17,7 @@ from app.schemas.spot_rental import (
     SpotRentalResponse,
     SpotRentalUpdate,
 )
+from app.utils.cache import invalidate_cache_for_vehicle
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -42,12 +43,12 @@ class SpotRentalService:
         Returns:
             SpotRentalListResponse with rentals and total count.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             query = (
                 select(SpotRental)
@@ -94,12 +95,12 @@ class SpotRentalService:
         Returns:
             SpotRentalResponse for the requested rental.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(SpotRental)
@@ -177,6 +178,7 @@ class SpotRentalService:
 
             self.db.add(rental)
             await self.db.commit()
+            await invalidate_cache_for_vehicle(vin)
             await self.db.refresh(rental)
 
             # Auto-create first billing entry if monthly rate is provided
@@ -201,6 +203,7 @@ class SpotRentalService:
                 )
                 self.db.add(billing)
                 await self.db.commit()
+                await invalidate_cache_for_vehicle(vin)
 
             # Eager-load billings relationship to avoid lazy-load issues
             await self.db.refresh(rental, attribute_names=["billings"])
@@ -250,12 +253,12 @@ class SpotRentalService:
         Returns:
             SpotRentalResponse for the updated rental.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(SpotRental)
@@ -296,6 +299,7 @@ class SpotRentalService:
                 rental.notes = data.notes
 
             await self.db.commit()
+            await invalidate_cache_for_vehicle(vin)
             await self.db.refresh(rental, attribute_names=["billings"])
 
             logger.info(
@@ -340,12 +344,12 @@ class SpotRentalService:
             rental_id: Spot rental record ID.
             current_user: Authenticated user.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(SpotRental).where(SpotRental.id == rental_id, SpotRental.vin == vin)
@@ -359,6 +363,7 @@ class SpotRentalService:
                 delete(SpotRental).where(SpotRental.id == rental_id, SpotRental.vin == vin)
             )
             await self.db.commit()
+            await invalidate_cache_for_vehicle(vin)
 
             logger.info(
                 "Deleted spot rental %s for vehicle %s",
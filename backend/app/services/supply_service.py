@@ -487,10 +487,10 @@ class SupplyService:
         from app.models.service_line_item import ServiceLineItem
         from app.models.service_visit import ServiceVisit
         from app.schemas.supply import VehicleSupplyUsagesResponse
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)  # read gate (tripwire)
+        await check_vehicle_access(vin, current_user, self.db)  # read gate (tripwire)
         rows = (
             (
                 await self.db.execute(
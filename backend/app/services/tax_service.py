@@ -36,12 +36,12 @@ class TaxRecordService:
         Returns:
             TaxRecordListResponse with records and total count.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(TaxRecord).where(TaxRecord.vin == vin).order_by(TaxRecord.date.desc())
@@ -75,12 +75,12 @@ class TaxRecordService:
         current_user: User,
     ) -> TaxRecordResponse:
         """Get a specific tax/registration record by ID."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(TaxRecord).where(TaxRecord.id == record_id, TaxRecord.vin == vin)
@@ -109,12 +109,12 @@ class TaxRecordService:
         current_user: User,
     ) -> TaxRecordResponse:
         """Create a new tax/registration record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             if data.vin != vin:
                 raise HTTPException(status_code=400, detail="VIN in URL and body must match")
@@ -167,12 +167,12 @@ class TaxRecordService:
         current_user: User,
     ) -> TaxRecordResponse:
         """Update an existing tax/registration record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(TaxRecord).where(TaxRecord.id == record_id, TaxRecord.vin == vin)
@@ -224,12 +224,12 @@ class TaxRecordService:
         current_user: User,
     ) -> None:
         """Delete a tax/registration record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(TaxRecord).where(TaxRecord.id == record_id, TaxRecord.vin == vin)
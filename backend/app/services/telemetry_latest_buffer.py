@@ -0,0 +1,301 @@
+"""Write-behind buffer for the vehicle_telemetry_latest table.
+
+Every ingest frame used to upsert one row per parameter into
+vehicle_telemetry_latest, and every 5-second ``/status`` poll read them back.
+Both sides only ever care about the newest value per (vin, param_key), so the
+values are held here instead:
+
+- Ingest records into memory and marks the key dirty. Nothing touches the
+  database on the hot path.
+- Readers (``/status``, the rate-of-change validator) are served from memory.
+  A VIN is hydrated from the table on first use and re-hydrated at most every
+  ``HYDRATE_TTL_SECONDS`` so rows written by other paths (Torque, SD backfill,
+  another worker) are picked up. Dirty keys always win over the table.
+- A background task flushes every dirty key in one batched upsert every
+  ``settings.livelink_latest_flush_seconds``; the lifespan hook runs a final
+  flush on shutdown.
+
+Values recorded by a frame whose transaction later rolls back still reach
+the table on the next flush. That is acceptable for a "last seen" cache and
+is the same trade-off the MQTT path already makes for device status.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.vehicle import Vehicle
+from app.models.vehicle_telemetry import VehicleTelemetryLatest
+from app.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+# How long a hydrated VIN is trusted before re-reading the table
+HYDRATE_TTL_SECONDS = 60.0
+
+# Rows per upsert statement (5 bound columns each; stays well under SQLite's
+# host-parameter limit)
+FLUSH_CHUNK_SIZE = 500
+
+
+@dataclass(slots=True)
+class LatestValue:
+    """Newest known value of one parameter for one vehicle."""
+
+    param_key: str
+    value: float
+    timestamp: datetime
+    received_at: datetime
+
+
+class LatestValueBuffer:
+    """In-memory, periodically flushed copy of vehicle_telemetry_latest."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, dict[str, LatestValue]] = {}
+        self._hydrated_at: dict[str, float] = {}
+        # (vin, param_key) -> monotonic time the key first became dirty
+        self._dirty: dict[tuple[str, str], float] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._interval = 0.0
+        self._flushes = 0
+        self._rows_flushed = 0
+        self._flush_errors = 0
+        self._last_flush_at: datetime | None = None
+        self._last_flush_duration_ms: float | None = None
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    async def get_values(self, db: AsyncSession, vin: str) -> list[LatestValue]:
+        """Return every latest value for a vehicle, ordered by param_key."""
+        await self._ensure_hydrated(db, vin)
+        return sorted(self._values.get(vin, {}).values(), key=attrgetter("param_key"))
+
+    async def get_previous_values(
+        self, db: AsyncSession, vin: str, param_keys: list[str]
+    ) -> dict[str, tuple[float, datetime]]:
+        """Return (value, timestamp) for the requested keys that have a value.
+
+        Same shape as TelemetryValidator.fetch_previous_values.
+        """
+        if not param_keys:
+            return {}
+        await self._ensure_hydrated(db, vin)
+        values = self._values.get(vin, {})
+        return {
+            key: (values[key].value, values[key].timestamp) for key in param_keys if key in values
+        }
+
+    def get_pending(self, vin: str) -> dict[str, LatestValue]:
+        """Return the values for a vehicle that have not been flushed yet."""
+        values = self._values.get(vin, {})
+        return {key: lv for key, lv in values.items() if (vin, key) in self._dirty}
+
+    async def _ensure_hydrated(self, db: AsyncSession, vin: str) -> None:
+        hydrated_at = self._hydrated_at.get(vin)
+        if hydrated_at is not None and time.monotonic() - hydrated_at < HYDRATE_TTL_SECONDS:
+            return
+
+        result = await db.execute(
+            select(
+                VehicleTelemetryLatest.param_key,
+                VehicleTelemetryLatest.value,
+                VehicleTelemetryLatest.timestamp,
+                VehicleTelemetryLatest.received_at,
+            ).where(VehicleTelemetryLatest.vin == vin)
+        )
+        merged = {row[0]: LatestValue(row[0], row[1], row[2], row[3]) for row in result.all()}
+        # Unflushed values are newer than anything in the table
+        merged.update(self.get_pending(vin))
+        self._values[vin] = merged
+        self._hydrated_at[vin] = time.monotonic()
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def record(self, vin: str, rows: list[dict[str, Any]]) -> None:
+        """Record new latest values and mark them dirty.
+
+        Each row is a dict with param_key, value, timestamp and received_at
+        (the same dicts TelemetryService builds for the latest upsert).
+        """
+        if not rows:
+            return
+        values = self._values.setdefault(vin, {})
+        now = time.monotonic()
+        for row in rows:
+            key = row["param_key"]
+            values[key] = LatestValue(key, row["value"], row["timestamp"], row["received_at"])
+            self._dirty.setdefault((vin, key), now)
+
+    def mark_stale(self, vin: str) -> None:
+        """Force the next read for a vehicle to re-hydrate from the table.
+
+        Used by paths that write vehicle_telemetry_latest directly (Torque,
+        SD-card backfill).
+        """
+        self._hydrated_at.pop(vin, None)
+
+    def discard_vin(self, vin: str) -> None:
+        """Drop everything held for a vehicle, including unflushed values."""
+        self._values.pop(vin, None)
+        self._hydrated_at.pop(vin, None)
+        for key in [k for k in self._dirty if k[0] == vin]:
+            del self._dirty[key]
+
+    def clear(self) -> None:
+        """Drop all buffered state (backup restore, tests)."""
+        self._values.clear()
+        self._hydrated_at.clear()
+        self._dirty.clear()
+
+    # -------------------------------------------------------------------------
+    # Flushing
+    # -------------------------------------------------------------------------
+
+    async def flush(self, db: AsyncSession | None = None) -> int:
+        """Write every dirty value to vehicle_telemetry_latest.
+
+        Opens and commits its own session unless ``db`` is given, in which case
+        the caller owns the transaction. Values for vehicles that no longer
+        exist are dropped. On failure the keys stay dirty and the error is
+        re-raised.
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            if not self._dirty:
+                return 0
+
+            pending = self._dirty
+            self._dirty = {}
+            started = time.perf_counter()
+            try:
+                if db is None:
+                    from app.database import AsyncSessionLocal
+
+                    async with AsyncSessionLocal() as session:
+                        written = await self._write(session, pending)
+                        await session.commit()
+                else:
+                    written = await self._write(db, pending)
+            except Exception:
+                # Keep the oldest dirty time so flush lag stays honest
+                for key, since in pending.items():
+                    self._dirty[key] = min(since, self._dirty.get(key, since))
+                self._flush_errors += 1
+                raise
+
+            self._flushes += 1
+            self._rows_flushed += written
+            self._last_flush_at = utc_now()
+            self._last_flush_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            return written
+
+    async def _write(self, db: AsyncSession, pending: dict[tuple[str, str], float]) -> int:
+        from app.services.telemetry_service import TelemetryService
+
+        vins = {vin for vin, _ in pending}
+        result = await db.execute(select(Vehicle.vin).where(Vehicle.vin.in_(vins)))
+        existing = {row[0] for row in result.all()}
+        for vin in vins - existing:
+            self.discard_vin(vin)
+
+        rows = []
+        for vin, key in pending:
+            lv = self._values.get(vin, {}).get(key)
+            if vin not in existing or lv is None:
+                continue
+            rows.append(
+                {
+                    "vin": vin,
+                    "param_key": key,
+                    "value": lv.value,
+                    "timestamp": lv.timestamp,
+                    "received_at": lv.received_at,
+                }
+            )
+
+        service = TelemetryService(db)
+        for i in range(0, len(rows), FLUSH_CHUNK_SIZE):
+            await service.upsert_latest_values(rows[i : i + FLUSH_CHUNK_SIZE])
+        return len(rows)
+
+    async def start(self, interval_seconds: float | None = None) -> None:
+        """Start the periodic flush task."""
+        if self._task and not self._task.done():
+            return
+        self._interval = interval_seconds or settings.livelink_latest_flush_seconds
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info("Telemetry latest-value flusher started (every %.1fs)", self._interval)
+
+    async def stop(self) -> None:
+        """Stop the periodic flush task and flush whatever is still dirty."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            written = await self.flush()
+            logger.info("Telemetry latest-value flusher stopped (%d rows flushed)", written)
+        except Exception as e:
+            logger.error("Final telemetry latest-value flush failed: %s", e)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Telemetry latest-value flush failed: %s", e)
+
+    # -------------------------------------------------------------------------
+    # Monitoring
+    # -------------------------------------------------------------------------
+
+    @property
+    def flush_lag_seconds(self) -> float:
+        """Age of the oldest unflushed value (0 when nothing is dirty)."""
+        if not self._dirty:
+            return 0.0
+        return round(time.monotonic() - min(self._dirty.values()), 3)
+
+    @property
+    def status(self) -> dict[str, Any]:
+        """Buffer counters for the admin monitoring endpoint."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "flush_interval_seconds": self._interval or settings.livelink_latest_flush_seconds,
+            "tracked_vehicles": len(self._values),
+            "tracked_entries": sum(len(v) for v in self._values.values()),
+            "dirty_entries": len(self._dirty),
+            "flush_lag_seconds": self.flush_lag_seconds,
+            "flushes": self._flushes,
+            "rows_flushed": self._rows_flushed,
+            "flush_errors": self._flush_errors,
+            "last_flush_at": self._last_flush_at,
+            "last_flush_duration_ms": self._last_flush_duration_ms,
+        }
+
+
+# Global buffer instance
+latest_buffer = LatestValueBuffer()
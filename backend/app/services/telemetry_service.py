@@ -3,12 +3,13 @@
 import hashlib
 import json
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from datetime import date as date_type
-from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import Integer, Row, and_, cast, delete, extract, func, or_, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,12 +29,15 @@ from app.models.vehicle_telemetry import (
     VehicleTelemetry,
     VehicleTelemetryLatest,
 )
+from app.services.parameter_registry import ParameterDefinition, parameter_registry
+from app.services.telemetry_latest_buffer import LatestValue, latest_buffer
 from app.services.telemetry_validator import TelemetryValidator
 from app.utils.autopid_normalizer import (
     canonical_param_key,
     infer_param_class,
     is_telemetry_param,
 )
+from app.utils.cache import invalidate_cache_for_vehicle
 
 
 @dataclass
@@ -54,6 +58,37 @@ ODOMETER_PID_PATTERNS = [
     "TOTAL_DISTANCE",
 ]
 
+
+@dataclass
+class TelemetryBucket:
+    """Aggregates of one parameter's readings within one time bucket."""
+
+    timestamp: datetime  # Bucket start (naive UTC)
+    avg_value: float
+    min_value: float
+    max_value: float
+    sample_count: int
+
+
+# Rows fetched per keyset page when streaming an export
+EXPORT_PAGE_SIZE = 5000
+
+# SD-card rows written (and committed) per backfill chunk
+BACKFILL_CHUNK_SIZE = 5000
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Telemetry timestamps are stored as naive UTC; align query bounds with them."""
+    if value.tzinfo is not None:
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def _epoch_seconds(column: Any) -> Any:
+    """Whole seconds since the Unix epoch (EXTRACT(epoch) / strftime('%s'))."""
+    return cast(extract("epoch", column), Integer)
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,6 +159,39 @@ class TelemetryService:
         result = await self.db.execute(select(LiveLinkParameter))
         return {p.param_key: p for p in result.scalars().all()}
 
+    async def get_parameter_definitions(self) -> dict[str, ParameterDefinition]:
+        """Get cached parameter definitions from the process-wide registry.
+
+        Read-only snapshot for hot paths (ingest, threshold checks, telemetry
+        queries). Use get_all_parameters() when ORM rows are needed.
+        """
+        return await parameter_registry.get_all(self.db)
+
+    async def _register_missing_parameters(
+        self,
+        param_keys: list[str],
+        config: dict[str, dict[str, str | None]] | None = None,
+    ) -> dict[str, ParameterDefinition]:
+        """Return definitions for param_keys, auto-registering unknown keys.
+
+        In steady state every key is already in the registry and this costs no
+        queries. The returned dict is a private copy only when keys had to be
+        registered.
+        """
+        parameters = await self.get_parameter_definitions()
+        missing = [param_key for param_key in param_keys if param_key not in parameters]
+        if not missing:
+            return parameters
+
+        parameters = dict(parameters)
+        for param_key in missing:
+            param_config = (config or {}).get(param_key, {})
+            unit = param_config.get("unit") if param_config else None
+            param_class = param_config.get("class") if param_config else None
+            param = await self.auto_register_parameter(param_key, unit, param_class)
+            parameters[param_key] = ParameterDefinition.from_model(param)
+        return parameters
+
     async def get_or_create_parameter(
         self,
         param_key: str,
@@ -145,7 +213,9 @@ class TelemetryService:
     ) -> LiveLinkParameter:
         """Auto-register a new parameter from WiCAN config block.
 
-        Returns existing parameter if already registered.
+        Returns existing parameter if already registered. Creation is an
+        INSERT ... ON CONFLICT DO NOTHING, so concurrent ingest tasks that
+        discover the same new key at once both end up with the one row.
         """
         # Explicit config class always wins; otherwise fall back to the
         # conservative catalog inference so MQTT-discovered params (which
@@ -159,15 +229,20 @@ class TelemetryService:
         existing = await self.get_parameter(param_key)
         if existing:
             # Update metadata if provided and not already set
+            changed = False
             if unit and not existing.unit:
                 existing.unit = unit
+                changed = True
             if not existing.param_class and resolved_class:
                 existing.param_class = resolved_class
+                changed = True
                 # Only recompute category when it's unset or still the
                 # "other" default — category is user-editable in the admin
                 # UI, and a hand-tuned value must survive the class backfill.
                 if not existing.category or existing.category == "other":
                     existing.category = self._classify_param(resolved_class)
+            if changed:
+                parameter_registry.invalidate()
             return existing
 
         # Create new parameter
@@ -186,20 +261,30 @@ class TelemetryService:
         )
         archive_only = not show_on_dashboard
 
-        param = LiveLinkParameter(
-            param_key=param_key,
-            display_name=display_name,
-            unit=unit,
-            param_class=resolved_class,
-            category=category,
-            show_on_dashboard=show_on_dashboard,
-            archive_only=archive_only,
-            storage_interval_seconds=0,  # Store all by default
+        stmt = (
+            dialect_insert(LiveLinkParameter)
+            .values(
+                param_key=param_key,
+                display_name=display_name,
+                unit=unit,
+                param_class=resolved_class,
+                category=category,
+                show_on_dashboard=show_on_dashboard,
+                archive_only=archive_only,
+                storage_interval_seconds=0,  # Store all by default
+            )
+            .on_conflict_do_nothing(index_elements=["param_key"])
         )
-        self.db.add(param)
-        await self.db.flush()
+        result = await self.db.execute(stmt)
+        parameter_registry.invalidate()
+
+        param = await self.get_parameter(param_key)
+        if param is None:
+            # Unreachable unless the row was deleted between the two statements
+            raise RuntimeError(f"Failed to register parameter {param_key}")
 
-        logger.info("Auto-registered new parameter: %s", param_key)
+        if result.rowcount:
+            logger.info("Auto-registered new parameter: %s", param_key)
         return param
 
     def _classify_param(self, param_class: str | None) -> str:
@@ -236,7 +321,16 @@ class TelemetryService:
                 return True
         return False
 
-    async def _sanitize_odometer_value(self, vin: str, value: float) -> float | None:
+    async def _get_max_odometer_km(self, vin: str) -> int:
+        """Return the highest recorded odometer reading (km) for a vehicle, or 0."""
+        max_result = await self.db.execute(
+            select(func.max(OdometerRecord.odometer_km)).where(OdometerRecord.vin == vin)
+        )
+        return max_result.scalar() or 0
+
+    async def _sanitize_odometer_value(
+        self, vin: str, value: float, max_odometer_km: int | None = None
+    ) -> float | None:
         """Sanitize an odometer value (km), returning None if invalid.
 
         Applies the same sanity checks as _sync_odometer_from_telemetry:
@@ -244,6 +338,9 @@ class TelemetryService:
         - Reject unreasonable jumps (>16,000 km from existing max)
         - Reject negative/zero values
 
+        max_odometer_km may be passed in when the caller already loaded it;
+        otherwise it is queried here.
+
         Returns:
             Sanitized value if valid, None if should be rejected
         """
@@ -263,10 +360,8 @@ class TelemetryService:
             return None
 
         # Query max existing odometer_km to check for unreasonable jumps
-        max_result = await self.db.execute(
-            select(func.max(OdometerRecord.odometer_km)).where(OdometerRecord.vin == vin)
-        )
-        max_odometer_km = max_result.scalar() or 0
+        if max_odometer_km is None:
+            max_odometer_km = await self._get_max_odometer_km(vin)
 
         # Reject values that are unreasonably higher than existing max
         # (prevents overflow values like 0xFFFFFF from being displayed)
@@ -319,82 +414,80 @@ class TelemetryService:
 
         received_at = utc_now()
 
-        # Get all parameters to check storage intervals and for validation
-        parameters = await self.get_all_parameters()
-
-        # Auto-register any new parameters before validation (so validator has class info)
-        for param_key in autopid_data:
-            if param_key not in parameters:
-                param_config = config.get(param_key, {})
-                unit = param_config.get("unit") if param_config else None
-                param_class = param_config.get("class") if param_config else None
-                param = await self.auto_register_parameter(param_key, unit, param_class)
-                parameters[param_key] = param
+        # Cached parameter definitions for storage intervals and validation.
+        # Any new parameters are auto-registered before validation (so the
+        # validator has class info).
+        parameters = await self._register_missing_parameters(list(autopid_data), config)
 
-        # Validate telemetry values before storage
+        # Validate telemetry values before storage. Previous values for the
+        # rate-of-change check come from the latest-value buffer.
         validator = TelemetryValidator(self.db)
-        valid_data, _rejected = await validator.validate_batch(vin, autopid_data, parameters)
-
-        stored_count = 0
+        previous_values = await latest_buffer.get_previous_values(self.db, vin, list(autopid_data))
+        valid_data, _rejected = await validator.validate_batch(
+            vin, autopid_data, parameters, previous_values=previous_values
+        )
 
-        for param_key, value in valid_data.items():
-            if value is None:
-                continue
+        # Numeric values only — None and strings (e.g. DTCs) are handled by the route
+        numeric_data = {
+            param_key: float(value)
+            for param_key, value in valid_data.items()
+            if isinstance(value, (int, float))
+        }
 
-            # Skip non-numeric values (e.g., DTC strings handled by route)
-            if not isinstance(value, (int, float)):
-                continue
+        # Odometer sanity checks and the odometer sync share one max() lookup
+        max_odometer_km: int | None = None
+        if any(self._is_odometer_param(param_key) for param_key in autopid_data):
+            max_odometer_km = await self._get_max_odometer_km(vin)
 
-            # Get parameter (already registered above)
-            param = parameters.get(param_key)
-
-            # Auto-register parameter if not exists
-            param_config = config.get(param_key, {})
-            param = parameters.get(param_key)
-            if not param:
-                unit = param_config.get("unit") if param_config else None
-                param_class = param_config.get("class") if param_config else None
-                param = await self.auto_register_parameter(param_key, unit, param_class)
-                parameters[param_key] = param
-
-            # Check if this is an odometer parameter and apply sanity checks
-            is_odometer = self._is_odometer_param(param_key)
-            if is_odometer:
-                sanitized_value = await self._sanitize_odometer_value(vin, float(value))
+        latest_rows: list[dict[str, Any]] = []
+        for param_key, value in numeric_data.items():
+            if self._is_odometer_param(param_key):
+                sanitized_value = await self._sanitize_odometer_value(
+                    vin, value, max_odometer_km=max_odometer_km
+                )
                 if sanitized_value is None:
-                    # Invalid odometer value - skip storing to latest but may still log to historical
+                    # Invalid odometer value - skip storing to latest and historical
                     continue
                 value = sanitized_value
+            latest_rows.append(
+                {
+                    "vin": vin,
+                    "param_key": param_key,
+                    "value": value,
+                    "timestamp": timestamp,
+                    "received_at": received_at,
+                }
+            )
 
-            # Always update latest value (for live dashboard)
-            await self._upsert_latest_value(vin, param_key, float(value), timestamp, received_at)
+        # Storage-interval gate: one grouped lookup for every throttled key
+        throttled_keys = [
+            row["param_key"]
+            for row in latest_rows
+            if parameters[row["param_key"]].storage_interval_seconds > 0
+        ]
+        last_stored = await self._get_last_historical_timestamps(vin, throttled_keys)
+
+        historical_rows: list[dict[str, Any]] = []
+        for row in latest_rows:
+            param = parameters[row["param_key"]]
+            if param.storage_interval_seconds > 0 and not self._interval_elapsed(
+                last_stored.get(row["param_key"]), param.storage_interval_seconds
+            ):
+                continue
+            historical_rows.append({**row, "device_id": device_id})
 
-            # Check storage interval for historical storage
-            if param.storage_interval_seconds > 0:
-                should_store = await self._should_store_historical(
-                    vin, param_key, param.storage_interval_seconds
-                )
-                if not should_store:
-                    continue
+        # Always update latest values (for live dashboard); the buffer writes
+        # them to vehicle_telemetry_latest on its next flush
+        latest_buffer.record(vin, latest_rows)
 
-            # Store to historical table
-            try:
-                telemetry = VehicleTelemetry(
-                    vin=vin,
-                    device_id=device_id,
-                    param_key=param_key,
-                    value=float(value),
-                    timestamp=timestamp,
-                    received_at=received_at,
-                )
-                self.db.add(telemetry)
-                stored_count += 1
-            except IntegrityError:
-                # Duplicate (same device_id, param_key, timestamp) - skip
-                pass
+        # Store to historical table in one statement; retried frames with the
+        # same (device_id, param_key, timestamp) are skipped by the dedup index
+        stored_count = await self._insert_historical_rows(historical_rows)
 
         # Check for odometer reading and sync
-        await self._sync_odometer_from_telemetry(vin, autopid_data, timestamp)
+        await self._sync_odometer_from_telemetry(
+            vin, autopid_data, timestamp, max_odometer_km=max_odometer_km
+        )
 
         return StoreResult(stored_count=stored_count, validated_data=valid_data)
 
@@ -403,11 +496,13 @@ class TelemetryService:
         vin: str,
         autopid_data: dict[str, float | int | str | None],
         timestamp: datetime,
+        max_odometer_km: int | None = None,
     ) -> None:
         """Sync odometer record from telemetry if odometer PID is present.
 
         Only creates one record per day to avoid spamming the odometer table.
-        Records are marked with source='livelink'.
+        Records are marked with source='livelink'. max_odometer_km may be
+        passed in when the caller already loaded it for this frame.
         """
         # Find odometer value in telemetry
         odometer_value: float | None = None
@@ -447,10 +542,8 @@ class TelemetryService:
             return
 
         # Query max existing odometer_km for this VIN to avoid duplicate values
-        max_result = await self.db.execute(
-            select(func.max(OdometerRecord.odometer_km)).where(OdometerRecord.vin == vin)
-        )
-        max_odometer_km = max_result.scalar() or 0
+        if max_odometer_km is None:
+            max_odometer_km = await self._get_max_odometer_km(vin)
 
         # Sanity check: reject unreasonable jumps (prevents overflow values like 0xFFFFFF)
         if max_odometer_km > 0 and odometer_km > float(max_odometer_km) + 16_000:
@@ -501,52 +594,68 @@ class TelemetryService:
                 odometer_key,
             )
 
-    async def _upsert_latest_value(
-        self,
-        vin: str,
-        param_key: str,
-        value: float,
-        timestamp: datetime,
-        received_at: datetime,
-    ) -> None:
-        """Upsert a value into the latest values cache table."""
-        # Use SQLite's INSERT OR REPLACE
-        stmt = dialect_insert(VehicleTelemetryLatest).values(
-            vin=vin,
-            param_key=param_key,
-            value=value,
-            timestamp=timestamp,
-            received_at=received_at,
-        )
+        await invalidate_cache_for_vehicle(vin)
+
+    async def upsert_latest_values(self, rows: list[dict[str, Any]]) -> None:
+        """Upsert many values into the latest values cache table in one statement.
+
+        Each row is a dict with vin, param_key, value, timestamp and received_at.
+        (vin, param_key) must be unique within rows — PostgreSQL refuses an
+        ON CONFLICT DO UPDATE that touches the same row twice. A stored value
+        at least as new as the row's (written by SD backfill or another
+        worker) is kept.
+        """
+        if not rows:
+            return
+
+        stmt = dialect_insert(VehicleTelemetryLatest).values(rows)
         stmt = stmt.on_conflict_do_update(
             index_elements=["vin", "param_key"],
             set_={
-                "value": value,
-                "timestamp": timestamp,
-                "received_at": received_at,
+                "value": stmt.excluded.value,
+                "timestamp": stmt.excluded.timestamp,
+                "received_at": stmt.excluded.received_at,
             },
+            where=stmt.excluded.timestamp > VehicleTelemetryLatest.timestamp,
         )
         await self.db.execute(stmt)
 
-    async def _should_store_historical(
-        self, vin: str, param_key: str, interval_seconds: int
-    ) -> bool:
-        """Check if we should store a historical value based on storage interval.
+    async def _insert_historical_rows(self, rows: list[dict[str, Any]]) -> int:
+        """Insert many historical rows in one statement, skipping duplicates.
 
-        Returns True if no recent value exists or last value is older than interval.
+        Each row is a dict with vin, device_id, param_key, value, timestamp and
+        received_at. Rows colliding with the (device_id, param_key, timestamp)
+        dedup index are skipped. Returns the number of rows actually inserted.
         """
+        if not rows:
+            return 0
+
+        stmt = (
+            dialect_insert(VehicleTelemetry)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["device_id", "param_key", "timestamp"])
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount or 0
+
+    async def _get_last_historical_timestamps(
+        self, vin: str, param_keys: list[str]
+    ) -> dict[str, datetime]:
+        """Return the newest historical timestamp per parameter in one grouped query."""
+        if not param_keys:
+            return {}
+
         result = await self.db.execute(
-            select(VehicleTelemetry.timestamp)
+            select(VehicleTelemetry.param_key, func.max(VehicleTelemetry.timestamp))
             .where(VehicleTelemetry.vin == vin)
-            .where(VehicleTelemetry.param_key == param_key)
-            .order_by(VehicleTelemetry.timestamp.desc())
-            .limit(1)
+            .where(VehicleTelemetry.param_key.in_(param_keys))
+            .group_by(VehicleTelemetry.param_key)
         )
-        row = result.first()
-        if not row:
-            return True
+        return {row[0]: row[1] for row in result.all() if row[1] is not None}
 
-        last_timestamp = row[0]
+    @staticmethod
+    def _interval_elapsed(last_timestamp: datetime | None, interval_seconds: int) -> bool:
+        """Return True if no value was stored yet or the last one is older than interval."""
         if not last_timestamp:
             return True
 
@@ -565,12 +674,14 @@ class TelemetryService:
     async def bulk_backfill(self, vin: str, device_id: str, rows: list) -> int:
         """Insert historical SD-card rows without triggering live side-effects.
 
-        rows: iterable of SdRow namedtuples with .param_key (already canonical),
+        rows: list of SdRow namedtuples with .param_key (already canonical),
         .value (float), .timestamp (datetime, tz-aware UTC).
 
         Deduplication is by (device_id, param_key, timestamp) — same unique
         constraint as the live ingest path.  Updates vehicle_telemetry_latest
         only when a backfilled row is strictly newer than the cached latest.
+        Rows are written BACKFILL_CHUNK_SIZE at a time, and the latest table is
+        reconciled once per parameter per chunk with that chunk's newest reading.
 
         Returns the number of rows actually inserted (conflict-skipped rows are
         not counted).
@@ -578,39 +689,44 @@ class TelemetryService:
         if not rows:
             return 0
 
-        # Commit in batches so a large backfill (tens of thousands of SD rows) never
-        # holds the SQLite write lock for the entire pull — live MQTT/HTTP ingest and
-        # scheduler writes interleave between batches instead of hitting
-        # "database is locked". Committed rows still dedup correctly across batches.
-        commit_batch = 500
+        # Each chunk is a few multi-row history INSERTs plus one latest-value
+        # upsert, committed on its own so a large backfill (hundreds of thousands of SD
+        # rows) never holds the SQLite write lock for the entire pull — live
+        # MQTT/HTTP ingest and scheduler writes interleave between chunks instead
+        # of hitting "database is locked". Committed rows still dedup correctly
+        # across chunks.
         inserted = 0
-        for i, r in enumerate(rows, start=1):
-            # Normalise to naive UTC once so the (device_id, param_key, timestamp)
-            # dedup index matches live-ingest rows (which store naive UTC via utc_now()).
-            # Binding tz-aware datetimes into PG's TIMESTAMP WITHOUT TIME ZONE is also unsafe.
-            ts = r.timestamp.replace(tzinfo=None) if r.timestamp.tzinfo is not None else r.timestamp
-
-            # Use the module-level dialect_insert (sqlite or pg, chosen at import time)
-            stmt = (
-                dialect_insert(VehicleTelemetry)
-                .values(
-                    vin=vin,
-                    device_id=device_id,
-                    param_key=r.param_key,
-                    value=r.value,
-                    timestamp=ts,
+        for start in range(0, len(rows), BACKFILL_CHUNK_SIZE):
+            history: list[dict[str, Any]] = []
+            newest: dict[str, tuple[datetime, float]] = {}
+            for r in rows[start : start + BACKFILL_CHUNK_SIZE]:
+                # Normalise to naive UTC so the (device_id, param_key, timestamp)
+                # dedup index matches live-ingest rows (which store naive UTC via
+                # utc_now()). Binding tz-aware datetimes into PG's TIMESTAMP
+                # WITHOUT TIME ZONE is also unsafe.
+                ts = (
+                    r.timestamp.replace(tzinfo=None)
+                    if r.timestamp.tzinfo is not None
+                    else r.timestamp
                 )
-                .on_conflict_do_nothing(index_elements=["device_id", "param_key", "timestamp"])
-            )
-            result = await self.db.execute(stmt)
-            # rowcount is 1 on insert, 0 when the conflict clause fires
-            inserted += result.rowcount or 0
-            await self._update_latest_if_newer(vin, r.param_key, r.value, ts)
+                history.append(
+                    {
+                        "vin": vin,
+                        "device_id": device_id,
+                        "param_key": r.param_key,
+                        "value": r.value,
+                        "timestamp": ts,
+                    }
+                )
+                current = newest.get(r.param_key)
+                if current is None or ts > current[0]:
+                    newest[r.param_key] = (ts, r.value)
 
-            if i % commit_batch == 0:
-                await self.db.commit()
+            inserted += await self._backfill_historical_rows(history)
+            await self._upsert_latest_if_newer(vin, newest)
+            await self.db.commit()
 
-        await self.db.commit()  # flush the final partial batch
+        latest_buffer.mark_stale(vin)
         return inserted
 
     async def store_torque_telemetry(
@@ -626,9 +742,9 @@ class TelemetryService:
         if not values:
             return 0
         ts = timestamp.replace(tzinfo=None) if timestamp.tzinfo is not None else timestamp
+        await self._register_missing_parameters(list(values))
         inserted = 0
         for param_key, value in values.items():
-            await self.auto_register_parameter(param_key)
             stmt = (
                 dialect_insert(VehicleTelemetry)
                 .values(
@@ -643,8 +759,64 @@ class TelemetryService:
             result = await self.db.execute(stmt)
             inserted += result.rowcount or 0
             await self._update_latest_if_newer(vin, param_key, float(value), ts)
+        latest_buffer.mark_stale(vin)
         return inserted
 
+    async def _backfill_historical_rows(self, rows: list[dict[str, Any]]) -> int:
+        """Insert a backfill chunk, skipping duplicates; returns rows inserted.
+
+        Unlike _insert_historical_rows, the rows are passed as executemany
+        parameters on the session's connection: SQLAlchemy's insertmanyvalues
+        then sends multi-row INSERTs of up to 1000 rows from one cached
+        compiled statement, where a 5000-row .values() list would be compiled
+        afresh for every chunk. RETURNING yields only the rows actually
+        inserted, which is a reliable count on both SQLite and PostgreSQL.
+        """
+        stmt = (
+            dialect_insert(VehicleTelemetry)
+            .on_conflict_do_nothing(index_elements=["device_id", "param_key", "timestamp"])
+            .returning(VehicleTelemetry.id)
+        )
+        connection = await self.db.connection()
+        result = await connection.execute(stmt, rows)
+        return len(result.all())
+
+    async def _upsert_latest_if_newer(
+        self, vin: str, newest: dict[str, tuple[datetime, float]]
+    ) -> None:
+        """Reconcile vehicle_telemetry_latest with many candidates in one statement.
+
+        newest maps param_key -> (naive UTC timestamp, value). An existing row is
+        only overwritten when the candidate is strictly newer, so a backfill never
+        clobbers a fresher live reading.
+        """
+        if not newest:
+            return
+
+        received_at = utc_now()
+        stmt = dialect_insert(VehicleTelemetryLatest).values(
+            [
+                {
+                    "vin": vin,
+                    "param_key": param_key,
+                    "value": value,
+                    "timestamp": ts,
+                    "received_at": received_at,
+                }
+                for param_key, (ts, value) in newest.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["vin", "param_key"],
+            set_={
+                "value": stmt.excluded.value,
+                "timestamp": stmt.excluded.timestamp,
+                "received_at": stmt.excluded.received_at,
+            },
+            where=stmt.excluded.timestamp > VehicleTelemetryLatest.timestamp,
+        )
+        await self.db.execute(stmt)
+
     async def _update_latest_if_newer(
         self, vin: str, param_key: str, value: float, ts: datetime
     ) -> None:
@@ -682,14 +854,13 @@ class TelemetryService:
     # Query Methods
     # =========================================================================
 
-    async def get_latest_values(self, vin: str) -> list[VehicleTelemetryLatest]:
-        """Get all latest telemetry values for a vehicle."""
-        result = await self.db.execute(
-            select(VehicleTelemetryLatest)
-            .where(VehicleTelemetryLatest.vin == vin)
-            .order_by(VehicleTelemetryLatest.param_key)
-        )
-        return list(result.scalars().all())
+    async def get_latest_values(self, vin: str) -> list[LatestValue]:
+        """Get all latest telemetry values for a vehicle.
+
+        Served from the write-behind buffer, so values ingested since the last
+        flush are included.
+        """
+        return await latest_buffer.get_values(self.db, vin)
 
     async def get_telemetry_range(
         self,
@@ -715,6 +886,148 @@ class TelemetryService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def iter_telemetry_range(
+        self,
+        vin: str,
+        start: datetime,
+        end: datetime,
+        param_keys: list[str] | None = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[list[Row]]:
+        """Yield (id, timestamp, param_key, value) rows for a time range, page by page.
+
+        Pages are keyset-paginated on (timestamp, id) over the vehicle/time
+        index, so every page is an index seek regardless of how deep into the
+        range it is, and only one page is held in memory at a time. Unlike
+        ``get_telemetry_range`` there is no row cap.
+        """
+        base = (
+            select(
+                VehicleTelemetry.id,
+                VehicleTelemetry.timestamp,
+                VehicleTelemetry.param_key,
+                VehicleTelemetry.value,
+            )
+            .where(VehicleTelemetry.vin == vin)
+            .where(VehicleTelemetry.timestamp >= start)
+            .where(VehicleTelemetry.timestamp <= end)
+            .order_by(VehicleTelemetry.timestamp, VehicleTelemetry.id)
+            .limit(page_size)
+        )
+        if param_keys:
+            base = base.where(VehicleTelemetry.param_key.in_(param_keys))
+
+        query = base
+        while True:
+            rows = list((await self.db.execute(query)).all())
+            if not rows:
+                return
+            yield rows
+            if len(rows) < page_size:
+                return
+            last = rows[-1]
+            query = base.where(
+                or_(
+                    VehicleTelemetry.timestamp > last.timestamp,
+                    and_(
+                        VehicleTelemetry.timestamp == last.timestamp,
+                        VehicleTelemetry.id > last.id,
+                    ),
+                )
+            )
+
+    async def get_bucketed_series(
+        self,
+        vin: str,
+        start: datetime,
+        end: datetime,
+        bucket_seconds: int,
+        param_keys: list[str] | None = None,
+        daily: bool = False,
+    ) -> dict[str, list[TelemetryBucket]]:
+        """Downsample a time range into fixed-width buckets per parameter, in SQL.
+
+        Each bucket carries the avg/min/max and sample count of the readings in
+        it, so the response size depends on ``(end - start) / bucket_seconds``
+        and not on how many readings were stored. With ``daily`` the buckets are
+        built from ``TelemetryDailySummary`` rows instead of raw readings (for
+        ranges reaching past raw retention); ``bucket_seconds`` should then be
+        a whole number of days.
+        """
+        start = _naive_utc(start)
+        end = _naive_utc(end)
+        if daily:
+            start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+            ts = TelemetryDailySummary.date
+            param_key = TelemetryDailySummary.param_key
+            vin_col = TelemetryDailySummary.vin
+            low = func.min(TelemetryDailySummary.min_value)
+            high = func.max(TelemetryDailySummary.max_value)
+            total = func.sum(TelemetryDailySummary.avg_value * TelemetryDailySummary.sample_count)
+            count = func.sum(TelemetryDailySummary.sample_count)
+        else:
+            ts = VehicleTelemetry.timestamp
+            param_key = VehicleTelemetry.param_key
+            vin_col = VehicleTelemetry.vin
+            low = func.min(VehicleTelemetry.value)
+            high = func.max(VehicleTelemetry.value)
+            total = func.sum(VehicleTelemetry.value)
+            count = func.count(VehicleTelemetry.id)
+
+        origin = int(start.replace(tzinfo=UTC).timestamp())
+        bucket = ((_epoch_seconds(ts) - origin) // bucket_seconds).label("bucket")
+        query = (
+            select(param_key, bucket, low, high, total, count)
+            .where(vin_col == vin)
+            .where(ts >= start)
+            .where(ts <= end)
+            .group_by(param_key, bucket)
+            .order_by(param_key, bucket)
+        )
+        if param_keys:
+            query = query.where(param_key.in_(param_keys))
+
+        series: dict[str, list[TelemetryBucket]] = {}
+        for key, index, min_value, max_value, value_sum, samples in (
+            await self.db.execute(query)
+        ).all():
+            if not samples or value_sum is None or min_value is None:
+                continue
+            series.setdefault(key, []).append(
+                TelemetryBucket(
+                    timestamp=datetime.fromtimestamp(
+                        origin + int(index) * bucket_seconds, UTC
+                    ).replace(tzinfo=None),
+                    avg_value=value_sum / samples,
+                    min_value=min_value,
+                    max_value=max_value,
+                    sample_count=int(samples),
+                )
+            )
+        return series
+
+    async def count_telemetry_range(self, vin: str, start: datetime, end: datetime) -> int:
+        """Number of stored readings for a vehicle in a time range."""
+        result = await self.db.execute(
+            select(func.count(VehicleTelemetry.id))
+            .where(VehicleTelemetry.vin == vin)
+            .where(VehicleTelemetry.timestamp >= start)
+            .where(VehicleTelemetry.timestamp <= end)
+        )
+        return result.scalar() or 0
+
+    async def get_param_keys_in_range(self, vin: str, start: datetime, end: datetime) -> list[str]:
+        """Distinct parameter keys recorded for a vehicle in a time range, sorted."""
+        result = await self.db.execute(
+            select(VehicleTelemetry.param_key)
+            .where(VehicleTelemetry.vin == vin)
+            .where(VehicleTelemetry.timestamp >= start)
+            .where(VehicleTelemetry.timestamp <= end)
+            .distinct()
+            .order_by(VehicleTelemetry.param_key)
+        )
+        return list(result.scalars().all())
+
     async def get_telemetry_stats(
         self,
         vin: str,
@@ -864,17 +1177,25 @@ class TelemetryService:
         received_at = timestamp
 
         # Get parameter for storage interval check
-        param = await self.get_parameter(param_key)
+        param = await parameter_registry.get(self.db, param_key)
 
         # Always update latest value
-        await self._upsert_latest_value(vin, param_key, value, timestamp, received_at)
+        latest_buffer.record(
+            vin,
+            [
+                {
+                    "param_key": param_key,
+                    "value": value,
+                    "timestamp": timestamp,
+                    "received_at": received_at,
+                }
+            ],
+        )
 
         # Check storage interval
         if param and param.storage_interval_seconds > 0:
-            should_store = await self._should_store_historical(
-                vin, param_key, param.storage_interval_seconds
-            )
-            if not should_store:
+            last = await self._get_last_historical_timestamps(vin, [param_key])
+            if not self._interval_elapsed(last.get(param_key), param.storage_interval_seconds):
                 return False
 
         # Store to historical table
@@ -898,28 +1219,35 @@ class TelemetryService:
         param_key: str,
         value: float,
     ) -> None:
-        """Check if a value exceeds parameter thresholds and send notifications.
+        """Check if a value exceeds parameter thresholds and queue a notification.
 
-        Respects alert cooldown to prevent notification spam.
+        Respects alert cooldown to prevent notification spam. Thresholds are
+        read from the parameter registry, so in-range values cost no queries;
+        the row itself is only loaded once a threshold is breached.
         """
-        param = await self.get_parameter(param_key)
-        if not param:
+        definition = await parameter_registry.get(self.db, param_key)
+        if not definition:
             return
 
         # Check if value is outside thresholds
         alert_type = None
         threshold_value = None
 
-        if param.warning_max is not None and value > param.warning_max:
+        if definition.warning_max is not None and value > definition.warning_max:
             alert_type = "max"
-            threshold_value = param.warning_max
-        elif param.warning_min is not None and value < param.warning_min:
+            threshold_value = definition.warning_max
+        elif definition.warning_min is not None and value < definition.warning_min:
             alert_type = "min"
-            threshold_value = param.warning_min
+            threshold_value = definition.warning_min
 
         if not alert_type or threshold_value is None:
             return
 
+        # Cooldown stamp lives on the row (written below), never in the registry
+        param = await self.get_parameter(param_key)
+        if not param:
+            return
+
         # Cooldown - skip dispatch while a prior notification for this
         # parameter is still within the admin-configured cooldown window
         # (Settings -> LiveLink, `livelink_alert_cooldown_minutes`, default
@@ -948,11 +1276,13 @@ class TelemetryService:
         else:
             vehicle_name = f"Vehicle ({vin[:8]}...)"
 
-        # Send notification
-        from app.services.notifications.dispatcher import NotificationDispatcher
+        # Queue the notification in this transaction; the outbox worker
+        # delivers it (with retries) once the caller commits, so an alert
+        # costs the ingest path one INSERT and never waits on a service.
+        from app.services.notifications.dispatcher import format_livelink_threshold_alert
+        from app.services.notifications.outbox import enqueue_notification
 
-        dispatcher = NotificationDispatcher(self.db)
-        dispatch_results = await dispatcher.notify_livelink_threshold_alert(
+        title, message = format_livelink_threshold_alert(
             vehicle_name=vehicle_name,
             parameter_name=param.display_name or param_key,
             value=value,
@@ -960,12 +1290,9 @@ class TelemetryService:
             threshold_value=threshold_value,
             unit=param.unit,
         )
+        enqueue_notification(self.db, "livelink_threshold_alert", title, message)
 
-        # Stamp the cooldown only when at least one service actually accepted
-        # the notification. The dispatcher records False for attempted-but-
-        # failed sends, so an all-failed dict (e.g. transient outage) must not
-        # start the cooldown clock and silence real alerts; nor must an empty
-        # dict (event disabled / no services enabled). The caller commits the
-        # surrounding transaction, so no explicit commit here.
-        if any(dispatch_results.values()):
-            param.warning_last_notified_at = now
+        # The queued row is retried until delivered or dead-lettered, so the
+        # cooldown starts now. The caller commits the surrounding
+        # transaction (row and stamp together), so no explicit commit here.
+        param.warning_last_notified_at = now
@@ -5,6 +5,7 @@ Based on WiCAN Discussion #198 findings about partial ECU wakes producing garbag
 """
 
 import logging
+from datetime import datetime
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -110,9 +111,28 @@ class TelemetryValidator:
         if not latest:
             return True, None  # No previous value to compare
 
+        return self.check_rate_of_change(param_class, value, latest.value, latest.timestamp)
+
+    def check_rate_of_change(
+        self,
+        param_class: str | None,
+        value: float,
+        prev_value: float,
+        prev_timestamp: datetime,
+    ) -> tuple[bool, str | None]:
+        """Check a value against an already-loaded previous reading.
+
+        Pure in-memory counterpart of validate_rate_of_change(), used by
+        validate_batch() once the previous values have been prefetched.
+
+        Returns:
+            (True, None) if valid or check not applicable, (False, reason) if rejected
+        """
+        if not param_class or param_class not in RATE_OF_CHANGE_LIMITS:
+            return True, None
+
         # Calculate time delta
         now = utc_now()
-        prev_timestamp = latest.timestamp
         if prev_timestamp.tzinfo is not None:
             prev_timestamp = prev_timestamp.replace(tzinfo=None)
         time_delta = (now - prev_timestamp).total_seconds()
@@ -121,7 +141,7 @@ class TelemetryValidator:
             return True, None  # Stale data or same timestamp, skip check
 
         # Calculate rate of change
-        value_delta = abs(value - latest.value)
+        value_delta = abs(value - prev_value)
         rate = value_delta / time_delta
         max_rate = RATE_OF_CHANGE_LIMITS[param_class]
 
@@ -133,18 +153,59 @@ class TelemetryValidator:
 
         return True, None
 
+    async def fetch_previous_values(
+        self,
+        vin: str,
+        param_keys: list[str],
+    ) -> dict[str, tuple[float, datetime]]:
+        """Load the latest cached value for several parameters in one query.
+
+        Args:
+            vin: Vehicle VIN
+            param_keys: Parameter keys to look up
+
+        Returns:
+            Dict of param_key -> (value, timestamp) for keys that have a previous value
+        """
+        if not param_keys:
+            return {}
+
+        result = await self.db.execute(
+            select(
+                VehicleTelemetryLatest.param_key,
+                VehicleTelemetryLatest.value,
+                VehicleTelemetryLatest.timestamp,
+            ).where(
+                VehicleTelemetryLatest.vin == vin,
+                VehicleTelemetryLatest.param_key.in_(param_keys),
+            )
+        )
+        return {row[0]: (row[1], row[2]) for row in result.all()}
+
+    @staticmethod
+    def _param_class(parameters_cache: dict[str, object], param_key: str) -> str | None:
+        """Return the cached parameter class for a key, if any."""
+        param = parameters_cache.get(param_key)
+        return getattr(param, "param_class", None) if param else None
+
     async def validate_batch(
         self,
         vin: str,
         autopid_data: dict[str, float | int | str | None],
         parameters_cache: dict[str, object],
+        previous_values: dict[str, tuple[float, datetime]] | None = None,
     ) -> tuple[dict[str, float | int | str | None], list[dict[str, object]]]:
         """Validate a batch of telemetry values.
 
+        Previous values for the rate-of-change check are loaded with a single
+        query for the whole batch, unless the caller already has them.
+
         Args:
             vin: Vehicle VIN
             autopid_data: Raw parameter values
             parameters_cache: Cached parameter definitions (from get_all_parameters)
+            previous_values: Optional param_key -> (value, timestamp) map (e.g.
+                from the latest-value buffer); skips the prefetch query
 
         Returns:
             Tuple of (valid_data, rejected_list) where rejected_list contains
@@ -153,6 +214,18 @@ class TelemetryValidator:
         valid_data: dict[str, float | int | str | None] = {}
         rejected: list[dict[str, object]] = []
 
+        # Prefetch previous values for every rate-limited key in one query
+        # instead of one SELECT per parameter inside the loop.
+        if previous_values is None:
+            rate_checked_keys = [
+                param_key
+                for param_key, value in autopid_data.items()
+                if value is not None
+                and not isinstance(value, str)
+                and self._param_class(parameters_cache, param_key) in RATE_OF_CHANGE_LIMITS
+            ]
+            previous_values = await self.fetch_previous_values(vin, rate_checked_keys)
+
         for param_key, value in autopid_data.items():
             # Pass through non-numeric values (None, strings like DTCs)
             if value is None or isinstance(value, str):
@@ -160,8 +233,7 @@ class TelemetryValidator:
                 continue
 
             # Get parameter class from cache
-            param = parameters_cache.get(param_key)
-            param_class = getattr(param, "param_class", None) if param else None
+            param_class = self._param_class(parameters_cache, param_key)
 
             # Range check
             is_valid, reason = self.validate_range(param_class, float(value))
@@ -175,13 +247,15 @@ class TelemetryValidator:
                 )
                 continue
 
-            # Rate-of-change check
-            is_valid, reason = await self.validate_rate_of_change(
-                vin,
-                param_key,
-                param_class,
-                float(value),
-            )
+            # Rate-of-change check against the prefetched previous value
+            previous = previous_values.get(param_key)
+            if previous is not None:
+                is_valid, reason = self.check_rate_of_change(
+                    param_class,
+                    float(value),
+                    previous[0],
+                    previous[1],
+                )
             if not is_valid:
                 rejected.append(
                     {
@@ -97,11 +97,11 @@ class TireService:
         return payload
 
     async def list_tires(self, vin: str, current_user: User) -> TireListResponse:
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
             result = await self.db.execute(
                 select(Tire)
                 .where(Tire.vin == vin)
@@ -122,13 +122,13 @@ class TireService:
             raise HTTPException(status_code=503, detail="Database temporarily unavailable")
 
     async def upsert_tire(self, vin: str, data: TireCreate, current_user: User) -> TireResponse:
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
         if data.position not in TIRE_POSITIONS:
             raise HTTPException(status_code=400, detail="Invalid tire position")
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             result = await self.db.execute(
                 select(Tire)
                 .where(Tire.vin == vin, Tire.position == data.position)
@@ -174,11 +174,11 @@ class TireService:
     async def update_tire(
         self, vin: str, tire_id: int, data: TireUpdate, current_user: User
     ) -> TireResponse:
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             result = await self.db.execute(
                 select(Tire)
                 .where(Tire.id == tire_id, Tire.vin == vin)
@@ -201,10 +201,10 @@ class TireService:
             raise HTTPException(status_code=503, detail="Database temporarily unavailable")
 
     async def delete_tire(self, vin: str, tire_id: int, current_user: User) -> None:
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+        await check_vehicle_access(vin, current_user, self.db, require_write=True)
         result = await self.db.execute(select(Tire).where(Tire.id == tire_id, Tire.vin == vin))
         tire = result.scalar_one_or_none()
         if not tire:
@@ -219,11 +219,11 @@ class TireService:
         data: TireReadingCreate,
         current_user: User,
     ) -> TireResponse:
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
             result = await self.db.execute(
                 select(Tire)
                 .where(Tire.id == tire_id, Tire.vin == vin)
@@ -42,12 +42,12 @@ class TollService:
         current_user: User,
     ) -> TollTagListResponse:
         """Get all toll tags for a vehicle."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(TollTag).where(TollTag.vin == vin).order_by(TollTag.created_at.desc())
@@ -76,12 +76,12 @@ class TollService:
         current_user: User,
     ) -> TollTagResponse:
         """Get a specific toll tag by ID."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(TollTag).where(TollTag.id == tag_id, TollTag.vin == vin)
@@ -110,12 +110,12 @@ class TollService:
         current_user: User,
     ) -> TollTagResponse:
         """Create a new toll tag for a vehicle."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             db_toll_tag = TollTag(
                 vin=vin,
@@ -163,12 +163,12 @@ class TollService:
         current_user: User,
     ) -> TollTagResponse:
         """Update an existing toll tag."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(TollTag).where(TollTag.id == tag_id, TollTag.vin == vin)
@@ -220,12 +220,12 @@ class TollService:
         current_user: User,
     ) -> None:
         """Delete a toll tag."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(TollTag).where(TollTag.id == tag_id, TollTag.vin == vin)
@@ -277,12 +277,12 @@ class TollService:
         toll_tag_id: int | None = None,
     ) -> TollTransactionListResponse:
         """Get all toll transactions for a vehicle with optional filtering."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             query = select(TollTransaction).where(TollTransaction.vin == vin)
 
@@ -320,12 +320,12 @@ class TollService:
         current_user: User,
     ) -> TollTransactionResponse:
         """Get a specific toll transaction by ID."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(TollTransaction).where(
@@ -356,12 +356,12 @@ class TollService:
         current_user: User,
     ) -> TollTransactionResponse:
         """Create a new toll transaction for a vehicle."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             # Verify toll tag exists if provided
             if data.toll_tag_id:
@@ -419,12 +419,12 @@ class TollService:
         current_user: User,
     ) -> TollTransactionResponse:
         """Update an existing toll transaction."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(TollTransaction).where(
@@ -487,12 +487,12 @@ class TollService:
         current_user: User,
     ) -> None:
         """Delete a toll transaction."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(TollTransaction).where(
@@ -545,12 +545,12 @@ class TollService:
         current_user: User,
     ) -> TollTransactionSummary:
         """Get toll transaction summary and monthly statistics."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             # Get total count and amount
             result = await self.db.execute(
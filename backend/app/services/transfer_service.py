@@ -182,11 +182,11 @@ class TransferService:
         Raises:
             HTTPException 403/404: User does not have access to this vehicle
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         # Read access is sufficient: history exposes prior owners' user objects.
         # Gate before querying so an unrelated user cannot enumerate transfers.
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         try:
             # Get transfers ordered by date descending
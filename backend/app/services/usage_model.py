@@ -0,0 +1,105 @@
+"""Per-vehicle usage model: current odometer/engine hours and accumulation rates.
+
+Smart reminder estimates, the calendar's mileage/hours projections and the
+due-reminder scheduler all need the same four facts per vehicle, and each
+used to query them per reminder (latest reading plus a rate aggregate, for
+km and again for hours), so listing N reminders cost 2N+1 queries.
+
+:func:`get_usage_models` loads them for any number of VINs with four grouped
+queries (latest odometer, latest hours, km rate, hours rate) and caches each
+VIN's model in the analytics cache. Odometer, hours and fuel writes already
+call ``invalidate_cache_for_vehicle``, which drops the model with the rest
+of that vehicle's cached analytics.
+
+Rates are the spread between the lowest and highest reading inside the last
+``usage_rate_window_days`` days, divided by the days between them (``None``
+with fewer than two readings on distinct days).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import HoursRecord, OdometerRecord
+from app.services.hours_service import latest_engine_hours_and_date_by_vin
+from app.services.odometer_service import latest_odometer_km_and_date_by_vin
+from app.utils.cache import cache
+
+# Kept short: rates move with the calendar even when nothing is written
+CACHE_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class UsageModel:
+    """How far a vehicle has gone and how fast it accumulates km and hours."""
+
+    vin: str
+    current_km: Decimal | None = None
+    current_hours: Decimal | None = None
+    km_per_day: float | None = None
+    hours_per_day: float | None = None
+
+
+def _cache_key(vin: str) -> str:
+    return cache.generate_key("usage_model", (vin,), {})
+
+
+async def _daily_rates(db: AsyncSession, column, vins: list[str]) -> dict[str, float]:
+    """Per-vin ``(max - min) / days`` of ``column`` readings inside the rate window."""
+    model = column.class_
+    cutoff = date.today() - timedelta(days=settings.usage_rate_window_days)
+    rows = await db.execute(
+        select(
+            model.vin,
+            func.min(column),
+            func.max(column),
+            func.min(model.date),
+            func.max(model.date),
+        )
+        .where(model.vin.in_(vins), model.date >= cutoff)
+        .group_by(model.vin)
+    )
+    rates: dict[str, float] = {}
+    for vin, low, high, first_date, last_date in rows.all():
+        days_span = (last_date - first_date).days
+        if days_span > 0:
+            rates[vin] = float(high - low) / days_span
+    return rates
+
+
+async def get_usage_models(db: AsyncSession, vins: list[str]) -> dict[str, UsageModel]:
+    """Usage models for ``vins`` (every vin gets one, possibly all ``None``)."""
+    models: dict[str, UsageModel] = {}
+    missing: list[str] = []
+    for vin in dict.fromkeys(vins):
+        cached = await cache.get(_cache_key(vin))
+        if cached is None:
+            missing.append(vin)
+        else:
+            models[vin] = cached
+
+    if missing:
+        odometer = await latest_odometer_km_and_date_by_vin(db, missing)
+        hours = await latest_engine_hours_and_date_by_vin(db, missing)
+        km_rates = await _daily_rates(db, OdometerRecord.odometer_km, missing)
+        hours_rates = await _daily_rates(db, HoursRecord.engine_hours, missing)
+        for vin in missing:
+            model = UsageModel(
+                vin=vin,
+                current_km=odometer[vin][0] if vin in odometer else None,
+                current_hours=hours[vin][0] if vin in hours else None,
+                km_per_day=km_rates.get(vin),
+                hours_per_day=hours_rates.get(vin),
+            )
+            cache.store(_cache_key(vin), model, CACHE_TTL_SECONDS, vin=vin.upper().strip())
+            models[vin] = model
+    return models
+
+
+async def get_usage_model(db: AsyncSession, vin: str) -> UsageModel:
+    """Usage model for one vehicle."""
+    return (await get_usage_models(db, [vin]))[vin]
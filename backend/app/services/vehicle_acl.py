@@ -0,0 +1,142 @@
+"""In-memory vehicle access-control index.
+
+``get_vehicle_or_403`` used to load the full ``Vehicle`` row and, for a
+non-owner, the caller's ``VehicleShare`` row on every call, although the
+access decision needs only the owner id and the share permissions. The photo
+and thumbnail routes gate every image a gallery requests, so a 60-photo
+gallery cost 120+ queries just for access checks.
+
+This module keeps ``vin -> VehicleACL(owner_id, {user_id: permission})``,
+loaded on first use per VIN. ``check_vehicle_access`` answers from it without
+touching the database; ``get_vehicle_or_403`` uses it too and then loads the
+``Vehicle`` only because its callers need the row.
+
+Session hooks keep it current: a committed ORM write to a vehicle
+(ownership transfer, delete) or to its shares (share, permission change,
+revoke) evicts that VIN, and bulk UPDATE/DELETE statements on vehicles,
+shares or users clear the index. Entries also expire after
+``ACL_TTL_SECONDS`` as a backstop for raw SQL writes.
+
+A load reads the vehicle and its shares with two awaited queries; a write
+that commits in between evicts the VIN before the load stores its (now
+stale) result. Each eviction therefore bumps a generation counter, and a
+load only stores its entry if the generation it started under is current.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.vehicle_share import VehicleShare
+
+# Backstop expiry for writes the session hooks cannot see
+ACL_TTL_SECONDS = 60.0
+
+# session.info keys: VINs written / whether to clear everything on commit
+_VINS_KEY = "vehicle_acl_vins"
+_CLEAR_KEY = "vehicle_acl_clear"
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleACL:
+    """Who may access one vehicle."""
+
+    owner_id: int | None
+    # user_id -> "read" | "write"
+    shares: dict[int, str]
+    expires_at: float
+
+
+class VehicleACLCache:
+    """Process-wide ``vin -> VehicleACL`` map."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, VehicleACL] = {}
+        # Bumped per VIN by invalidate() and for every VIN by clear()
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+
+    def _generation(self, vin: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(vin, 0)
+
+    async def get(self, db: AsyncSession, vin: str) -> VehicleACL | None:
+        """Return the ACL for ``vin``, or None if the vehicle doesn't exist."""
+        entry = self._entries.get(vin)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry
+
+        generation = self._generation(vin)
+        result = await db.execute(select(Vehicle.user_id).where(Vehicle.vin == vin))
+        row = result.one_or_none()
+        if row is None:
+            self._entries.pop(vin, None)
+            return None
+        shares = await db.execute(
+            select(VehicleShare.user_id, VehicleShare.permission).where(
+                VehicleShare.vehicle_vin == vin
+            )
+        )
+        entry = VehicleACL(
+            owner_id=row.user_id,
+            shares={user_id: permission for user_id, permission in shares.all()},
+            expires_at=time.monotonic() + ACL_TTL_SECONDS,
+        )
+        # Not cached if a write committed while the queries were in flight
+        if self._generation(vin) == generation:
+            self._entries[vin] = entry
+        return entry
+
+    def invalidate(self, vin: str) -> None:
+        self._entries.pop(vin, None)
+        self._generations[vin] = self._generations.get(vin, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_acl(session: Session, flush_context: Any) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Vehicle):
+            session.info.setdefault(_VINS_KEY, set()).add(obj.vin)
+        elif isinstance(obj, VehicleShare):
+            session.info.setdefault(_VINS_KEY, set()).add(obj.vehicle_vin)
+        elif isinstance(obj, User) and obj in session.deleted:
+            # The database cascades the user's shares
+            session.info[_CLEAR_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_acl(state: ORMExecuteState) -> None:
+    if (state.is_update or state.is_delete) and (
+        state.bind_mapper is not None and state.bind_mapper.class_ in (Vehicle, VehicleShare, User)
+    ):
+        state.session.info[_CLEAR_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    vins = session.info.pop(_VINS_KEY, None)
+    if session.info.pop(_CLEAR_KEY, None):
+        vehicle_acl.clear()
+    elif vins:
+        for vin in vins:
+            vehicle_acl.invalidate(vin)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_VINS_KEY, None)
+    session.info.pop(_CLEAR_KEY, None)
+
+
+# Global cache instance
+vehicle_acl = VehicleACLCache()
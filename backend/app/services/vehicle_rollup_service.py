@@ -0,0 +1,503 @@
+"""Per-vehicle rollup projection, maintained on write.
+
+The dashboard, widget API, family dashboard and calendar all show the same
+handful of per-vehicle facts — record counts, latest odometer and engine
+hours, last service, total spend, overdue/upcoming reminders. Re-deriving them
+costs a dozen queries per vehicle per read, and home dashboards poll the
+widget endpoints every minute. ``vehicle_rollup`` keeps one precomputed row
+per vehicle instead, so those reads are a single-row lookup.
+
+Maintenance:
+
+1. **Refreshed after every write.** An ``after_flush`` hook notes the VIN of
+   every flushed service visit (and its line items / supply usages),
+   fuel, DEF, odometer, hours, reminder, document, note and photo row; a
+   ``do_orm_execute`` hook does the same for bulk ``update()``/``delete()``
+   statements on those tables, looking the VINs up before the rows change.
+   An ``after_commit`` hook hands the noted VINs to ``rollup_refresher``,
+   which recomputes their rows from a task of its own once the commit has
+   returned, with a short debounce so a burst of commits (an import, a sync)
+   is refreshed in one pass. The writer's connection is never held for the
+   refresh, and a rolled-back transaction queues nothing. This covers every
+   writer — routes, services, imports, webhooks, telemetry sync — without
+   each one having to remember a call.
+2. **Recomputed, not incremented.** A refresh re-aggregates the vehicle's
+   rows with a fixed number of grouped queries (independent of how many
+   VINs are refreshed) and upserts the result, so a refresh can never
+   compound an earlier error.
+3. **Date-dependent figures are rebuilt nightly.** Overdue/upcoming counts
+   and the next-due reminder change with the calendar; a scheduled job
+   rebuilds every row just after midnight. :func:`get_vehicle_rollups` never
+   writes: rows that are missing, from an earlier day, still queued for a
+   refresh, or behind this session's own uncommitted writes are recomputed
+   in memory for that read.
+4. **Repairable.** Writes outside the ORM session (manual database edits, a
+   failed refresh) are repaired by ``python -m app.services.vehicle_rollup_service``,
+   which rebuilds the whole table from the record tables.
+
+The hooks are registered on import; ``app.main`` imports this module through
+the routes that read the projection and drains the refresher on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import date
+from decimal import Decimal
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Date, cast, event, func, literal, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.database import AsyncSessionLocal
+from app.models import (
+    DEFRecord,
+    Document,
+    FuelRecord,
+    HoursRecord,
+    Note,
+    OdometerRecord,
+    Reminder,
+    ServiceLineItem,
+    ServiceVisit,
+    SupplyUsage,
+    Vehicle,
+    VehiclePhoto,
+)
+from app.models.vehicle_rollup import VehicleRollup
+from app.services.analytics_service.garage import visit_costs
+from app.services.hours_service import latest_engine_hours_by_vin_query
+from app.services.odometer_service import latest_odometer_by_vin_query
+from app.services.reminder_service import is_reminder_overdue
+from app.services.telemetry_service import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+
+# VINs refreshed per statement batch by rebuild_all_vehicle_rollups and the
+# refresher
+REBUILD_BATCH_SIZE = 200
+
+# How long the refresher waits after a commit to collect further VINs
+REFRESH_DELAY_SECONDS = 0.5
+
+# Models whose rows carry the vin of the vehicle they roll up into
+_VIN_MODELS = (
+    DEFRecord,
+    Document,
+    FuelRecord,
+    HoursRecord,
+    Note,
+    OdometerRecord,
+    Reminder,
+    ServiceVisit,
+    VehiclePhoto,
+)
+
+_PENDING_KEY = "vehicle_rollup_pending"
+
+
+# -----------------------------------------------------------------------------
+# Change tracking (session hooks)
+# -----------------------------------------------------------------------------
+
+
+def _loaded(obj: Any, key: str) -> Any:
+    """An attribute's in-memory value, without triggering a load."""
+    return obj.__dict__.get(key)
+
+
+def _pending(session: Session) -> set[str]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_rows(session: Session, flush_context: Any) -> None:
+    vins = _pending(session)
+    visit_ids: set[int] = set()
+    line_item_ids: set[int] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _VIN_MODELS):
+            if (vin := _loaded(obj, "vin")) is not None:
+                vins.add(vin)
+        elif isinstance(obj, ServiceLineItem):
+            if (visit_id := _loaded(obj, "visit_id")) is not None:
+                visit_ids.add(visit_id)
+        elif isinstance(obj, SupplyUsage):
+            if (line_item_id := _loaded(obj, "service_line_item_id")) is not None:
+                line_item_ids.add(line_item_id)
+    # Line items and supply usages only know their parent's id
+    if visit_ids:
+        vins.update(
+            session.connection()
+            .execute(select(ServiceVisit.vin).where(ServiceVisit.id.in_(visit_ids)))
+            .scalars()
+        )
+    if line_item_ids:
+        vins.update(
+            session.connection()
+            .execute(
+                select(ServiceVisit.vin)
+                .join(ServiceLineItem, ServiceLineItem.visit_id == ServiceVisit.id)
+                .where(ServiceLineItem.id.in_(line_item_ids))
+            )
+            .scalars()
+        )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_rows(state: ORMExecuteState) -> None:
+    if not (state.is_update or state.is_delete) or state.bind_mapper is None:
+        return
+    model = state.bind_mapper.class_
+    if model in _VIN_MODELS:
+        affected = select(model.vin)
+    elif model is ServiceLineItem:
+        affected = select(ServiceVisit.vin).join(
+            ServiceLineItem, ServiceLineItem.visit_id == ServiceVisit.id
+        )
+    elif model is SupplyUsage:
+        affected = (
+            select(ServiceVisit.vin)
+            .join(ServiceLineItem, ServiceLineItem.visit_id == ServiceVisit.id)
+            .join(SupplyUsage, SupplyUsage.service_line_item_id == ServiceLineItem.id)
+        )
+    else:
+        return
+    # Resolve the rows before the statement changes them; a bulk UPDATE by
+    # primary key (a list of parameter dicts) has no WHERE and names its rows
+    if isinstance(state.parameters, list):
+        (pk,) = state.bind_mapper.primary_key
+        ids = [params[pk.key] for params in state.parameters if pk.key in params]
+        affected = affected.where(pk.in_(ids))
+    elif (criteria := state.statement.whereclause) is not None:
+        affected = affected.where(criteria)
+    _pending(state.session).update(
+        state.session.connection().execute(affected.distinct()).scalars()
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session: Session) -> None:
+    # Still inside the writer's commit: only queue, the refresher runs later
+    if vins := session.info.pop(_PENDING_KEY, None):
+        rollup_refresher.schedule(vins)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# -----------------------------------------------------------------------------
+# Refresh
+# -----------------------------------------------------------------------------
+
+
+def _money(value: Any) -> Decimal:
+    """Normalize a SQL sum to a 2-place Decimal (SQLite sums come back as floats)."""
+    if value is None:
+        return Decimal("0.00")
+    return Decimal(str(value)).quantize(CENT)
+
+
+def _compute_rollups(session: Session, vins: list[str], today: date) -> list[dict[str, Any]]:
+    """Aggregate the rollup row of every vin with a fixed number of statements."""
+    rows: dict[str, dict[str, Any]] = {
+        vin: {
+            "vin": vin,
+            "service_count": 0,
+            "fuel_count": 0,
+            "odometer_count": 0,
+            "reminder_count": 0,
+            "document_count": 0,
+            "note_count": 0,
+            "photo_count": 0,
+            "last_service_date": None,
+            "last_service_description": None,
+            "last_fuel_date": None,
+            "latest_odometer_km": None,
+            "latest_odometer_date": None,
+            "latest_hours": None,
+            "latest_hours_date": None,
+            "total_spend": Decimal("0.00"),
+            "overdue_count": 0,
+            "upcoming_count": 0,
+            "next_due_title": None,
+            "next_due_date": None,
+            "computed_on": today,
+        }
+        for vin in vins
+    }
+
+    no_date = cast(null(), Date)
+
+    def _counts(kind: str, model, latest_date):
+        return (
+            select(literal(kind), model.vin, func.count(model.id), latest_date)
+            .where(model.vin.in_(vins))
+            .group_by(model.vin)
+        )
+
+    counts = union_all(
+        # First select types the date column (parsed from text on SQLite)
+        _counts("service", ServiceVisit, func.max(ServiceVisit.date)),
+        _counts("fuel", FuelRecord, func.max(FuelRecord.date)),
+        _counts("odometer", OdometerRecord, no_date),
+        _counts("reminder", Reminder, no_date),
+        _counts("document", Document, no_date),
+        _counts("note", Note, no_date),
+        _counts("photo", VehiclePhoto, no_date),
+    )
+    for kind, vin, count, latest_date in session.execute(counts).all():
+        rows[vin][f"{kind}_count"] = count
+        if kind in ("service", "fuel"):
+            rows[vin][f"last_{kind}_date"] = latest_date
+
+    for vin, odometer_km, reading_date in session.execute(latest_odometer_by_vin_query(vins)):
+        rows[vin]["latest_odometer_km"] = odometer_km
+        rows[vin]["latest_odometer_date"] = reading_date
+
+    for vin, engine_hours, reading_date in session.execute(latest_engine_hours_by_vin_query(vins)):
+        rows[vin]["latest_hours"] = engine_hours
+        rows[vin]["latest_hours_date"] = reading_date
+
+    # Last service: its first line item's description, else the visit notes
+    ranked = (
+        select(
+            ServiceVisit.id,
+            ServiceVisit.vin,
+            ServiceVisit.notes,
+            func.row_number()
+            .over(
+                partition_by=ServiceVisit.vin,
+                order_by=(ServiceVisit.date.desc(), ServiceVisit.id.desc()),
+            )
+            .label("rank"),
+        )
+        .where(ServiceVisit.vin.in_(vins))
+        .subquery()
+    )
+    last_visits = session.execute(
+        select(ranked.c.id, ranked.c.vin, ranked.c.notes).where(ranked.c.rank == 1)
+    ).all()
+    if last_visits:
+        visit_ids = [visit_id for visit_id, _, _ in last_visits]
+        first_items = select(func.min(ServiceLineItem.id)).where(
+            ServiceLineItem.visit_id.in_(visit_ids)
+        )
+        descriptions = dict(
+            session.execute(
+                select(ServiceLineItem.visit_id, ServiceLineItem.description).where(
+                    ServiceLineItem.id.in_(first_items.group_by(ServiceLineItem.visit_id))
+                )
+            ).all()
+        )
+        for visit_id, vin, notes in last_visits:
+            rows[vin]["last_service_description"] = descriptions.get(visit_id, notes)
+
+    # Total spend, costed exactly like the garage analytics
+    visits = visit_costs(vins)
+    spend = union_all(
+        select(visits.c.vin, func.sum(visits.c.cost)).group_by(visits.c.vin),
+        select(FuelRecord.vin, func.sum(FuelRecord.cost))
+        .where(FuelRecord.vin.in_(vins))
+        .group_by(FuelRecord.vin),
+        select(DEFRecord.vin, func.sum(DEFRecord.cost))
+        .where(DEFRecord.vin.in_(vins))
+        .group_by(DEFRecord.vin),
+    )
+    for vin, amount in session.execute(spend).all():
+        rows[vin]["total_spend"] += _money(amount)
+
+    # Pending reminders against the readings above; the next-due reminder is
+    # the soonest-dated one that is not overdue yet.
+    pending = session.execute(
+        select(Reminder)
+        .where(Reminder.vin.in_(vins), Reminder.status == "pending")
+        .order_by(Reminder.due_date, Reminder.id)
+    )
+    for reminder in pending.scalars().all():
+        row = rows[reminder.vin]
+        if is_reminder_overdue(reminder, row["latest_odometer_km"], row["latest_hours"], today):
+            row["overdue_count"] += 1
+            continue
+        row["upcoming_count"] += 1
+        if reminder.due_date is not None and (
+            row["next_due_date"] is None or reminder.due_date < row["next_due_date"]
+        ):
+            row["next_due_title"] = reminder.title
+            row["next_due_date"] = reminder.due_date
+
+    return list(rows.values())
+
+
+def refresh_rollups(session: Session, vins: set[str] | list[str]) -> int:
+    """Recompute and upsert the rollup rows of ``vins`` on a sync session.
+
+    VINs without a vehicle (deleted in this transaction) are skipped; their
+    rows go with the vehicle via ``ON DELETE CASCADE``. Returns the number of
+    rows written.
+    """
+    existing = list(
+        session.execute(select(Vehicle.vin).where(Vehicle.vin.in_(list(vins)))).scalars()
+    )
+    if not existing:
+        return 0
+    rows = _compute_rollups(session, existing, date.today())
+    stmt = dialect_insert(VehicleRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["vin"],
+        set_={column: stmt.excluded[column] for column in rows[0] if column != "vin"}
+        | {"updated_at": func.now()},
+    )
+    session.execute(stmt, rows)
+    return len(rows)
+
+
+async def refresh_vehicle_rollups(db: AsyncSession, vins: list[str]) -> int:
+    """Recompute the rollup rows of ``vins`` in the caller's transaction."""
+    if not vins:
+        return 0
+    return await db.run_sync(refresh_rollups, vins)
+
+
+class RollupRefresher:
+    """Refreshes the rollup rows of committed writes from a background task."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None) -> None:
+        self._session_factory = session_factory or AsyncSessionLocal
+        self._queued: set[str] = set()
+        self._refreshing: set[str] = set()
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+
+    @property
+    def pending(self) -> set[str]:
+        """VINs whose stored row may not reflect their latest commit yet."""
+        return self._queued | self._refreshing
+
+    def schedule(self, vins: set[str]) -> None:
+        """Queue ``vins`` and make sure a refresh pass is coming."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (a sync script): the nightly rebuild catches up
+            logger.debug("No event loop; skipped refreshing %d vehicle rollup(s)", len(vins))
+            return
+        self._queued.update(vins)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wake.wait(), REFRESH_DELAY_SECONDS)
+        self._wake.clear()
+        while self._queued:
+            self._refreshing, self._queued = self._queued, set()
+            vins = sorted(self._refreshing)
+            try:
+                async with self._session_factory() as db:
+                    for start in range(0, len(vins), REBUILD_BATCH_SIZE):
+                        await refresh_vehicle_rollups(db, vins[start : start + REBUILD_BATCH_SIZE])
+                        await db.commit()
+            except Exception:
+                logger.exception(
+                    "Vehicle rollup refresh failed for %d vehicle(s); "
+                    "rebuild with `python -m app.services.vehicle_rollup_service`",
+                    len(vins),
+                )
+            finally:
+                self._refreshing = set()
+
+    async def drain(self) -> None:
+        """Skip the debounce and wait until every queued VIN is refreshed."""
+        while self._task is not None and not self._task.done():
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+# Global refresher instance
+rollup_refresher = RollupRefresher()
+
+
+# -----------------------------------------------------------------------------
+# Read
+# -----------------------------------------------------------------------------
+
+
+async def get_vehicle_rollups(db: AsyncSession, vins: list[str]) -> dict[str, VehicleRollup]:
+    """Return the current rollup row of every vin that exists, keyed by vin.
+
+    A single indexed lookup when the rows are fresh. Rows that are missing,
+    computed on an earlier day, still queued for a refresh, or behind writes
+    this session has not committed yet are recomputed for this read only: the returned objects are
+    transient and nothing is written, so the caller's transaction is left as
+    it was (flushed, never committed).
+    """
+    if not vins:
+        return {}
+    await db.flush()
+
+    def _load(session: Session) -> dict[str, VehicleRollup]:
+        today = date.today()
+        queued = rollup_refresher.pending
+        stmt = (
+            select(VehicleRollup)
+            .where(VehicleRollup.vin.in_(vins))
+            .execution_options(populate_existing=True)
+        )
+        rollups = {row.vin: row for row in session.execute(stmt).scalars()}
+        stale = {
+            vin
+            for vin in vins
+            if vin not in rollups
+            or rollups[vin].computed_on != today
+            or vin in queued
+            or vin in session.info.get(_PENDING_KEY, ())
+        }
+        if stale:
+            existing = session.execute(select(Vehicle.vin).where(Vehicle.vin.in_(stale))).scalars()
+            for row in _compute_rollups(session, list(existing), today):
+                rollups[row["vin"]] = VehicleRollup(**row)
+        return rollups
+
+    return await db.run_sync(_load)
+
+
+# -----------------------------------------------------------------------------
+# Rebuild
+# -----------------------------------------------------------------------------
+
+
+async def rebuild_all_vehicle_rollups(db: AsyncSession) -> int:
+    """Recompute every vehicle's rollup row and commit; returns the row count.
+
+    Run nightly so date-dependent figures roll over; also repairs drift from
+    writes outside the ORM session (manual database edits, a failed refresh)
+    and seeds the table after a restore.
+    """
+    vins = list((await db.execute(select(Vehicle.vin).order_by(Vehicle.vin))).scalars())
+    total = 0
+    for start in range(0, len(vins), REBUILD_BATCH_SIZE):
+        total += await refresh_vehicle_rollups(db, vins[start : start + REBUILD_BATCH_SIZE])
+        await db.commit()
+    return total
+
+
+async def _main() -> None:
+    from app.database import AsyncSessionLocal, engine
+
+    async with AsyncSessionLocal() as db:
+        count = await rebuild_all_vehicle_rollups(db)
+    await engine.dispose()
+    print(f"✓ Rebuilt {count} vehicle rollup row(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
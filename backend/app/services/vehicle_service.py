@@ -24,6 +24,8 @@ from app.models.vehicle import Vehicle
 from app.models.vehicle_share import VehicleShare
 from app.schemas.vehicle import VehicleCreate, VehicleUpdate
 from app.services.hours_service import set_manual_current_hours
+from app.services.telemetry_latest_buffer import latest_buffer
+from app.utils.cache import invalidate_cache_for_vehicle
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -278,6 +280,7 @@ class VehicleService:
 
             await self.db.commit()
             await self.db.refresh(vehicle)
+            await invalidate_cache_for_vehicle(vehicle.vin)
 
             logger.info("Updated vehicle: %s", sanitize_for_log(vehicle.vin))
 
@@ -341,6 +344,8 @@ class VehicleService:
             # Filesystem cleanup only after a successful commit — a rolled-back
             # delete must not lose files.
             self._remove_vehicle_files(vin, attachment_paths, sticker_path)
+            latest_buffer.discard_vin(vin)
+            await invalidate_cache_for_vehicle(vin)
 
             logger.info("Deleted vehicle: %s", sanitize_for_log(vin))
 
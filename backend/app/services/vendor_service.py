@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.service_visit import ServiceVisit
 from app.models.user import User
 from app.models.vendor import Vendor
 from app.schemas.vendor import (
@@ -14,6 +15,7 @@ from app.schemas.vendor import (
     VendorResponse,
     VendorUpdate,
 )
+from app.utils.cache import invalidate_cache_for_vehicle
 from app.utils.logging_utils import sanitize_for_log
 
 logger = logging.getLogger(__name__)
@@ -169,6 +171,13 @@ class VendorService:
             await self.db.commit()
             await self.db.refresh(vendor)
 
+            # Cached service timelines show the vendor's name
+            vins = await self.db.scalars(
+                select(ServiceVisit.vin).where(ServiceVisit.vendor_id == vendor_id).distinct()
+            )
+            for vin in vins:
+                await invalidate_cache_for_vehicle(vin)
+
             logger.info("Updated vendor %s: %s", vendor_id, sanitize_for_log(vendor.name))
             return vendor
 
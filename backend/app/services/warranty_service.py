@@ -37,12 +37,12 @@ class WarrantyService:
         Returns:
             List of warranty record responses.
         """
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db)
+            await check_vehicle_access(vin, current_user, self.db)
 
             result = await self.db.execute(
                 select(WarrantyRecordModel)
@@ -67,10 +67,10 @@ class WarrantyService:
 
     async def get_warranty(self, vin: str, warranty_id: int, current_user: User) -> WarrantyRecord:
         """Get a specific warranty record by ID."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
-        await get_vehicle_or_403(vin, current_user, self.db)
+        await check_vehicle_access(vin, current_user, self.db)
 
         result = await self.db.execute(
             select(WarrantyRecordModel).where(
@@ -88,12 +88,12 @@ class WarrantyService:
         self, vin: str, data: WarrantyRecordCreate, current_user: User
     ) -> WarrantyRecord:
         """Create a new warranty record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             record_dict = data.model_dump()
             record_dict["vin"] = vin
@@ -138,12 +138,12 @@ class WarrantyService:
         current_user: User,
     ) -> WarrantyRecord:
         """Update an existing warranty record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(WarrantyRecordModel).where(
@@ -195,12 +195,12 @@ class WarrantyService:
 
     async def delete_warranty(self, vin: str, warranty_id: int, current_user: User) -> None:
         """Delete a warranty record."""
-        from app.services.auth import get_vehicle_or_403
+        from app.services.auth import check_vehicle_access
 
         vin = vin.upper().strip()
 
         try:
-            await get_vehicle_or_403(vin, current_user, self.db, require_write=True)
+            await check_vehicle_access(vin, current_user, self.db, require_write=True)
 
             result = await self.db.execute(
                 select(WarrantyRecordModel).where(
@@ -6,10 +6,11 @@ an interactive dashboard load, wasteful when homepage polls every 60 seconds.
 
 Design rules:
 
-1. **No fan-out joins.** Joining `service_visits + fuel_records + documents +
-   notes + photos + vehicle_reminders` in one query would multiply COUNT/MAX
-   values via the classic aggregate-fan-out bug. Each child table gets its own
-   indexed, scoped query instead.
+1. **Rollup lookups.** Record counts, latest odometer/hours readings, last
+   service/fuel dates and overdue/upcoming reminder counts are read from the
+   `vehicle_rollup` projection (`services/vehicle_rollup_service.py`), which
+   is maintained in the same transaction as every record write — one indexed
+   lookup per request instead of a query per child table.
 2. **Request-time ownership filter.** `allowed_vins` on the key is a filter
    only; every lookup re-derives the VIN set from current `vehicles.user_id`
    ownership so transfer/archive changes invalidate access immediately.
@@ -28,13 +29,7 @@ from decimal import Decimal
 from sqlalchemy import case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.document import Document
 from app.models.fuel import FuelRecord
-from app.models.note import Note
-from app.models.odometer import OdometerRecord
-from app.models.photo import VehiclePhoto
-from app.models.reminder import Reminder
-from app.models.service_visit import ServiceVisit
 from app.models.vehicle import Vehicle
 from app.schemas.widget import (
     WidgetSummary,
@@ -43,8 +38,7 @@ from app.schemas.widget import (
     WidgetVehicleV2,
 )
 from app.services.fuel_service import calculate_average_hours_economy
-from app.services.hours_service import latest_engine_hours_and_date
-from app.services.reminder_service import get_current_hours, is_reminder_overdue
+from app.services.vehicle_rollup_service import get_vehicle_rollups
 from app.utils.units import UnitConverter
 
 RECENT_MPG_WINDOW = 3
@@ -81,10 +75,9 @@ class _VehicleCore:
 
     ``latest_hours``/``average_l_per_hr``/``average_cost_per_hr`` (Task 8) are
     hours-only additions: v1's ``vehicle()`` formatter never reads them (v1 is
-    frozen), only ``vehicle_v2()`` does. They are fetched here regardless of
-    which caller invoked ``_vehicle_core`` so ``latest_hours`` can double as
-    the current-hours reading for the overdue-count check below — one fetch,
-    not two.
+    frozen), only ``vehicle_v2()`` does. ``latest_hours`` comes from the same
+    rollup row as the overdue count, which was evaluated against that reading,
+    so the displayed hours and the reminder status can never disagree.
     """
 
     label: str
@@ -173,12 +166,14 @@ class WidgetAggregationService:
                 total_photos=0,
             )
 
-        total_service = await self._scalar_count(ServiceVisit.vin, vins)
-        total_fuel = await self._scalar_count(FuelRecord.vin, vins)
-        total_documents = await self._scalar_count(Document.vin, vins)
-        total_notes = await self._scalar_count(Note.vin, vins)
-        total_photos = await self._scalar_count(VehiclePhoto.vin, vins)
-        overdue, upcoming = await self._reminder_totals(vins)
+        rollups = (await get_vehicle_rollups(self.db, vins)).values()
+        total_service = sum(r.service_count for r in rollups)
+        total_fuel = sum(r.fuel_count for r in rollups)
+        total_documents = sum(r.document_count for r in rollups)
+        total_notes = sum(r.note_count for r in rollups)
+        total_photos = sum(r.photo_count for r in rollups)
+        overdue = sum(r.overdue_count for r in rollups)
+        upcoming = sum(r.upcoming_count for r in rollups)
 
         return WidgetSummary(
             total_vehicles=total_vehicles,
@@ -233,51 +228,31 @@ class WidgetAggregationService:
         if vehicle is None:
             return None
 
-        service_count, last_service_date = await self._count_and_latest(
-            ServiceVisit.vin, ServiceVisit.date, vin
-        )
-        fuel_count, last_fuel_date = await self._count_and_latest(
-            FuelRecord.vin, FuelRecord.date, vin
-        )
-        documents = await self._scalar_count(Document.vin, [vin])
-        notes = await self._scalar_count(Note.vin, [vin])
-        photos = await self._scalar_count(VehiclePhoto.vin, [vin])
-
-        odometer_km, odometer_date = await self._latest_odometer_reading(vin)
+        rollup = (await get_vehicle_rollups(self.db, [vin]))[vin]
         recent_l100km, average_l100km = await self._consumption_l100km(vin)
-        current_odometer_km = int(odometer_km) if odometer_km is not None else None
-
-        # Canonical latest engine-hours reading (Task 8 §1 helper) + hours
-        # economy. Null for a pure-distance vehicle (no hours_records rows).
-        # Fetched once and reused below for the overdue-count check so the
-        # displayed reading and the reminder evaluation can never disagree —
-        # no extra query per vehicle for the hours-reminder check.
-        latest_hours, _latest_hours_date = await latest_engine_hours_and_date(self.db, vin)
         average_l_per_hr, average_cost_per_hr = await calculate_average_hours_economy(self.db, vin)
 
-        overdue, upcoming = await self._overdue_upcoming([vin], current_odometer_km, latest_hours)
-
         return _VehicleCore(
             label=_vehicle_label(vehicle),
             year=vehicle.year,
             make=vehicle.make,
             model=vehicle.model,
-            odometer_km=odometer_km,
-            odometer_date=odometer_date,
+            odometer_km=rollup.latest_odometer_km,
+            odometer_date=rollup.latest_odometer_date,
             recent_l100km=recent_l100km,
             average_l100km=average_l100km,
-            latest_hours=latest_hours,
+            latest_hours=rollup.latest_hours,
             average_l_per_hr=average_l_per_hr,
             average_cost_per_hr=average_cost_per_hr,
-            upcoming_maintenance=upcoming,
-            overdue_maintenance=overdue,
-            service_records=service_count,
-            fuel_records=fuel_count,
-            last_service_date=last_service_date,
-            last_fuel_date=last_fuel_date,
-            documents=documents,
-            notes=notes,
-            photos=photos,
+            upcoming_maintenance=rollup.upcoming_count,
+            overdue_maintenance=rollup.overdue_count,
+            service_records=rollup.service_count,
+            fuel_records=rollup.fuel_count,
+            last_service_date=rollup.last_service_date,
+            last_fuel_date=rollup.last_fuel_date,
+            documents=rollup.document_count,
+            notes=rollup.note_count,
+            photos=rollup.photo_count,
         )
 
     async def vehicle(
@@ -356,116 +331,6 @@ class WidgetAggregationService:
     # Internal query helpers (each hits a single indexed path)
     # -------------------------------------------------------------------------
 
-    async def _scalar_count(self, column, vins: list[str]) -> int:
-        if not vins:
-            return 0
-        stmt = select(func.count()).where(column.in_(vins))
-        return int((await self.db.execute(stmt)).scalar_one() or 0)
-
-    async def _count_and_latest(self, vin_col, date_col, vin: str) -> tuple[int, date_type | None]:
-        stmt = select(func.count(), func.max(date_col)).where(vin_col == vin)
-        count, latest = (await self.db.execute(stmt)).one()
-        return int(count or 0), latest
-
-    async def _latest_odometer_reading(self, vin: str) -> tuple[Decimal | None, date_type | None]:
-        """Latest odometer reading for `vin` as canonical km (Decimal) + date.
-
-        The single metric source for both the v1 (miles) and v2 (km + miles)
-        response formatting and the mileage-based reminder comparison.
-        """
-        stmt = (
-            select(OdometerRecord.odometer_km, OdometerRecord.date)
-            .where(OdometerRecord.vin == vin)
-            .order_by(OdometerRecord.date.desc(), OdometerRecord.id.desc())
-            .limit(1)
-        )
-        row = (await self.db.execute(stmt)).first()
-        if row is None:
-            return None, None
-        return row.odometer_km, row.date
-
-    async def _latest_odometer_km(self, vin: str) -> int | None:
-        """Internal: latest odometer reading for `vin` in km (for SQL comparisons)."""
-        stmt = (
-            select(OdometerRecord.odometer_km)
-            .where(OdometerRecord.vin == vin)
-            .order_by(OdometerRecord.date.desc(), OdometerRecord.id.desc())
-            .limit(1)
-        )
-        row = (await self.db.execute(stmt)).first()
-        if row is None or row.odometer_km is None:
-            return None
-        return int(row.odometer_km)
-
-    async def _reminder_totals(self, vins: list[str]) -> tuple[int, int]:
-        """Sum overdue and upcoming pending reminders across `vins`.
-
-        Overdue derivation per reminder (Task 8: routed through the shared
-        `is_reminder_overdue` helper, so this now also honors ``due_hours``):
-          (due_date <= today) OR (due_mileage_km <= current odometer_km)
-          OR (due_hours <= current engine hours)
-        Each VIN's current odometer_km / engine hours comes from its own
-        latest-reading query, fetched ONCE per VIN here (not per reminder) —
-        the reminder query then classifies with a per-VIN comparison.
-        """
-        if not vins:
-            return 0, 0
-
-        # Per-VIN latest odometer_km / engine hours for mileage/hours-based
-        # overdue checks — one fetch per VIN, reused for every reminder.
-        odometer_by_vin: dict[str, int] = {}
-        hours_by_vin: dict[str, Decimal] = {}
-        for vin in vins:
-            current_km = await self._latest_odometer_km(vin)
-            if current_km is not None:
-                odometer_by_vin[vin] = current_km
-            current_hours = await get_current_hours(vin, self.db)
-            if current_hours is not None:
-                hours_by_vin[vin] = current_hours
-
-        overdue_total = 0
-        upcoming_total = 0
-        for vin in vins:
-            current_odometer_km = odometer_by_vin.get(vin)
-            current_hours = hours_by_vin.get(vin)
-            overdue, upcoming = await self._overdue_upcoming(
-                [vin], current_odometer_km, current_hours
-            )
-            overdue_total += overdue
-            upcoming_total += upcoming
-        return overdue_total, upcoming_total
-
-    async def _overdue_upcoming(
-        self,
-        vins: list[str],
-        current_odometer_km: int | None,
-        current_hours: Decimal | None,
-    ) -> tuple[int, int]:
-        """Classify pending reminders for the given VIN(s).
-
-        Delegates the per-reminder overdue determination to the shared
-        `is_reminder_overdue` helper (date, mileage, OR hours — Task 8,
-        P5-review gap) so a pure `hours` reminder counts here exactly like it
-        already does on the dashboard/detail-stats surfaces. Everything else
-        pending counts as upcoming.
-        """
-        if not vins:
-            return 0, 0
-        today = date_type.today()
-        current_km_decimal = (
-            Decimal(current_odometer_km) if current_odometer_km is not None else None
-        )
-        stmt = select(Reminder).where(Reminder.vin.in_(vins), Reminder.status == "pending")
-        reminders = (await self.db.execute(stmt)).scalars().all()
-        overdue = 0
-        upcoming = 0
-        for reminder in reminders:
-            if is_reminder_overdue(reminder, current_km_decimal, current_hours, today):
-                overdue += 1
-            else:
-                upcoming += 1
-        return overdue, upcoming
-
     async def _consumption_l100km(self, vin: str) -> tuple[Decimal | None, Decimal | None]:
         """Return (recent, average) consumption in L/100km, bounded to the last
         10 full-tank fill-ups.
@@ -4,11 +4,11 @@
 
 import asyncio
 import logging
-import os
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+from app.services.ocr_pipeline import PADDLEOCR_ENABLED, ocr_pipeline
 from app.services.window_sticker_parsers import (
     ParserRegistry,
     WindowStickerData,
@@ -17,9 +17,6 @@ from app.services.window_sticker_parsers import (
 
 logger = logging.getLogger(__name__)
 
-# Check if PaddleOCR is enabled
-PADDLEOCR_ENABLED = os.getenv("ENABLE_PADDLEOCR", "false").lower() == "true"
-
 # US MPG -> L/100km conversion factor (235.214583 / mpg = L/100km)
 _MPG_TO_L100KM = Decimal("235.214583")
 
@@ -30,7 +27,6 @@ class WindowStickerOCRService:
     def __init__(self):
         """Initialize the OCR service."""
         self.supported_formats = {".pdf", ".jpg", ".jpeg", ".png"}
-        self._paddleocr = None
 
     async def extract_data_from_file(
         self,
@@ -66,11 +62,7 @@ class WindowStickerOCRService:
         logger.info("Extracting data from window sticker: %s", file_path)
 
         try:
-            # Extract text based on file type
-            if path.suffix.lower() == ".pdf":
-                text = await self._extract_text_from_pdf(file_path)
-            else:
-                text = await self._extract_text_from_image(file_path)
+            text = await self._extract_text(path)
 
             if not text or len(text.strip()) < 50:
                 logger.warning("Insufficient text extracted from %s", file_path)
@@ -133,10 +125,7 @@ class WindowStickerOCRService:
 
         try:
             # Extract text
-            if path.suffix.lower() == ".pdf":
-                text = await self._extract_text_from_pdf(file_path)
-            else:
-                text = await self._extract_text_from_image(file_path)
+            text = await self._extract_text(path)
 
             result["raw_text"] = text
 
@@ -170,180 +159,10 @@ class WindowStickerOCRService:
 
         return result
 
-    async def _extract_text_from_pdf(self, file_path: str) -> str:
-        """
-        Extract text from a PDF file using PyMuPDF.
-
-        Args:
-            file_path: Path to the PDF file
-
-        Returns:
-            Extracted text content
-        """
-        try:
-            import fitz  # PyMuPDF
-
-            text_content = []
-            with fitz.open(file_path) as doc:
-                for page in doc:
-                    text_content.append(page.get_text())
-
-            full_text = "\n".join(text_content)
-
-            # If PDF has minimal text, it might be a scanned image
-            if len(full_text.strip()) < 100:
-                logger.info("PDF appears to be scanned, attempting OCR")
-                return await self._ocr_pdf(file_path)
-
-            return full_text
-
-        except ImportError:
-            logger.warning("PyMuPDF not installed, falling back to OCR")
-            return await self._ocr_pdf(file_path)
-        except Exception as e:
-            logger.error("Error extracting text from PDF: %s", e)
-            return ""
-
-    async def _ocr_pdf(self, file_path: str) -> str:
-        """OCR a PDF by converting to images first."""
-        try:
-            import fitz  # PyMuPDF
-
-            text_content = []
-            with fitz.open(file_path) as doc:
-                for _page_num, page in enumerate(doc):
-                    # Render page to image
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better OCR
-                    img_data = pix.tobytes("png")
-
-                    # OCR the image
-                    text = await self._ocr_image_bytes(img_data)
-                    if text:
-                        text_content.append(text)
-
-            return "\n".join(text_content)
-        except Exception as e:
-            logger.error("Error OCR-ing PDF: %s", e)
-            return ""
-
-    async def _extract_text_from_image(self, file_path: str) -> str:
-        """
-        Extract text from an image file using OCR.
-
-        Args:
-            file_path: Path to the image file
-
-        Returns:
-            Extracted text content
-        """
-        # Try PaddleOCR first if enabled
-        if PADDLEOCR_ENABLED:
-            try:
-                text = await self._paddleocr_extract(file_path)
-                if text:
-                    return text
-            except Exception as e:
-                logger.warning("PaddleOCR failed, falling back to Tesseract: %s", e)
-
-        # Fallback to Tesseract (offload CPU-intensive OCR to thread pool)
-        try:
-            import pytesseract
-            from PIL import Image
-
-            image = await asyncio.to_thread(Image.open, file_path)
-            text = await asyncio.to_thread(pytesseract.image_to_string, image)
-            return str(text)
-        except ImportError:
-            logger.warning("PIL or pytesseract not installed, OCR not available")
-            return ""
-        except Exception as e:
-            logger.error("Error extracting text from image: %s", e)
-            return ""
-
-    async def _ocr_image_bytes(self, img_bytes: bytes) -> str:
-        """OCR image from bytes."""
-        # Try PaddleOCR first if enabled
-        if PADDLEOCR_ENABLED:
-            try:
-                text = await self._paddleocr_extract_bytes(img_bytes)
-                if text:
-                    return text
-            except Exception as e:
-                logger.warning("PaddleOCR bytes failed: %s", e)
-
-        # Fallback to Tesseract (offload CPU-intensive OCR to thread pool)
-        try:
-            import io
-
-            import pytesseract
-            from PIL import Image
-
-            image = Image.open(io.BytesIO(img_bytes))
-            return str(await asyncio.to_thread(pytesseract.image_to_string, image))
-        except Exception as e:
-            logger.error("Error OCR-ing image bytes: %s", e)
-            return ""
-
-    async def _paddleocr_extract(self, file_path: str) -> str:
-        """Extract text using PaddleOCR."""
-        try:
-            if self._paddleocr is None:
-                from paddleocr import PaddleOCR
-
-                self._paddleocr = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
-
-            result = self._paddleocr.ocr(file_path, cls=True)
-
-            # Extract text from result
-            lines = []
-            for line in result:
-                if line:
-                    for word_info in line:
-                        if word_info and len(word_info) > 1:
-                            text = word_info[1][0]
-                            lines.append(text)
-
-            return "\n".join(lines)
-
-        except ImportError:
-            logger.warning("PaddleOCR not installed")
-            return ""
-        except Exception as e:
-            logger.error("PaddleOCR extraction failed: %s", e)
-            return ""
-
-    async def _paddleocr_extract_bytes(self, img_bytes: bytes) -> str:
-        """Extract text from image bytes using PaddleOCR."""
-        try:
-            import io
-
-            import numpy as np
-            from PIL import Image
-
-            if self._paddleocr is None:
-                from paddleocr import PaddleOCR
-
-                self._paddleocr = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
-
-            # Convert bytes to numpy array
-            image = Image.open(io.BytesIO(img_bytes))
-            img_array = np.array(image)
-
-            result = self._paddleocr.ocr(img_array, cls=True)
-
-            lines = []
-            for line in result:
-                if line:
-                    for word_info in line:
-                        if word_info and len(word_info) > 1:
-                            text = word_info[1][0]
-                            lines.append(text)
-
-            return "\n".join(lines)
-
-        except Exception as e:
-            logger.error("PaddleOCR bytes extraction failed: %s", e)
-            return ""
+    async def _extract_text(self, path: Path) -> str:
+        """Extract text from a PDF (text layer, else OCR) or an image (OCR)."""
+        contents = await asyncio.to_thread(path.read_bytes)
+        return await ocr_pipeline.extract_text(contents, is_pdf=path.suffix.lower() == ".pdf")
 
     def _sticker_data_to_dict(self, data: WindowStickerData) -> dict[str, Any]:
         """Convert WindowStickerData to dict for database storage."""
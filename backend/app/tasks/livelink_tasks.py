@@ -331,10 +331,7 @@ async def finalize_pending_offlines():
 
 async def _get_bool_setting(db: AsyncSession, key: str, default: bool = False) -> bool:
     """Get a boolean setting value."""
-    setting = await SettingsService.get(db, key)
-    if not setting or not setting.value:
-        return default
-    return setting.value.lower() in ("true", "1", "yes")
+    return await SettingsService.get_bool(db, key, default)
 
 
 # =============================================================================
@@ -345,8 +342,7 @@ async def _get_bool_setting(db: AsyncSession, key: str, default: bool = False) -
 async def is_mqtt_enabled() -> bool:
     """Check if MQTT is enabled in settings."""
     async with AsyncSessionLocal() as db:
-        setting = await SettingsService.get(db, "livelink_mqtt_enabled")
-        return setting is not None and setting.value == "true"
+        return await SettingsService.get_value(db, "livelink_mqtt_enabled") == "true"
 
 
 async def start_mqtt_subscriber() -> None:
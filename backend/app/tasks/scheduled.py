@@ -6,13 +6,16 @@
 
 """Scheduled tasks for MyGarage application."""
 
-import asyncio
 import logging
 import os
-from datetime import date, timedelta
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
 
+import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import select
+from sqlalchemy import Integer, and_, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.fuel import has_def_capacity, is_diesel_vehicle
@@ -20,12 +23,20 @@ from app.database import AsyncSessionLocal
 from app.models import (
     DEFRecord,
     InsurancePolicy,
-    OdometerRecord,
     Recall,
     Vehicle,
     WarrantyRecord,
 )
-from app.services.notifications.dispatcher import NotificationDispatcher
+from app.services.notifications.dispatcher import (
+    NotificationDispatcher,
+    format_def_low,
+    format_insurance_expiring,
+    format_odometer_milestone,
+    format_recall_detected,
+    format_warranty_expiring,
+)
+from app.services.notifications.outbox import enqueue_notification
+from app.services.odometer_service import latest_odometer_by_vin_query
 from app.services.settings_service import SettingsService
 from app.tasks.livelink_tasks import (
     check_device_offline_status,
@@ -44,11 +55,14 @@ scheduler = AsyncIOScheduler()
 # Notification dedup cooldown (24 hours)
 NOTIFICATION_COOLDOWN = timedelta(hours=24)
 
+# Latest completed run of each notification sweep (duration_ms plus row
+# counts), keyed by job name and reported at /api/settings/system/jobs
+job_stats: dict[str, dict[str, Any]] = {}
+
 
 async def _get_setting(db: AsyncSession, key: str, default: str = "") -> str:
     """Get a setting value with a default fallback."""
-    setting = await SettingsService.get(db, key)
-    return setting.value if setting and setting.value else default
+    return await SettingsService.get_value(db, key, default)
 
 
 async def reset_daily_limits() -> None:
@@ -79,16 +93,46 @@ async def reset_monthly_limits() -> None:
                 logger.error("Failed to reset usage for %s: %s", provider, str(e))
 
 
+def _record_job_run(name: str, started: float, **counts: int) -> None:
+    """Keep and log the duration and row counts of a sweep's latest run."""
+    duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    job_stats[name] = {
+        "finished_at": utc_now().isoformat(),
+        "duration_ms": duration_ms,
+        **counts,
+    }
+    logger.info(
+        "%s complete in %.1f ms (%s)",
+        name,
+        duration_ms,
+        ", ".join(f"{key}={value}" for key, value in counts.items()),
+    )
+
+
+def _vehicle_name(vehicle: Vehicle | None, vin: str) -> str:
+    if vehicle is None:
+        return vin
+    return vehicle.nickname or f"{vehicle.year} {vehicle.make} {vehicle.model}"
+
+
+def _cooled_down(column, cutoff: datetime):
+    """Never notified, or last notified at least NOTIFICATION_COOLDOWN ago."""
+    return or_(column.is_(None), column <= cutoff)
+
+
 async def check_expiring_documents() -> None:
     """Check for expiring insurance and warranties and send notifications.
 
     Runs daily at 9 AM UTC. Reads notify_insurance_days and notify_warranty_days
-    settings. Uses 24-hour cooldown to prevent duplicate notifications.
+    settings. Uses 24-hour cooldown to prevent duplicate notifications. Each
+    document type is one query returning the policies/warranties inside the
+    window and past the cooldown, joined to their vehicle for the name.
     """
+    started = time.perf_counter()
     async with AsyncSessionLocal() as db:
         try:
             dispatcher = NotificationDispatcher(db)
-            if not await dispatcher._has_any_service_enabled():
+            if not await dispatcher.has_any_service_enabled():
                 return
 
             notify_insurance_days = int(await _get_setting(db, "notify_insurance_days", "30"))
@@ -96,81 +140,57 @@ async def check_expiring_documents() -> None:
 
             today = date.today()
             now = utc_now()
+            cooldown_cutoff = now - NOTIFICATION_COOLDOWN
 
-            # Get all vehicles for name lookup
-            vehicles_result = await db.execute(select(Vehicle))
-            vehicles_dict = {v.vin: v for v in vehicles_result.scalars().all()}
-
-            # Check insurance policies
             insurance_cutoff = today + timedelta(days=notify_insurance_days)
             insurance_result = await db.execute(
-                select(InsurancePolicy).where(
+                select(InsurancePolicy, Vehicle)
+                .outerjoin(Vehicle, Vehicle.vin == InsurancePolicy.vin)
+                .where(
                     InsurancePolicy.end_date >= today,
                     InsurancePolicy.end_date <= insurance_cutoff,
+                    _cooled_down(InsurancePolicy.last_notified_at, cooldown_cutoff),
                 )
             )
-            for policy in insurance_result.scalars().all():
-                # Dedup check
-                if (
-                    policy.last_notified_at
-                    and (now - policy.last_notified_at) < NOTIFICATION_COOLDOWN
-                ):
-                    continue
-
-                vehicle = vehicles_dict.get(policy.vin)
-                vehicle_name = (
-                    vehicle.nickname or f"{vehicle.year} {vehicle.make} {vehicle.model}"
-                    if vehicle
-                    else policy.vin
-                )
-                days_until = (policy.end_date - today).days
-
-                await dispatcher.notify_insurance_expiring(
-                    vehicle_name=vehicle_name,
+            insurance_rows = insurance_result.all()
+            for policy, vehicle in insurance_rows:
+                title, message = format_insurance_expiring(
+                    vehicle_name=_vehicle_name(vehicle, policy.vin),
                     policy_name=f"{policy.provider} - {policy.policy_type}",
-                    days_until_expiry=days_until,
+                    days_until_expiry=(policy.end_date - today).days,
                 )
-
+                enqueue_notification(db, "insurance_expiring", title, message)
                 policy.last_notified_at = now
 
-            # Check warranty records
             warranty_cutoff = today + timedelta(days=notify_warranty_days)
             warranty_result = await db.execute(
-                select(WarrantyRecord).where(
+                select(WarrantyRecord, Vehicle)
+                .outerjoin(Vehicle, Vehicle.vin == WarrantyRecord.vin)
+                .where(
                     WarrantyRecord.end_date.isnot(None),
                     WarrantyRecord.end_date >= today,
                     WarrantyRecord.end_date <= warranty_cutoff,
+                    _cooled_down(WarrantyRecord.last_notified_at, cooldown_cutoff),
                 )
             )
-            for warranty in warranty_result.scalars().all():
-                # Dedup check
-                if (
-                    warranty.last_notified_at
-                    and (now - warranty.last_notified_at) < NOTIFICATION_COOLDOWN
-                ):
-                    continue
-
-                if not warranty.end_date:
-                    continue
-
-                vehicle = vehicles_dict.get(warranty.vin)
-                vehicle_name = (
-                    vehicle.nickname or f"{vehicle.year} {vehicle.make} {vehicle.model}"
-                    if vehicle
-                    else warranty.vin
-                )
-                days_until = (warranty.end_date - today).days
-
-                await dispatcher.notify_warranty_expiring(
-                    vehicle_name=vehicle_name,
+            warranty_rows = warranty_result.all()
+            for warranty, vehicle in warranty_rows:
+                title, message = format_warranty_expiring(
+                    vehicle_name=_vehicle_name(vehicle, warranty.vin),
                     warranty_name=f"{warranty.warranty_type} Warranty",
-                    days_until_expiry=days_until,
+                    days_until_expiry=(warranty.end_date - today).days,
                 )
-
+                enqueue_notification(db, "warranty_expiring", title, message)
                 warranty.last_notified_at = now
 
             await db.commit()
-            logger.info("Expiring documents notification check complete")
+            _record_job_run(
+                "check_expiring_documents",
+                started,
+                insurance=len(insurance_rows),
+                warranties=len(warranty_rows),
+                queued=len(insurance_rows) + len(warranty_rows),
+            )
 
         except Exception as e:
             logger.error("Expiring documents check failed: %s", str(e))
@@ -182,13 +202,18 @@ async def check_odometer_milestones() -> None:
     Runs daily at 10 AM UTC. Checks each vehicle's latest odometer_km against
     milestone boundaries (every 10,000 km). Uses last_milestone_notified_km
     on the vehicle to prevent duplicate notifications.
+
+    One query ranks every vehicle's readings and returns only the non-archived
+    vehicles whose latest reading sits in a higher 10,000 km bucket than the
+    last notified milestone.
     """
     MILESTONE_INTERVAL_KM = 10_000  # noqa: N806 — constant value, intentionally uppercased
 
+    started = time.perf_counter()
     async with AsyncSessionLocal() as db:
         try:
             dispatcher = NotificationDispatcher(db)
-            if not await dispatcher._has_any_service_enabled():
+            if not await dispatcher.has_any_service_enabled():
                 return
 
             # Check if milestone notifications are enabled
@@ -196,55 +221,46 @@ async def check_odometer_milestones() -> None:
             if milestones_enabled.lower() != "true":
                 return
 
-            vehicles_result = await db.execute(select(Vehicle).where(Vehicle.archived_at.is_(None)))
-            vehicles = vehicles_result.scalars().all()
-
-            for vehicle in vehicles:
-                try:
-                    # Get latest odometer_km
-                    odo_result = await db.execute(
-                        select(OdometerRecord.odometer_km)
-                        .where(OdometerRecord.vin == vehicle.vin)
-                        .order_by(OdometerRecord.date.desc())
-                        .limit(1)
-                    )
-                    current_odometer_km = odo_result.scalar_one_or_none()
-                    if not current_odometer_km:
-                        continue
-
-                    # Calculate the highest milestone crossed (integer-floor on km)
-                    current_milestone = (
-                        int(current_odometer_km) // MILESTONE_INTERVAL_KM
-                    ) * MILESTONE_INTERVAL_KM
-                    if current_milestone == 0:
-                        continue
-
-                    last_notified = int(vehicle.last_milestone_notified_km or 0)
-
-                    if current_milestone > last_notified:
-                        vehicle_name = (
-                            vehicle.nickname or f"{vehicle.year} {vehicle.make} {vehicle.model}"
-                        )
-                        await dispatcher.notify_odometer_milestone(
-                            vehicle_name=vehicle_name,
-                            milestone=current_milestone,
-                        )
-                        vehicle.last_milestone_notified_km = current_milestone
-                        logger.info(
-                            "Milestone notification: %s reached %s km",
-                            vehicle_name,
-                            f"{current_milestone:,}",
-                        )
+            latest = latest_odometer_by_vin_query().subquery()
+            candidates_result = await db.execute(
+                select(Vehicle, latest.c.odometer_km)
+                .join(latest, latest.c.vin == Vehicle.vin)
+                .where(
+                    Vehicle.archived_at.is_(None),
+                    cast(latest.c.odometer_km, Integer) // MILESTONE_INTERVAL_KM
+                    > cast(func.coalesce(Vehicle.last_milestone_notified_km, 0), Integer)
+                    // MILESTONE_INTERVAL_KM,
+                )
+            )
+            candidates = candidates_result.all()
+
+            queued = 0
+            for vehicle, current_odometer_km in candidates:
+                # Calculate the highest milestone crossed (integer-floor on km)
+                current_milestone = (
+                    int(current_odometer_km) // MILESTONE_INTERVAL_KM
+                ) * MILESTONE_INTERVAL_KM
+                if current_milestone <= int(vehicle.last_milestone_notified_km or 0):
+                    continue
 
-                except Exception as e:
-                    logger.error(
-                        "Error checking milestones for %s: %s",
-                        vehicle.vin,
-                        str(e),
-                    )
+                vehicle_name = _vehicle_name(vehicle, vehicle.vin)
+                title, message = format_odometer_milestone(vehicle_name, current_milestone)
+                enqueue_notification(db, "odometer_milestone", title, message)
+                vehicle.last_milestone_notified_km = current_milestone
+                queued += 1
+                logger.info(
+                    "Milestone notification: %s reached %s km",
+                    vehicle_name,
+                    f"{current_milestone:,}",
+                )
 
             await db.commit()
-            logger.info("Odometer milestone check complete")
+            _record_job_run(
+                "check_odometer_milestones",
+                started,
+                candidates=len(candidates),
+                queued=queued,
+            )
 
         except Exception as e:
             logger.error("Odometer milestone check failed: %s", str(e))
@@ -276,15 +292,18 @@ async def check_def_levels() -> None:
     nag daily or (if long enough) swallow a genuine post-refill depletion.
     Crossing at/under the threshold notifies once and stamps; recovering
     above the threshold clears the stamp so the next dip re-notifies. The
-    stamp only lands when at least one notification backend actually
-    dispatched — an all-failed attempt (e.g. a transient Discord outage)
-    leaves the vehicle unstamped so the next run retries instead of going
-    silent until the next refill-and-dip cycle.
+    notice is queued in the notification outbox in the same transaction as
+    the stamp, and the outbox retries delivery, so a transient backend outage
+    delays the alert instead of dropping it.
+
+    One query ranks each vehicle's readings and returns only the vehicles
+    whose stamp has to change: low and unstamped, or recovered and stamped.
     """
+    started = time.perf_counter()
     async with AsyncSessionLocal() as db:
         try:
             dispatcher = NotificationDispatcher(db)
-            if not await dispatcher._has_any_service_enabled():
+            if not await dispatcher.has_any_service_enabled():
                 return
 
             notify_def_low = await _get_setting(db, "notify_def_low", "false")
@@ -293,90 +312,121 @@ async def check_def_levels() -> None:
 
             threshold_percent = await _get_def_low_threshold_percent(db)
 
-            vehicles_result = await db.execute(select(Vehicle).where(Vehicle.archived_at.is_(None)))
-            vehicles = vehicles_result.scalars().all()
-
-            for vehicle in vehicles:
-                try:
-                    if not is_diesel_vehicle(vehicle.fuel_type, vehicle.fuel_type_secondary):
-                        continue
-                    if not has_def_capacity(vehicle.def_tank_capacity_liters):
-                        continue
-
-                    def_result = await db.execute(
-                        select(DEFRecord.fill_level, DEFRecord.date)
-                        .where(DEFRecord.vin == vehicle.vin, DEFRecord.fill_level.is_not(None))
-                        .order_by(DEFRecord.date.desc(), DEFRecord.id.desc())
-                        .limit(1)
+            latest = (
+                select(
+                    DEFRecord.vin,
+                    DEFRecord.fill_level,
+                    DEFRecord.date,
+                    func.row_number()
+                    .over(
+                        partition_by=DEFRecord.vin,
+                        order_by=(DEFRecord.date.desc(), DEFRecord.id.desc()),
                     )
-                    row = def_result.first()
-                    if row is None:
-                        continue
-
-                    fill_level, record_date = row
-                    percent = fill_level * 100
-
-                    if percent <= threshold_percent:
-                        if vehicle.def_low_notified_at is None:
-                            vehicle_name = (
-                                vehicle.nickname or f"{vehicle.year} {vehicle.make} {vehicle.model}"
-                            )
-                            remaining_liters = fill_level * vehicle.def_tank_capacity_liters
-                            dispatch_results = await dispatcher.notify_def_low(
-                                vehicle_name=vehicle_name,
-                                vin=vehicle.vin,
-                                percent=percent,
-                                remaining_liters=remaining_liters,
-                                as_of_date=record_date,
-                            )
-                            # Stamp only on at least one successful dispatch
-                            # (mirrors TelemetryService.check_thresholds's
-                            # cooldown guard) — an all-failed dict (e.g. a
-                            # transient Discord outage) must not start the
-                            # crossing-based dedup clock, or the alert stays
-                            # silent until the tank refills and dips again,
-                            # which can be weeks away.
-                            if any(dispatch_results.values()):
-                                vehicle.def_low_notified_at = utc_now()
-                                logger.info(
-                                    "DEF low notification: %s at %.1f%%",
-                                    vehicle_name,
-                                    percent,
-                                )
-                            else:
-                                logger.warning(
-                                    "DEF low notification dispatch failed for %s at "
-                                    "%.1f%%; will retry next run",
-                                    vehicle_name,
-                                    percent,
-                                )
-                    elif vehicle.def_low_notified_at is not None:
-                        # Recovery reset — the next dip below threshold re-notifies.
-                        vehicle.def_low_notified_at = None
+                    .label("rank"),
+                )
+                .where(DEFRecord.fill_level.is_not(None))
+                .subquery()
+            )
+            # fill_level is a 0-1 fraction; compare against the threshold as
+            # a fraction so the boundary (e.g. 0.25 vs 25%) stays exact.
+            is_low = latest.c.fill_level <= Decimal(threshold_percent) / 100
+            candidates_result = await db.execute(
+                select(Vehicle, latest.c.fill_level, latest.c.date)
+                .join(latest, latest.c.vin == Vehicle.vin)
+                .where(
+                    latest.c.rank == 1,
+                    Vehicle.archived_at.is_(None),
+                    Vehicle.def_tank_capacity_liters > 0,
+                    or_(
+                        and_(is_low, Vehicle.def_low_notified_at.is_(None)),
+                        and_(~is_low, Vehicle.def_low_notified_at.is_not(None)),
+                    ),
+                )
+            )
+            candidates = candidates_result.all()
 
-                except Exception as e:
-                    logger.error(
-                        "Error checking DEF level for %s: %s",
-                        vehicle.vin,
-                        str(e),
-                    )
+            queued = cleared = 0
+            for vehicle, fill_level, record_date in candidates:
+                if not is_diesel_vehicle(vehicle.fuel_type, vehicle.fuel_type_secondary):
+                    continue
+                if not has_def_capacity(vehicle.def_tank_capacity_liters):
+                    continue
+
+                percent = fill_level * 100
+                if percent <= threshold_percent:
+                    if vehicle.def_low_notified_at is None:
+                        vehicle_name = _vehicle_name(vehicle, vehicle.vin)
+                        title, message = format_def_low(
+                            vehicle_name=vehicle_name,
+                            vin=vehicle.vin,
+                            percent=percent,
+                            remaining_liters=fill_level * vehicle.def_tank_capacity_liters,
+                            as_of_date=record_date,
+                        )
+                        enqueue_notification(db, "def_low", title, message)
+                        vehicle.def_low_notified_at = utc_now()
+                        queued += 1
+                        logger.info(
+                            "DEF low notification: %s at %.1f%%",
+                            vehicle_name,
+                            percent,
+                        )
+                elif vehicle.def_low_notified_at is not None:
+                    # Recovery reset — the next dip below threshold re-notifies.
+                    vehicle.def_low_notified_at = None
+                    cleared += 1
 
             await db.commit()
-            logger.info("DEF level check complete")
+            _record_job_run(
+                "check_def_levels",
+                started,
+                candidates=len(candidates),
+                queued=queued,
+                cleared=cleared,
+            )
 
         except Exception as e:
             logger.error("DEF level check failed: %s", str(e))
 
 
-async def check_recalls_all_vehicles() -> None:
+def _new_recalls(vin: str, recalls: list[dict[str, Any]], seen: set[str]) -> list[Recall]:
+    """Recall rows for the campaigns in ``recalls`` that ``vin`` does not have yet."""
+    new: dict[str, Recall] = {}
+    for recall_data in recalls:
+        campaign_num = recall_data.get("nhtsa_campaign_number") or recall_data.get(
+            "NHTSACampaignNumber"
+        )
+        if not campaign_num or campaign_num in seen or campaign_num in new:
+            continue
+        new[campaign_num] = Recall(
+            vin=vin,
+            nhtsa_campaign_number=campaign_num,
+            component=recall_data.get("Component") or recall_data.get("component"),
+            summary=recall_data.get("Summary") or recall_data.get("summary"),
+            consequence=recall_data.get("Consequence") or recall_data.get("consequence"),
+            remedy=recall_data.get("Remedy") or recall_data.get("remedy"),
+        )
+    return list(new.values())
+
+
+async def check_recalls_all_vehicles(transport: httpx.AsyncBaseTransport | None = None) -> None:
     """Auto-check NHTSA recalls for all vehicles.
 
-    Runs weekly (Sunday 2 AM UTC). Checks nhtsa_auto_check setting,
-    queries NHTSA for each vehicle, inserts new recalls, and sends
-    notifications for any newly discovered recalls.
+    Runs weekly (Sunday 2 AM UTC). Checks nhtsa_auto_check setting, decodes
+    every active vehicle's VIN (cached decodes first, the rest through vPIC's
+    batch endpoint), reads the recall list of each distinct make/model/year
+    once (through the recall cache), inserts new recalls, and queues
+    notifications for vehicles with newly discovered recalls. NHTSA requests
+    are paced by NHTSAService's rate limiter rather than a sleep per vehicle.
+    A failed decode batch skips only its VINs, and a vehicle whose recalls
+    cannot be stored is rolled back alone; the rest of the sweep completes.
+
+    ``transport`` replaces the HTTP transport, so tests can answer NHTSA
+    requests from a local stub.
     """
-    from app.services.nhtsa import NHTSAService
+    from app.services.nhtsa import REQUEST_TIMEOUT_SECONDS, NHTSAService
 
+    started = time.perf_counter()
     async with AsyncSessionLocal() as db:
         try:
             # Check if auto-check is enabled
@@ -385,84 +435,86 @@ async def check_recalls_all_vehicles() -> None:
                 logger.info("NHTSA auto-check disabled, skipping")
                 return
 
-            nhtsa = NHTSAService()
-            dispatcher = NotificationDispatcher(db)
-
             # Get all active vehicles
             vehicles_result = await db.execute(select(Vehicle).where(Vehicle.archived_at.is_(None)))
             vehicles = vehicles_result.scalars().all()
 
-            total_new = 0
-
-            for vehicle in vehicles:
-                try:
-                    vehicle_name = (
-                        vehicle.nickname or f"{vehicle.year} {vehicle.make} {vehicle.model}"
-                    )
+            async with httpx.AsyncClient(
+                timeout=REQUEST_TIMEOUT_SECONDS, transport=transport
+            ) as client:
+                nhtsa = NHTSAService(client=client)
+                decoded = await nhtsa.decode_vins([v.vin for v in vehicles], db)
+                recall_vehicles = {
+                    vin: (info["make"], info["model"], info["year"])
+                    for vin, info in decoded.items()
+                }
+                recalls_by_vehicle = await nhtsa.get_recalls_by_vehicle(
+                    recall_vehicles.values(), db
+                )
 
-                    # Fetch recalls from NHTSA
-                    recalls_data = await nhtsa.get_vehicle_recalls(vehicle.vin, db)
+            # Existing campaign numbers for every vehicle
+            existing_result = await db.execute(
+                select(Recall.vin, Recall.nhtsa_campaign_number).where(
+                    Recall.vin.in_(recall_vehicles),
+                    Recall.nhtsa_campaign_number.isnot(None),
+                )
+            )
+            existing_campaigns: dict[str, set[str]] = {}
+            for vin, campaign in existing_result.all():
+                existing_campaigns.setdefault(vin, set()).add(campaign)
 
-                    # Get existing campaign numbers for this vehicle
-                    existing_result = await db.execute(
-                        select(Recall.nhtsa_campaign_number).where(
-                            Recall.vin == vehicle.vin,
-                            Recall.nhtsa_campaign_number.isnot(None),
-                        )
-                    )
-                    existing_campaigns = {r[0] for r in existing_result.fetchall()}
+            total_new = 0
+            queued = 0
+            failed = 0
 
-                    # Insert new recalls
-                    new_count = 0
-                    for recall_data in recalls_data:
-                        campaign_num = recall_data.get("nhtsa_campaign_number") or recall_data.get(
-                            "NHTSACampaignNumber"
-                        )
-                        if not campaign_num or campaign_num in existing_campaigns:
-                            continue
+            for vehicle in vehicles:
+                recall_vehicle = recall_vehicles.get(vehicle.vin)
+                if recall_vehicle is None:
+                    logger.warning("Could not decode VIN %s, skipping recall check", vehicle.vin)
+                    continue
 
-                        recall = Recall(
-                            vin=vehicle.vin,
-                            nhtsa_campaign_number=campaign_num,
-                            component=recall_data.get("Component") or recall_data.get("component"),
-                            summary=recall_data.get("Summary") or recall_data.get("summary"),
-                            consequence=recall_data.get("Consequence")
-                            or recall_data.get("consequence"),
-                            remedy=recall_data.get("Remedy") or recall_data.get("remedy"),
-                        )
-                        db.add(recall)
-                        new_count += 1
+                vehicle_name = _vehicle_name(vehicle, vehicle.vin)
+                seen = existing_campaigns.setdefault(vehicle.vin, set())
 
-                    if new_count > 0:
-                        total_new += new_count
-                        await dispatcher.notify_recall_detected(
-                            vehicle_name=vehicle_name,
-                            recall_count=new_count,
-                        )
-                        logger.info(
-                            "Found %d new recall(s) for %s",
-                            new_count,
-                            vehicle_name,
+                # Insert new recalls; one vehicle's failure leaves the others'
+                try:
+                    async with db.begin_nested():
+                        new_recalls = _new_recalls(
+                            vehicle.vin, recalls_by_vehicle[recall_vehicle], seen
                         )
-
-                    # Rate limit: 2 seconds between vehicles
-                    await asyncio.sleep(2)
-
+                        db.add_all(new_recalls)
+                        new_count = len(new_recalls)
+                        if new_count > 0:
+                            title, message = format_recall_detected(vehicle_name, new_count)
+                            enqueue_notification(db, "recall_detected", title, message)
                 except Exception as e:
-                    logger.error(
-                        "Error checking recalls for %s: %s",
-                        vehicle.vin,
-                        str(e),
+                    failed += 1
+                    logger.error("Recall check failed for %s: %s", vehicle.vin, str(e))
+                    continue
+
+                seen.update(recall.nhtsa_campaign_number for recall in new_recalls)
+                if new_count > 0:
+                    total_new += new_count
+                    queued += 1
+                    logger.info(
+                        "Found %d new recall(s) for %s",
+                        new_count,
+                        vehicle_name,
                     )
 
             # Update last check timestamp
             await SettingsService.set(db, "nhtsa_last_check", utc_now().isoformat())
             await db.commit()
 
-            logger.info(
-                "NHTSA recall check complete. Found %d new recall(s) across %d vehicle(s)",
-                total_new,
-                len(vehicles),
+            _record_job_run(
+                "check_recalls_all_vehicles",
+                started,
+                vehicles=len(vehicles),
+                decoded=len(recall_vehicles),
+                vehicle_types=len(set(recall_vehicles.values())),
+                new_recalls=total_new,
+                queued=queued,
+                failed=failed,
             )
 
         except Exception as e:
@@ -471,17 +523,30 @@ async def check_recalls_all_vehicles() -> None:
 
 async def check_reminder_notifications() -> None:
     """Check pending vehicle reminders and send notifications for due items."""
-    logger.info("Running reminder notification check...")
+    started = time.perf_counter()
     try:
         async with AsyncSessionLocal() as db:
             from app.services.reminder_service import check_due_reminders
 
-            await check_due_reminders(db)
-        logger.info("Reminder notification check completed")
+            checked, queued = await check_due_reminders(db)
+        _record_job_run("check_reminder_notifications", started, candidates=checked, queued=queued)
     except Exception as e:
         logger.error("Reminder notification check failed: %s", str(e))
 
 
+async def rebuild_vehicle_rollups() -> None:
+    """Rebuild every vehicle rollup row so its date-dependent figures roll over."""
+    started = time.perf_counter()
+    try:
+        async with AsyncSessionLocal() as db:
+            from app.services.vehicle_rollup_service import rebuild_all_vehicle_rollups
+
+            count = await rebuild_all_vehicle_rollups(db)
+        _record_job_run("rebuild_vehicle_rollups", started, vehicles=count)
+    except Exception as e:
+        logger.error("Vehicle rollup rebuild failed: %s", str(e))
+
+
 def start_scheduler() -> None:
     """Start the scheduled tasks.
 
@@ -490,6 +555,7 @@ def start_scheduler() -> None:
     Schedules:
         - Daily reset at midnight UTC for daily-limited providers
         - Monthly reset on 1st at midnight UTC for monthly-limited providers
+        - Vehicle rollup rebuild at 00:05 UTC
         - Maintenance notification check at 8 AM UTC
         - Document expiration check at 9 AM UTC
         - Odometer milestone check at 10 AM UTC
@@ -532,6 +598,16 @@ def start_scheduler() -> None:
         replace_existing=True,
     )
 
+    # Vehicle rollup rebuild at 00:05 UTC, once the date has changed
+    scheduler.add_job(
+        rebuild_vehicle_rollups,
+        "cron",
+        hour=0,
+        minute=5,
+        id="rebuild_vehicle_rollups",
+        replace_existing=True,
+    )
+
     # Reminder notification check at 8:00 AM UTC
     scheduler.add_job(
         check_reminder_notifications,
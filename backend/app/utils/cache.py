@@ -1,84 +1,177 @@
-"""Simple in-memory TTL cache for analytics results."""
+"""In-memory LRU + TTL cache for analytics results.
+
+Cached functions are keyed on their qualified name and their business
+arguments (vin, flags, odometer). The ``AsyncSession`` argument is
+deliberately left out of the key — every request gets a new session, so
+keying on it meant results were never reused across requests.
+
+Entries carry the VIN they were computed for, so write paths (fuel, service
+visits, DEF, odometer, hours, spot rental billing) can drop exactly the
+affected vehicle's results with ``invalidate_cache_for_vehicle``.
+"""
 
-import asyncio
 import hashlib
+import inspect
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Upper bound on cached results; least recently used entries are evicted first
+DEFAULT_MAX_ENTRIES = 1024
+
+_MISSING = object()
+
 
 class InMemoryCache:
-    """Thread-safe in-memory cache with TTL support."""
+    """LRU cache with per-entry TTL, per-VIN invalidation and hit/miss stats.
 
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, datetime]] = {}
-        self._lock = asyncio.Lock()
+    All operations are synchronous dict updates with no await in between, so
+    they are atomic on the event loop; the async signatures are kept for
+    existing callers.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (value, monotonic expiry, vin)
+        self._cache: OrderedDict[str, tuple[Any, float, str | None]] = OrderedDict()
+        self._vin_keys: dict[str, set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
 
     def generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
-        """Generate a cache key from function name and arguments."""
-        # Convert args and kwargs to a stable string representation
+        """Generate a cache key from function name and arguments.
+
+        Database sessions are skipped: they differ per request and carry no
+        business meaning.
+        """
         key_parts = [func_name]
 
         # Add positional args
         for arg in args:
-            if hasattr(arg, "id"):  # For database sessions, use id
-                key_parts.append(f"session_{id(arg)}")
-            else:
-                key_parts.append(str(arg))
+            if isinstance(arg, (AsyncSession, Session)):
+                continue
+            key_parts.append(str(arg))
 
         # Add keyword args (sorted for consistency)
         for k, v in sorted(kwargs.items()):
+            if isinstance(v, (AsyncSession, Session)):
+                continue
             key_parts.append(f"{k}={v}")
 
         key_string = "|".join(key_parts)
         return hashlib.md5(key_string.encode()).hexdigest()
 
+    def lookup(self, key: str) -> Any:
+        """Return the cached value, or the ``_MISSING`` sentinel.
+
+        Unlike ``get`` this distinguishes a cached ``None`` from a miss.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return _MISSING
+
+        value, expiry, _ = entry
+        if time.monotonic() >= expiry:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return _MISSING
+
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return value
+
     async def get(self, key: str) -> Any | None:
         """Get value from cache if not expired."""
-        async with self._lock:
-            if key in self._cache:
-                value, expiry = self._cache[key]
-                if datetime.now() < expiry:
-                    return value
-                else:
-                    # Clean up expired entry
-                    del self._cache[key]
-        return None
-
-    async def set(self, key: str, value: Any, ttl_seconds: int = 300):
+        value = self.lookup(key)
+        return None if value is _MISSING else value
+
+    def store(self, key: str, value: Any, ttl_seconds: int = 300, vin: str | None = None):
+        """Store a value, evicting the least recently used entries over the bound."""
+        if key in self._cache:
+            self._remove(key)
+        self._cache[key] = (value, time.monotonic() + ttl_seconds, vin)
+        if vin is not None:
+            self._vin_keys.setdefault(vin, set()).add(key)
+
+        while len(self._cache) > self.max_entries:
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self._evictions += 1
+
+    async def set(self, key: str, value: Any, ttl_seconds: int = 300, vin: str | None = None):
         """Set value in cache with TTL."""
-        expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        async with self._lock:
-            self._cache[key] = (value, expiry)
+        self.store(key, value, ttl_seconds, vin)
 
     async def delete(self, key: str):
         """Delete a specific key from cache."""
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        if key in self._cache:
+            self._remove(key)
+
+    def invalidate_vin(self, vin: str) -> int:
+        """Drop every entry computed for a vehicle. Returns the number removed."""
+        keys = self._vin_keys.pop(vin, set())
+        for key in keys:
+            self._cache.pop(key, None)
+        self._invalidations += len(keys)
+        return len(keys)
 
     async def clear(self):
         """Clear all cached data."""
-        async with self._lock:
-            self._cache.clear()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every entry (synchronous form of ``clear``)."""
+        self._cache.clear()
+        self._vin_keys.clear()
 
     async def clear_expired(self):
         """Remove all expired entries."""
-        now = datetime.now()
-        async with self._lock:
-            expired_keys = [key for key, (_, expiry) in self._cache.items() if expiry <= now]
-            for key in expired_keys:
-                del self._cache[key]
+        now = time.monotonic()
+        expired_keys = [key for key, (_, expiry, _) in self._cache.items() if expiry <= now]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters."""
+        self._hits = self._misses = self._evictions = 0
+        self._expirations = self._invalidations = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, vin = self._cache.pop(key)
+        if vin is not None:
+            keys = self._vin_keys.get(vin)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._vin_keys[vin]
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        now = datetime.now()
-        active = sum(1 for _, expiry in self._cache.values() if expiry > now)
+        now = time.monotonic()
+        active = sum(1 for _, expiry, _ in self._cache.values() if expiry > now)
+        lookups = self._hits + self._misses
         return {
             "total_entries": len(self._cache),
             "active_entries": active,
             "expired_entries": len(self._cache) - active,
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
         }
 
 
@@ -90,30 +183,47 @@ def cached(ttl_seconds: int = 300):
     """
     Decorator to cache async function results with TTL.
 
+    Arguments are bound to the function signature (so positional and keyword
+    calls share an entry, and defaults are filled in), the session argument
+    is dropped, and a parameter named ``vin`` tags the entry for per-vehicle
+    invalidation. ``None`` results are cached too.
+
     Args:
         ttl_seconds: Time to live in seconds (default: 5 minutes)
 
     Usage:
         @cached(ttl_seconds=600)
-        async def expensive_function(param1, param2):
+        async def expensive_function(db, vin, flag=True):
             # ... expensive computation
             return result
     """
 
     def decorator(func: Callable):
+        signature = inspect.signature(func)
+        func_name = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            vin = bound.arguments.get("vin")
+
             # Generate cache key
-            cache_key = cache.generate_key(func.__name__, args, kwargs)
+            cache_key = cache.generate_key(func_name, (), bound.arguments)
 
             # Try to get from cache
-            cached_value = await cache.get(cache_key)
-            if cached_value is not None:
+            cached_value = cache.lookup(cache_key)
+            if cached_value is not _MISSING:
                 return cached_value
 
             # Call function and cache result
             result = await func(*args, **kwargs)
-            await cache.set(cache_key, result, ttl_seconds)
+            cache.store(
+                cache_key,
+                result,
+                ttl_seconds,
+                vin=vin.upper().strip() if isinstance(vin, str) else None,
+            )
 
             return result
 
@@ -127,9 +237,7 @@ async def invalidate_cache_for_vehicle(vin: str):
     Invalidate all cached analytics for a specific vehicle.
     This should be called when vehicle data is updated.
     """
-    # For simplicity, we'll clear the entire cache
-    # In production, you might want more granular cache key management
-    await cache.clear()
+    cache.invalidate_vin(vin.upper().strip())
 
 
 async def clear_analytics_cache():
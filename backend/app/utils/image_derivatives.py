@@ -0,0 +1,112 @@
+"""Render resized photo derivatives (runs inside image pipeline worker processes).
+
+Kept free of ``app.config`` and FastAPI imports so a worker process only
+pays for Pillow when it starts. See ``app.services.image_pipeline`` for the
+pool and the content-addressed store layout.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+HEIF_SUPPORTED = False
+try:
+    import pillow_heif  # type: ignore
+
+    pillow_heif.register_heif_opener()
+    HEIF_SUPPORTED = True
+except Exception:  # pragma: no cover - optional dependency
+    pass
+
+# Longest edge in pixels per named size; never upscaled
+DERIVATIVE_SIZES = {"sm": 480, "md": 1280, "lg": 2048}
+
+# Legacy gallery thumbnail (vehicle_photos.thumbnail_path), always JPEG
+THUMBNAIL_SIZE = (512, 512)
+THUMBNAIL_NAME = "thumb.jpg"
+
+MANIFEST_NAME = "manifest.json"
+
+# (format, extension, save options), in order of preference when serving
+_ENCODERS = [
+    ("AVIF", "avif", {"quality": 60, "speed": 8}),
+    ("WEBP", "webp", {"quality": 80, "method": 4}),
+    ("JPEG", "jpg", {"quality": 85, "optimize": True, "progressive": True}),
+]
+
+FORMAT_MEDIA_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpg": "image/jpeg"}
+
+
+class InvalidImageError(Exception):
+    """Raised when the upload cannot be decoded as an image."""
+
+
+def available_formats() -> list[str]:
+    """Derivative extensions this Pillow build can encode, best first."""
+    return [ext for fmt, ext, _ in _ENCODERS if fmt != "AVIF" or features.check("avif")]
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """Drop alpha/palette for encoders and the JPEG fallback."""
+    if image.mode in ("RGBA", "LA", "P"):
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        rgba = image.convert("RGBA")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
+
+
+def render_derivatives(contents: bytes, target_dir: str) -> dict:
+    """Decode ``contents`` once and write every derivative into ``target_dir``.
+
+    Files are rendered into a temporary sibling directory that is renamed into
+    place, so ``target_dir`` either holds a complete set (including the
+    manifest) or does not exist. If another worker finished the same content
+    first, its directory is kept.
+
+    Returns the manifest: original dimensions and per-size dimensions/formats.
+
+    Raises:
+        InvalidImageError: If the bytes are not a decodable image
+    """
+    try:
+        with Image.open(BytesIO(contents)) as opened:
+            opened.load()
+            image = _flatten(ImageOps.exif_transpose(opened))
+    except (UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError) as e:
+        raise InvalidImageError(str(e)) from None
+
+    target = Path(target_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    formats = available_formats()
+    manifest: dict = {"width": image.width, "height": image.height, "sizes": {}, "formats": formats}
+    try:
+        for name, edge in DERIVATIVE_SIZES.items():
+            resized = image.copy()
+            resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            for fmt, ext, options in _ENCODERS:
+                if ext in formats:
+                    resized.save(staging / f"{name}.{ext}", format=fmt, **options)
+            manifest["sizes"][name] = [resized.width, resized.height]
+
+        thumb = image.copy()
+        thumb.thumbnail(THUMBNAIL_SIZE)
+        thumb.save(staging / THUMBNAIL_NAME, format="JPEG", quality=85)
+
+        (staging / MANIFEST_NAME).write_text(json.dumps(manifest))
+        try:
+            os.rename(staging, target)
+        except OSError:
+            if not (target / MANIFEST_NAME).exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return manifest
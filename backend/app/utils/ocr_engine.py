@@ -0,0 +1,80 @@
+"""OCR primitives (run inside OCR pipeline worker processes).
+
+Kept free of ``app.config`` and FastAPI imports so a worker process only
+pays for PyMuPDF and the OCR engines when it starts. See
+``app.services.ocr_pipeline`` for the pool and the result cache.
+"""
+
+import io
+import logging
+
+logger = logging.getLogger(__name__)
+
+# PDF pages are rasterised at this scale before OCR (2x reads small print)
+PAGE_RENDER_SCALE = 2
+
+# One PaddleOCR model per worker process, loaded on first use
+_paddleocr = None
+
+
+def pdf_text_layer(pdf_bytes: bytes) -> tuple[str, int]:
+    """Embedded text of every page, and the page count."""
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return "\n".join(page.get_text() for page in doc), doc.page_count
+
+
+def ocr_pdf_page(pdf_bytes: bytes, index: int, use_paddle: bool) -> str:
+    """Render one PDF page and OCR it."""
+    import fitz  # PyMuPDF
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        matrix = fitz.Matrix(PAGE_RENDER_SCALE, PAGE_RENDER_SCALE)
+        png = doc[index].get_pixmap(matrix=matrix).tobytes("png")
+    return ocr_image(png, use_paddle)
+
+
+def ocr_image(img_bytes: bytes, use_paddle: bool) -> str:
+    """OCR an image, with PaddleOCR first when enabled and Tesseract as fallback.
+
+    Raises:
+        ImportError: If neither engine is installed
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(img_bytes))
+    image.load()
+
+    if use_paddle:
+        try:
+            text = _paddleocr_text(image)
+            if text:
+                return text
+        except Exception as e:
+            logger.warning("PaddleOCR failed, falling back to Tesseract: %s", e)
+
+    import pytesseract
+
+    return str(pytesseract.image_to_string(image))
+
+
+def _paddleocr_text(image) -> str:
+    global _paddleocr
+
+    import numpy as np
+
+    if _paddleocr is None:
+        from paddleocr import PaddleOCR
+
+        _paddleocr = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
+
+    result = _paddleocr.ocr(np.array(image), cls=True)
+
+    lines = []
+    for line in result:
+        if line:
+            for word_info in line:
+                if word_info and len(word_info) > 1:
+                    lines.append(word_info[1][0])
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""Benchmark latency of a trivial authenticated GET (p50/p99).
+
+Usage: PYTHONPATH=. python3 scripts/bench_auth_request.py [requests] [warmup]
+
+Seeds one user in a throwaway SQLite database, then sends ``requests``
+(default 2,000) ``GET /api/auth/me`` calls with a bearer token through the
+full ASGI stack (middleware, auth dependency, serialization) via httpx's
+ASGITransport, and prints the p50/p99/mean latency in milliseconds. The first
+``warmup`` requests (default 50) are discarded.
+
+Only public entry points are used, so the same script can be run against an
+older checkout to get the "before" numbers.
+
+All file I/O is isolated to a temp directory, same as export_openapi.py.
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+logging.disable(logging.WARNING)
+
+_tmpdir = tempfile.TemporaryDirectory(prefix="mygarage-bench-")
+_tmp = _tmpdir.name
+
+os.environ.setdefault("MYGARAGE_DATABASE_URL", f"sqlite+aiosqlite:///{_tmp}/bench.db")
+os.environ.setdefault("MYGARAGE_SECRET_KEY", "bench-dummy-key")
+os.environ.setdefault("MYGARAGE_DATA_DIR", _tmp)
+os.environ.setdefault("MYGARAGE_ATTACHMENTS_DIR", os.path.join(_tmp, "attachments"))
+os.environ.setdefault("MYGARAGE_PHOTOS_DIR", os.path.join(_tmp, "photos"))
+os.environ.setdefault("MYGARAGE_DOCUMENTS_DIR", os.path.join(_tmp, "documents"))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+import app.models  # noqa: E402, F401  (register every mapper before create_all)
+import app.models.toll  # noqa: E402, F401  (not re-exported by app.models; Vehicle relates to it)
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.main import app as asgi_app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.auth import create_access_token  # noqa: E402
+
+
+async def _seed() -> str:
+    async with AsyncSessionLocal() as session:
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        session.add(user)
+        await session.commit()
+        return create_access_token({"sub": str(user.id), "username": user.username})
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+async def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    warmup = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    token = await _seed()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    samples: list[float] = []
+    transport = ASGITransport(app=asgi_app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for n in range(warmup + requests):
+            started = time.perf_counter()
+            response = await client.get("/api/auth/me", headers=headers)
+            elapsed = time.perf_counter() - started
+            if response.status_code != 200:
+                raise SystemExit(f"GET /api/auth/me returned {response.status_code}")
+            if n >= warmup:
+                samples.append(elapsed * 1000)
+
+    print(f"{requests} x GET /api/auth/me (SQLite)")
+    print(f"  p50   {_percentile(samples, 50):7.3f} ms")
+    print(f"  p99   {_percentile(samples, 99):7.3f} ms")
+    print(f"  mean  {statistics.fmean(samples):7.3f} ms")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    finally:
+        _tmpdir.cleanup()
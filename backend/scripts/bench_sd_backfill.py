@@ -0,0 +1,173 @@
+"""Benchmark SD-card backfill throughput (rows per second).
+
+Usage: PYTHONPATH=. python3 scripts/bench_sd_backfill.py [rows] [pids] [per_row_rows]
+
+Builds a synthetic WiCAN SD log (param_info/param_data SQLite file) with
+``rows`` readings (default 1,000,000) spread over ``pids`` parameters (default
+20) at one reading per parameter per second, parses it with SdLogParser, and
+backfills it into a throwaway SQLite database with two strategies:
+
+- per-row: the pre-chunking statement pattern (one INSERT ... ON CONFLICT DO
+  NOTHING, one latest-value SELECT and a possible ORM add per row, committing
+  every 500 rows). Being slow, it replays only the first ``per_row_rows``
+  parsed rows (default 50,000); rows/sec is what is compared.
+- chunked: TelemetryService.bulk_backfill (one multi-row INSERT and one
+  latest-value upsert per BACKFILL_CHUNK_SIZE rows).
+
+All file I/O is isolated to a temp directory, same as export_openapi.py.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+logging.disable(logging.WARNING)
+
+_tmpdir = tempfile.TemporaryDirectory(prefix="mygarage-bench-")
+_tmp = _tmpdir.name
+
+os.environ.setdefault("MYGARAGE_DATABASE_URL", f"sqlite+aiosqlite:///{_tmp}/bench.db")
+os.environ.setdefault("MYGARAGE_SECRET_KEY", "bench-dummy-key")
+os.environ.setdefault("MYGARAGE_DATA_DIR", _tmp)
+os.environ.setdefault("MYGARAGE_ATTACHMENTS_DIR", os.path.join(_tmp, "attachments"))
+os.environ.setdefault("MYGARAGE_PHOTOS_DIR", os.path.join(_tmp, "photos"))
+os.environ.setdefault("MYGARAGE_DOCUMENTS_DIR", os.path.join(_tmp, "documents"))
+
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+import app.models  # noqa: E402, F401  (register every mapper before create_all)
+import app.models.toll  # noqa: E402, F401  (not re-exported by app.models; Vehicle relates to it)
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.vehicle import Vehicle  # noqa: E402
+from app.models.vehicle_telemetry import VehicleTelemetry  # noqa: E402
+from app.services.sd_log_parser import SdLogParser, SdRow  # noqa: E402
+from app.services.telemetry_service import TelemetryService, dialect_insert  # noqa: E402
+
+# WiCAN SD logs name PIDs in mixed case; the parser canonicalises them
+_BASE_PIDS = (
+    "0D-VehicleSpeed",
+    "0C-EngineRPM",
+    "05-EngineCoolantTemp",
+    "0F-IntakeAirTemp",
+    "0B-IntakeManifoldPres",
+    "11-ThrottlePosition",
+    "42-ControlModuleVolt",
+    "2F-FuelTankLevel",
+)
+
+_VINS = {"per-row": "BENCHSDPERROW0001", "chunked": "BENCHSDCHUNKED001"}
+
+# 2026-01-01 00:00:00 UTC, well above the parser's pre-RTC-sync floor
+_START_EPOCH = 1767225600
+
+
+def _pids(count: int) -> list[str]:
+    pids = list(_BASE_PIDS[:count])
+    pids.extend(f"9B-CustomPid{i:02d}" for i in range(count - len(pids)))
+    return pids
+
+
+def _build_sd_log(path: Path, rows: int, pids: list[str]) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE param_info (Id INTEGER PRIMARY KEY, Name VARCHAR, Type VARCHAR, Data TEXT)"
+    )
+    conn.execute("CREATE TABLE param_data (timestamp INTEGER, param_id INTEGER, value REAL)")
+    conn.executemany(
+        "INSERT INTO param_info (Id, Name, Type) VALUES (?, ?, 'NUMERIC')",
+        [(i + 1, name) for i, name in enumerate(pids)],
+    )
+    conn.executemany(
+        "INSERT INTO param_data VALUES (?, ?, ?)",
+        ((_START_EPOCH + n // len(pids), n % len(pids) + 1, 20.0 + (n % 7)) for n in range(rows)),
+    )
+    conn.execute("CREATE INDEX idx_param_data_ts ON param_data (timestamp)")
+    conn.commit()
+    conn.close()
+
+
+async def _seed(session: AsyncSession, vin: str) -> None:
+    user = User(username=f"bench_{vin}", email=f"{vin}@bench.local", hashed_password="x")
+    session.add(user)
+    await session.flush()
+    session.add(Vehicle(vin=vin, user_id=user.id, nickname=vin, vehicle_type="Car"))
+    await session.commit()
+
+
+async def _per_row_backfill(
+    svc: TelemetryService, vin: str, device_id: str, rows: list[SdRow]
+) -> None:
+    """Replay the pre-chunking bulk_backfill statement pattern."""
+    for i, r in enumerate(rows, start=1):
+        ts = r.timestamp.replace(tzinfo=None)
+        await svc.db.execute(
+            dialect_insert(VehicleTelemetry)
+            .values(
+                vin=vin, device_id=device_id, param_key=r.param_key, value=r.value, timestamp=ts
+            )
+            .on_conflict_do_nothing(index_elements=["device_id", "param_key", "timestamp"])
+        )
+        await svc._update_latest_if_newer(vin, r.param_key, r.value, ts)
+        # The sessions don't autoflush, so the next SELECT would miss a freshly
+        # added latest row and add a second one; flush like autoflush would.
+        await svc.db.flush()
+        if i % 500 == 0:
+            await svc.db.commit()
+    await svc.db.commit()
+
+
+async def _run(mode: str, rows: list[SdRow]) -> float:
+    vin = _VINS[mode]
+    device_id = f"bench_{mode}"
+    async with AsyncSessionLocal() as session:
+        await _seed(session, vin)
+        svc = TelemetryService(session)
+
+        started = time.perf_counter()
+        if mode == "chunked":
+            await svc.bulk_backfill(vin, device_id, rows)
+        else:
+            await _per_row_backfill(svc, vin, device_id, rows)
+        elapsed = time.perf_counter() - started
+    return len(rows) / elapsed
+
+
+async def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pid_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    per_row_count = int(sys.argv[3]) if len(sys.argv) > 3 else 50_000
+    pids = _pids(pid_count)
+
+    sd_log = Path(_tmp) / "sd_log.db"
+    _build_sd_log(sd_log, row_count, pids)
+    started = time.perf_counter()
+    rows = SdLogParser().parse(sd_log.read_bytes())
+    parse_rate = len(rows) / (time.perf_counter() - started)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{len(rows)} SD rows x {pid_count} PIDs (SQLite)")
+    print(f"  {'parse':<10} {parse_rate:10.0f} rows/s")
+    results = {
+        "per-row": await _run("per-row", rows[:per_row_count]),
+        "chunked": await _run("chunked", rows),
+    }
+    for mode, rate in results.items():
+        print(f"  {mode:<10} {rate:10.0f} rows/s")
+    print(f"  speedup    {results['chunked'] / results['per-row']:10.2f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    finally:
+        _tmpdir.cleanup()
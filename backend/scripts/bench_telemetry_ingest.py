@@ -0,0 +1,173 @@
+"""Benchmark LiveLink telemetry ingest throughput (frames per second).
+
+Usage: PYTHONPATH=. python3 scripts/bench_telemetry_ingest.py [frames] [pids]
+
+Runs two ingest strategies against a throwaway SQLite database and prints
+frames/sec for each:
+
+- per-param: the pre-batching statement pattern (one rate-of-change SELECT,
+  one latest-value upsert, one storage-interval lookup and one history
+  INSERT per parameter, plus the odometer max() lookups), replayed by
+  calling the current statements one key at a time.
+- batched: TelemetryService.store_telemetry as the MQTT/HTTP ingest calls it
+  (one prefetch, one multi-row history INSERT; latest values go to the
+  write-behind buffer, flushed here after every frame so both modes end
+  with the same rows written).
+
+All file I/O is isolated to a temp directory, same as export_openapi.py.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+logging.disable(logging.WARNING)
+
+_tmpdir = tempfile.TemporaryDirectory(prefix="mygarage-bench-")
+_tmp = _tmpdir.name
+
+os.environ.setdefault("MYGARAGE_DATABASE_URL", f"sqlite+aiosqlite:///{_tmp}/bench.db")
+os.environ.setdefault("MYGARAGE_SECRET_KEY", "bench-dummy-key")
+os.environ.setdefault("MYGARAGE_DATA_DIR", _tmp)
+os.environ.setdefault("MYGARAGE_ATTACHMENTS_DIR", os.path.join(_tmp, "attachments"))
+os.environ.setdefault("MYGARAGE_PHOTOS_DIR", os.path.join(_tmp, "photos"))
+os.environ.setdefault("MYGARAGE_DOCUMENTS_DIR", os.path.join(_tmp, "documents"))
+
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+import app.models  # noqa: E402, F401  (register every mapper before create_all)
+import app.models.toll  # noqa: E402, F401  (not re-exported by app.models; Vehicle relates to it)
+from app.database import AsyncSessionLocal, Base, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.vehicle import Vehicle  # noqa: E402
+from app.models.vehicle_telemetry import VehicleTelemetry  # noqa: E402
+from app.services.telemetry_latest_buffer import latest_buffer  # noqa: E402
+from app.services.telemetry_service import TelemetryService  # noqa: E402
+from app.services.telemetry_validator import TelemetryValidator  # noqa: E402
+from app.utils.autopid_normalizer import infer_param_class  # noqa: E402
+from app.utils.datetime_utils import utc_now  # noqa: E402
+
+# Representative WiCAN AutoPID names: a mix of rate-checked classes
+# (speed, RPM, temperatures, pressures) and unclassified PIDs.
+_BASE_PIDS = (
+    "0D-VEHICLESPEED",
+    "0C-ENGINERPM",
+    "05-ENGINECOOLANTTEMP",
+    "0F-INTAKEAIRTEMP",
+    "0B-INTAKEMANIFOLDPRES",
+    "11-THROTTLEPOSITION",
+    "42-CONTROLMODULEVOLT",
+    "2F-FUELTANKLEVEL",
+)
+
+_VINS = {"per-param": "BENCHPERPARAM0001", "batched": "BENCHBATCHED00001"}
+
+
+def _pids(count: int) -> list[str]:
+    pids = list(_BASE_PIDS[:count])
+    pids.extend(f"9B-CUSTOMPID{i:02d}" for i in range(count - len(pids)))
+    return pids
+
+
+def _frame(pids: list[str], n: int) -> dict[str, float | int | str | None]:
+    # Small per-frame drift so rate-of-change checks pass and history rows differ
+    return {pid: 20.0 + (n % 5) for pid in pids}
+
+
+async def _seed(session: AsyncSession, vin: str) -> None:
+    user = User(username=f"bench_{vin}", email=f"{vin}@bench.local", hashed_password="x")
+    session.add(user)
+    await session.flush()
+    session.add(Vehicle(vin=vin, user_id=user.id, nickname=vin, vehicle_type="Car"))
+    await session.commit()
+
+
+async def _per_param_frame(svc: TelemetryService, vin: str, device_id: str, data: dict, ts) -> None:
+    """Replay the pre-batching store_telemetry statement pattern."""
+    parameters = await svc.get_all_parameters()
+    validator = TelemetryValidator(svc.db)
+    received_at = utc_now()
+    for param_key, value in data.items():
+        param = parameters[param_key]
+        await validator.validate_rate_of_change(vin, param_key, param.param_class, float(value))
+        await svc.upsert_latest_values(
+            [
+                {
+                    "vin": vin,
+                    "param_key": param_key,
+                    "value": float(value),
+                    "timestamp": ts,
+                    "received_at": received_at,
+                }
+            ]
+        )
+        if param.storage_interval_seconds > 0:
+            last = await svc._get_last_historical_timestamps(vin, [param_key])
+            if not svc._interval_elapsed(last.get(param_key), param.storage_interval_seconds):
+                continue
+        svc.db.add(
+            VehicleTelemetry(
+                vin=vin,
+                device_id=device_id,
+                param_key=param_key,
+                value=float(value),
+                timestamp=ts,
+                received_at=received_at,
+            )
+        )
+    await svc._sync_odometer_from_telemetry(vin, data, ts)
+
+
+async def _run(mode: str, frames: int, pids: list[str]) -> float:
+    vin = _VINS[mode]
+    device_id = f"bench_{mode}"
+    async with AsyncSessionLocal() as session:
+        await _seed(session, vin)
+        svc = TelemetryService(session)
+        for pid in pids:
+            await svc.auto_register_parameter(pid, param_class=infer_param_class(pid))
+        await session.commit()
+
+        start_ts = utc_now()
+        started = time.perf_counter()
+        for n in range(frames):
+            ts = start_ts + timedelta(seconds=n)
+            data = _frame(pids, n)
+            if mode == "batched":
+                await svc.store_telemetry(vin, device_id, data, {}, ts)
+                await latest_buffer.flush(session)
+            else:
+                await _per_param_frame(svc, vin, device_id, data, ts)
+            # MQTT ingest commits once per frame
+            await session.commit()
+        elapsed = time.perf_counter() - started
+    return frames / elapsed
+
+
+async def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pid_count = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    pids = _pids(pid_count)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{frames} frames x {pid_count} PIDs (SQLite)")
+    results: dict[str, float] = {}
+    for mode in ("per-param", "batched"):
+        results[mode] = await _run(mode, frames, pids)
+        print(f"  {mode:<10} {results[mode]:8.1f} frames/s")
+    print(f"  speedup    {results['batched'] / results['per-param']:8.2f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    finally:
+        _tmpdir.cleanup()
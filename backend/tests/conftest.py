@@ -89,6 +89,103 @@ async def db_session(test_sessionmaker, init_test_db) -> AsyncGenerator[AsyncSes
         yield session
 
 
+@pytest.fixture(autouse=True)
+def reset_parameter_registry():
+    """Start every test with a cold LiveLink parameter registry.
+
+    The registry is process-wide; tests that add or edit LiveLinkParameter
+    rows directly (bypassing the admin routes) would otherwise see
+    definitions cached by an earlier test.
+    """
+    from app.services.parameter_registry import parameter_registry
+
+    parameter_registry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_settings_cache():
+    """Start every test with a stale settings snapshot.
+
+    The snapshot is process-wide and tests write settings rows directly, some
+    with raw SQL that the write hooks cannot see.
+    """
+    from app.services.settings_cache import settings_cache
+
+    settings_cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_principal_cache():
+    """Start every test without cached principals (users are reused across tests)."""
+    from app.services.principal_cache import principal_cache
+
+    principal_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_vehicle_acl():
+    """Start every test with an empty vehicle ACL index (VINs are reused across tests)."""
+    from app.services.vehicle_acl import vehicle_acl
+
+    vehicle_acl.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_latest_buffer():
+    """Start every test with an empty latest-value write-behind buffer.
+
+    Tests share one database but roll back their sessions, so values buffered
+    by an earlier test would otherwise leak into later reads and flushes.
+    """
+    from app.services.telemetry_latest_buffer import latest_buffer
+
+    latest_buffer.clear()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def drain_rollup_refresher(test_sessionmaker, monkeypatch):
+    """Refresh vehicle rollups against the test database, and finish each
+    test's queued refreshes before the next test starts."""
+    from app.services.vehicle_rollup_service import rollup_refresher
+
+    monkeypatch.setattr(rollup_refresher, "_session_factory", test_sessionmaker)
+    yield
+    await rollup_refresher.drain()
+
+
+@pytest.fixture(autouse=True)
+def reset_analytics_cache():
+    """Start every test with an empty analytics cache and zeroed stats.
+
+    Cached results are keyed on the VIN, not the session, so a result computed
+    inside one test's rolled-back transaction would otherwise be served to a
+    later test that reuses the VIN.
+    """
+    from app.utils.cache import cache
+
+    cache.reset()
+    cache.reset_stats()
+
+
+@pytest.fixture
+def query_counter(test_engine):
+    """Record every SQL statement the test engine executes while the test runs.
+
+    Yields the list of executed statement strings; use ``len()`` for
+    query-count regression assertions.
+    """
+    from sqlalchemy import event
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Create a temporary data directory for file upload tests.
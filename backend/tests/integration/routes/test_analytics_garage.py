@@ -0,0 +1,268 @@
+"""Regression tests for the SQL-aggregated garage analytics endpoint.
+
+The figures below were produced by the previous implementation, which loaded
+every record and summed in Python; the SQL aggregation must return exactly
+the same response, down to the two-decimal string serialization.
+"""
+
+import itertools
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import DEFRecord, FuelRecord, ServiceVisit, Vehicle
+from app.models.insurance import InsurancePolicy
+from app.models.service_line_item import ServiceLineItem
+from app.models.supply import Supply, SupplyUsage
+from app.models.tax import TaxRecord
+from app.models.user import User
+from app.routes.analytics import get_garage_analytics
+
+_SEQ = itertools.count()
+
+
+async def _make_user(db_session: AsyncSession) -> User:
+    n = next(_SEQ)
+    user = User(
+        username=f"garage_agg_user_{n}",
+        email=f"garage_agg_{n}@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_admin=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user
+
+
+async def _make_vehicle(
+    db_session: AsyncSession, user: User, suffix: str, purchase_price: Decimal | None
+) -> str:
+    vin = f"GARAGEAGG{next(_SEQ):06d}{suffix}"  # 17 chars
+    db_session.add(
+        Vehicle(
+            vin=vin,
+            user_id=user.id,
+            nickname=f"Garage {suffix}",
+            vehicle_type="Car",
+            year=2020,
+            make="Make",
+            model=suffix,
+            purchase_price=purchase_price,
+        )
+    )
+    await db_session.flush()
+    return vin
+
+
+async def _add_visit(
+    db_session: AsyncSession,
+    vin: str,
+    visit_date: date,
+    category: str | None,
+    line_costs: list[str],
+    **fees: Decimal,
+) -> ServiceVisit:
+    visit = ServiceVisit(vin=vin, date=visit_date, service_category=category, **fees)
+    db_session.add(visit)
+    await db_session.flush()
+    for i, cost in enumerate(line_costs):
+        db_session.add(
+            ServiceLineItem(visit_id=visit.id, description=f"Item {i}", cost=Decimal(cost))
+        )
+    await db_session.flush()
+    return visit
+
+
+async def _seed_garage(db_session: AsyncSession) -> tuple[User, str, str]:
+    """Two vehicles for one user, plus someone else's vehicle that must not count.
+
+    Returns the user and the VINs of their car and truck.
+    """
+    user = await _make_user(db_session)
+    car = await _make_vehicle(db_session, user, "CA", Decimal("20000.00"))
+    truck = await _make_vehicle(db_session, user, "TR", None)
+
+    # Car: uncategorized visit with a supply usage and fees -> Maintenance 172.09
+    visit = await _add_visit(
+        db_session,
+        car,
+        date(2024, 1, 10),
+        None,
+        ["100.00", "50.25"],
+        tax_amount=Decimal("8.00"),
+        shop_supplies=Decimal("1.50"),
+    )
+    supply = Supply(name="Garage agg oil", unit_type="volume")
+    db_session.add(supply)
+    await db_session.flush()
+    await db_session.refresh(visit, ["line_items"])
+    db_session.add(
+        SupplyUsage(
+            supply_id=supply.id,
+            quantity=Decimal("1.000"),
+            cost_snapshot=Decimal("12.34"),
+            service_line_item_id=visit.line_items[0].id,
+        )
+    )
+    await _add_visit(db_session, car, date(2024, 2, 5), "Upgrades", ["300.00"])
+    await _add_visit(db_session, car, date(2024, 2, 20), "Maintenance", ["20.00"])
+    # Zero-cost visit: no Inspection spend and no month of its own
+    await _add_visit(db_session, car, date(2024, 3, 1), "Inspection", [])
+
+    db_session.add_all(
+        [
+            FuelRecord(vin=car, date=date(2024, 1, 15), cost=Decimal("45.10")),
+            FuelRecord(vin=car, date=date(2024, 3, 15), cost=None),
+            FuelRecord(vin=car, date=date(2024, 3, 20), cost=Decimal("0.00")),
+            FuelRecord(vin=car, date=date(2024, 4, 2), cost=Decimal("-5.00")),
+            DEFRecord(vin=car, date=date(2024, 2, 1), cost=Decimal("19.99")),
+            InsurancePolicy(
+                vin=car,
+                provider="Acme",
+                policy_number="P-1",
+                policy_type="Liability",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 12, 31),
+                premium_amount=Decimal("600.00"),
+            ),
+            InsurancePolicy(
+                vin=car,
+                provider="Acme",
+                policy_number="P-2",
+                policy_type="Other",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 12, 31),
+                premium_amount=None,
+            ),
+            TaxRecord(vin=car, date=date(2024, 1, 5), amount=Decimal("150.00")),
+        ]
+    )
+
+    # Truck: 14 months of fuel so the trend window has to drop the oldest two
+    await _add_visit(db_session, truck, date(2023, 6, 1), "Collision", ["500.00"])
+    await _add_visit(db_session, truck, date(2024, 2, 10), "Detailing", ["80.00"])
+    for i in range(14):
+        db_session.add(
+            FuelRecord(vin=truck, date=date(2023 + (i // 12), i % 12 + 1, 3), cost=Decimal("10.00"))
+        )
+
+    other = await _make_user(db_session)
+    stranger = await _make_vehicle(db_session, other, "XX", Decimal("1.00"))
+    db_session.add(FuelRecord(vin=stranger, date=date(2024, 1, 1), cost=Decimal("999.00")))
+    await db_session.flush()
+
+    return user, car, truck
+
+
+def _trend(month: str, service: str = "0.00", fuel: str = "0.00", def_cost: str = "0.00"):
+    total = Decimal(service) + Decimal(fuel) + Decimal(def_cost)
+    return {
+        "month": month,
+        "service": service,
+        "fuel": fuel,
+        "def_cost": def_cost,
+        "total": str(total),
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestGarageAnalyticsAggregation:
+    async def test_figures_match_previous_implementation(self, db_session: AsyncSession):
+        """Totals, per-vehicle costs, breakdown and 12-month trends are unchanged."""
+        user, car, truck = await _seed_garage(db_session)
+
+        result = await get_garage_analytics(db=db_session, current_user=user)
+        data = result.model_dump(mode="json")
+
+        assert data["vehicle_count"] == 2
+        assert data["total_costs"] == {
+            "total_garage_value": "20000.00",
+            "total_maintenance": "192.09",
+            "total_upgrades": "300.00",
+            "total_inspection": "0.00",
+            "total_collision": "500.00",
+            "total_detailing": "80.00",
+            "total_fuel": "180.10",
+            "total_def": "19.99",
+            "total_insurance": "600.00",
+            "total_taxes": "150.00",
+        }
+        assert data["cost_breakdown_by_category"] == [
+            {"category": "Maintenance", "amount": "192.09"},
+            {"category": "Upgrades", "amount": "300.00"},
+            {"category": "Collision", "amount": "500.00"},
+            {"category": "Detailing", "amount": "80.00"},
+            {"category": "Fuel", "amount": "180.10"},
+            {"category": "DEF", "amount": "19.99"},
+            {"category": "Insurance", "amount": "600.00"},
+            {"category": "Taxes", "amount": "150.00"},
+        ]
+        assert data["cost_by_vehicle"] == [
+            {
+                "vin": truck,
+                "name": "2020 Make TR",
+                "nickname": "Garage TR",
+                "purchase_price": "0.00",
+                "total_maintenance": "0.00",
+                "total_upgrades": "0.00",
+                "total_inspection": "0.00",
+                "total_collision": "500.00",
+                "total_detailing": "80.00",
+                "total_fuel": "140.00",
+                "total_def": "0.00",
+                "total_cost": "720.00",
+            },
+            {
+                "vin": car,
+                "name": "2020 Make CA",
+                "nickname": "Garage CA",
+                "purchase_price": "20000.00",
+                "total_maintenance": "192.09",
+                "total_upgrades": "300.00",
+                "total_inspection": "0.00",
+                "total_collision": "0.00",
+                "total_detailing": "0.00",
+                "total_fuel": "40.10",
+                "total_def": "19.99",
+                "total_cost": "552.18",
+            },
+        ]
+        # 2023-01..03 fall outside the window; March 2024 only has zero/None costs
+        assert data["monthly_trends"] == [
+            _trend("Apr 2023", fuel="10.00"),
+            _trend("May 2023", fuel="10.00"),
+            _trend("Jun 2023", service="500.00", fuel="10.00"),
+            _trend("Jul 2023", fuel="10.00"),
+            _trend("Aug 2023", fuel="10.00"),
+            _trend("Sep 2023", fuel="10.00"),
+            _trend("Oct 2023", fuel="10.00"),
+            _trend("Nov 2023", fuel="10.00"),
+            _trend("Dec 2023", fuel="10.00"),
+            _trend("Jan 2024", service="172.09", fuel="55.10"),
+            _trend("Feb 2024", service="400.00", fuel="10.00", def_cost="19.99"),
+            _trend("Apr 2024", fuel="-5.00"),
+        ]
+
+    async def test_query_count_is_independent_of_record_count(
+        self, db_session: AsyncSession, query_counter: list[str]
+    ):
+        """Adding records to the garage does not add statements."""
+        user, car, _ = await _seed_garage(db_session)
+
+        query_counter.clear()
+        await get_garage_analytics(db=db_session, current_user=user)
+        before = len(query_counter)
+
+        for day in range(1, 29):
+            await _add_visit(db_session, car, date(2024, 5, day), "Maintenance", ["1.00", "2.00"])
+            db_session.add(FuelRecord(vin=car, date=date(2024, 5, day), cost=Decimal("3.00")))
+        await db_session.flush()
+
+        query_counter.clear()
+        await get_garage_analytics(db=db_session, current_user=user)
+
+        assert len(query_counter) == before
@@ -344,3 +344,88 @@ class TestAnalyticsDefConsistency:
 
         await db_session.execute(delete(DEFRecord).where(DEFRecord.vin == vin))
         await db_session.commit()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestAnalyticsCache:
+    """Cached analytics are reused across sessions and dropped on writes."""
+
+    async def test_second_request_runs_no_sql(
+        self, client: AsyncClient, auth_headers, test_vehicle, test_sessionmaker, query_counter
+    ):
+        from app.routes.analytics import get_cost_analysis, get_fuel_economy_trend
+        from app.utils.cache import cache
+
+        vin = test_vehicle["vin"]
+        async with test_sessionmaker() as first:
+            cost = await get_cost_analysis(first, vin)
+            trend = await get_fuel_economy_trend(first, vin)
+
+        # A new session (i.e. a new request) is served entirely from the cache
+        query_counter.clear()
+        async with test_sessionmaker() as second:
+            assert await get_cost_analysis(second, vin) == cost
+            assert await get_fuel_economy_trend(second, vin) == trend
+        assert query_counter == []
+        assert cache.get_stats()["hits"] == 2
+
+        # A fuel write invalidates that vehicle's entries
+        response = await client.post(
+            f"/api/vehicles/{vin}/fuel",
+            json={
+                "vin": vin,
+                "date": "2024-02-15",
+                "liters": 40.0,
+                "cost": 50.00,
+                "odometer_km": 25500.0,
+                "is_full_tank": True,
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+        query_counter.clear()
+        async with test_sessionmaker() as third:
+            await get_cost_analysis(third, vin)
+        assert query_counter
+
+    async def test_vendor_rename_refreshes_service_timeline(
+        self, client: AsyncClient, auth_headers, test_vehicle, test_sessionmaker
+    ):
+        from app.routes.analytics import get_service_history_timeline
+
+        vin = test_vehicle["vin"]
+        vendor = await client.post(
+            "/api/vendors", json={"name": "Timeline Cache Garage"}, headers=auth_headers
+        )
+        assert vendor.status_code == 201
+        vendor_id = vendor.json()["id"]
+        visit = await client.post(
+            f"/api/vehicles/{vin}/service-visits",
+            json={
+                "vin": vin,
+                "date": "2024-03-01",
+                "vendor_id": vendor_id,
+                "line_items": [{"description": "Oil Change", "cost": 60.00}],
+            },
+            headers=auth_headers,
+        )
+        assert visit.status_code == 201
+
+        async with test_sessionmaker() as first:
+            timeline = await get_service_history_timeline(first, vin)
+        assert "Timeline Cache Garage" in {item.vendor_name for item in timeline}
+
+        response = await client.put(
+            f"/api/vendors/{vendor_id}",
+            json={"name": "Renamed Cache Garage"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        async with test_sessionmaker() as second:
+            timeline = await get_service_history_timeline(second, vin)
+        names = {item.vendor_name for item in timeline}
+        assert "Renamed Cache Garage" in names
+        assert "Timeline Cache Garage" not in names
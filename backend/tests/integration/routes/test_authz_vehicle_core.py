@@ -173,6 +173,7 @@ class TestLiveLinkInfraAdminOnly:
             ("get", "/api/livelink/parameters"),
             ("get", "/api/livelink/mqtt/settings"),
             ("get", "/api/livelink/mqtt/status"),
+            ("get", "/api/livelink/telemetry/buffer"),
             ("get", "/api/livelink/firmware/latest"),
         ],
     )
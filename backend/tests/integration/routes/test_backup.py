@@ -126,7 +126,7 @@ class TestBackupRoutes:
         assert "backup" in data
         assert "filename" in data["backup"]
         assert data["backup"]["filename"].startswith("mygarage-full-")
-        assert data["backup"]["filename"].endswith(".tar.gz")
+        assert data["backup"]["filename"].endswith(".manifest.json")
 
     @requires_write_access
     async def test_download_backup(self, client: AsyncClient, auth_headers):
@@ -320,6 +320,70 @@ class TestBackupRoutes:
         assert response.status_code == 400
         assert "Invalid backup file type" in response.json()["detail"]
 
+    async def test_full_restore_resets_process_state(
+        self, client: AsyncClient, auth_headers, db_session, test_vehicle, monkeypatch
+    ):
+        """A full restore drops pooled connections and caches, and rebuilds rollups."""
+        from datetime import date
+
+        from sqlalchemy import func, select, update
+
+        from app.models.note import Note
+        from app.models.vehicle_rollup import VehicleRollup
+        from app.routes import backup as backup_route
+        from app.services.principal_cache import principal_cache
+        from app.services.vehicle_acl import vehicle_acl
+        from app.services.vehicle_rollup_service import rollup_refresher
+
+        if not backup_route.is_sqlite:
+            pytest.skip("Full restore runs on SQLite only")
+
+        class StubService:
+            async def restore_full_backup(self, filename: str) -> dict:
+                return {"files_restored": 0}
+
+        class StubEngine:
+            disposed = False
+
+            async def dispose(self) -> None:
+                self.disposed = True
+
+        engine = StubEngine()
+        monkeypatch.setattr(backup_route, "get_backup_service", StubService)
+        monkeypatch.setattr(backup_route, "engine", engine)
+
+        vin = test_vehicle["vin"]
+        db_session.add(Note(vin=vin, date=date.today(), title="n", content="x"))
+        await db_session.commit()
+        await rollup_refresher.drain()
+        # The "restored" database's rollup disagrees with its records
+        await db_session.execute(
+            update(VehicleRollup).where(VehicleRollup.vin == vin).values(note_count=42)
+        )
+        await db_session.commit()
+        await vehicle_acl.get(db_session, vin)
+        assert (await client.get("/api/vehicles", headers=auth_headers)).status_code == 200
+        assert principal_cache.stats["size"] >= 1
+
+        response = await client.post(
+            "/api/backup/restore/mygarage-full-2020-01-01-000000.manifest.json",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert engine.disposed
+        assert principal_cache.stats["size"] == 0
+        assert vehicle_acl._entries == {}
+        notes = await db_session.scalar(select(func.count(Note.id)).where(Note.vin == vin))
+        rollup = (
+            await db_session.execute(
+                select(VehicleRollup)
+                .where(VehicleRollup.vin == vin)
+                .execution_options(populate_existing=True)
+            )
+        ).scalar_one()
+        assert rollup.note_count == notes
+
     async def test_backup_unauthorized(self, client: AsyncClient):
         """Test that unauthenticated users cannot access backup endpoints."""
         # Test stats
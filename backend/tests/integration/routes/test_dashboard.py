@@ -20,6 +20,7 @@ from app.models import (
     ServiceVisit,
     Vehicle,
 )
+from app.services.vehicle_rollup_service import rollup_refresher
 
 
 async def _isolated_fleet(db_session: AsyncSession) -> tuple[str, dict[str, str]]:
@@ -267,15 +268,13 @@ class TestDashboardRoutes:
         assert card["upcoming_maintenance_count"] == 2
 
     async def test_dashboard_fetches_current_hours_once_per_vehicle(
-        self, client: AsyncClient, db_session: AsyncSession, monkeypatch
+        self, client: AsyncClient, db_session: AsyncSession, query_counter: list[str]
     ):
-        """No N+1: latest_engine_hours_and_date is called exactly once per
-        vehicle regardless of how many pending hours reminders it has —
-        dashboard.py already fetches it once for the `latest_hours` display
-        figure and must reuse that SAME reading for the reminder evaluation,
-        not re-query per reminder."""
-        import app.routes.dashboard as dashboard_module
-
+        """No N+1: the dashboard reads latest engine hours from the vehicle
+        rollup, refreshed after the records were committed — no hours_records
+        query on read, however many pending hours reminders the vehicle has.
+        The rollup's overdue count was evaluated against that SAME reading, so
+        the `latest_hours` figure and the reminder status cannot disagree."""
         vin, headers = await _isolated_fleet(db_session)
         db_session.add(HoursRecord(vin=vin, date=date.today(), engine_hours=Decimal("500.0")))
         db_session.add_all(
@@ -304,19 +303,15 @@ class TestDashboardRoutes:
             ]
         )
         await db_session.commit()
+        await rollup_refresher.drain()
 
-        calls: dict[str, int] = {"n": 0}
-        original = dashboard_module.latest_engine_hours_and_date
-
-        async def counting(db, vin_arg):
-            calls["n"] += 1
-            return await original(db, vin_arg)
-
-        monkeypatch.setattr(dashboard_module, "latest_engine_hours_and_date", counting)
-
+        query_counter.clear()
         response = await client.get("/api/dashboard", headers=headers)
         assert response.status_code == 200
-        assert calls["n"] == 1
+        card = next(v for v in response.json()["vehicles"] if v["vin"] == vin)
+        assert Decimal(card["latest_hours"]) == Decimal("500.0")
+        assert card["overdue_maintenance_count"] == 2
+        assert not [q for q in query_counter if "hours_records" in q]
 
     async def test_dashboard_after_adding_service_visit(
         self, client: AsyncClient, auth_headers, test_vehicle
@@ -845,3 +840,211 @@ class TestDashboardRoutes:
         # If scope leaked, the day+1 out-of-scope reminder (earlier) would win.
         assert next_due["vin"] == owned_vin
         assert next_due["label"] == "Mine due later"
+
+    async def test_dashboard_query_count_is_independent_of_fleet_size(
+        self, client: AsyncClient, db_session: AsyncSession, query_counter: list[str]
+    ):
+        """Per-vehicle figures come from grouped queries covering every vin, so
+        adding vehicles (and their records) adds no statements — and each card
+        still gets its own counts and latest dates."""
+        from sqlalchemy import select
+
+        from app.models import Note
+
+        vin, headers = await _isolated_fleet(db_session)
+        owner_id = await db_session.scalar(select(Vehicle.user_id).where(Vehicle.vin == vin))
+
+        # The first read builds the vehicle's rollup row; measure steady state
+        await client.get("/api/dashboard", headers=headers)
+        query_counter.clear()
+        response = await client.get("/api/dashboard", headers=headers)
+        assert response.status_code == 200
+        single_vehicle = len(query_counter)
+
+        today = date.today()
+        extra_vins = [f"{vin[:-2]}X{i}" for i in range(4)]
+        for i, extra in enumerate(extra_vins):
+            db_session.add(
+                Vehicle(vin=extra, user_id=owner_id, nickname=f"Extra {i}", vehicle_type="Car")
+            )
+            await db_session.flush()
+            for n in range(i + 1):
+                day = today - timedelta(days=10 * (n + 1))
+                db_session.add_all(
+                    [
+                        ServiceVisit(vin=extra, date=day, service_category="Maintenance"),
+                        FuelRecord(
+                            vin=extra,
+                            date=day,
+                            odometer_km=Decimal(10000 + 500 * n),
+                            engine_hours=Decimal(100 + 10 * n),
+                            liters=Decimal("40.00"),
+                            cost=Decimal("60.00"),
+                            is_full_tank=True,
+                        ),
+                        OdometerRecord(vin=extra, date=day, odometer_km=Decimal(10000 + 500 * n)),
+                        HoursRecord(vin=extra, date=day, engine_hours=Decimal(100 + 10 * n)),
+                        Note(vin=extra, date=day, title=f"Note {n}", content="x"),
+                        Reminder(
+                            vin=extra,
+                            title=f"Reminder {n}",
+                            reminder_type="date",
+                            due_date=today - timedelta(days=1),
+                            status="pending",
+                        ),
+                    ]
+                )
+        await db_session.commit()
+        await rollup_refresher.drain()
+
+        query_counter.clear()
+        response = await client.get("/api/dashboard", headers=headers)
+        assert response.status_code == 200
+        assert len(query_counter) == single_vehicle
+
+        cards = {v["vin"]: v for v in response.json()["vehicles"]}
+        assert len(cards) == 5
+        for i, extra in enumerate(extra_vins):
+            card = cards[extra]
+            records = i + 1
+            assert card["total_service_records"] == records
+            assert card["total_fuel_records"] == records
+            assert card["total_odometer_records"] == records
+            assert card["total_notes"] == records
+            assert card["total_maintenance_items"] == records
+            assert card["overdue_maintenance_count"] == records
+            assert card["latest_service_date"] == str(today - timedelta(days=10))
+            assert card["latest_fuel_date"] == str(today - timedelta(days=10))
+            assert Decimal(card["latest_hours"]) == Decimal(100 + 10 * i)
+            # Records are dated newest-first, so the latest odometer is the lowest
+            assert Decimal(card["latest_odometer_km"]) == Decimal(10000)
+        assert cards[vin]["total_service_records"] == 0
+        assert cards[vin]["latest_hours"] is None
+
+
+async def _stored_rollup(db_session: AsyncSession, vin: str):
+    """The committed vehicle_rollup row once queued refreshes ran (no recompute on read)."""
+    from sqlalchemy import select
+
+    from app.models.vehicle_rollup import VehicleRollup
+
+    await rollup_refresher.drain()
+    return (
+        await db_session.execute(
+            select(VehicleRollup)
+            .where(VehicleRollup.vin == vin)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestRollupAfterDeletes:
+    """Delete endpoints remove rows with bulk ``delete()`` statements; the
+    vehicle rollup behind the dashboard must follow them."""
+
+    async def test_fuel_delete_drops_synced_def_and_odometer(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        vin, headers = await _isolated_fleet(db_session)
+        fuel = FuelRecord(vin=vin, date=date.today(), cost=Decimal("60.00"))
+        db_session.add(fuel)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                DEFRecord(
+                    vin=vin,
+                    date=date.today(),
+                    cost=Decimal("15.00"),
+                    origin_fuel_record_id=fuel.id,
+                ),
+                OdometerRecord(
+                    vin=vin, date=date.today(), odometer_km=Decimal(1200), fuel_record_id=fuel.id
+                ),
+            ]
+        )
+        await db_session.commit()
+        rollup = await _stored_rollup(db_session, vin)
+        assert (rollup.fuel_count, rollup.odometer_count) == (1, 1)
+        assert rollup.total_spend == Decimal("75.00")
+
+        response = await client.delete(f"/api/vehicles/{vin}/fuel/{fuel.id}", headers=headers)
+        assert response.status_code == 204
+
+        rollup = await _stored_rollup(db_session, vin)
+        assert (rollup.fuel_count, rollup.odometer_count) == (0, 0)
+        assert rollup.latest_odometer_km is None
+        assert rollup.total_spend == Decimal("0.00")
+
+    async def test_record_deletes_refresh_the_rollup(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        from app.models import Document, VehiclePhoto
+        from app.routes import photos as photos_route
+
+        vin, headers = await _isolated_fleet(db_session)
+        odometer = OdometerRecord(vin=vin, date=date.today(), odometer_km=Decimal(500))
+        hours = HoursRecord(vin=vin, date=date.today(), engine_hours=Decimal("42.0"))
+        def_record = DEFRecord(vin=vin, date=date.today(), cost=Decimal("9.00"))
+        document = Document(
+            vin=vin,
+            file_path="missing.pdf",
+            file_name="missing.pdf",
+            file_size=1,
+            mime_type="application/pdf",
+            title="Registration",
+        )
+        photo = VehiclePhoto(vin=vin, file_path=f"{vin}/rollup.jpg")
+        db_session.add_all([odometer, hours, def_record, document, photo])
+        await db_session.commit()
+        (photos_route.PHOTO_DIR / vin).mkdir(parents=True, exist_ok=True)
+        (photos_route.PHOTO_DIR / vin / "rollup.jpg").write_bytes(b"jpg")
+
+        rollup = await _stored_rollup(db_session, vin)
+        assert (rollup.odometer_count, rollup.document_count, rollup.photo_count) == (1, 1, 1)
+        assert rollup.latest_hours == Decimal("42.0")
+        assert rollup.total_spend == Decimal("9.00")
+
+        for path in (
+            f"/api/vehicles/{vin}/odometer/{odometer.id}",
+            f"/api/vehicles/{vin}/hours/{hours.id}",
+            f"/api/vehicles/{vin}/def/{def_record.id}",
+            f"/api/vehicles/{vin}/documents/{document.id}",
+            f"/api/vehicles/{vin}/photos/rollup.jpg",
+        ):
+            response = await client.delete(path, headers=headers)
+            assert response.status_code == 204, path
+
+        rollup = await _stored_rollup(db_session, vin)
+        assert (rollup.odometer_count, rollup.document_count, rollup.photo_count) == (0, 0, 0)
+        assert rollup.latest_odometer_km is None
+        assert rollup.latest_hours is None
+        assert rollup.total_spend == Decimal("0.00")
+
+    async def test_service_visit_delete_drops_synced_odometer(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        vin, headers = await _isolated_fleet(db_session)
+        visit = ServiceVisit(vin=vin, date=date.today())
+        db_session.add(visit)
+        await db_session.flush()
+        db_session.add(
+            OdometerRecord(
+                vin=vin,
+                date=date.today() - timedelta(days=1),
+                odometer_km=Decimal(800),
+                notes=f"[AUTO-SYNC from service_visit #{visit.id}]",
+            )
+        )
+        await db_session.commit()
+        assert (await _stored_rollup(db_session, vin)).odometer_count == 1
+
+        response = await client.delete(
+            f"/api/vehicles/{vin}/service-visits/{visit.id}", headers=headers
+        )
+        assert response.status_code == 204
+
+        rollup = await _stored_rollup(db_session, vin)
+        assert (rollup.service_count, rollup.odometer_count) == (0, 0)
+        assert rollup.latest_odometer_km is None
@@ -18,6 +18,7 @@ from app.models.user import User
 from app.models.vehicle import Vehicle
 from app.models.vehicle_share import VehicleShare
 from app.models.vehicle_transfer import VehicleTransfer  # noqa: F401
+from app.services.vehicle_rollup_service import rollup_refresher
 
 
 @pytest_asyncio.fixture
@@ -457,21 +458,21 @@ class TestFamilyDashboard:
         vehicle_summary = next(v for v in member["vehicles"] if v["vin"] == vin)
         assert vehicle_summary["overdue_maintenance"] == 1
 
-    async def test_family_dashboard_fetches_current_hours_once_per_vehicle(
+    async def test_family_dashboard_reads_current_hours_from_rollup(
         self,
         client: AsyncClient,
         family_admin,
         family_vehicle,
         db_session,
         clean_family_vehicle_schedule,
-        monkeypatch,
+        query_counter,
     ):
-        """No N+1: latest_engine_hours_and_date is called exactly once for
-        our vehicle regardless of how many pending hours reminders it has,
-        not once per reminder. Counts by vin (not globally) so the shared,
-        cross-file integration DB can't pollute the assertion."""
-        import app.services.family_dashboard_service as family_dashboard_module
-
+        """No N+1: once the vehicles' rollup rows are fresh, the family
+        dashboard reads current hours (and the overdue count derived from
+        them) from the rollup — no hours_records query at all, however many
+        pending hours reminders the vehicle has. The first request brings
+        every member vehicle's row up to date, since the shared, cross-file
+        integration DB may hold vehicles without one."""
         vin = family_vehicle["vin"]
         db_session.add(HoursRecord(vin=vin, date=date.today(), engine_hours=Decimal("500.0")))
         db_session.add_all(
@@ -500,19 +501,20 @@ class TestFamilyDashboard:
             ]
         )
         await db_session.commit()
+        await rollup_refresher.drain()
 
-        calls: list[str] = []
-        original = family_dashboard_module.latest_engine_hours_and_date
-
-        async def counting(db, vin_arg):
-            calls.append(vin_arg)
-            return await original(db, vin_arg)
-
-        monkeypatch.setattr(family_dashboard_module, "latest_engine_hours_and_date", counting)
+        response = await client.get("/api/family/dashboard", headers=family_admin["headers"])
+        assert response.status_code == 200
 
+        query_counter.clear()
         response = await client.get("/api/family/dashboard", headers=family_admin["headers"])
         assert response.status_code == 200
-        assert calls.count(vin) == 1
+        member = next(
+            m for m in response.json()["members"] if m["username"] == family_admin["username"]
+        )
+        vehicle_summary = next(v for v in member["vehicles"] if v["vin"] == vin)
+        assert vehicle_summary["overdue_maintenance"] == 2
+        assert not [q for q in query_counter if "hours_records" in q]
 
     async def test_get_dashboard_members(self, client: AsyncClient, family_admin):
         """Test getting dashboard members for management."""
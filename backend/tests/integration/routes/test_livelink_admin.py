@@ -232,6 +232,31 @@ class TestLiveLinkParameters:
 
         assert response.status_code == 404
 
+    async def test_update_parameter_bumps_registry_version(
+        self, client: AsyncClient, auth_headers, db_session
+    ):
+        """Editing a parameter invalidates the process-wide parameter registry."""
+        from app.models.livelink_parameter import LiveLinkParameter
+        from app.services.parameter_registry import parameter_registry
+
+        db_session.add(LiveLinkParameter(param_key="9B-REGISTRYBUMP", display_name="Before"))
+        await db_session.commit()
+        definitions = await parameter_registry.get_all(db_session)
+        assert definitions["9B-REGISTRYBUMP"].warning_max is None
+        version = parameter_registry.version
+
+        response = await client.put(
+            "/api/livelink/parameters/9B-REGISTRYBUMP",
+            headers=auth_headers,
+            json={"warning_max": 42.0},
+        )
+
+        assert response.status_code == 200
+        assert parameter_registry.version > version
+        definition = await parameter_registry.get(db_session, "9B-REGISTRYBUMP")
+        assert definition is not None
+        assert definition.warning_max == 42.0
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -364,6 +389,15 @@ class TestLiveLinkMQTT:
         # The actual field may be 'connection_status' instead of 'connected'
         assert "connection_status" in data or "connected" in data
 
+    async def test_get_latest_buffer_status(self, client: AsyncClient, auth_headers):
+        """Test getting the latest-value write-behind buffer status."""
+        response = await client.get("/api/livelink/telemetry/buffer", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "dirty_entries" in data
+        assert "flush_lag_seconds" in data
+
     async def test_test_mqtt_connection(self, client: AsyncClient, auth_headers):
         """Test MQTT connection test endpoint."""
         response = await client.post("/api/livelink/mqtt/test", headers=auth_headers)
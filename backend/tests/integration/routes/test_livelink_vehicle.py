@@ -4,11 +4,24 @@ Integration tests for vehicle-specific LiveLink routes.
 Tests status, telemetry, sessions, DTCs, and export endpoints.
 """
 
+import csv
+import io
+import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.drive_session import DriveSession
+from app.models.vehicle_telemetry import TelemetryDailySummary, VehicleTelemetry
+
+
+def _recent_noon(days_ago: int) -> datetime:
+    """Naive-UTC noon a few days back: inside raw retention, clear of live test data."""
+    day = (datetime.now(UTC) - timedelta(days=days_ago)).date()
+    return datetime(day.year, day.month, day.day, 12, 0, 0)
 
 
 @pytest.mark.integration
@@ -53,7 +66,7 @@ class TestVehicleLiveLinkStatus:
 
             mock_telemetry = MagicMock()
             mock_telemetry.get_latest_values = AsyncMock(return_value=[])
-            mock_telemetry.get_all_parameters = AsyncMock(return_value={})
+            mock_telemetry.get_parameter_definitions = AsyncMock(return_value={})
             mock_telemetry_class.return_value = mock_telemetry
 
             mock_session = MagicMock()
@@ -108,6 +121,186 @@ class TestVehicleTelemetry:
         )
         assert response.status_code == 404
 
+    async def test_get_telemetry_max_points_buckets_in_sql(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """max_points returns avg/min/max buckets instead of raw readings."""
+        t0 = _recent_noon(days_ago=3)
+        db_session.add_all(
+            VehicleTelemetry(
+                vin=test_vehicle["vin"],
+                device_id="bucket_dev",
+                param_key="RPM",
+                value=float(i),
+                timestamp=t0 + timedelta(seconds=i),
+            )
+            for i in range(120)
+        )
+        await db_session.flush()
+
+        response = await client.get(
+            f"/api/vehicles/{test_vehicle['vin']}/livelink/telemetry",
+            headers=auth_headers,
+            params={
+                "start": t0.isoformat(),
+                "end": (t0 + timedelta(seconds=120)).isoformat(),
+                "max_points": 12,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "bucketed"
+        assert data["bucket_seconds"] == 10
+        [series] = data["series"]
+        assert len(series["data"]) == 12
+        assert series["data"][0] == {
+            "timestamp": t0.isoformat(),
+            "value": 4.5,
+            "min_value": 0.0,
+            "max_value": 9.0,
+        }
+        assert series["data"][-1]["timestamp"] == (t0 + timedelta(seconds=110)).isoformat()
+        assert (series["min_value"], series["max_value"], series["avg_value"]) == (
+            0.0,
+            119.0,
+            59.5,
+        )
+
+    async def test_get_telemetry_long_range_uses_daily_summaries(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """A range longer than raw retention is served from TelemetryDailySummary."""
+        day0 = datetime(2003, 3, 1)
+        db_session.add_all(
+            TelemetryDailySummary(
+                vin=test_vehicle["vin"],
+                param_key="COOLANT",
+                date=day0 + timedelta(days=d),
+                min_value=70.0 + d,
+                max_value=95.0 + d,
+                avg_value=avg,
+                sample_count=count,
+            )
+            for d, avg, count in [(0, 80.0, 100), (1, 90.0, 300), (5, 85.0, 100)]
+        )
+        await db_session.flush()
+
+        response = await client.get(
+            f"/api/vehicles/{test_vehicle['vin']}/livelink/telemetry",
+            headers=auth_headers,
+            # Longer than the maximum configurable retention (365 days)
+            params={
+                "start": (day0 - timedelta(days=200)).isoformat(),
+                "end": (day0 + timedelta(days=200)).isoformat(),
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "daily"
+        assert data["bucket_seconds"] == 86400
+        [series] = data["series"]
+        assert [(p["timestamp"], p["value"]) for p in series["data"]] == [
+            ("2003-03-01T00:00:00", 80.0),
+            ("2003-03-02T00:00:00", 90.0),
+            ("2003-03-06T00:00:00", 85.0),
+        ]
+        assert series["min_value"] == 70.0
+        assert series["max_value"] == 100.0
+        # Weighted by sample count: (80*100 + 90*300 + 85*100) / 500
+        assert series["avg_value"] == 87.0
+
+    async def test_get_telemetry_short_old_range_uses_daily_summaries(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """A short range whose raw readings were pruned is still answered, per day."""
+        day = datetime(2004, 6, 1)
+        db_session.add(
+            TelemetryDailySummary(
+                vin=test_vehicle["vin"],
+                param_key="OILTEMP",
+                date=day,
+                min_value=80.0,
+                max_value=110.0,
+                avg_value=95.0,
+                sample_count=50,
+            )
+        )
+        await db_session.flush()
+
+        response = await client.get(
+            f"/api/vehicles/{test_vehicle['vin']}/livelink/telemetry",
+            headers=auth_headers,
+            params={
+                "start": (day + timedelta(hours=14)).isoformat(),
+                "end": (day + timedelta(hours=15)).isoformat(),
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["resolution"] == "daily"
+        [series] = data["series"]
+        assert [(p["timestamp"], p["value"]) for p in series["data"]] == [
+            ("2004-06-01T00:00:00", 95.0)
+        ]
+
+    async def test_get_telemetry_columnar_matches_points(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """format=columnar carries the same series as parallel epoch-ms/value arrays."""
+        t0 = _recent_noon(days_ago=4)
+        db_session.add_all(
+            VehicleTelemetry(
+                vin=test_vehicle["vin"],
+                device_id="columnar_dev",
+                param_key=key,
+                value=value,
+                timestamp=t0 + timedelta(seconds=offset),
+            )
+            for key, value, offset in [("RPM", 900.0, 0), ("SPEED", 10.0, 0), ("RPM", 1500.0, 2)]
+        )
+        await db_session.flush()
+        url = f"/api/vehicles/{test_vehicle['vin']}/livelink/telemetry"
+        params = {"start": t0.isoformat(), "end": (t0 + timedelta(minutes=1)).isoformat()}
+
+        points = (await client.get(url, headers=auth_headers, params=params)).json()
+        response = await client.get(
+            url, headers=auth_headers, params={**params, "format": "columnar"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_points"] == points["total_points"] == 3
+        assert data["resolution"] == "raw"
+        rpm = next(s for s in data["series"] if s["param_key"] == "RPM")
+        t0_ms = int(t0.replace(tzinfo=UTC).timestamp() * 1000)
+        assert rpm["t"] == [t0_ms, t0_ms + 2000]
+        assert rpm["v"] == [900.0, 1500.0]
+        assert rpm["min"] is None
+        assert (rpm["min_value"], rpm["max_value"], rpm["avg_value"]) == (900.0, 1500.0, 1200.0)
+        rpm_points = next(s for s in points["series"] if s["param_key"] == "RPM")
+        assert [p["value"] for p in rpm_points["data"]] == rpm["v"]
+        # Raw points carry no bucket fields
+        assert set(rpm_points["data"][0]) == {"timestamp", "value"}
+
+    async def test_get_telemetry_rejects_unknown_format(
+        self, client: AsyncClient, auth_headers, test_vehicle
+    ):
+        """An unknown response format is a 400."""
+        now = datetime.now(UTC)
+        response = await client.get(
+            f"/api/vehicles/{test_vehicle['vin']}/livelink/telemetry",
+            headers=auth_headers,
+            params={
+                "start": (now - timedelta(hours=1)).isoformat(),
+                "end": now.isoformat(),
+                "format": "rows",
+            },
+        )
+        assert response.status_code == 400
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -161,6 +354,46 @@ class TestVehicleSessions:
 
         assert response.status_code == 404
 
+    async def test_get_session_detail_counts_and_columnar_series(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """Detail counts every reading; format=columnar adds the bucketed series."""
+        t0 = datetime(2002, 3, 1, 7, 0, 0)
+        session = DriveSession(
+            vin=test_vehicle["vin"],
+            device_id="detail_dev",
+            started_at=t0,
+            ended_at=t0 + timedelta(seconds=59),
+            duration_seconds=59,
+        )
+        db_session.add(session)
+        db_session.add_all(
+            VehicleTelemetry(
+                vin=test_vehicle["vin"],
+                device_id="detail_dev",
+                param_key="RPM" if i % 2 else "SPEED",
+                value=float(i),
+                timestamp=t0 + timedelta(seconds=i),
+            )
+            for i in range(60)
+        )
+        await db_session.flush()
+        url = f"/api/vehicles/{test_vehicle['vin']}/livelink/sessions/{session.id}"
+
+        detail = (await client.get(url, headers=auth_headers)).json()
+        response = await client.get(url, headers=auth_headers, params={"format": "columnar"})
+
+        assert detail["data_points_count"] == 60
+        assert detail["parameters_recorded"] == ["RPM", "SPEED"]
+        assert "series" not in detail
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data_points_count"] == 60
+        assert data["bucket_seconds"] == 1
+        speed = next(s for s in data["series"] if s["param_key"] == "SPEED")
+        assert speed["v"] == [float(i) for i in range(0, 60, 2)]
+        assert speed["t"][0] == int(t0.replace(tzinfo=UTC).timestamp() * 1000)
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -225,6 +458,105 @@ class TestVehicleExport:
         )
         assert response.status_code == 404
 
+    # A range of its own so telemetry written by other tests never shows up
+    EXPORT_START = datetime(2001, 1, 1, 12, 0, 0)
+
+    async def _seed_export_rows(self, db_session: AsyncSession, vin: str) -> None:
+        t0 = self.EXPORT_START
+        db_session.add_all(
+            [
+                VehicleTelemetry(
+                    vin=vin, device_id="export_dev", param_key=key, value=value, timestamp=ts
+                )
+                for key, value, ts in [
+                    ("RPM", 800.0, t0),
+                    ("SPEED", 0.0, t0),
+                    ("RPM", 2100.0, t0 + timedelta(seconds=1)),
+                    ("=CMD", 1.0, t0 + timedelta(seconds=2)),
+                ]
+            ]
+        )
+        await db_session.flush()
+
+    def _export_params(self, **extra: str) -> dict[str, str]:
+        return {
+            "start": self.EXPORT_START.isoformat(),
+            "end": (self.EXPORT_START + timedelta(minutes=1)).isoformat(),
+            **extra,
+        }
+
+    async def test_export_telemetry_csv_long(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """Long CSV has one sanitized row per value, in timestamp order."""
+        await self._seed_export_rows(db_session, test_vehicle["vin"])
+        response = await client.get(
+            f"/api/vehicles/{test_vehicle['vin']}/livelink/export/telemetry",
+            headers=auth_headers,
+            params=self._export_params(),
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == ["timestamp", "param_key", "value"]
+        assert [row[1:] for row in rows[1:]] == [
+            ["RPM", "800.0"],
+            ["SPEED", "0.0"],
+            ["RPM", "2100.0"],
+            ["'=CMD", "1.0"],
+        ]
+
+    async def test_export_telemetry_csv_wide(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """Wide CSV has one row per timestamp and one column per parameter."""
+        await self._seed_export_rows(db_session, test_vehicle["vin"])
+        response = await client.get(
+            f"/api/vehicles/{test_vehicle['vin']}/livelink/export/telemetry",
+            headers=auth_headers,
+            params=self._export_params(layout="wide", param_keys="SPEED,RPM"),
+        )
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows == [
+            ["timestamp", "SPEED", "RPM"],
+            ["2001-01-01T12:00:00", "0.0", "800.0"],
+            ["2001-01-01T12:00:01", "", "2100.0"],
+        ]
+
+    async def test_export_telemetry_ndjson_and_json(
+        self, client: AsyncClient, auth_headers, test_vehicle, db_session: AsyncSession
+    ):
+        """NDJSON has one object per line; JSON is a single array of the same objects."""
+        await self._seed_export_rows(db_session, test_vehicle["vin"])
+        url = f"/api/vehicles/{test_vehicle['vin']}/livelink/export/telemetry"
+
+        ndjson = await client.get(
+            url, headers=auth_headers, params=self._export_params(format="ndjson")
+        )
+        assert ndjson.status_code == 200
+        assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in ndjson.text.splitlines()]
+        assert lines[0] == {"timestamp": "2001-01-01T12:00:00", "param_key": "RPM", "value": 800.0}
+        assert len(lines) == 4
+
+        array = await client.get(
+            url, headers=auth_headers, params=self._export_params(format="json")
+        )
+        assert array.status_code == 200
+        assert array.json() == lines
+
+    async def test_export_telemetry_rejects_unknown_format(
+        self, client: AsyncClient, auth_headers, test_vehicle
+    ):
+        """Unknown formats and a wide non-CSV layout are rejected up front."""
+        url = f"/api/vehicles/{test_vehicle['vin']}/livelink/export/telemetry"
+        for extra in ({"format": "xml"}, {"format": "json", "layout": "wide"}):
+            response = await client.get(
+                url, headers=auth_headers, params=self._export_params(**extra)
+            )
+            assert response.status_code == 400
+
     async def test_export_sessions_unauthorized(self, client: AsyncClient, test_vehicle):
         """Test exporting sessions without authentication."""
         response = await client.get(f"/api/vehicles/{test_vehicle['vin']}/livelink/export/sessions")
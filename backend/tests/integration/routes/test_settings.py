@@ -213,6 +213,27 @@ class TestSettingsRoutes:
         response = await client.get("/api/settings/system/info")
         assert response.status_code == 401
 
+    async def test_get_analytics_cache_stats_unauthorized(self, client: AsyncClient):
+        """Test that analytics cache stats require authentication."""
+        response = await client.get("/api/settings/system/cache")
+        assert response.status_code == 401
+
+    async def test_get_password_hashing_stats_unauthorized(self, client: AsyncClient):
+        """Test that password hashing stats require authentication."""
+        response = await client.get("/api/settings/system/password-hashing")
+        assert response.status_code == 401
+
+    async def test_get_scheduled_job_stats_unauthorized(self, client: AsyncClient):
+        """Test that scheduled job stats require authentication."""
+        response = await client.get("/api/settings/system/jobs")
+        assert response.status_code == 401
+
+    async def test_health_does_not_report_internal_stats(self, client: AsyncClient):
+        """Test that the unauthenticated health check keeps internal counters private."""
+        response = await client.get("/health")
+        assert response.status_code == 200
+        assert set(response.json()) == {"status", "app", "version"}
+
     async def test_public_settings_structure(self, client: AsyncClient):
         """Test public settings response structure."""
         response = await client.get("/api/settings/public")
@@ -306,6 +327,50 @@ class TestSettingsAdminRoutes:
         # Regular users get 403, admin gets 200
         assert response.status_code in [200, 403]
 
+    async def test_analytics_cache_stats_requires_admin(self, client: AsyncClient, auth_headers):
+        """Test that analytics cache stats require admin role."""
+        response = await client.get(
+            "/api/settings/system/cache",
+            headers=auth_headers,
+        )
+        # Regular users get 403, admin gets 200
+        assert response.status_code in [200, 403]
+        if response.status_code == 200:
+            assert "hit_rate" in response.json()
+
+    async def test_password_hashing_stats_requires_admin(
+        self, client: AsyncClient, auth_headers, non_admin_headers
+    ):
+        """Test that password hashing stats are admin only."""
+        response = await client.get(
+            "/api/settings/system/password-hashing",
+            headers=non_admin_headers,
+        )
+        assert response.status_code == 403
+
+        response = await client.get(
+            "/api/settings/system/password-hashing",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert set(response.json()) == {"running", "queued", "rejected"}
+
+    async def test_scheduled_job_stats_requires_admin(
+        self, client: AsyncClient, auth_headers, non_admin_headers, monkeypatch
+    ):
+        """Test that scheduled job stats are admin only."""
+        from app.tasks import scheduled
+
+        run = {"finished_at": "2026-01-01T00:00:00", "duration_ms": 1.5, "candidates": 3}
+        monkeypatch.setattr(scheduled, "job_stats", {"check_service_reminders": run})
+
+        response = await client.get("/api/settings/system/jobs", headers=non_admin_headers)
+        assert response.status_code == 403
+
+        response = await client.get("/api/settings/system/jobs", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {"jobs": {"check_service_reminders": run}}
+
     async def test_batch_update_requires_admin(self, client: AsyncClient, auth_headers):
         """Test that batch update requires admin role."""
         response = await client.post(
@@ -421,32 +421,36 @@ class TestVehicleDetailStats:
     ):
         """R2-B1 / R3-B1 (cross-route): the locked decision — SAME vehicle => SAME
         overdue/upcoming on the dashboard card AND the detail hero. Both routes MUST
-        derive the latest odometer from the ONE shared helper
-        (`odometer_service.latest_odometer_km_and_date`, date DESC, id DESC).
+        derive the latest odometer from the shared odometer_service helpers, which
+        share ONE order (date DESC, id DESC): the detail route's
+        `latest_odometer_km_and_date` and the fleet-wide
+        `latest_odometer_by_vin_query` the dashboard's vehicle rollup is
+        refreshed with.
 
         R3-B1 — a data-only assertion is NOT discriminating: on the default SQLite
         test schema the `(vin, date)` index reverse-scan returns the higher-id row
         even for a bare `ORDER BY date DESC`, so reverting EITHER route to an inline
         date-only query would STILL pass the count assertions below. To prove both
-        routes actually go through the shared helper we wrap it with an AsyncMock in
-        BOTH route modules' namespaces (each imports it as a bare name — see Step
-        3b-ii / Step 4 — so the lookup is the module attribute) and assert each was
-        awaited for the target vin. Reverting either call site to an inline query
+        routes actually go through the shared helpers we wrap them with mocks in
+        the detail route's and the rollup service's namespaces (each imports it as a
+        bare name — see Step 3b-ii / Step 4 — so the lookup is the module attribute)
+        and assert each was called for the target vin. Reverting either call site to an inline query
         then leaves that route's spy un-awaited and fails deterministically,
         independent of the engine's same-date row choice. The behavioural equality
         assertions are kept as the correctness check."""
-        from unittest.mock import AsyncMock
+        from unittest.mock import AsyncMock, Mock
 
-        import app.routes.dashboard as dashboard_routes
         import app.routes.vehicles as vehicle_routes
+        import app.services.vehicle_rollup_service as rollup_service
         from app.services.odometer_service import (
-            latest_odometer_km_and_date as real_helper,
+            latest_odometer_by_vin_query,
+            latest_odometer_km_and_date,
         )
 
-        detail_spy = AsyncMock(wraps=real_helper)
-        dashboard_spy = AsyncMock(wraps=real_helper)
+        detail_spy = AsyncMock(wraps=latest_odometer_km_and_date)
+        dashboard_spy = Mock(wraps=latest_odometer_by_vin_query)
         monkeypatch.setattr(vehicle_routes, "latest_odometer_km_and_date", detail_spy)
-        monkeypatch.setattr(dashboard_routes, "latest_odometer_km_and_date", dashboard_spy)
+        monkeypatch.setattr(rollup_service, "latest_odometer_by_vin_query", dashboard_spy)
 
         vin = await _seed_vehicle(db_session, non_admin_user["id"], "5NPE24AF0FH100008")
         today = date.today()
@@ -471,18 +475,15 @@ class TestVehicleDetailStats:
         dashboard = (await client.get("/api/dashboard", headers=non_admin_headers)).json()
         card = next(v for v in dashboard["vehicles"] if v["vin"] == vin)
 
-        # (1) STRUCTURAL (R3-B1): both routes went through the shared helper for
+        # (1) STRUCTURAL (R3-B1): both routes went through the shared helpers for
         # this vin. Reverting EITHER call site to an inline query leaves that
         # route's spy un-awaited -> this fails deterministically, independent of the
-        # engine's same-date row choice. (The dashboard iterates all of the user's
-        # vehicles, so `any(... vin ...)` matches the target's call among them.)
+        # engine's same-date row choice. (The rollup refresh covers every vin the
+        # commit touched in one call, so the target vin is one of that call's vins.)
         assert any(
             vin in call.args or vin in call.kwargs.values() for call in detail_spy.await_args_list
         )
-        assert any(
-            vin in call.args or vin in call.kwargs.values()
-            for call in dashboard_spy.await_args_list
-        )
+        assert any(vin in call.args[0] for call in dashboard_spy.call_args_list)
         # (2) BEHAVIOURAL: same row on both routes -> identical, correct counts
         # (dashboard exposes overdue_maintenance_count / upcoming_maintenance_count;
         # detail-stats exposes overdue_count / upcoming_count — the same values).
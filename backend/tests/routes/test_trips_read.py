@@ -19,7 +19,7 @@ the checks these tests exist to prove.
 """
 
 import itertools
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 
 import pytest
@@ -219,6 +219,28 @@ async def test_get_trip_points_ordered_with_float_coordinates(
     assert points[1]["latitude"] == pytest.approx(47.6070)
 
 
+@pytest.mark.asyncio
+async def test_get_trip_points_columnar_matches_points(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """format=columnar returns the same points as parallel arrays with epoch-ms times."""
+    vin, owner_headers = await _make_owned_vehicle(db_session)
+    session_id, t1, t2 = await _seed_trip(db_session, vin)
+    url = f"/api/vehicles/{vin}/livelink/trips/{session_id}/points"
+
+    points = (await client.get(url, headers=owner_headers)).json()["points"]
+    r = await client.get(url, headers=owner_headers, params={"format": "columnar"})
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["session_id"] == session_id
+    assert body["t"] == [int(t.replace(tzinfo=UTC).timestamp() * 1000) for t in (t1, t2)]
+    assert body["id"] == [p["id"] for p in points]
+    assert body["latitude"] == [p["latitude"] for p in points]
+    assert body["longitude"] == [p["longitude"] for p in points]
+    assert body["speed"] == [None, None]
+
+
 @pytest.mark.asyncio
 async def test_get_trip_points_404s_for_nonexistent_session_id(
     client: AsyncClient, db_session: AsyncSession
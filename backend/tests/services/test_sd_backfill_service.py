@@ -3,7 +3,7 @@
 import itertools
 import sqlite3
 import tempfile
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -14,8 +14,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.livelink_device import LiveLinkDevice
 from app.models.user import User
 from app.models.vehicle import Vehicle
-from app.models.vehicle_telemetry import VehicleTelemetry
+from app.models.vehicle_telemetry import VehicleTelemetry, VehicleTelemetryLatest
+from app.services import telemetry_service
 from app.services.sd_backfill_service import SdBackfillService
+from app.services.sd_log_parser import SdRow
+from app.services.telemetry_service import TelemetryService
 
 # Module-level counter — persists for the entire test session so that each
 # make_vehicle_and_device call gets globally unique usernames/VINs/device IDs
@@ -236,3 +239,76 @@ async def test_backfill_dedups_against_live_row(db_session, make_vehicle_and_dev
     )
     row_count = count_result.scalar()
     assert row_count == 1, f"expected exactly 1 telemetry row (merged), found {row_count}"
+
+
+async def _latest(db_session: AsyncSession, vin: str) -> dict[str, tuple[datetime, float]]:
+    result = await db_session.execute(
+        select(
+            VehicleTelemetryLatest.param_key,
+            VehicleTelemetryLatest.timestamp,
+            VehicleTelemetryLatest.value,
+        ).where(VehicleTelemetryLatest.vin == vin)
+    )
+    return {key: (ts, value) for key, ts, value in result.all()}
+
+
+@pytest.mark.asyncio
+async def test_bulk_backfill_chunks_and_reconciles_latest(
+    db_session, make_vehicle_and_device, monkeypatch, query_counter
+):
+    """Rows go in as multi-row INSERTs per chunk; latest ends on each param's newest row."""
+    monkeypatch.setattr(telemetry_service, "BACKFILL_CHUNK_SIZE", 4)
+    vin, device_id = await make_vehicle_and_device(db_session)
+    base = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+    # Out of order on purpose: the newest RPM row sits in the first chunk
+    rows = [
+        SdRow("0C-ENGINERPM", 900.0, base + timedelta(seconds=1)),
+        SdRow("0C-ENGINERPM", 1500.0, base + timedelta(seconds=9)),
+        SdRow("0D-VEHICLESPEED", 10.0, base + timedelta(seconds=1)),
+        SdRow("0D-VEHICLESPEED", 20.0, base + timedelta(seconds=2)),
+        SdRow("0C-ENGINERPM", 1000.0, base + timedelta(seconds=3)),
+        SdRow("0D-VEHICLESPEED", 30.0, base + timedelta(seconds=5)),
+        SdRow("0D-VEHICLESPEED", 30.0, base + timedelta(seconds=5)),  # duplicate
+        SdRow("0C-ENGINERPM", 1100.0, base + timedelta(seconds=4)),
+        SdRow("0D-VEHICLESPEED", 25.0, base + timedelta(seconds=4)),
+    ]
+
+    query_counter.clear()
+    inserted = await TelemetryService(db_session).bulk_backfill(vin, device_id, rows)
+
+    assert inserted == 8
+    inserts = [q for q in query_counter if q.lstrip().upper().startswith("INSERT")]
+    # 3 chunks x (history INSERT + latest upsert), independent of rows per chunk
+    assert len(inserts) == 6
+
+    naive = base.replace(tzinfo=None)
+    assert await _latest(db_session, vin) == {
+        "0C-ENGINERPM": (naive + timedelta(seconds=9), 1500.0),
+        "0D-VEHICLESPEED": (naive + timedelta(seconds=5), 30.0),
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_backfill_never_clobbers_fresher_latest(db_session, make_vehicle_and_device):
+    """A backfilled reading older than the cached latest leaves it untouched."""
+    vin, device_id = await make_vehicle_and_device(db_session)
+    live_ts = datetime(2026, 3, 2, 8, 0)
+    db_session.add(
+        VehicleTelemetryLatest(
+            vin=vin, param_key="0C-ENGINERPM", value=2000.0, timestamp=live_ts, received_at=live_ts
+        )
+    )
+    await db_session.flush()
+
+    rows = [
+        SdRow("0C-ENGINERPM", 800.0, datetime(2026, 3, 1, 8, 0, tzinfo=UTC)),
+        SdRow("0C-ENGINERPM", 2001.0, live_ts.replace(tzinfo=UTC)),  # same instant
+        SdRow("0D-VEHICLESPEED", 42.0, datetime(2026, 3, 1, 8, 0, tzinfo=UTC)),
+    ]
+    inserted = await TelemetryService(db_session).bulk_backfill(vin, device_id, rows)
+
+    assert inserted == 3
+    assert await _latest(db_session, vin) == {
+        "0C-ENGINERPM": (live_ts, 2000.0),
+        "0D-VEHICLESPEED": (datetime(2026, 3, 1, 8, 0), 42.0),
+    }
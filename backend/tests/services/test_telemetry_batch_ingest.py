@@ -0,0 +1,150 @@
+"""Tests for the batched, set-based TelemetryService.store_telemetry ingest path."""
+
+import itertools
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.livelink_parameter import LiveLinkParameter
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.vehicle_telemetry import VehicleTelemetry, VehicleTelemetryLatest
+from app.services.telemetry_latest_buffer import latest_buffer
+from app.services.telemetry_service import TelemetryService
+from app.utils.datetime_utils import utc_now
+
+_SEQ = itertools.count()
+
+
+async def _make_vehicle(db_session: AsyncSession) -> tuple[str, str]:
+    """Create a minimal user + vehicle, return (vin, device_id)."""
+    n = next(_SEQ)
+    user = User(
+        username=f"batch_ingest_user_{n}",
+        email=f"batch_ingest_{n}@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_admin=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    vin = f"BATCHINGEST{n:06d}"  # 17 chars
+    db_session.add(Vehicle(vin=vin, user_id=user.id, nickname=f"Batch Car {n}", vehicle_type="Car"))
+    await db_session.flush()
+    return vin, f"batch_dev_{n:06d}"
+
+
+def _frame(n: int) -> dict[str, float | int | str | None]:
+    """A frame of 40 unclassified PIDs (no validator class, so nothing is rejected)."""
+    return {f"9B-BATCHSENSOR{i:02d}": float(i) for i in range(n)}
+
+
+@pytest.mark.asyncio
+async def test_frame_writes_every_param_to_latest_and_history(db_session: AsyncSession):
+    """All values of one frame land in both the history and latest tables."""
+    vin, device_id = await _make_vehicle(db_session)
+    svc = TelemetryService(db_session)
+
+    result = await svc.store_telemetry(vin, device_id, _frame(40), {}, None)
+    await db_session.commit()
+
+    assert result.stored_count == 40
+    history = await db_session.execute(
+        select(func.count()).select_from(VehicleTelemetry).where(VehicleTelemetry.vin == vin)
+    )
+    assert history.scalar() == 40
+    assert len(await svc.get_latest_values(vin)) == 40
+
+    # Latest values reach the table on the next buffer flush
+    await latest_buffer.flush(db_session)
+    latest = await db_session.execute(
+        select(func.count())
+        .select_from(VehicleTelemetryLatest)
+        .where(VehicleTelemetryLatest.vin == vin)
+    )
+    assert latest.scalar() == 40
+
+
+@pytest.mark.asyncio
+async def test_retried_frame_is_deduplicated(db_session: AsyncSession):
+    """Replaying a frame with the same timestamp inserts nothing new."""
+    vin, device_id = await _make_vehicle(db_session)
+    svc = TelemetryService(db_session)
+    ts = utc_now().replace(microsecond=0)
+
+    first = await svc.store_telemetry(vin, device_id, _frame(5), {}, ts)
+    again = await svc.store_telemetry(vin, device_id, _frame(5), {}, ts)
+    await db_session.commit()
+
+    assert first.stored_count == 5
+    assert again.stored_count == 0
+
+
+@pytest.mark.asyncio
+async def test_latest_values_are_overwritten(db_session: AsyncSession):
+    """A newer frame replaces the cached latest value for each key."""
+    vin, device_id = await _make_vehicle(db_session)
+    svc = TelemetryService(db_session)
+    ts = utc_now().replace(microsecond=0)
+
+    await svc.store_telemetry(vin, device_id, {"9B-BATCHSENSOR00": 1.0}, {}, ts)
+    await svc.store_telemetry(
+        vin, device_id, {"9B-BATCHSENSOR00": 2.0}, {}, ts + timedelta(seconds=1)
+    )
+    await db_session.commit()
+
+    [latest] = await svc.get_latest_values(vin)
+    assert latest.value == 2.0
+
+
+@pytest.mark.asyncio
+async def test_storage_interval_throttles_history_but_not_latest(db_session: AsyncSession):
+    """Keys with a storage interval skip history inside the window but still update latest."""
+    vin, device_id = await _make_vehicle(db_session)
+    svc = TelemetryService(db_session)
+    db_session.add(LiveLinkParameter(param_key="9B-BATCHINTERVAL", storage_interval_seconds=3600))
+    await db_session.flush()
+    ts = utc_now().replace(microsecond=0)
+
+    await svc.store_telemetry(vin, device_id, {"9B-BATCHINTERVAL": 1.0}, {}, ts)
+    second = await svc.store_telemetry(
+        vin, device_id, {"9B-BATCHINTERVAL": 2.0}, {}, ts + timedelta(seconds=1)
+    )
+    await db_session.commit()
+
+    assert second.stored_count == 0
+    history = await db_session.execute(
+        select(func.count())
+        .select_from(VehicleTelemetry)
+        .where(VehicleTelemetry.vin == vin, VehicleTelemetry.param_key == "9B-BATCHINTERVAL")
+    )
+    assert history.scalar() == 1
+    [latest] = await svc.get_latest_values(vin)
+    assert latest.value == 2.0
+
+
+@pytest.mark.asyncio
+async def test_statement_count_is_independent_of_frame_width(
+    db_session: AsyncSession, query_counter: list[str]
+):
+    """A 40-PID frame costs the same number of statements as a 2-PID frame."""
+    vin, device_id = await _make_vehicle(db_session)
+    svc = TelemetryService(db_session)
+    # Register the parameters and warm the registry so the measured frames
+    # are steady-state.
+    await svc.store_telemetry(vin, device_id, _frame(40), {}, None)
+    await db_session.flush()
+    await svc.get_parameter_definitions()
+
+    query_counter.clear()
+    await svc.store_telemetry(vin, device_id, _frame(2), {}, utc_now() + timedelta(seconds=1))
+    narrow = len(query_counter)
+
+    query_counter.clear()
+    await svc.store_telemetry(vin, device_id, _frame(40), {}, utc_now() + timedelta(seconds=2))
+    wide = len(query_counter)
+
+    assert wide == narrow
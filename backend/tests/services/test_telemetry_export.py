@@ -0,0 +1,85 @@
+"""Tests for TelemetryService.iter_telemetry_range keyset paging."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.vehicle_telemetry import VehicleTelemetry
+from app.services.telemetry_service import TelemetryService
+
+
+async def _make_vehicle(db_session: AsyncSession) -> str:
+    user = User(
+        username="telemetry_export_user",
+        email="telemetry_export@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_admin=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    vin = "TELEMETRYEXPORT01"
+    db_session.add(Vehicle(vin=vin, user_id=user.id, nickname="Export Car", vehicle_type="Car"))
+    await db_session.flush()
+    return vin
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_range_without_gaps_or_repeats(db_session: AsyncSession):
+    """Rows sharing a timestamp across a page boundary are neither skipped nor repeated."""
+    vin = await _make_vehicle(db_session)
+    t0 = datetime(2001, 1, 1)
+    # Three values share each timestamp, so page boundaries fall mid-timestamp
+    db_session.add_all(
+        VehicleTelemetry(
+            vin=vin,
+            device_id="export_dev",
+            param_key=f"P{i % 3}",
+            value=float(i),
+            timestamp=t0 + timedelta(seconds=i // 3),
+        )
+        for i in range(11)
+    )
+    await db_session.flush()
+    svc = TelemetryService(db_session)
+
+    pages = [
+        page
+        async for page in svc.iter_telemetry_range(vin, t0, t0 + timedelta(minutes=1), page_size=4)
+    ]
+
+    assert [len(page) for page in pages] == [4, 4, 3]
+    assert [row.value for page in pages for row in page] == [float(i) for i in range(11)]
+
+
+@pytest.mark.asyncio
+async def test_param_filter_and_distinct_keys(db_session: AsyncSession):
+    """The key filter applies to every page; the distinct-key helper lists the range's keys."""
+    vin = await _make_vehicle(db_session)
+    t0 = datetime(2001, 1, 1)
+    db_session.add_all(
+        VehicleTelemetry(
+            vin=vin,
+            device_id="export_dev",
+            param_key=key,
+            value=float(i),
+            timestamp=t0 + timedelta(seconds=i),
+        )
+        for i, key in enumerate(["SPEED", "RPM", "SPEED", "COOLANT", "SPEED"])
+    )
+    await db_session.flush()
+    svc = TelemetryService(db_session)
+    end = t0 + timedelta(minutes=1)
+
+    rows = [
+        row
+        async for page in svc.iter_telemetry_range(vin, t0, end, ["SPEED"], page_size=2)
+        for row in page
+    ]
+
+    assert [row.value for row in rows] == [0.0, 2.0, 4.0]
+    assert await svc.get_param_keys_in_range(vin, t0, end) == ["COOLANT", "RPM", "SPEED"]
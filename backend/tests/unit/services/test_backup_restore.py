@@ -0,0 +1,236 @@
+"""Tests for staged full restores, safety snapshots and streamed uploads."""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import tarfile
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+
+import pytest
+
+from app.services import backup_service
+from app.services.backup_service import BackupService
+from app.services.backup_store import SNAPSHOT_SUFFIX, BackupTooLargeError, read_manifest
+
+
+def _service(tmp_path: Path) -> BackupService:
+    data_dir = tmp_path / "data"
+    for sub in ("photos", "documents", "attachments"):
+        (data_dir / sub).mkdir(parents=True, exist_ok=True)
+    db_path = data_dir / "mygarage.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+    return BackupService(
+        backup_dir=tmp_path / "backups",
+        database_path=db_path,
+        data_dir=data_dir,
+        is_sqlite=True,
+        workers=2,
+    )
+
+
+def _write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+async def _chunks(data: bytes | Iterable[bytes], size: int = 1000) -> AsyncIterator[bytes]:
+    if isinstance(data, bytes):
+        data = [data[i : i + size] for i in range(0, len(data), size)]
+    for chunk in data:
+        yield chunk
+
+
+def _tar_gz(members: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStagedRestore:
+    async def test_bad_archive_leaves_live_data_untouched(self, tmp_path: Path):
+        service = _service(tmp_path)
+        photo = service.data_dir / "photos" / "VIN1" / "a.jpg"
+        _write(photo, b"live photo")
+        # A valid member first, then one outside the allowed roots
+        archive = _tar_gz({"photos/VIN1/a.jpg": b"old photo", "etc/passwd": b"x"})
+        _write(service.backup_dir / "mygarage-full-2020-01-01-000000.tar.gz", archive)
+
+        with pytest.raises(ValueError, match="Unexpected entry"):
+            await service.restore_full_backup(
+                "mygarage-full-2020-01-01-000000.tar.gz", create_safety=False
+            )
+
+        assert photo.read_bytes() == b"live photo"
+        assert not [p for p in service.data_dir.iterdir() if p.name.startswith(".restore-")]
+
+    async def test_archive_restore_swaps_in_staged_roots(self, tmp_path: Path):
+        service = _service(tmp_path)
+        _write(service.data_dir / "photos" / "VIN1" / "new.jpg", b"added later")
+        derivative = service.data_dir / "photos" / ".derivatives" / "ab" / "sm.jpg"
+        _write(derivative, b"thumb")
+        archive = _tar_gz({"photos/VIN1/a.jpg": b"old photo", "documents/d.pdf": b"%PDF"})
+        _write(service.backup_dir / "mygarage-full-2020-01-01-000000.tar.gz", archive)
+
+        result = await service.restore_full_backup(
+            "mygarage-full-2020-01-01-000000.tar.gz", create_safety=False
+        )
+
+        assert result["files_restored"] == 2
+        assert result["bytes_restored"] == len(b"old photo") + len(b"%PDF")
+        assert result["throughput_mb_s"] >= 0
+        assert (service.data_dir / "photos" / "VIN1" / "a.jpg").read_bytes() == b"old photo"
+        assert not (service.data_dir / "photos" / "VIN1" / "new.jpg").exists()
+        assert derivative.read_bytes() == b"thumb"
+        assert sorted(p.name for p in service.data_dir.iterdir()) == [
+            "attachments",
+            "documents",
+            "mygarage.db",
+            "photos",
+        ]
+
+    async def test_failed_database_swap_undoes_the_data_roots(self, tmp_path: Path, monkeypatch):
+        service = _service(tmp_path)
+        photo = service.data_dir / "photos" / "VIN1" / "a.jpg"
+        _write(photo, b"live photo")
+        live_db = service.database_path.read_bytes()
+        archive = _tar_gz({"photos/VIN1/a.jpg": b"old photo", "mygarage.db": b"restored db"})
+        _write(service.backup_dir / "mygarage-full-2020-01-01-000000.tar.gz", archive)
+
+        rename = os.rename
+
+        def _failing_rename(src, dst):
+            if Path(src).parent.name.endswith("-db") and Path(dst).name == "mygarage.db":
+                raise OSError("disk full")
+            rename(src, dst)
+
+        monkeypatch.setattr(backup_service.os, "rename", _failing_rename)
+        with pytest.raises(OSError, match="disk full"):
+            await service.restore_full_backup(
+                "mygarage-full-2020-01-01-000000.tar.gz", create_safety=False
+            )
+
+        assert photo.read_bytes() == b"live photo"
+        assert service.database_path.read_bytes() == live_db
+        assert not [p for p in service.data_dir.iterdir() if p.name.startswith(".restore-")]
+
+    async def test_leftovers_keep_data_moved_aside_by_an_interrupted_swap(self, tmp_path: Path):
+        service = _service(tmp_path)
+        moved_aside = service.data_dir / ".restore-0123456789ab-photos-old" / "VIN1" / "a.jpg"
+        _write(moved_aside, b"pre-restore photo")
+        _write(service.data_dir / ".restore-0123456789ab-photos" / "VIN1" / "a.jpg", b"staged")
+        archive = _tar_gz({"documents/d.pdf": b"%PDF"})
+        _write(service.backup_dir / "mygarage-full-2020-01-01-000000.tar.gz", archive)
+
+        await service.restore_full_backup(
+            "mygarage-full-2020-01-01-000000.tar.gz", create_safety=False
+        )
+
+        assert moved_aside.read_bytes() == b"pre-restore photo"
+        assert not (service.data_dir / ".restore-0123456789ab-photos").exists()
+
+    async def test_safety_snapshot_restores_previous_state(self, tmp_path: Path):
+        service = _service(tmp_path)
+        photo = service.data_dir / "photos" / "VIN1" / "a.jpg"
+        _write(photo, b"before")
+        info = await service.create_full_backup()
+        photo.write_bytes(b"after")
+        os.utime(photo, ns=(1, 1))
+
+        result = await service.restore_full_backup(info["filename"])
+
+        snapshot_name = result["safety_backup"]
+        assert snapshot_name.endswith(SNAPSHOT_SUFFIX)
+        assert photo.read_bytes() == b"before"
+        listed = {b["filename"]: b for b in service.get_backup_files("full")}
+        assert listed[snapshot_name]["format"] == "snapshot"
+        assert listed[snapshot_name]["is_safety"] is True
+
+        await service.restore_full_backup(snapshot_name, create_safety=False)
+
+        assert photo.read_bytes() == b"after"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamedUpload:
+    async def test_archive_upload_is_verified_and_saved(self, tmp_path: Path):
+        service = _service(tmp_path)
+        payload = os.urandom(5000)
+
+        info = await service.receive_upload(
+            "backup.tar.gz", _chunks(payload), hashlib.sha256(payload).hexdigest()
+        )
+
+        assert info["filename"].startswith("mygarage-full-uploaded-")
+        assert (service.backup_dir / info["filename"]).read_bytes() == payload
+        assert not list(service.backup_dir.glob(".*.part"))
+
+    async def test_checksum_mismatch_discards_upload(self, tmp_path: Path):
+        service = _service(tmp_path)
+
+        with pytest.raises(ValueError, match="checksum mismatch"):
+            await service.receive_upload("backup.tar.gz", _chunks(b"data"), "0" * 64)
+
+        assert list(service.backup_dir.iterdir()) == []
+
+    async def test_settings_upload_is_validated(self, tmp_path: Path):
+        service = _service(tmp_path)
+
+        with pytest.raises(ValueError, match="Invalid backup file structure"):
+            await service.receive_upload("s.json", _chunks(json.dumps({"x": 1}).encode()))
+
+        info = await service.receive_upload("s.json", _chunks(b'{"settings": []}'))
+        assert info["type"] == "settings"
+
+    async def test_oversized_upload_is_rejected(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(backup_service, "_MAX_SETTINGS_UPLOAD_BYTES", 10)
+        service = _service(tmp_path)
+
+        with pytest.raises(BackupTooLargeError):
+            await service.receive_upload("s.json", _chunks(b'{"settings": []}', 4))
+
+        assert list(service.backup_dir.iterdir()) == []
+
+    async def test_bundle_round_trip(self, tmp_path: Path):
+        source = _service(tmp_path / "source")
+        _write(source.data_dir / "photos" / "VIN1" / "a.jpg", os.urandom(3000))
+        info = await source.create_full_backup()
+        bundle = b"".join(source.iter_manifest_bundle(info["filename"]))
+
+        target = _service(tmp_path / "target")
+        uploaded = await target.receive_upload(
+            "backup.tar", _chunks(bundle, 4096), hashlib.sha256(bundle).hexdigest()
+        )
+
+        manifest = read_manifest(target.backup_dir / uploaded["filename"])
+        assert manifest["entries"] == read_manifest(source.backup_dir / info["filename"])["entries"]
+        await target.restore_full_backup(uploaded["filename"], create_safety=False)
+        assert (target.data_dir / "photos" / "VIN1" / "a.jpg").read_bytes() == (
+            source.data_dir / "photos" / "VIN1" / "a.jpg"
+        ).read_bytes()
+
+    async def test_invalid_bundle_leaves_no_blobs(self, tmp_path: Path):
+        source = _service(tmp_path / "source")
+        _write(source.data_dir / "photos" / "VIN1" / "a.jpg", os.urandom(3000))
+        info = await source.create_full_backup()
+        bundle = b"".join(source.iter_manifest_bundle(info["filename"]))
+
+        target = _service(tmp_path / "target")
+        with pytest.raises(ValueError):
+            await target.receive_upload("backup.tar", _chunks(gzip.compress(bundle)))
+
+        assert target.get_blob_store_size() == 0
+        assert not list(target.backup_dir.glob("*.manifest.json"))
@@ -21,6 +21,7 @@ from pathlib import Path
 import pytest
 
 from app.services.backup_service import BackupService
+from app.services.backup_store import read_manifest
 
 
 def _make_wal_db_with_pending_frames(db_path: Path) -> sqlite3.Connection:
@@ -54,17 +55,6 @@ def _service(tmp_path: Path, db_path: Path) -> BackupService:
     )
 
 
-def _extract_member(archive: Path, member: str, dest: Path) -> Path:
-    with tarfile.open(archive, "r:gz") as tar:
-        info = tar.getmember(member)
-        extracted = tar.extractfile(info)
-        assert extracted is not None
-        target = dest / member
-        with extracted, open(target, "wb") as fh:
-            fh.write(extracted.read())
-    return target
-
-
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_full_backup_db_member_is_self_contained(tmp_path: Path) -> None:
@@ -80,7 +70,9 @@ async def test_full_backup_db_member_is_self_contained(tmp_path: Path) -> None:
         meta = await service.create_full_backup()
         archive = service.backup_dir / meta["filename"]
 
-        extracted_db = _extract_member(archive, "mygarage.db", tmp_path)
+        entries = {e["path"]: e for e in read_manifest(archive)["entries"]}
+        extracted_db = tmp_path / "mygarage.db.restored"
+        service.blob_store.extract_to(entries["mygarage.db"]["sha256"], extracted_db)
         check = sqlite3.connect(f"file:{extracted_db}?mode=ro", uri=True)
         try:
             rows = check.execute("SELECT id, v FROM audit_rows ORDER BY id").fetchall()
@@ -93,11 +85,9 @@ async def test_full_backup_db_member_is_self_contained(tmp_path: Path) -> None:
             f"(audit finding F2); got {rows!r}"
         )
 
-        with tarfile.open(archive, "r:gz") as tar:
-            names = tar.getnames()
-        assert "mygarage.db-wal" not in names and "mygarage.db-shm" not in names, (
+        assert "mygarage.db-wal" not in entries and "mygarage.db-shm" not in entries, (
             "snapshot backups must be self-contained; wal/shm sidecars in the "
-            "archive indicate the live-file-copy path is still in use"
+            "manifest indicate the live-file-copy path is still in use"
         )
     finally:
         writer.close()
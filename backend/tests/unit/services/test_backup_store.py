@@ -0,0 +1,160 @@
+"""Tests for incremental, content-addressed full backups."""
+
+import io
+import os
+import sqlite3
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from app.services.backup_service import BackupService
+from app.services.backup_store import (
+    BackupInProgressError,
+    current_progress,
+    exclusive_run,
+    read_manifest,
+)
+
+
+def _service(tmp_path: Path) -> BackupService:
+    data_dir = tmp_path / "data"
+    for sub in ("photos", "documents", "attachments"):
+        (data_dir / sub).mkdir(parents=True, exist_ok=True)
+    db_path = data_dir / "mygarage.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+    return BackupService(
+        backup_dir=tmp_path / "backups",
+        database_path=db_path,
+        data_dir=data_dir,
+        is_sqlite=True,
+        workers=2,
+    )
+
+
+def _write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestManifestBackups:
+    async def test_unchanged_files_are_not_stored_again(self, tmp_path: Path):
+        service = _service(tmp_path)
+        _write(service.data_dir / "photos" / "VIN1" / "a.jpg", os.urandom(4096))
+        _write(service.data_dir / "documents" / "VIN1" / "b.pdf", b"%PDF" * 1000)
+
+        first = await service.create_full_backup()
+        assert first["files"] == 3
+        assert first["new_blobs"] == 3
+
+        # Force a second manifest name (timestamps have one-second resolution)
+        first_path = service.backup_dir / first["filename"]
+        first_path.rename(first_path.with_name("mygarage-full-2000-01-01-000000.manifest.json"))
+
+        second = await service.create_full_backup()
+        # Only an unchanged database snapshot is re-read; it dedups too
+        assert second["new_blobs"] == 0
+        assert second["new_blob_bytes"] == 0
+
+    async def test_identical_files_share_one_blob(self, tmp_path: Path):
+        service = _service(tmp_path)
+        payload = os.urandom(2048)
+        _write(service.data_dir / "photos" / "VIN1" / "a.jpg", payload)
+        _write(service.data_dir / "attachments" / "x" / "copy.jpg", payload)
+
+        info = await service.create_full_backup()
+
+        entries = read_manifest(service.backup_dir / info["filename"])["entries"]
+        digests = {e["path"]: e["sha256"] for e in entries}
+        assert digests["photos/VIN1/a.jpg"] == digests["attachments/x/copy.jpg"]
+        assert info["new_blobs"] == 2  # database + one shared photo
+
+    async def test_derivatives_are_left_out(self, tmp_path: Path):
+        service = _service(tmp_path)
+        _write(service.data_dir / "photos" / ".derivatives" / "ab" / "abc" / "sm.jpg", b"x")
+        _write(service.data_dir / "photos" / "VIN1" / "a.jpg", b"photo")
+
+        info = await service.create_full_backup()
+
+        paths = {e["path"] for e in read_manifest(service.backup_dir / info["filename"])["entries"]}
+        assert paths == {"mygarage.db", "photos/VIN1/a.jpg"}
+
+    async def test_restore_round_trip(self, tmp_path: Path):
+        service = _service(tmp_path)
+        photo = service.data_dir / "photos" / "VIN1" / "a.jpg"
+        _write(photo, b"original photo")
+        info = await service.create_full_backup()
+
+        photo.write_bytes(b"edited")
+        _write(service.data_dir / "documents" / "stray.pdf", b"added later")
+
+        result = await service.restore_full_backup(info["filename"], create_safety=False)
+
+        assert result["files_restored"] == 2
+        assert photo.read_bytes() == b"original photo"
+        assert not (service.data_dir / "documents" / "stray.pdf").exists()
+        assert current_progress() is not None
+        assert current_progress().as_dict()["phase"] == "done"
+
+    async def test_restore_rejects_corrupt_blob(self, tmp_path: Path):
+        service = _service(tmp_path)
+        _write(service.data_dir / "photos" / "VIN1" / "a.jpg", b"photo")
+        info = await service.create_full_backup()
+        manifest = read_manifest(service.backup_dir / info["filename"])
+        digest = next(e["sha256"] for e in manifest["entries"] if e["path"].startswith("photos"))
+        # A valid blob for other bytes stored under this digest
+        other = tmp_path / "other"
+        other.write_bytes(b"tampered")
+        tampered, _ = service.blob_store.store_file(other)
+        os.replace(service.blob_store.path_for(tampered), service.blob_store.path_for(digest))
+
+        with pytest.raises(ValueError, match="corrupt"):
+            await service.restore_full_backup(info["filename"], create_safety=False)
+
+    async def test_restore_rejects_unsafe_paths(self, tmp_path: Path):
+        service = _service(tmp_path)
+        info = await service.create_full_backup()
+        manifest_path = service.backup_dir / info["filename"]
+        manifest_path.write_text(
+            manifest_path.read_text().replace('"mygarage.db"', '"../escape.db"')
+        )
+
+        with pytest.raises(ValueError):
+            await service.restore_full_backup(info["filename"], create_safety=False)
+
+    async def test_delete_prunes_unreferenced_blobs(self, tmp_path: Path):
+        service = _service(tmp_path)
+        _write(service.data_dir / "photos" / "VIN1" / "a.jpg", os.urandom(1024))
+        info = await service.create_full_backup()
+        assert service.get_blob_store_size() > 0
+
+        service.delete_backup(info["filename"])
+
+        assert service.get_blob_store_size() == 0
+
+    async def test_only_one_run_at_a_time(self, tmp_path: Path):
+        service = _service(tmp_path)
+        with exclusive_run("backup", "busy"):
+            with pytest.raises(BackupInProgressError):
+                await service.create_full_backup()
+
+    async def test_bundle_contains_manifest_and_blobs(self, tmp_path: Path):
+        service = _service(tmp_path)
+        _write(service.data_dir / "photos" / "VIN1" / "a.jpg", b"photo")
+        info = await service.create_full_backup()
+
+        bundle = b"".join(service.iter_manifest_bundle(info["filename"]))
+
+        assert len(bundle) % tarfile.RECORDSIZE == 0
+        with tarfile.open(fileobj=io.BytesIO(bundle), mode="r:") as tar:
+            names = tar.getnames()
+        assert names[0] == "manifest.json"
+        manifest = read_manifest(service.backup_dir / info["filename"])
+        assert {f"blobs/{e['sha256'][:2]}/{e['sha256']}.zst" for e in manifest["entries"]} == set(
+            names[1:]
+        )
@@ -49,9 +49,8 @@ async def test_liters_per_1000_km_excludes_final_unconsumed_purchase() -> None:
 
     service = DEFRecordService(mock_db)
     with patch(
-        "app.services.auth.get_vehicle_or_403",
+        "app.services.auth.check_vehicle_access",
         new_callable=AsyncMock,
-        return_value=MagicMock(),
     ):
         result = await service.get_def_analytics("FENCEPOST00000001", MagicMock())
 
@@ -87,9 +86,8 @@ async def test_purchases_tied_at_final_odometer_are_all_excluded() -> None:
 
     service = DEFRecordService(mock_db)
     with patch(
-        "app.services.auth.get_vehicle_or_403",
+        "app.services.auth.check_vehicle_access",
         new_callable=AsyncMock,
-        return_value=MagicMock(),
     ):
         result = await service.get_def_analytics("FENCEPOST00000002", MagicMock())
 
@@ -14,13 +14,6 @@ from app.schemas.def_record import DEFAnalytics
 from app.services.def_service import DEFRecordService
 
 
-def _make_mock_vehicle(tank_capacity=None):
-    """Create a mock vehicle with DEF tank capacity (liters, metric canonical)."""
-    vehicle = MagicMock()
-    vehicle.def_tank_capacity_liters = tank_capacity
-    return vehicle
-
-
 def _make_mock_record(record_date, mileage_mi, gallons, cost, fill_level=None):
     """Create a mock DEF record (metric canonical: km/liters).
 
@@ -49,16 +42,13 @@ class TestDEFAnalytics:
         mock_db = AsyncMock()
         service = DEFRecordService(mock_db)
 
-        mock_vehicle = _make_mock_vehicle(tank_capacity=None)
-
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
         mock_db.execute.return_value = mock_result
 
         with patch(
-            "app.services.auth.get_vehicle_or_403",
+            "app.services.auth.check_vehicle_access",
             new_callable=AsyncMock,
-            return_value=mock_vehicle,
         ):
             result = await service.get_def_analytics("TEST_VIN", MagicMock())
 
@@ -73,8 +63,6 @@ class TestDEFAnalytics:
         mock_db = AsyncMock()
         service = DEFRecordService(mock_db)
 
-        mock_vehicle = _make_mock_vehicle(tank_capacity=Decimal("5.0"))
-
         # No fill_level set — avoids the tank capacity lookup code path
         records = [
             _make_mock_record(date(2024, 1, 1), 10000, Decimal("2.5"), Decimal("15.00")),
@@ -86,9 +74,8 @@ class TestDEFAnalytics:
         mock_db.execute.return_value = mock_result
 
         with patch(
-            "app.services.auth.get_vehicle_or_403",
+            "app.services.auth.check_vehicle_access",
             new_callable=AsyncMock,
-            return_value=mock_vehicle,
         ):
             result = await service.get_def_analytics("TEST_VIN", MagicMock())
 
@@ -103,8 +90,6 @@ class TestDEFAnalytics:
         mock_db = AsyncMock()
         service = DEFRecordService(mock_db)
 
-        mock_vehicle = _make_mock_vehicle(tank_capacity=Decimal("5.0"))
-
         # No fill_level — avoids tank capacity lookup code path
         records = [
             _make_mock_record(
@@ -121,9 +106,8 @@ class TestDEFAnalytics:
         mock_db.execute.return_value = mock_result
 
         with patch(
-            "app.services.auth.get_vehicle_or_403",
+            "app.services.auth.check_vehicle_access",
             new_callable=AsyncMock,
-            return_value=mock_vehicle,
         ):
             result = await service.get_def_analytics("TEST_VIN", MagicMock())
 
@@ -139,8 +123,6 @@ class TestDEFAnalytics:
         mock_db = AsyncMock()
         service = DEFRecordService(mock_db)
 
-        mock_vehicle = _make_mock_vehicle(tank_capacity=Decimal("5.0"))
-
         # 3 purchase records ~30 days apart, plus 2 auto-synced records in between
         records = [
             _make_mock_record(date(2024, 1, 1), 10000, Decimal("2.5"), Decimal("15.00")),
@@ -171,9 +153,8 @@ class TestDEFAnalytics:
         mock_db.execute.return_value = mock_result
 
         with patch(
-            "app.services.auth.get_vehicle_or_403",
+            "app.services.auth.check_vehicle_access",
             new_callable=AsyncMock,
-            return_value=mock_vehicle,
         ):
             result = await service.get_def_analytics("TEST_VIN", MagicMock())
 
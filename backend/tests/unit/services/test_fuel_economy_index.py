@@ -0,0 +1,165 @@
+"""Unit tests for the per-vehicle fuel economy index.
+
+The index must agree with a full rescan (``compute_full_tank_economy`` /
+``compute_full_tank_hours_economy``) after any sequence of inserts, edits
+and deletes, while only re-scoring the intervals each change touches.
+"""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models.fuel import FuelRecord
+from app.services.fuel_economy_index import FillUp, FuelEconomyIndex
+from app.services.fuel_service import (
+    compute_full_tank_economy,
+    compute_full_tank_hours_economy,
+)
+
+
+def _fr(
+    record_id: int,
+    odometer: str | None,
+    liters: str | None,
+    *,
+    hours: str | None = None,
+    cost: str | None = None,
+    full: bool = True,
+    hauling: bool = False,
+    missed: bool = False,
+    day: int = 0,
+) -> FuelRecord:
+    """Terse FuelRecord factory with an explicit id."""
+    return FuelRecord(
+        id=record_id,
+        vin="ECONINDEX00000000",
+        date=date(2026, 1, 1) + timedelta(days=day),
+        odometer_km=Decimal(odometer) if odometer is not None else None,
+        engine_hours=Decimal(hours) if hours is not None else None,
+        liters=Decimal(liters) if liters is not None else None,
+        cost=Decimal(cost) if cost is not None else None,
+        is_full_tank=full,
+        is_hauling=hauling,
+        missed_fillup=missed,
+    )
+
+
+def _rescan(records: list[FuelRecord]) -> tuple[dict, dict]:
+    """Per-record figures the way the old full-history list path computed them."""
+    by_odometer = sorted(
+        (r for r in records if r.odometer_km is not None),
+        key=lambda r: (r.odometer_km, r.date, r.id),
+    )
+    by_hours = sorted(
+        (r for r in records if r.engine_hours is not None),
+        key=lambda r: (r.engine_hours, r.date, r.id),
+    )
+    distance = {r.id: value for r, value in compute_full_tank_economy(by_odometer)}
+    hours = {
+        r.id: l_per_hr
+        for r, l_per_hr, _ in compute_full_tank_hours_economy(by_hours)
+        if l_per_hr is not None
+    }
+    return distance, hours
+
+
+def _figures(index: FuelEconomyIndex, records: list[FuelRecord]) -> tuple[dict, dict]:
+    distance = {r.id: v for r in records if (v := index.l_per_100km(r.id)) is not None}
+    hours = {r.id: v for r in records if (v := index.l_per_hr(r.id)) is not None}
+    return distance, hours
+
+
+@pytest.mark.unit
+@pytest.mark.fuel
+class TestFuelEconomyIndex:
+    def test_partial_folds_into_next_full_tank(self) -> None:
+        """Partials count toward the next endpoint, as in the rescan (issue #113)."""
+        records = [
+            _fr(1, "1000", "40.000"),
+            _fr(2, "1200", "10.000", full=False),
+            _fr(3, "1500", "30.000"),
+        ]
+        index = FuelEconomyIndex(FillUp.from_record(r) for r in records)
+
+        # (10 + 30) L over 500 km
+        assert index.l_per_100km(3) == Decimal("8.00")
+        assert index.l_per_100km(1) is None
+        assert index.l_per_100km(2) is None
+
+    def test_insert_between_endpoints_rescores_the_interval(self) -> None:
+        """A back-dated fill-up changes the endpoint after it, not the one before."""
+        records = [_fr(1, "1000", "40.000"), _fr(2, "1500", "30.000"), _fr(3, "2000", "35.000")]
+        index = FuelEconomyIndex(FillUp.from_record(r) for r in records)
+        assert index.l_per_100km(2) == Decimal("6.00")
+
+        inserted = _fr(4, "1250", "20.000")
+        index.upsert(inserted)
+
+        assert index.l_per_100km(4) == Decimal("8.00")  # 20 L over 250 km
+        assert index.l_per_100km(2) == Decimal("12.00")  # 30 L over 250 km
+        assert index.l_per_100km(3) == Decimal("7.00")  # untouched
+
+    def test_delete_endpoint_merges_intervals(self) -> None:
+        """Removing an endpoint re-anchors the next one on the endpoint before it."""
+        records = [_fr(1, "1000", "40.000"), _fr(2, "1500", "30.000"), _fr(3, "2000", "35.000")]
+        index = FuelEconomyIndex(FillUp.from_record(r) for r in records)
+
+        index.remove(2)
+
+        assert index.l_per_100km(2) is None
+        assert index.l_per_100km(3) == Decimal("3.50")  # 35 L over 1000 km
+
+    def test_hours_axis_tracks_engine_hours(self) -> None:
+        """L/hr is scored on the engine-hours axis independently of odometer."""
+        records = [
+            _fr(1, None, "20.000", hours="100.0", cost="30.00"),
+            _fr(2, None, "10.000", hours="110.0", cost="18.00", full=False),
+            _fr(3, None, "15.000", hours="120.0", cost="25.00"),
+        ]
+        index = FuelEconomyIndex(FillUp.from_record(r) for r in records)
+
+        assert index.l_per_hr(3) == Decimal("1.25")
+        assert index.l_per_100km(3) is None
+
+    def test_random_edits_match_full_rescan(self) -> None:
+        """Any sequence of upserts and deletes leaves the index equal to a rescan."""
+        rng = random.Random(20260101)
+        records: dict[int, FuelRecord] = {}
+
+        def random_record(record_id: int) -> FuelRecord:
+            return _fr(
+                record_id,
+                str(rng.randint(0, 400) * 25) if rng.random() > 0.1 else None,
+                f"{rng.uniform(0, 60):.3f}" if rng.random() > 0.05 else None,
+                hours=f"{rng.randint(0, 400) / 2:.1f}" if rng.random() > 0.3 else None,
+                cost=f"{rng.uniform(0, 90):.2f}" if rng.random() > 0.1 else None,
+                full=rng.random() > 0.35,
+                hauling=rng.random() > 0.85,
+                missed=rng.random() > 0.9,
+                day=rng.randint(0, 60),
+            )
+
+        for record_id in range(1, 41):
+            records[record_id] = random_record(record_id)
+        index = FuelEconomyIndex(FillUp.from_record(r) for r in records.values())
+        assert _figures(index, list(records.values())) == _rescan(list(records.values()))
+
+        next_id = 41
+        for _ in range(300):
+            op = rng.random()
+            if op < 0.4 or not records:
+                records[next_id] = random_record(next_id)
+                index.upsert(records[next_id])
+                next_id += 1
+            elif op < 0.75:
+                record_id = rng.choice(list(records))
+                records[record_id] = random_record(record_id)
+                index.upsert(records[record_id])
+            else:
+                record_id = rng.choice(list(records))
+                del records[record_id]
+                index.remove(record_id)
+
+            assert _figures(index, list(records.values())) == _rescan(list(records.values()))
@@ -0,0 +1,187 @@
+"""Tests for the photo derivative pipeline and derivative serving."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from sqlalchemy import select
+
+from app.config import settings
+from app.models.photo import VehiclePhoto
+from app.services.image_pipeline import (
+    backfill_derivatives,
+    content_hash,
+    derivative_dir,
+)
+from app.utils.image_derivatives import (
+    MANIFEST_NAME,
+    InvalidImageError,
+    available_formats,
+    render_derivatives,
+)
+
+
+def _jpeg(width: int, height: int, color: tuple[int, int, int]) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+async def _upload(
+    client, headers, vin: str, contents: bytes, name: str = "car.jpg", caption: str | None = None
+):
+    return await client.post(
+        f"/api/vehicles/{vin}/photos",
+        files={"file": (name, BytesIO(contents), "image/jpeg")},
+        data={"caption": caption} if caption else None,
+        headers=headers,
+    )
+
+
+@pytest.mark.unit
+class TestRenderDerivatives:
+    def test_renders_every_size_and_format_without_upscaling(self, tmp_path):
+        target = tmp_path / "abc"
+        manifest = render_derivatives(_jpeg(1600, 900, (200, 30, 30)), str(target))
+
+        assert manifest["width"] == 1600
+        assert manifest["sizes"] == {"sm": [480, 270], "md": [1280, 720], "lg": [1600, 900]}
+        for size in ("sm", "md", "lg"):
+            for ext in available_formats():
+                assert (target / f"{size}.{ext}").is_file()
+        with Image.open(target / "sm.webp") as sm:
+            assert sm.size == (480, 270)
+        assert (target / "thumb.jpg").is_file()
+        assert (target / MANIFEST_NAME).is_file()
+        # The staging directory was renamed into place
+        assert [p.name for p in tmp_path.iterdir()] == ["abc"]
+
+    def test_undecodable_bytes_are_rejected_without_output(self, tmp_path):
+        with pytest.raises(InvalidImageError):
+            render_derivatives(b"\xff\xd8\xff\xe0 not really a jpeg", str(tmp_path / "bad"))
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPhotoDerivativeRoutes:
+    async def test_upload_renders_variants_served_by_accept(
+        self, client, auth_headers, test_vehicle
+    ):
+        vin = test_vehicle["vin"]
+        response = await _upload(client, auth_headers, vin, _jpeg(1400, 1000, (10, 120, 40)))
+        assert response.status_code == 201
+        photo = response.json()
+        assert set(photo["variants"]) == {"sm", "md", "lg"}
+
+        webp = await client.get(
+            photo["variants"]["md"], headers={**auth_headers, "Accept": "image/webp,*/*"}
+        )
+        assert webp.status_code == 200
+        assert webp.headers["content-type"] == "image/webp"
+        assert "Accept" in webp.headers["vary"]
+        with Image.open(BytesIO(webp.content)) as image:
+            assert max(image.size) == 1280
+
+        jpeg = await client.get(photo["variants"]["sm"], headers=auth_headers)
+        assert jpeg.headers["content-type"] == "image/jpeg"
+
+        etag = webp.headers["etag"]
+        not_modified = await client.get(
+            photo["variants"]["md"],
+            headers={**auth_headers, "Accept": "image/webp", "If-None-Match": etag},
+        )
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+    async def test_original_and_thumbnail_revalidate(self, client, auth_headers, test_vehicle):
+        vin = test_vehicle["vin"]
+        photo = (await _upload(client, auth_headers, vin, _jpeg(300, 200, (1, 2, 3)))).json()
+
+        for url in (photo["path"], photo["thumbnail_url"]):
+            first = await client.get(url, headers=auth_headers)
+            assert first.status_code == 200
+            again = await client.get(
+                url, headers={**auth_headers, "If-None-Match": first.headers["etag"]}
+            )
+            assert again.status_code == 304
+
+    async def test_identical_uploads_are_rendered_once(
+        self, client, auth_headers, test_vehicle, db_session
+    ):
+        vin = test_vehicle["vin"]
+        contents = _jpeg(640, 480, (90, 90, 200))
+        first = await _upload(client, auth_headers, vin, contents, caption="Front")
+        manifest = derivative_dir(content_hash(contents)) / MANIFEST_NAME
+        rendered_at = manifest.stat().st_mtime_ns
+
+        second = await _upload(client, auth_headers, vin, contents, "again.jpg", caption="Rear")
+
+        # A new photo of its own; the first one is left as it was
+        assert second.status_code == 201
+        assert second.json()["id"] != first.json()["id"]
+        assert second.json()["caption"] == "Rear"
+        assert manifest.stat().st_mtime_ns == rendered_at
+        rows = await db_session.execute(
+            select(VehiclePhoto)
+            .where(VehiclePhoto.content_hash == content_hash(contents))
+            .execution_options(populate_existing=True)
+        )
+        captions = {photo.id: photo.caption for photo in rows.scalars().all()}
+        assert captions == {first.json()["id"]: "Front", second.json()["id"]: "Rear"}
+
+        # The shared derivatives stay until the last photo using them is gone
+        response = await client.delete(
+            f"/api/vehicles/{vin}/photos/{second.json()['filename']}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert manifest.exists()
+
+    async def test_deleting_last_user_removes_derivatives(self, client, auth_headers, test_vehicle):
+        vin = test_vehicle["vin"]
+        contents = _jpeg(500, 500, (250, 250, 0))
+        photo = (await _upload(client, auth_headers, vin, contents)).json()
+        store = derivative_dir(content_hash(contents))
+        assert (store / MANIFEST_NAME).exists()
+
+        response = await client.delete(
+            f"/api/vehicles/{vin}/photos/{photo['filename']}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert not store.exists()
+
+    async def test_undecodable_upload_writes_nothing(self, client, auth_headers, test_vehicle):
+        vin = test_vehicle["vin"]
+        before = set((settings.photos_dir / vin).glob("*"))
+        # Valid JPEG magic bytes, undecodable body
+        response = await _upload(
+            client, auth_headers, vin, b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + b"\x00" * 64
+        )
+        assert response.status_code == 400
+        assert set((settings.photos_dir / vin).glob("*")) == before
+
+    async def test_backfill_hashes_and_renders_existing_photos(
+        self, client, db_session, test_vehicle
+    ):
+        vin = test_vehicle["vin"]
+        contents = _jpeg(800, 600, (3, 200, 200))
+        (settings.photos_dir / vin).mkdir(parents=True, exist_ok=True)
+        (settings.photos_dir / vin / "legacy.jpg").write_bytes(contents)
+        photo = VehiclePhoto(vin=vin, file_path=f"{vin}/legacy.jpg")
+        missing = VehiclePhoto(vin=vin, file_path=f"{vin}/missing.jpg")
+        db_session.add_all([photo, missing])
+        await db_session.commit()
+
+        try:
+            rendered, skipped = await backfill_derivatives(db_session)
+
+            assert rendered >= 1
+            assert skipped >= 1
+            assert photo.content_hash == content_hash(contents)
+            assert (derivative_dir(photo.content_hash) / MANIFEST_NAME).exists()
+            assert missing.content_hash is None
+        finally:
+            await db_session.delete(photo)
+            await db_session.delete(missing)
+            await db_session.commit()
@@ -13,6 +13,9 @@ from app.services.livelink_service import (
     LiveLinkService,
 )
 
+# Settings reads go through the snapshot cache behind SettingsService.get_value/get_int
+CACHED_SETTING = "app.services.settings_service.settings_cache.get"
+
 
 class TestTokenGeneration:
     """Test token generation and hashing static methods."""
@@ -131,11 +134,7 @@ class TestGlobalTokenOperations:
         test_token = "ll_test_token_123"
         token_hash = hashlib.sha256(test_token.encode()).hexdigest()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = token_hash
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=token_hash)):
             service = LiveLinkService(mock_db)
             result = await service.validate_global_token(test_token)
 
@@ -146,11 +145,7 @@ class TestGlobalTokenOperations:
         mock_db = AsyncMock()
         stored_hash = hashlib.sha256(b"correct_token").hexdigest()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = stored_hash
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=stored_hash)):
             service = LiveLinkService(mock_db)
             result = await service.validate_global_token("wrong_token")
 
@@ -160,9 +155,7 @@ class TestGlobalTokenOperations:
         """Test validation when no global token is stored."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_settings.get = AsyncMock(return_value=None)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.validate_global_token("any_token")
 
@@ -172,11 +165,7 @@ class TestGlobalTokenOperations:
         """Test validation when stored token value is empty."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = None
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.validate_global_token("any_token")
 
@@ -508,11 +497,7 @@ class TestSettingsHelpers:
         """Test is_enabled returns True when enabled."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = "true"
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value="true")):
             service = LiveLinkService(mock_db)
             result = await service.is_enabled()
 
@@ -522,11 +507,7 @@ class TestSettingsHelpers:
         """Test is_enabled returns False when disabled."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = "false"
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value="false")):
             service = LiveLinkService(mock_db)
             result = await service.is_enabled()
 
@@ -536,9 +517,7 @@ class TestSettingsHelpers:
         """Test is_enabled returns False when setting doesn't exist."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_settings.get = AsyncMock(return_value=None)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.is_enabled()
 
@@ -548,11 +527,7 @@ class TestSettingsHelpers:
         """Test getting session timeout when configured."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = "10"
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value="10")):
             service = LiveLinkService(mock_db)
             result = await service.get_session_timeout_minutes()
 
@@ -562,9 +537,7 @@ class TestSettingsHelpers:
         """Test getting session timeout default when not configured."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_settings.get = AsyncMock(return_value=None)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.get_session_timeout_minutes()
 
@@ -574,11 +547,7 @@ class TestSettingsHelpers:
         """Test getting device offline timeout when configured."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = "30"
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value="30")):
             service = LiveLinkService(mock_db)
             result = await service.get_device_offline_timeout_minutes()
 
@@ -588,9 +557,7 @@ class TestSettingsHelpers:
         """Test getting device offline timeout default."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_settings.get = AsyncMock(return_value=None)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.get_device_offline_timeout_minutes()
 
@@ -600,11 +567,7 @@ class TestSettingsHelpers:
         """Test getting retention days when configured."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = "365"
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value="365")):
             service = LiveLinkService(mock_db)
             result = await service.get_retention_days()
 
@@ -614,9 +577,7 @@ class TestSettingsHelpers:
         """Test getting retention days default."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_settings.get = AsyncMock(return_value=None)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.get_retention_days()
 
@@ -626,11 +587,7 @@ class TestSettingsHelpers:
         """Test getting alert cooldown when configured."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_setting = MagicMock()
-            mock_setting.value = "60"
-            mock_settings.get = AsyncMock(return_value=mock_setting)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value="60")):
             service = LiveLinkService(mock_db)
             result = await service.get_alert_cooldown_minutes()
 
@@ -640,9 +597,7 @@ class TestSettingsHelpers:
         """Test getting alert cooldown default."""
         mock_db = AsyncMock()
 
-        with patch("app.services.livelink_service.SettingsService") as mock_settings:
-            mock_settings.get = AsyncMock(return_value=None)
-
+        with patch(CACHED_SETTING, AsyncMock(return_value=None)):
             service = LiveLinkService(mock_db)
             result = await service.get_alert_cooldown_minutes()
 
@@ -0,0 +1,223 @@
+"""Tests for the NHTSA decode/recall caches and the weekly recall sweep.
+
+NHTSA is replaced by a local stub behind an ``httpx.MockTransport``: it
+answers vPIC's batch decode and the recalls API from fixed tables and
+records every request, so the tests can count round trips.
+"""
+
+import itertools
+import time
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+
+from app.models import NHTSARecallCache, NHTSAVINDecode, Recall, Setting, Vehicle
+from app.models.notification_outbox import NotificationOutbox
+from app.services import nhtsa
+from app.services.nhtsa import NHTSAService, TokenBucket
+from app.tasks.scheduled import check_recalls_all_vehicles, job_stats
+
+_SEQ = itertools.count()
+
+
+class StubNHTSA:
+    """Answers vPIC batch decodes and recallsByVehicle requests."""
+
+    def __init__(self) -> None:
+        self.vehicles: dict[str, tuple[str, str, str]] = {}
+        self.recalls: dict[tuple[str, str, str], list[dict]] = {}
+        self.etag = '"v1"'
+        self.failing: set[str] = set()
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("/DecodeVINValuesBatch/"):
+            form = parse_qs(request.content.decode())
+            if self.failing & set(form["data"][0].split(";")):
+                return httpx.Response(500)
+            results = []
+            for vin in form["data"][0].split(";"):
+                make, model, year = self.vehicles.get(vin, ("", "", ""))
+                results.append({"VIN": vin, "Make": make, "Model": model, "ModelYear": year})
+            return httpx.Response(200, json={"Count": len(results), "Results": results})
+        if request.url.path.endswith("/recallsByVehicle"):
+            if request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            query = parse_qs(urlparse(str(request.url)).query)
+            key = (query["make"][0], query["model"][0], query["modelYear"][0])
+            results = self.recalls.get(key, [])
+            return httpx.Response(
+                200, json={"Count": len(results), "results": results}, headers={"ETag": self.etag}
+            )
+        return httpx.Response(404)
+
+    def count(self, suffix: str) -> int:
+        return sum(1 for r in self.requests if r.url.path.endswith(suffix))
+
+
+def _vin() -> str:
+    return f"NHTSATEST{next(_SEQ):08d}"
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """A fresh stub, with the shared rate limiter opened up for the tests."""
+    monkeypatch.setattr(nhtsa, "rate_limiter", TokenBucket(rate=1000.0, burst=1000.0))
+    return StubNHTSA()
+
+
+@pytest_asyncio.fixture
+async def clean_caches(db_session):
+    await db_session.execute(delete(NHTSAVINDecode))
+    await db_session.execute(delete(NHTSARecallCache))
+    await db_session.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestNHTSACaches:
+    async def test_uncached_vins_are_decoded_in_one_batch_and_kept(
+        self, db_session, stub, clean_caches
+    ):
+        vins = [_vin() for _ in range(3)]
+        for vin in vins[:2]:
+            stub.vehicles[vin] = ("HONDA", "Civic", "2021")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(stub.handler)) as client:
+            service = NHTSAService(client=client)
+            decoded = await service.decode_vins(vins, db_session)
+            assert stub.count("/DecodeVINValuesBatch/") == 1
+            assert set(decoded) == set(vins[:2])
+            assert decoded[vins[0]]["year"] == 2021
+
+            # Decoded VINs come from the table; the undecodable one is retried
+            again = await service.decode_vins(vins, db_session)
+            assert again == decoded
+            assert stub.count("/DecodeVINValuesBatch/") == 2
+            assert "data=" + vins[2] in stub.requests[-1].content.decode()
+
+    async def test_recall_lists_are_shared_and_refreshed_conditionally(
+        self, db_session, stub, clean_caches
+    ):
+        first, second = _vin(), _vin()
+        stub.vehicles[first] = stub.vehicles[second] = ("FORD", "F-150", "2019")
+        stub.recalls[("FORD", "F-150", "2019")] = [{"NHTSACampaignNumber": "19V001000"}]
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(stub.handler)) as client:
+            service = NHTSAService(client=client)
+            assert await service.get_vehicle_recalls(first, db_session) == [
+                {"NHTSACampaignNumber": "19V001000"}
+            ]
+            assert await service.get_vehicle_recalls(second, db_session) == [
+                {"NHTSACampaignNumber": "19V001000"}
+            ]
+            assert stub.count("/recallsByVehicle") == 1
+
+            # Past the cache age the list is revalidated; a 304 keeps it
+            row = await db_session.scalar(select(NHTSARecallCache))
+            row.checked_at -= timedelta(days=2)
+            assert len(await service.get_vehicle_recalls(first, db_session)) == 1
+            assert stub.count("/recallsByVehicle") == 2
+            assert stub.requests[-1].headers["If-None-Match"] == '"v1"'
+
+    async def test_token_bucket_spaces_requests(self):
+        bucket = TokenBucket(rate=50.0, burst=1.0)
+        started = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        # The first token is free, the next three wait 20 ms each
+        assert time.monotonic() - started >= 0.055
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRecallSweep:
+    async def test_sweep_fetches_each_vehicle_type_once_and_queues_notices(
+        self, db_session, test_sessionmaker, test_user, stub, clean_caches, monkeypatch
+    ):
+        vins = [_vin() for _ in range(3)]
+        for i, vin in enumerate(vins):
+            db_session.add(
+                Vehicle(vin=vin, user_id=test_user["id"], nickname=f"Sweep {i}", vehicle_type="Car")
+            )
+            stub.vehicles[vin] = ("TOYOTA", "Tacoma", "2020")
+        stub.recalls[("TOYOTA", "Tacoma", "2020")] = [
+            {"NHTSACampaignNumber": "20V100000", "Component": "BRAKES", "Summary": "x"},
+            {"NHTSACampaignNumber": "20V200000", "Component": "AIR BAGS", "Summary": "y"},
+        ]
+        # One vehicle already has the first campaign on file
+        db_session.add(Recall(vin=vins[0], nhtsa_campaign_number="20V100000", component="B"))
+        await db_session.commit()
+        monkeypatch.setattr("app.tasks.scheduled.AsyncSessionLocal", test_sessionmaker)
+
+        await check_recalls_all_vehicles(transport=httpx.MockTransport(stub.handler))
+
+        # Other tests' vehicles are swept too but decode to nothing
+        assert stub.count("/recallsByVehicle") == 1
+        campaigns = (
+            await db_session.execute(
+                select(Recall.vin, Recall.nhtsa_campaign_number).where(Recall.vin.in_(vins))
+            )
+        ).all()
+        assert len(campaigns) == 6
+        notices = (
+            await db_session.scalars(
+                select(NotificationOutbox.message).where(
+                    NotificationOutbox.event_type == "recall_detected",
+                    NotificationOutbox.title.like("Recall Alert: Sweep %"),
+                )
+            )
+        ).all()
+        assert sorted(notices) == [
+            "1 new recall(s) detected for Sweep 0. Please review and take appropriate action.",
+            "2 new recall(s) detected for Sweep 1. Please review and take appropriate action.",
+            "2 new recall(s) detected for Sweep 2. Please review and take appropriate action.",
+        ]
+        assert job_stats["check_recalls_all_vehicles"]["new_recalls"] == 5
+
+        for model in (Recall, Vehicle):
+            await db_session.execute(delete(model).where(model.vin.in_(vins)))
+        await db_session.execute(
+            delete(NotificationOutbox).where(NotificationOutbox.title.like("Recall Alert: Sweep %"))
+        )
+        await db_session.commit()
+
+    async def test_failed_decode_batch_skips_only_its_vehicles(
+        self, db_session, test_sessionmaker, test_user, stub, clean_caches, monkeypatch
+    ):
+        good, bad = _vin(), _vin()
+        for vin in (good, bad):
+            db_session.add(
+                Vehicle(vin=vin, user_id=test_user["id"], nickname="Batch", vehicle_type="Car")
+            )
+            stub.vehicles[vin] = ("MAZDA", "CX-5", "2022")
+        stub.failing.add(bad)
+        stub.recalls[("MAZDA", "CX-5", "2022")] = [{"NHTSACampaignNumber": "22V300000"}]
+        await db_session.execute(delete(Setting).where(Setting.key == "nhtsa_last_check"))
+        await db_session.commit()
+        monkeypatch.setattr(nhtsa, "DECODE_BATCH_SIZE", 1)
+        monkeypatch.setattr("app.tasks.scheduled.AsyncSessionLocal", test_sessionmaker)
+
+        await check_recalls_all_vehicles(transport=httpx.MockTransport(stub.handler))
+
+        campaigns = (
+            await db_session.scalars(select(Recall.vin).where(Recall.vin.in_([good, bad])))
+        ).all()
+        assert campaigns == [good]
+        last_check = await db_session.scalar(
+            select(Setting.value).where(Setting.key == "nhtsa_last_check")
+        )
+        assert last_check is not None
+        assert job_stats["check_recalls_all_vehicles"]["new_recalls"] >= 1
+
+        for model in (Recall, Vehicle):
+            await db_session.execute(delete(model).where(model.vin.in_([good, bad])))
+        await db_session.execute(
+            delete(NotificationOutbox).where(NotificationOutbox.title.like("Recall Alert: Batch%"))
+        )
+        await db_session.commit()
@@ -93,7 +93,7 @@ class TestNotificationDispatcher:
     @pytest.mark.asyncio
     async def test_dispatch_returns_empty_when_event_disabled(self, dispatcher):
         """Test dispatch returns empty dict when event type is disabled."""
-        with patch.object(dispatcher, "_is_event_enabled", return_value=False):
+        with patch.object(dispatcher, "is_event_enabled", return_value=False):
             results = await dispatcher.dispatch("recall_detected", "Title", "Message")
 
         assert results == {}
@@ -102,8 +102,8 @@ class TestNotificationDispatcher:
     async def test_dispatch_returns_empty_when_no_services(self, dispatcher):
         """Test dispatch returns empty dict when no services enabled."""
         with (
-            patch.object(dispatcher, "_is_event_enabled", return_value=True),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[]),
+            patch.object(dispatcher, "is_event_enabled", return_value=True),
+            patch.object(dispatcher, "get_enabled_services", return_value=[]),
         ):
             results = await dispatcher.dispatch("recall_detected", "Title", "Message")
 
@@ -115,10 +115,10 @@ class TestNotificationDispatcher:
         fake_service = FakeNotificationService(should_succeed=True)
 
         with (
-            patch.object(dispatcher, "_is_event_enabled", return_value=True),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[fake_service]),
-            patch.object(dispatcher, "_get_setting_int", return_value=3),
-            patch.object(dispatcher, "_get_setting", return_value="2.0"),
+            patch.object(dispatcher, "is_event_enabled", return_value=True),
+            patch.object(dispatcher, "get_enabled_services", return_value=[fake_service]),
+            patch.object(dispatcher, "get_setting_int", return_value=3),
+            patch.object(dispatcher, "get_setting", return_value="2.0"),
         ):
             results = await dispatcher.dispatch(
                 "service_due",
@@ -129,7 +129,8 @@ class TestNotificationDispatcher:
         assert results == {"fake": True}
         assert len(fake_service.sent_messages) == 1
         assert fake_service.sent_messages[0]["title"] == "Service Due"
-        assert fake_service.closed is True
+        # Services are shared by the registry and stay open across dispatches
+        assert fake_service.closed is False
 
     @pytest.mark.asyncio
     async def test_dispatch_uses_default_priority(self, dispatcher):
@@ -137,10 +138,10 @@ class TestNotificationDispatcher:
         fake_service = FakeNotificationService(should_succeed=True)
 
         with (
-            patch.object(dispatcher, "_is_event_enabled", return_value=True),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[fake_service]),
-            patch.object(dispatcher, "_get_setting_int", return_value=3),
-            patch.object(dispatcher, "_get_setting", return_value="2.0"),
+            patch.object(dispatcher, "is_event_enabled", return_value=True),
+            patch.object(dispatcher, "get_enabled_services", return_value=[fake_service]),
+            patch.object(dispatcher, "get_setting_int", return_value=3),
+            patch.object(dispatcher, "get_setting", return_value="2.0"),
         ):
             await dispatcher.dispatch("recall_detected", "Alert", "Recall found")
 
@@ -153,10 +154,10 @@ class TestNotificationDispatcher:
         fake_service.send_with_retry = AsyncMock(return_value=True)
 
         with (
-            patch.object(dispatcher, "_is_event_enabled", return_value=True),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[fake_service]),
-            patch.object(dispatcher, "_get_setting_int", return_value=3),
-            patch.object(dispatcher, "_get_setting", return_value="2.0"),
+            patch.object(dispatcher, "is_event_enabled", return_value=True),
+            patch.object(dispatcher, "get_enabled_services", return_value=[fake_service]),
+            patch.object(dispatcher, "get_setting_int", return_value=3),
+            patch.object(dispatcher, "get_setting", return_value="2.0"),
         ):
             await dispatcher.dispatch("recall_detected", "Alert", "High priority")
 
@@ -169,15 +170,15 @@ class TestNotificationDispatcher:
         failing_service.send = AsyncMock(side_effect=Exception("Connection failed"))
 
         with (
-            patch.object(dispatcher, "_is_event_enabled", return_value=True),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[failing_service]),
-            patch.object(dispatcher, "_get_setting_int", return_value=3),
-            patch.object(dispatcher, "_get_setting", return_value="2.0"),
+            patch.object(dispatcher, "is_event_enabled", return_value=True),
+            patch.object(dispatcher, "get_enabled_services", return_value=[failing_service]),
+            patch.object(dispatcher, "get_setting_int", return_value=3),
+            patch.object(dispatcher, "get_setting", return_value="2.0"),
         ):
             results = await dispatcher.dispatch("service_due", "Title", "Message")
 
         assert results == {"fake": False}
-        assert failing_service.closed is True
+        assert failing_service.closed is False
 
     @pytest.mark.asyncio
     async def test_dispatch_multiple_services(self, dispatcher):
@@ -188,10 +189,10 @@ class TestNotificationDispatcher:
         service2.service_name = "discord"
 
         with (
-            patch.object(dispatcher, "_is_event_enabled", return_value=True),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[service1, service2]),
-            patch.object(dispatcher, "_get_setting_int", return_value=3),
-            patch.object(dispatcher, "_get_setting", return_value="2.0"),
+            patch.object(dispatcher, "is_event_enabled", return_value=True),
+            patch.object(dispatcher, "get_enabled_services", return_value=[service1, service2]),
+            patch.object(dispatcher, "get_setting_int", return_value=3),
+            patch.object(dispatcher, "get_setting", return_value="2.0"),
         ):
             results = await dispatcher.dispatch("service_due", "Title", "Message")
 
@@ -202,16 +203,16 @@ class TestNotificationDispatcher:
     @pytest.mark.asyncio
     async def test_is_event_enabled_unknown_event(self, dispatcher):
         """Test unknown event types are allowed by default."""
-        with patch.object(dispatcher, "_has_any_service_enabled", return_value=True):
-            result = await dispatcher._is_event_enabled("unknown_event")
+        with patch.object(dispatcher, "has_any_service_enabled", return_value=True):
+            result = await dispatcher.is_event_enabled("unknown_event")
 
         assert result is True
 
     @pytest.mark.asyncio
     async def test_is_event_enabled_no_services(self, dispatcher):
         """Test event is disabled when no services are enabled."""
-        with patch.object(dispatcher, "_has_any_service_enabled", return_value=False):
-            result = await dispatcher._is_event_enabled("recall_detected")
+        with patch.object(dispatcher, "has_any_service_enabled", return_value=False):
+            result = await dispatcher.is_event_enabled("recall_detected")
 
         assert result is False
 
@@ -219,10 +220,10 @@ class TestNotificationDispatcher:
     async def test_is_event_enabled_def_low_disabled_by_toggle(self, dispatcher):
         """Test def_low is disabled when notify_def_low toggle is false (services otherwise on)."""
         with (
-            patch.object(dispatcher, "_has_any_service_enabled", return_value=True),
+            patch.object(dispatcher, "has_any_service_enabled", return_value=True),
             patch.object(dispatcher, "_get_setting_bool", return_value=False),
         ):
-            result = await dispatcher._is_event_enabled("def_low")
+            result = await dispatcher.is_event_enabled("def_low")
 
         assert result is False
 
@@ -232,9 +233,9 @@ class TestNotificationDispatcher:
         fake_service = FakeNotificationService(should_succeed=True)
 
         with (
-            patch.object(dispatcher, "_has_any_service_enabled", return_value=True),
+            patch.object(dispatcher, "has_any_service_enabled", return_value=True),
             patch.object(dispatcher, "_get_setting_bool", return_value=False),
-            patch.object(dispatcher, "_get_enabled_services", return_value=[fake_service]),
+            patch.object(dispatcher, "get_enabled_services", return_value=[fake_service]),
         ):
             results = await dispatcher.dispatch("def_low", "DEF Low", "DEF is low")
 
@@ -245,7 +246,7 @@ class TestNotificationDispatcher:
     async def test_get_setting_bool_true_values(self, dispatcher):
         """Test boolean setting parsing for true values."""
         for val in ("true", "1", "yes", "True", "YES"):
-            with patch.object(dispatcher, "_get_setting", return_value=val):
+            with patch.object(dispatcher, "get_setting", return_value=val):
                 result = await dispatcher._get_setting_bool("key")
                 assert result is True, f"Expected True for '{val}'"
 
@@ -253,22 +254,22 @@ class TestNotificationDispatcher:
     async def test_get_setting_bool_false_values(self, dispatcher):
         """Test boolean setting parsing for false values."""
         for val in ("false", "0", "no", ""):
-            with patch.object(dispatcher, "_get_setting", return_value=val):
+            with patch.object(dispatcher, "get_setting", return_value=val):
                 result = await dispatcher._get_setting_bool("key")
                 assert result is False, f"Expected False for '{val}'"
 
     @pytest.mark.asyncio
     async def test_get_setting_int_valid(self, dispatcher):
         """Test integer setting parsing."""
-        with patch.object(dispatcher, "_get_setting", return_value="42"):
-            result = await dispatcher._get_setting_int("key")
+        with patch.object(dispatcher, "get_setting", return_value="42"):
+            result = await dispatcher.get_setting_int("key")
             assert result == 42
 
     @pytest.mark.asyncio
     async def test_get_setting_int_invalid_returns_default(self, dispatcher):
         """Test integer setting returns default on parse failure."""
-        with patch.object(dispatcher, "_get_setting", return_value="not-a-number"):
-            result = await dispatcher._get_setting_int("key", default=5)
+        with patch.object(dispatcher, "get_setting", return_value="not-a-number"):
+            result = await dispatcher.get_setting_int("key", default=5)
             assert result == 5
 
 
@@ -0,0 +1,194 @@
+"""Tests for the notification outbox worker.
+
+Rows queued by ``enqueue_notification`` are fanned out to every enabled
+service and delivered off the request path: services run concurrently, sends
+to one service are spaced by its minimum interval, failures back off and
+eventually dead-letter, and disabled events are dropped without sending.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, update
+
+from app.models.notification_outbox import NotificationOutbox
+from app.services.notifications import outbox
+from app.services.notifications.base import NotificationService
+from app.services.notifications.dispatcher import NotificationDispatcher
+from app.services.notifications.outbox import NotificationOutboxWorker, enqueue_notification
+from app.services.settings_service import SettingsService
+from app.utils.datetime_utils import utc_now
+
+
+class FakeService(NotificationService):
+    """Records sends; fails while ``failures`` is positive."""
+
+    def __init__(self, name: str, failures: int = 0, delay: float = 0.0):
+        self.service_name = name
+        self.failures = failures
+        self.delay = delay
+        self.sent: list[tuple[str, float]] = []
+
+    async def send(self, title, message, priority="default", tags=None, url=None) -> bool:
+        started = time.monotonic()
+        await asyncio.sleep(self.delay)
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError(f"{self.service_name} unavailable")
+        self.sent.append((title, started))
+        return True
+
+    async def test_connection(self) -> tuple[bool, str]:
+        return True, "ok"
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest_asyncio.fixture
+async def worker(db_session, test_sessionmaker, monkeypatch):
+    """A worker on the test database with an empty outbox and no throttling."""
+    await db_session.execute(delete(NotificationOutbox))
+    await db_session.commit()
+    monkeypatch.setattr(outbox, "SERVICE_MIN_INTERVAL_SECONDS", {})
+    return NotificationOutboxWorker(test_sessionmaker)
+
+
+def _use_services(monkeypatch, *services: FakeService, event_enabled: bool = True) -> None:
+    async def _enabled(self):
+        return list(services)
+
+    async def is_event_enabled(self, event_type):
+        return event_enabled
+
+    monkeypatch.setattr(NotificationDispatcher, "get_enabled_services", _enabled)
+    monkeypatch.setattr(NotificationDispatcher, "is_event_enabled", is_event_enabled)
+
+
+async def _rows(db_session) -> list[NotificationOutbox]:
+    return list(
+        (
+            await db_session.scalars(
+                select(NotificationOutbox)
+                .order_by(NotificationOutbox.id)
+                .execution_options(populate_existing=True)
+            )
+        ).all()
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestNotificationOutbox:
+    async def test_event_fans_out_and_is_delivered_to_each_service(
+        self, db_session, worker, monkeypatch
+    ):
+        ntfy, discord = FakeService("ntfy"), FakeService("discord")
+        _use_services(monkeypatch, ntfy, discord)
+        enqueue_notification(db_session, "livelink_threshold_alert", "Alert", "Too hot")
+        await db_session.commit()
+
+        assert await worker.run_once() == 2
+
+        assert [title for title, _ in ntfy.sent] == ["Alert"]
+        assert [title for title, _ in discord.sent] == ["Alert"]
+        rows = await _rows(db_session)
+        assert sorted(row.service for row in rows) == ["discord", "ntfy"]
+        assert all(row.status == "sent" and row.sent_at is not None for row in rows)
+        assert all(row.priority == "high" and row.attempts == 1 for row in rows)
+
+        # Nothing left to do
+        assert await worker.run_once() == 0
+        assert len(ntfy.sent) == 1
+
+    async def test_disabled_event_is_dropped(self, db_session, worker, monkeypatch):
+        ntfy = FakeService("ntfy")
+        _use_services(monkeypatch, ntfy, event_enabled=False)
+        enqueue_notification(db_session, "livelink_threshold_alert", "Alert", "Too hot")
+        await db_session.commit()
+
+        assert await worker.run_once() == 0
+        assert ntfy.sent == []
+        assert await _rows(db_session) == []
+
+    async def test_failures_back_off_then_dead_letter(self, db_session, worker, monkeypatch):
+        await SettingsService.set(db_session, "notification_retry_attempts", "2")
+        await SettingsService.set(db_session, "notification_retry_delay", "30")
+        failing, healthy = FakeService("slack", failures=5), FakeService("ntfy")
+        _use_services(monkeypatch, failing, healthy)
+        enqueue_notification(db_session, "service_due", "Due", "Oil change")
+        await db_session.commit()
+
+        # The healthy service is not held back by the failing one
+        assert await worker.run_once() == 1
+        slack_row = next(r for r in await _rows(db_session) if r.service == "slack")
+        assert slack_row.status == "pending"
+        assert slack_row.attempts == 1
+        assert slack_row.last_error == "slack unavailable"
+        # 30s base delay x 1.2 slack multiplier
+        assert slack_row.next_attempt_at > utc_now() + timedelta(seconds=30)
+
+        # Not due yet
+        assert await worker.run_once() == 0
+        assert failing.failures == 4
+
+        await db_session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id == slack_row.id)
+            .values(next_attempt_at=utc_now() - timedelta(seconds=1))
+        )
+        await db_session.commit()
+        assert await worker.run_once() == 0
+
+        slack_row = next(r for r in await _rows(db_session) if r.service == "slack")
+        assert slack_row.status == "dead"
+        assert slack_row.attempts == 2
+        assert healthy.sent and not failing.sent
+
+    async def test_services_run_concurrently_and_are_rate_limited(
+        self, db_session, worker, monkeypatch
+    ):
+        monkeypatch.setattr(outbox, "SERVICE_MIN_INTERVAL_SECONDS", {"telegram": 0.2})
+        slow, throttled = FakeService("email", delay=0.3), FakeService("telegram")
+        _use_services(monkeypatch, slow, throttled)
+        for i in range(3):
+            enqueue_notification(db_session, "service_due", f"Due {i}", "Oil change")
+        await db_session.commit()
+
+        started = time.monotonic()
+        assert await worker.run_once() == 6
+        elapsed = time.monotonic() - started
+
+        # Sequential delivery would take 3 x 0.3s (email) + 2 x 0.2s (telegram)
+        assert elapsed < 1.2
+        assert [title for title, _ in throttled.sent] == ["Due 0", "Due 1", "Due 2"]
+        gaps = [b - a for (_, a), (_, b) in zip(throttled.sent, throttled.sent[1:], strict=False)]
+        assert all(gap >= 0.19 for gap in gaps)
+
+    async def test_service_disabled_after_fan_out_is_dead_lettered(
+        self, db_session, worker, monkeypatch
+    ):
+        _use_services(monkeypatch, FakeService("ntfy"))
+        enqueue_notification(db_session, "service_due", "Due", "Oil change")
+        await db_session.commit()
+        # Fan out, but fail the send so the row stays queued
+        monkeypatch.setattr(FakeService, "send", _raise)
+        await worker.run_once()
+
+        _use_services(monkeypatch)
+        await db_session.execute(
+            update(NotificationOutbox).values(next_attempt_at=utc_now() - timedelta(seconds=1))
+        )
+        await db_session.commit()
+        await worker.run_once()
+
+        [row] = await _rows(db_session)
+        assert row.status == "dead"
+        assert row.last_error == "ntfy is no longer enabled"
+
+
+async def _raise(self, *args, **kwargs):
+    raise RuntimeError("down")
@@ -0,0 +1,114 @@
+"""Tests for the pooled notification service registry."""
+
+import re
+
+import pytest
+import pytest_asyncio
+
+from app.services.notifications import registry as registry_module
+from app.services.notifications.dispatcher import NotificationDispatcher
+from app.services.notifications.ntfy import NtfyNotificationService
+from app.services.notifications.registry import NotificationRegistry, notification_registry
+from app.services.settings_service import SettingsService
+
+
+@pytest_asyncio.fixture
+async def ntfy_settings(db_session):
+    """ntfy enabled and configured; every other service disabled."""
+    for service in ("gotify", "pushover", "slack", "discord", "matrix", "telegram", "email"):
+        await SettingsService.set(db_session, f"{service}_enabled", "false")
+    await SettingsService.set(db_session, "ntfy_enabled", "true")
+    await SettingsService.set(db_session, "ntfy_server", "https://ntfy.example.com")
+    await SettingsService.set(db_session, "ntfy_topic", "garage")
+    await db_session.commit()
+    yield
+    # Don't leave a live service configured for later tests
+    await db_session.rollback()
+    await SettingsService.set(db_session, "ntfy_enabled", "false")
+    await db_session.commit()
+
+
+@pytest_asyncio.fixture
+async def registry():
+    reg = NotificationRegistry()
+    yield reg
+    await reg.close()
+
+
+def _settings_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if re.search(r"FROM settings\b(?!_version)", s)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestNotificationRegistry:
+    async def test_services_are_built_once_and_reused(self, db_session, ntfy_settings, registry):
+        config = await registry.get(db_session)
+        again = await registry.get(db_session)
+
+        assert again is config
+        [service] = config.services
+        assert isinstance(service, NtfyNotificationService)
+        assert service.topic == "garage"
+        assert config.values["ntfy_server"] == "https://ntfy.example.com"
+
+    async def test_rebuilds_only_when_notification_settings_change(
+        self, db_session, ntfy_settings, registry, monkeypatch
+    ):
+        [original] = (await registry.get(db_session)).services
+
+        # An unrelated write reloads the snapshot but keeps the services
+        await SettingsService.set(db_session, "theme", "dark")
+        await db_session.commit()
+        assert (await registry.get(db_session)).services == (original,)
+
+        await SettingsService.set(db_session, "ntfy_topic", "alerts")
+        await db_session.commit()
+        [rebuilt] = (await registry.get(db_session)).services
+        assert rebuilt is not original
+        assert rebuilt.topic == "alerts"
+        # The replaced client may still be mid-send, so it is not closed yet
+        assert not original.client.is_closed
+
+        monkeypatch.setattr(registry_module, "RETIRE_GRACE_SECONDS", 0.0)
+        await SettingsService.set(db_session, "ntfy_topic", "garage")
+        await db_session.commit()
+        await registry.get(db_session)
+        assert original.client.is_closed
+        assert not rebuilt.client.is_closed
+
+    async def test_dispatch_reads_no_settings_once_warm(
+        self, db_session, ntfy_settings, query_counter, monkeypatch
+    ):
+        sent = []
+
+        async def _send(self, title, message, priority="default", tags=None, url=None):
+            sent.append(title)
+            return True
+
+        monkeypatch.setattr(NtfyNotificationService, "send", _send)
+        dispatcher = NotificationDispatcher(db_session)
+
+        assert await dispatcher.dispatch("service_due", "First", "m") == {"ntfy": True}
+        query_counter.clear()
+        assert await dispatcher.dispatch("service_due", "Second", "m") == {"ntfy": True}
+
+        assert sent == ["First", "Second"]
+        assert _settings_queries(query_counter) == []
+
+    async def test_settings_route_write_rebuilds_services(
+        self, client, auth_headers, db_session, ntfy_settings
+    ):
+        [service] = (await notification_registry.get(db_session)).services
+
+        response = await client.post(
+            "/api/settings/batch",
+            json={"settings": {"ntfy_topic": "from-ui"}},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        await db_session.commit()  # end the read snapshot opened above
+
+        [rebuilt] = (await notification_registry.get(db_session)).services
+        assert rebuilt is not service
+        assert rebuilt.topic == "from-ui"
@@ -0,0 +1,188 @@
+"""Tests for the OCR process pool, its text cache and background parse jobs."""
+
+import asyncio
+import itertools
+from io import BytesIO
+
+import pytest
+from sqlalchemy import select
+
+from app.models.ocr_job import OCRJob
+from app.services.ocr_jobs import INTERRUPTED_ERROR, KIND_INSURANCE, OCRJobRunner, ocr_job_runner
+from app.services.ocr_pipeline import ocr_pipeline
+
+fitz = pytest.importorskip("fitz")
+
+_SEQ = itertools.count()
+
+
+def _policy_pdf(vin: str, pages: int = 1) -> bytes:
+    """A text-layer PDF that looks like an insurance declarations page."""
+    policy = f"PN{next(_SEQ):06d}"
+    with fitz.open() as doc:
+        for page_number in range(pages):
+            page = doc.new_page()
+            page.insert_text(
+                (72, 72),
+                "Acme Mutual Insurance Company\n"
+                f"Policy Number: {policy}\n"
+                "Policy Period: 01/01/2026 to 07/01/2026\n"
+                f"Vehicle VIN: {vin}\n"
+                "Total Premium: $612.50\n"
+                f"Page {page_number + 1} of {pages}",
+            )
+        return doc.tobytes()
+
+
+@pytest.fixture
+def job_runner(monkeypatch, test_sessionmaker):
+    """The global runner, writing job rows through the test database."""
+    monkeypatch.setattr(ocr_job_runner, "_session_factory", test_sessionmaker)
+    return ocr_job_runner
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOCRPipeline:
+    async def test_text_layer_is_read_in_the_pool_and_cached(self):
+        ocr_pipeline.clear()
+        contents = _policy_pdf("1HGBH41JXMN109186", pages=3)
+
+        text = await ocr_pipeline.extract_text(contents)
+        assert "Acme Mutual Insurance Company" in text
+        assert "Page 3 of 3" in text
+        assert ocr_pipeline.stats["misses"] == 1
+
+        assert await ocr_pipeline.extract_text(contents) == text
+        assert ocr_pipeline.stats["hits"] == 1
+
+    async def test_concurrent_requests_share_one_extraction(self, monkeypatch):
+        ocr_pipeline.clear()
+        contents = _policy_pdf("1HGBH41JXMN109186")
+        extractions = 0
+        original = ocr_pipeline._extract_pdf
+
+        async def _counting(pdf_bytes):
+            nonlocal extractions
+            extractions += 1
+            return await original(pdf_bytes)
+
+        monkeypatch.setattr(ocr_pipeline, "_extract_pdf", _counting)
+        results = await asyncio.gather(*(ocr_pipeline.extract_text(contents) for _ in range(4)))
+
+        assert extractions == 1
+        assert len(set(results)) == 1
+
+    async def test_corrupt_pdf_yields_no_text_and_is_not_cached(self):
+        ocr_pipeline.clear()
+        assert await ocr_pipeline.extract_text(b"%PDF-1.7 truncated") == ""
+        assert ocr_pipeline.stats["cached"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInsuranceParseJobs:
+    async def test_job_runs_in_background_and_is_polled(
+        self, client, auth_headers, test_vehicle, job_runner
+    ):
+        vin = test_vehicle["vin"]
+        response = await client.post(
+            f"/api/vehicles/{vin}/insurance/parse-jobs",
+            files={"file": ("policy.pdf", BytesIO(_policy_pdf(vin)), "application/pdf")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+
+        await job_runner.drain()
+
+        polled = await client.get(f"/api/insurance/parse-jobs/{job['id']}", headers=auth_headers)
+        assert polled.status_code == 200
+        body = polled.json()
+        assert body["status"] == "done"
+        assert body["result"]["success"] is True
+        assert vin in body["result"]["vehicles_found"]
+        assert body["finished_at"] is not None
+
+    async def test_resubmitting_the_same_document_returns_the_job(
+        self, client, auth_headers, test_vehicle, job_runner
+    ):
+        vin = test_vehicle["vin"]
+        contents = _policy_pdf(vin)
+
+        async def _submit():
+            return await client.post(
+                f"/api/vehicles/{vin}/insurance/parse-jobs",
+                files={"file": ("policy.pdf", BytesIO(contents), "application/pdf")},
+                headers=auth_headers,
+            )
+
+        first = (await _submit()).json()
+        await job_runner.drain()
+        second = (await _submit()).json()
+
+        assert second["id"] == first["id"]
+        assert second["status"] == "done"
+
+    async def test_unparseable_document_fails_the_job(
+        self, client, auth_headers, test_vehicle, job_runner
+    ):
+        vin = test_vehicle["vin"]
+        response = await client.post(
+            f"/api/vehicles/{vin}/insurance/parse-jobs",
+            files={"file": ("policy.pdf", BytesIO(b"%PDF-1.7 broken"), "application/pdf")},
+            headers=auth_headers,
+        )
+        await job_runner.drain()
+
+        body = (
+            await client.get(
+                f"/api/insurance/parse-jobs/{response.json()['id']}", headers=auth_headers
+            )
+        ).json()
+        assert body["status"] == "failed"
+        assert body["error"] == "Invalid insurance document format"
+        assert body["result"] is None
+
+    async def test_other_users_cannot_poll_the_job(
+        self, client, auth_headers, non_admin_headers, test_vehicle, job_runner
+    ):
+        vin = test_vehicle["vin"]
+        response = await client.post(
+            f"/api/vehicles/{vin}/insurance/parse-jobs",
+            files={"file": ("policy.pdf", BytesIO(_policy_pdf(vin)), "application/pdf")},
+            headers=auth_headers,
+        )
+        await job_runner.drain()
+
+        polled = await client.get(
+            f"/api/insurance/parse-jobs/{response.json()['id']}", headers=non_admin_headers
+        )
+        assert polled.status_code == 404
+
+    async def test_start_fails_jobs_left_unfinished(self, db_session, test_sessionmaker):
+        job = OCRJob(id="interrupted0001", kind=KIND_INSURANCE, cache_key="x", status="running")
+        db_session.add(job)
+        await db_session.commit()
+
+        await OCRJobRunner(session_factory=test_sessionmaker).start()
+
+        db_session.expire_all()
+        row = await db_session.scalar(select(OCRJob).where(OCRJob.id == "interrupted0001"))
+        assert row.status == "failed"
+        assert row.error == INTERRUPTED_ERROR
+        await db_session.delete(row)
+        await db_session.commit()
+
+    async def test_sync_parse_route_still_returns_the_result(
+        self, client, auth_headers, test_vehicle
+    ):
+        vin = test_vehicle["vin"]
+        response = await client.post(
+            f"/api/vehicles/{vin}/insurance/parse-pdf",
+            files={"file": ("policy.pdf", BytesIO(_policy_pdf(vin)), "application/pdf")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["success"] is True
@@ -0,0 +1,84 @@
+"""Unit tests for the process-wide LiveLink parameter registry."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.livelink_parameter import LiveLinkParameter
+from app.services import parameter_registry as registry_module
+from app.services.parameter_registry import ParameterDefinition, ParameterRegistry
+from app.services.telemetry_service import TelemetryService
+
+
+@pytest.mark.asyncio
+class TestParameterRegistry:
+    async def test_steady_state_reads_run_no_queries(
+        self, db_session: AsyncSession, query_counter: list[str]
+    ):
+        """After the first load, repeated reads are served from memory."""
+        registry = ParameterRegistry()
+        await registry.get_all(db_session)
+
+        query_counter.clear()
+        for _ in range(10):
+            await registry.get_all(db_session)
+            await registry.get(db_session, "0C-ENGINERPM")
+
+        assert query_counter == []
+
+    async def test_invalidate_forces_reload(self, db_session: AsyncSession):
+        """Rows added after the first load appear once the registry is invalidated."""
+        registry = ParameterRegistry()
+        assert await registry.get(db_session, "9B-REGISTRYRELOAD") is None
+
+        db_session.add(
+            LiveLinkParameter(param_key="9B-REGISTRYRELOAD", unit="kPa", warning_max=5.0)
+        )
+        await db_session.flush()
+        # Still the cached snapshot until someone bumps the version
+        assert await registry.get(db_session, "9B-REGISTRYRELOAD") is None
+
+        registry.invalidate()
+        definition = await registry.get(db_session, "9B-REGISTRYRELOAD")
+        assert definition == ParameterDefinition(
+            param_key="9B-REGISTRYRELOAD",
+            display_name=None,
+            unit="kPa",
+            param_class=None,
+            category=None,
+            warning_min=None,
+            warning_max=5.0,
+            show_on_dashboard=True,
+            archive_only=False,
+            storage_interval_seconds=0,
+        )
+
+    async def test_fingerprint_change_reloads_without_local_invalidate(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Edits made by another worker are picked up on the next fingerprint check."""
+        registry = ParameterRegistry()
+        await registry.get_all(db_session)
+
+        db_session.add(LiveLinkParameter(param_key="9B-REGISTRYREMOTE"))
+        await db_session.flush()
+
+        monkeypatch.setattr(registry_module, "FINGERPRINT_CHECK_SECONDS", 0.0)
+        assert await registry.get(db_session, "9B-REGISTRYREMOTE") is not None
+
+
+@pytest.mark.asyncio
+class TestAutoRegisterRace:
+    async def test_concurrently_registered_key_is_reused(self, db_session: AsyncSession):
+        """A key inserted by another ingest task between lookup and insert is not an error."""
+        svc = TelemetryService(db_session)
+        winner = await svc.auto_register_parameter("9B-REGISTRYRACE")
+
+        # Simulate losing the race: our lookup missed, then the INSERT conflicts
+        real_get = svc.get_parameter
+        svc.get_parameter = AsyncMock(side_effect=[None, await real_get("9B-REGISTRYRACE")])
+
+        loser = await svc.auto_register_parameter("9B-REGISTRYRACE")
+
+        assert loser.id == winner.id
@@ -0,0 +1,86 @@
+"""Tests for the bounded password hashing pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services import auth as auth_module
+from app.services.auth import hash_password_async, verify_password_async
+from app.services.password_hashing import PasswordHashingBusyError, PasswordHashingPool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPasswordHashingPool:
+    async def test_hashing_runs_off_the_event_loop(self):
+        pool = PasswordHashingPool(max_workers=1, max_queue=0)
+        ticks = 0
+
+        async def _tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        def _slow() -> str:
+            time.sleep(0.2)
+            return threading.current_thread().name
+
+        ticker = asyncio.create_task(_tick())
+        try:
+            thread_name = await pool.run(_slow)
+        finally:
+            ticker.cancel()
+            pool.shutdown()
+
+        assert thread_name.startswith("password-hash")
+        # The loop kept running while the hash was in progress
+        assert ticks >= 5
+
+    async def test_rejects_immediately_when_saturated(self):
+        pool = PasswordHashingPool(max_workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            running = asyncio.create_task(pool.run(release.wait, 5))
+            queued = asyncio.create_task(pool.run(release.wait, 5))
+            await asyncio.sleep(0.05)
+            assert pool.stats == {"running": 1, "queued": 1, "rejected": 0}
+
+            with pytest.raises(PasswordHashingBusyError):
+                await pool.run(release.wait, 5)
+            assert pool.stats["rejected"] == 1
+
+            release.set()
+            assert await running is True
+            assert await queued is True
+            assert pool.stats == {"running": 0, "queued": 0, "rejected": 1}
+        finally:
+            release.set()
+            pool.shutdown()
+
+    async def test_async_helpers_round_trip(self):
+        hashed = await hash_password_async("correct horse")
+        assert hashed.startswith("$argon2id$")
+        assert await verify_password_async("correct horse", hashed) is True
+        assert await verify_password_async("wrong horse", hashed) is False
+
+    async def test_saturated_login_returns_503(self, client, test_user, monkeypatch):
+        from app.routes.auth import limiter as auth_limiter
+
+        # Earlier login tests may have used up the auth rate limit
+        auth_limiter.reset()
+
+        async def _busy(fn, *args):
+            raise PasswordHashingBusyError
+
+        monkeypatch.setattr(auth_module.password_pool, "run", _busy)
+
+        response = await client.post(
+            "/api/auth/login",
+            json={"username": test_user["username"], "password": "testpassword123"},
+        )
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
@@ -0,0 +1,177 @@
+"""Tests for the authentication fast path.
+
+Principals are cached per (user_id, jti) and re-attached without a SELECT;
+committed user changes evict them, and the CSRF check runs in the auth
+dependency on the request's own session.
+"""
+
+import re
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+
+from app.models.csrf_token import CSRFToken
+from app.models.user import User
+from app.services.principal_cache import principal_cache
+from app.utils.datetime_utils import utc_now
+
+
+def _user_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if re.search(r"\bFROM users\b", s)]
+
+
+def _csrf_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if re.search(r"\bFROM csrf_tokens\b", s)]
+
+
+@pytest_asyncio.fixture
+async def restore_test_user(db_session, test_user):
+    yield
+    await db_session.rollback()
+    user = await db_session.get(User, test_user["id"], populate_existing=True)
+    user.is_active = True
+    user.is_admin = True
+    user.full_name = None
+    await db_session.commit()
+
+
+@pytest_asyncio.fixture
+async def csrf_token(db_session, test_user):
+    """A live CSRF token for the test user; CSRF checks enabled."""
+    value = f"csrf-{test_user['id']}-principal-cache"
+    await db_session.execute(delete(CSRFToken).where(CSRFToken.token == value))
+    db_session.add(
+        CSRFToken(token=value, user_id=test_user["id"], expires_at=utc_now() + timedelta(hours=1))
+    )
+    await db_session.commit()
+    yield value
+    await db_session.execute(delete(CSRFToken).where(CSRFToken.token == value))
+    await db_session.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPrincipalCache:
+    async def test_repeat_requests_skip_the_user_lookup(self, client, auth_headers, query_counter):
+        first = await client.get("/api/auth/me", headers=auth_headers)
+        assert first.status_code == 200
+        assert len(_user_queries(query_counter)) == 1
+
+        query_counter.clear()
+        second = await client.get("/api/auth/me", headers=auth_headers)
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert _user_queries(query_counter) == []
+
+    async def test_cached_user_can_be_modified(
+        self, client, auth_headers, db_session, test_user, restore_test_user
+    ):
+        await client.get("/api/auth/me", headers=auth_headers)
+        assert principal_cache.stats["size"] == 1
+
+        response = await client.put(
+            "/api/auth/me", json={"full_name": "Cached Name"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        # The commit went through the re-attached user and evicted its entry
+        name = await db_session.scalar(
+            select(User.full_name)
+            .where(User.id == test_user["id"])
+            .execution_options(populate_existing=True)
+        )
+        assert name == "Cached Name"
+        me = await client.get("/api/auth/me", headers=auth_headers)
+        assert me.json()["full_name"] == "Cached Name"
+
+    async def test_deactivation_takes_effect_immediately(
+        self, client, auth_headers, db_session, test_user, restore_test_user
+    ):
+        assert (await client.get("/api/auth/me", headers=auth_headers)).status_code == 200
+
+        user = await db_session.get(User, test_user["id"])
+        user.is_active = False
+        await db_session.commit()
+
+        response = await client.get("/api/auth/me", headers=auth_headers)
+        assert response.status_code == 403
+
+    async def test_demotion_takes_effect_immediately(
+        self, client, auth_headers, db_session, test_user, restore_test_user
+    ):
+        assert (await client.get("/api/auth/users", headers=auth_headers)).status_code == 200
+
+        user = await db_session.get(User, test_user["id"])
+        user.is_admin = False
+        await db_session.commit()
+
+        response = await client.get("/api/auth/users", headers=auth_headers)
+        assert response.status_code == 403
+
+    async def test_deactivation_during_a_load_is_not_cached(
+        self, db_session, test_sessionmaker, test_user, restore_test_user
+    ):
+        user_id = test_user["id"]
+        generation = principal_cache.generation(user_id)
+        user = await db_session.get(User, user_id, populate_existing=True)
+        assert user.is_active
+
+        # Commits (and evicts) while the loaded row is still in hand
+        async with test_sessionmaker() as other:
+            (await other.get(User, user_id)).is_active = False
+            await other.commit()
+
+        assert principal_cache.put("jti-race", user, generation) is None
+        assert principal_cache.get(user_id, "jti-race") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCSRFInAuthDependency:
+    @pytest.fixture(autouse=True)
+    def _enforce_csrf(self, monkeypatch):
+        monkeypatch.setenv("MYGARAGE_TEST_MODE", "false")
+
+    async def test_missing_and_invalid_tokens_are_rejected(self, client, auth_headers, csrf_token):
+        missing = await client.put("/api/auth/me", json={}, headers=auth_headers)
+        assert missing.status_code == 403
+        assert "CSRF token missing" in missing.json()["detail"]
+
+        invalid = await client.put(
+            "/api/auth/me", json={}, headers={**auth_headers, "X-CSRF-Token": "nope"}
+        )
+        assert invalid.status_code == 403
+        assert "Invalid or expired CSRF token" in invalid.json()["detail"]
+
+    async def test_token_of_another_user_is_rejected(self, client, non_admin_headers, csrf_token):
+        response = await client.put(
+            "/api/auth/me", json={}, headers={**non_admin_headers, "X-CSRF-Token": csrf_token}
+        )
+        assert response.status_code == 403
+
+    async def test_valid_token_is_checked_once_per_login_session(
+        self, client, auth_headers, csrf_token, query_counter
+    ):
+        headers = {**auth_headers, "X-CSRF-Token": csrf_token}
+
+        # 404 means the request got past authentication and the CSRF check
+        response = await client.delete("/api/vehicles/NOSUCHVIN00000000", headers=headers)
+        assert response.status_code == 404
+        assert len(_csrf_queries(query_counter)) == 1
+
+        query_counter.clear()
+        response = await client.delete("/api/vehicles/NOSUCHVIN00000000", headers=headers)
+        assert response.status_code == 404
+        assert _csrf_queries(query_counter) == []
+        assert _user_queries(query_counter) == []
+
+    async def test_logout_revokes_cached_csrf_token(self, client, auth_headers, csrf_token):
+        headers = {**auth_headers, "X-CSRF-Token": csrf_token}
+        assert (await client.put("/api/auth/me", json={}, headers=headers)).status_code == 200
+
+        assert (await client.post("/api/auth/logout", headers=auth_headers)).status_code == 200
+
+        response = await client.put("/api/auth/me", json={}, headers=headers)
+        assert response.status_code == 403
@@ -19,10 +19,11 @@ from decimal import Decimal
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import HoursRecord, OdometerRecord, Reminder
+from app.models.notification_outbox import NotificationOutbox
 from app.services.reminder_service import (
     _build_reminder_message,
     calculate_hours_driving_rate,
@@ -54,8 +55,11 @@ async def clean_odometer_records(db_session: AsyncSession, test_vehicle):
 
 @pytest_asyncio.fixture
 async def clean_reminders(db_session: AsyncSession, test_vehicle):
-    """Isolate Reminder rows for the shared test_vehicle vin."""
+    """Isolate Reminder rows (and queued reminder notices) for the shared test_vehicle vin."""
     await db_session.execute(delete(Reminder).where(Reminder.vin == test_vehicle["vin"]))
+    await db_session.execute(
+        delete(NotificationOutbox).where(NotificationOutbox.event_type == "reminder_due")
+    )
     await db_session.commit()
     yield
     await db_session.execute(delete(Reminder).where(Reminder.vin == test_vehicle["vin"]))
@@ -65,6 +69,17 @@ async def clean_reminders(db_session: AsyncSession, test_vehicle):
 # clean_hours_records is a shared fixture in tests/unit/conftest.py.
 
 
+async def _queued_reminder_messages(db_session: AsyncSession, title: str) -> list[str]:
+    """Messages of the reminder notices check_due_reminders queued for ``title``."""
+    rows = await db_session.scalars(
+        select(NotificationOutbox.message).where(
+            NotificationOutbox.event_type == "reminder_due",
+            NotificationOutbox.title == f"Reminder Due: {title}",
+        )
+    )
+    return list(rows.all())
+
+
 async def _add_odometer_record(
     db_session: AsyncSession, vin: str, reading_date: date, odometer_km: Decimal
 ) -> OdometerRecord:
@@ -502,7 +517,6 @@ class TestCheckDueRemindersHours:
         test_vehicle,
         clean_hours_records,
         clean_reminders,
-        monkeypatch,
     ):
         """An 'hours' reminder is overdue when current hours >= due_hours,
         and the dispatched notification message reflects due_hours (not
@@ -520,29 +534,13 @@ class TestCheckDueRemindersHours:
         db_session.add(reminder)
         await db_session.commit()
 
-        sent_messages: list[str] = []
-
-        class _StubDispatcher:
-            def __init__(self, db):
-                pass
-
-            async def dispatch(self, event_type, title, message):
-                sent_messages.append(message)
-
-        monkeypatch.setattr(
-            "app.services.notifications.dispatcher.NotificationDispatcher",
-            _StubDispatcher,
-        )
-
         await check_due_reminders(db_session)
 
         # check_due_reminders is a global scheduler entry point (queries ALL
         # pending reminders, not vin-scoped), so the shared test DB may carry
         # other pending/overdue reminders from other test modules. Filter to
         # the message for THIS reminder rather than asserting a global count.
-        own_messages = [
-            m for m in sent_messages if m.startswith(f"Service reminder: {reminder.title}")
-        ]
+        own_messages = await _queued_reminder_messages(db_session, reminder.title)
         assert len(own_messages) == 1
         assert "Due hours: 500" in own_messages[0]
         assert "Due mileage" not in own_messages[0]
@@ -553,7 +551,6 @@ class TestCheckDueRemindersHours:
         test_vehicle,
         clean_hours_records,
         clean_reminders,
-        monkeypatch,
     ):
         vin = test_vehicle["vin"]
         await _add_hours_record(db_session, vin, date.today(), Decimal("100.0"))
@@ -568,25 +565,9 @@ class TestCheckDueRemindersHours:
         db_session.add(reminder)
         await db_session.commit()
 
-        sent_messages: list[str] = []
-
-        class _StubDispatcher:
-            def __init__(self, db):
-                pass
-
-            async def dispatch(self, event_type, title, message):
-                sent_messages.append(message)
-
-        monkeypatch.setattr(
-            "app.services.notifications.dispatcher.NotificationDispatcher",
-            _StubDispatcher,
-        )
-
         await check_due_reminders(db_session)
 
-        own_messages = [
-            m for m in sent_messages if m.startswith(f"Service reminder: {reminder.title}")
-        ]
+        own_messages = await _queued_reminder_messages(db_session, reminder.title)
         assert own_messages == []
 
     async def test_mileage_reminder_overdue_path_unaffected(
@@ -595,7 +576,6 @@ class TestCheckDueRemindersHours:
         test_vehicle,
         clean_odometer_records,
         clean_reminders,
-        monkeypatch,
     ):
         """A 'mileage' reminder's overdue behavior is unchanged by the hours
         additions."""
@@ -612,25 +592,9 @@ class TestCheckDueRemindersHours:
         db_session.add(reminder)
         await db_session.commit()
 
-        sent_messages: list[str] = []
-
-        class _StubDispatcher:
-            def __init__(self, db):
-                pass
-
-            async def dispatch(self, event_type, title, message):
-                sent_messages.append(message)
-
-        monkeypatch.setattr(
-            "app.services.notifications.dispatcher.NotificationDispatcher",
-            _StubDispatcher,
-        )
-
         await check_due_reminders(db_session)
 
-        own_messages = [
-            m for m in sent_messages if m.startswith(f"Service reminder: {reminder.title}")
-        ]
+        own_messages = await _queued_reminder_messages(db_session, reminder.title)
         assert len(own_messages) == 1
         assert "Due mileage: 55,000 km" in own_messages[0]
 
@@ -644,15 +608,15 @@ class TestCheckDueRemindersHours:
 @pytest.mark.asyncio
 class TestCheckDueRemindersNaiveLastNotifiedAt:
     """Regression test for the naive-vs-aware last_notified_at bug fixed in
-    check_due_reminders (~lines 322-325).
+    check_due_reminders.
 
     Reminder.last_notified_at is a plain (non-tz-aware) DateTime column.
     SQLite's bind processor drops tzinfo on write, so a value round-tripped
     through the DB comes back naive even though it was written as UTC.
     Comparing that naive value directly against the aware `datetime.now(UTC)`
-    raises TypeError on the scheduler's next tick after a reminder has ever
-    been notified once. Without the `.replace(tzinfo=UTC)` normalization,
-    this test fails with exactly that TypeError.
+    raised TypeError on the scheduler's next tick after a reminder had ever
+    been notified once. The cooldown is now applied in SQL against a naive
+    UTC cutoff; this test pins that the stored naive value still dedups.
     """
 
     async def test_naive_last_notified_at_within_cooldown_is_not_renotified(
@@ -661,7 +625,6 @@ class TestCheckDueRemindersNaiveLastNotifiedAt:
         test_vehicle,
         clean_hours_records,
         clean_reminders,
-        monkeypatch,
     ):
         vin = test_vehicle["vin"]
         # Overdue by hours target, but already notified 1 hour ago — well
@@ -684,31 +647,15 @@ class TestCheckDueRemindersNaiveLastNotifiedAt:
         # the value written as UTC-aware round-trips through SQLite naive.
         assert reminder.last_notified_at.tzinfo is None
 
-        sent_messages: list[str] = []
-
-        class _StubDispatcher:
-            def __init__(self, db):
-                pass
-
-            async def dispatch(self, event_type, title, message):
-                sent_messages.append(message)
-
-        monkeypatch.setattr(
-            "app.services.notifications.dispatcher.NotificationDispatcher",
-            _StubDispatcher,
-        )
-
         # Must not raise: "TypeError: can't subtract offset-naive and
         # offset-aware datetimes."
         await check_due_reminders(db_session)
 
-        own_messages = [
-            m for m in sent_messages if m.startswith(f"Service reminder: {reminder.title}")
-        ]
+        own_messages = await _queued_reminder_messages(db_session, reminder.title)
         # Within the cooldown window -> skipped, not re-notified. This
         # assertion only passes if the naive last_notified_at was correctly
-        # normalized and compared — a broken dedup (e.g. always False on
-        # exception, or always True without normalization) would fail here.
+        # compared — a broken dedup (e.g. an aware cutoff never matching)
+        # would fail here.
         assert own_messages == []
 
 
@@ -0,0 +1,97 @@
+"""Tests for the process-wide settings snapshot."""
+
+import re
+
+import pytest
+from sqlalchemy import text
+
+from app.services import settings_cache as settings_cache_module
+from app.services.settings_cache import settings_cache
+from app.services.settings_service import SettingsService
+
+
+def _settings_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if re.search(r"\bsettings(_version)?\b", s)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSettingsCache:
+    async def test_warm_reads_issue_no_queries(self, db_session, query_counter):
+        await SettingsService.set(db_session, "cache_probe", "42")
+        await db_session.commit()
+        assert await SettingsService.get_int(db_session, "cache_probe") == 42
+
+        query_counter.clear()
+        assert await SettingsService.get_value(db_session, "cache_probe") == "42"
+        assert await SettingsService.get_value(db_session, "cache_missing", "dflt") == "dflt"
+        assert await SettingsService.get_bool(db_session, "cache_missing", True) is True
+
+        assert _settings_queries(query_counter) == []
+
+    async def test_committed_write_is_seen_by_other_sessions(self, db_session, test_sessionmaker):
+        await SettingsService.set(db_session, "cache_probe", "before")
+        await db_session.commit()
+        assert await SettingsService.get_value(db_session, "cache_probe") == "before"
+
+        async with test_sessionmaker() as other:
+            await SettingsService.set(other, "cache_probe", "after")
+            await other.commit()
+
+        await db_session.commit()  # end this session's read snapshot
+        assert await SettingsService.get_value(db_session, "cache_probe") == "after"
+
+    async def test_uncommitted_write_is_private_and_rollback_is_harmless(
+        self, db_session, test_sessionmaker
+    ):
+        await SettingsService.set(db_session, "cache_probe", "committed")
+        await db_session.commit()
+
+        await SettingsService.set(db_session, "cache_probe", "pending")
+        # The writing session reads its own change...
+        assert await SettingsService.get_value(db_session, "cache_probe") == "pending"
+        # ...nobody else does
+        async with test_sessionmaker() as other:
+            assert await SettingsService.get_value(other, "cache_probe") == "committed"
+
+        await db_session.rollback()
+        assert await SettingsService.get_value(db_session, "cache_probe") == "committed"
+
+    async def test_bulk_delete_invalidates(self, db_session):
+        await SettingsService.set(db_session, "cache_probe", "x")
+        await db_session.commit()
+        assert await SettingsService.get_value(db_session, "cache_probe") == "x"
+
+        await SettingsService.delete(db_session, "cache_probe")
+        await db_session.commit()
+        assert await SettingsService.get_value(db_session, "cache_probe") == ""
+
+    async def test_other_worker_writes_are_detected_by_version(self, db_session, monkeypatch):
+        await SettingsService.set(db_session, "cache_probe", "old")
+        await db_session.commit()
+        assert await SettingsService.get_value(db_session, "cache_probe") == "old"
+        loads = settings_cache.loads
+
+        # Raw SQL stands in for another process: no local hook fires
+        await db_session.execute(
+            text("UPDATE settings SET value = 'new' WHERE key = 'cache_probe'")
+        )
+        await db_session.commit()
+        monkeypatch.setattr(settings_cache_module, "VERSION_CHECK_SECONDS", 0.0)
+        assert await SettingsService.get_value(db_session, "cache_probe") == "old"
+        assert settings_cache.loads == loads
+
+        # The other worker's transaction also bumped the shared counter
+        await db_session.execute(text("UPDATE settings_version SET version = version + 1"))
+        await db_session.commit()
+        assert await SettingsService.get_value(db_session, "cache_probe") == "new"
+        assert settings_cache.loads == loads + 1
+
+    async def test_typed_accessors(self, db_session):
+        await SettingsService.set(db_session, "cache_bool", "Yes")
+        await SettingsService.set(db_session, "cache_int", "not-a-number")
+        await db_session.commit()
+
+        assert await SettingsService.get_bool(db_session, "cache_bool") is True
+        assert await SettingsService.get_int(db_session, "cache_int", 7) == 7
+        assert await SettingsService.get_int(db_session, "cache_missing", 3) == 3
@@ -0,0 +1,150 @@
+"""Unit tests for the vehicle_telemetry_latest write-behind buffer."""
+
+import itertools
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.vehicle_telemetry import VehicleTelemetryLatest
+from app.services.telemetry_latest_buffer import LatestValueBuffer
+from app.utils.datetime_utils import utc_now
+
+_SEQ = itertools.count()
+
+
+async def _make_vehicle(db_session: AsyncSession) -> str:
+    n = next(_SEQ)
+    user = User(
+        username=f"latest_buffer_user_{n}",
+        email=f"latest_buffer_{n}@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_admin=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    vin = f"LATESTBUFFER{n:05d}"  # 17 chars
+    db_session.add(
+        Vehicle(vin=vin, user_id=user.id, nickname=f"Buffer Car {n}", vehicle_type="Car")
+    )
+    await db_session.flush()
+    return vin
+
+
+def _row(param_key: str, value: float, offset: int = 0) -> dict:
+    ts = utc_now().replace(microsecond=0) + timedelta(seconds=offset)
+    return {"param_key": param_key, "value": value, "timestamp": ts, "received_at": ts}
+
+
+async def _table_values(db_session: AsyncSession, vin: str) -> dict[str, float]:
+    result = await db_session.execute(
+        select(VehicleTelemetryLatest.param_key, VehicleTelemetryLatest.value).where(
+            VehicleTelemetryLatest.vin == vin
+        )
+    )
+    return {row[0]: row[1] for row in result.all()}
+
+
+@pytest.mark.asyncio
+class TestLatestValueBuffer:
+    async def test_record_is_readable_before_flush(self, db_session: AsyncSession):
+        """Recorded values are served from memory and nothing is written yet."""
+        vin = await _make_vehicle(db_session)
+        buffer = LatestValueBuffer()
+
+        buffer.record(vin, [_row("SPEED", 50.0), _row("RPM", 2000.0)])
+
+        values = await buffer.get_values(db_session, vin)
+        assert [(v.param_key, v.value) for v in values] == [("RPM", 2000.0), ("SPEED", 50.0)]
+        assert await _table_values(db_session, vin) == {}
+
+    async def test_flush_writes_dirty_values_and_updates_status(self, db_session: AsyncSession):
+        """One flush writes every dirty key and resets the dirty count and lag."""
+        vin = await _make_vehicle(db_session)
+        buffer = LatestValueBuffer()
+        buffer.record(vin, [_row("SPEED", 50.0), _row("RPM", 2000.0)])
+        buffer.record(vin, [_row("SPEED", 55.0, offset=1)])
+
+        status = buffer.status
+        assert status["dirty_entries"] == 2
+        assert status["flush_lag_seconds"] >= 0.0
+
+        assert await buffer.flush(db_session) == 2
+
+        assert await _table_values(db_session, vin) == {"SPEED": 55.0, "RPM": 2000.0}
+        status = buffer.status
+        assert status["dirty_entries"] == 0
+        assert status["flush_lag_seconds"] == 0.0
+        assert status["flushes"] == 1
+        assert status["rows_flushed"] == 2
+        assert status["last_flush_at"] is not None
+
+    async def test_hydration_keeps_unflushed_values(self, db_session: AsyncSession):
+        """Rows already in the table are loaded, but a dirty key beats the table."""
+        vin = await _make_vehicle(db_session)
+        now = utc_now()
+        db_session.add_all(
+            [
+                VehicleTelemetryLatest(
+                    vin=vin, param_key="COOLANT", value=90.0, timestamp=now, received_at=now
+                ),
+                VehicleTelemetryLatest(
+                    vin=vin, param_key="SPEED", value=10.0, timestamp=now, received_at=now
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        buffer = LatestValueBuffer()
+        buffer.record(vin, [_row("SPEED", 60.0, offset=1)])
+
+        values = {v.param_key: v.value for v in await buffer.get_values(db_session, vin)}
+        assert values == {"COOLANT": 90.0, "SPEED": 60.0}
+        assert set(buffer.get_pending(vin)) == {"SPEED"}
+
+    async def test_flush_keeps_newer_table_values(self, db_session: AsyncSession):
+        """A buffered value older than the stored row does not overwrite it."""
+        vin = await _make_vehicle(db_session)
+        newer = utc_now().replace(microsecond=0) + timedelta(seconds=60)
+        db_session.add(
+            VehicleTelemetryLatest(
+                vin=vin, param_key="SPEED", value=99.0, timestamp=newer, received_at=newer
+            )
+        )
+        await db_session.flush()
+
+        buffer = LatestValueBuffer()
+        buffer.record(vin, [_row("SPEED", 50.0), _row("RPM", 1500.0)])
+
+        assert await buffer.flush(db_session) == 2
+        assert await _table_values(db_session, vin) == {"SPEED": 99.0, "RPM": 1500.0}
+
+    async def test_flush_drops_values_for_deleted_vehicles(self, db_session: AsyncSession):
+        """Values for a VIN that no longer exists are discarded, not written."""
+        buffer = LatestValueBuffer()
+        buffer.record("LATESTBUFGONE0001", [_row("SPEED", 1.0)])
+
+        assert await buffer.flush(db_session) == 0
+        assert buffer.status["dirty_entries"] == 0
+        assert buffer.status["tracked_vehicles"] == 0
+
+    async def test_failed_flush_keeps_keys_dirty(self):
+        """A failed flush leaves every key dirty for the next attempt."""
+        buffer = LatestValueBuffer()
+        buffer.record("LATESTBUFFAIL0001", [_row("SPEED", 1.0)])
+        db = AsyncMock()
+        db.execute.side_effect = RuntimeError("database is locked")
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush(db)
+
+        status = buffer.status
+        assert status["dirty_entries"] == 1
+        assert status["flush_errors"] == 1
+        assert status["flushes"] == 0
@@ -10,14 +10,16 @@ These tests pin a per-parameter cooldown keyed off
 admin setting ``livelink_alert_cooldown_minutes`` (migration 034, exposed
 via ``LiveLinkService.get_alert_cooldown_minutes``, default 30 when unset):
 
-- a breach dispatches a notification and stamps the cooldown
-- a second breach inside the window is suppressed (no dispatch)
-- a breach after the window elapses dispatches again
-- a non-breaching value never dispatches and never stamps
-- the stamp is only set when at least one service actually ACCEPTED the
-  notification — an empty result (no services enabled) or an all-failed
-  result (transient outage) must not start the cooldown clock
+- a breach queues a notification and stamps the cooldown
+- a second breach inside the window is suppressed (nothing queued)
+- a breach after the window elapses queues again
+- a non-breaching value never queues and never stamps
 - changing the admin setting changes the window
+
+Alerts go to the notification outbox in the caller's transaction rather than
+being dispatched inline, so the ingest path never waits on a notification
+service. The queued row is retried until delivered or dead-lettered, which is
+why the stamp is set on enqueue.
 """
 
 from datetime import timedelta
@@ -25,9 +27,11 @@ from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.livelink_parameter import LiveLinkParameter
+from app.models.notification_outbox import NotificationOutbox
 from app.models.vehicle import Vehicle
 from app.services.settings_service import SettingsService
 from app.services.telemetry_service import TelemetryService
@@ -78,37 +82,31 @@ async def make_param(db_session: AsyncSession):
     return _factory
 
 
-def _patch_dispatcher(monkeypatch, *, results: dict[str, bool] | None = None):
-    """Patch NotificationDispatcher.notify_livelink_threshold_alert.
+@pytest_asyncio.fixture(autouse=True)
+async def empty_outbox(db_session: AsyncSession):
+    await db_session.execute(delete(NotificationOutbox))
+    await db_session.commit()
+
 
-    ``results`` is the dict the dispatcher returns: service name -> success.
-    ``{"ntfy": True}`` mimics a service accepting the message; ``{}`` mimics
-    a dispatch that reached zero enabled services; ``{"discord": False}``
-    mimics an attempted-but-failed send (the dispatcher records False for
-    caught send errors).
-    """
-    mock = AsyncMock(return_value=results if results is not None else {"ntfy": True})
-    monkeypatch.setattr(
-        "app.services.notifications.dispatcher.NotificationDispatcher.notify_livelink_threshold_alert",
-        mock,
+async def _queued(db_session: AsyncSession) -> list[NotificationOutbox]:
+    return list(
+        (await db_session.scalars(select(NotificationOutbox).order_by(NotificationOutbox.id))).all()
     )
-    return mock
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestCheckThresholdsCooldown:
-    async def test_breach_dispatches_and_stamps_cooldown(
+    async def test_breach_queues_and_stamps_cooldown(
         self, db_session, make_vehicle, make_param, monkeypatch
     ):
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch)
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
 
-        mock.assert_awaited_once()
+        assert len(await _queued(db_session)) == 1
         assert param.warning_last_notified_at is not None
 
     async def test_second_breach_within_window_is_suppressed(
@@ -116,11 +114,10 @@ class TestCheckThresholdsCooldown:
     ):
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch)
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
-        assert mock.await_count == 1
+        assert len(await _queued(db_session)) == 1
         first_stamp = param.warning_last_notified_at
 
         # 5 minutes later — still inside the default 30-minute window.
@@ -130,19 +127,18 @@ class TestCheckThresholdsCooldown:
         )
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=160.0)
 
-        assert mock.await_count == 1  # no second dispatch
+        assert len(await _queued(db_session)) == 1  # nothing new queued
         assert param.warning_last_notified_at == first_stamp  # stamp unchanged
 
-    async def test_breach_after_window_dispatches_again(
+    async def test_breach_after_window_queues_again(
         self, db_session, make_vehicle, make_param, monkeypatch
     ):
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch)
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
-        assert mock.await_count == 1
+        assert len(await _queued(db_session)) == 1
         first_stamp = param.warning_last_notified_at
 
         # 31 minutes later — outside the default 30-minute window.
@@ -150,23 +146,22 @@ class TestCheckThresholdsCooldown:
         monkeypatch.setattr("app.services.telemetry_service.utc_now", lambda: later)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=160.0)
 
-        assert mock.await_count == 2
+        assert len(await _queued(db_session)) == 2
         assert param.warning_last_notified_at == later
 
     async def test_admin_setting_changes_the_window(
         self, db_session, make_vehicle, make_param, monkeypatch
     ):
         """The cooldown honors `livelink_alert_cooldown_minutes` — with a
-        5-minute setting, a breach 6 minutes after the stamp dispatches again
+        5-minute setting, a breach 6 minutes after the stamp queues again
         (it would still be suppressed under the 30-minute default)."""
         await SettingsService.set(db_session, "livelink_alert_cooldown_minutes", "5")
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch)
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
-        assert mock.await_count == 1
+        assert len(await _queued(db_session)) == 1
         first_stamp = param.warning_last_notified_at
 
         # 4 minutes later — inside the 5-minute window: suppressed.
@@ -175,75 +170,62 @@ class TestCheckThresholdsCooldown:
             lambda: first_stamp + timedelta(minutes=4),
         )
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=160.0)
-        assert mock.await_count == 1
+        assert len(await _queued(db_session)) == 1
 
-        # 6 minutes later — outside the 5-minute window: dispatches again.
+        # 6 minutes later — outside the 5-minute window: queues again.
         monkeypatch.setattr(
             "app.services.telemetry_service.utc_now",
             lambda: first_stamp + timedelta(minutes=6),
         )
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=160.0)
-        assert mock.await_count == 2
+        assert len(await _queued(db_session)) == 2
 
-    async def test_non_breaching_value_never_dispatches_or_stamps(
+    async def test_non_breaching_value_never_queues_or_stamps(
         self, db_session, make_vehicle, make_param, monkeypatch
     ):
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch)
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=50.0)
 
-        mock.assert_not_awaited()
+        assert await _queued(db_session) == []
         assert param.warning_last_notified_at is None
 
-    async def test_stamp_not_set_when_no_services_enabled(
+    async def test_alert_is_queued_not_dispatched(
         self, db_session, make_vehicle, make_param, monkeypatch
     ):
-        """Dispatch reaches zero enabled services (empty result dict) — the
-        cooldown clock must not start, so the very next breach dispatches
-        again instead of silently going dark for the whole window."""
+        """The ingest path only INSERTs an outbox row; no service is contacted."""
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch, results={})
-
-        svc = TelemetryService(db_session)
-        await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
-
-        mock.assert_awaited_once()
-        assert param.warning_last_notified_at is None
-
-    async def test_stamp_not_set_when_all_sends_failed(
-        self, db_session, make_vehicle, make_param, monkeypatch
-    ):
-        """The dispatcher records False for attempted-but-failed sends. An
-        all-failed result (e.g. transient outage of every enabled service)
-        must not stamp the cooldown — otherwise real alerts go silent for
-        the whole window with nothing ever delivered."""
-        vin = await make_vehicle()
-        param = await make_param()
-        mock = _patch_dispatcher(monkeypatch, results={"discord": False})
+        dispatch = AsyncMock(return_value={"ntfy": True})
+        monkeypatch.setattr(
+            "app.services.notifications.dispatcher.NotificationDispatcher.dispatch", dispatch
+        )
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
 
-        mock.assert_awaited_once()
-        assert param.warning_last_notified_at is None
-
-    async def test_stamp_set_when_at_least_one_send_succeeded(
-        self, db_session, make_vehicle, make_param, monkeypatch
-    ):
-        """Partial success (one service accepted, one failed) counts as sent."""
+        dispatch.assert_not_awaited()
+        [row] = await _queued(db_session)
+        assert row.event_type == "livelink_threshold_alert"
+        assert row.service is None
+        assert row.status == "pending"
+        assert row.priority == "high"
+        assert row.title == "Threshold Alert: 2020 TestMake TestModel"
+        assert row.message == ("Test Param exceeded maximum (150.0 unit vs threshold 100.0 unit).")
+
+    async def test_rollback_discards_queued_alert(self, db_session, make_vehicle, make_param):
+        """The outbox row shares the ingest transaction: no commit, no alert."""
         vin = await make_vehicle()
         param = await make_param()
-        mock = _patch_dispatcher(monkeypatch, results={"discord": True, "ntfy": False})
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=150.0)
+        assert len(await _queued(db_session)) == 1
 
-        mock.assert_awaited_once()
-        assert param.warning_last_notified_at is not None
+        await db_session.rollback()
+        assert await _queued(db_session) == []
 
     async def test_min_threshold_breach_also_respects_cooldown(
         self, db_session, make_vehicle, make_param, monkeypatch
@@ -253,10 +235,9 @@ class TestCheckThresholdsCooldown:
         param.warning_max = None
         param.warning_min = 10.0
         await db_session.flush()
-        mock = _patch_dispatcher(monkeypatch)
 
         svc = TelemetryService(db_session)
         await svc.check_thresholds(vin=vin, param_key=param.param_key, value=-5.0)
 
-        mock.assert_awaited_once()
+        assert len(await _queued(db_session)) == 1
         assert param.warning_last_notified_at is not None
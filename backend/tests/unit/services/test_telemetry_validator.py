@@ -419,3 +419,57 @@ class TestRangeCompleteness:
         """Every class with a rate limit should have a range."""
         for cls in RATE_OF_CHANGE_LIMITS:
             assert cls in PARAM_CLASS_RANGES, f"Class '{cls}' has rate limit but no range"
+
+
+class TestBatchPrefetch:
+    """validate_batch loads previous values once per batch, not once per key."""
+
+    @pytest.fixture
+    def validator(self):
+        db = AsyncMock()
+        return TelemetryValidator(db)
+
+    @pytest.mark.asyncio
+    async def test_single_query_for_all_rate_checked_keys(self, validator):
+        """Several rate-limited keys share one prefetch query."""
+        params = {
+            "0D-VehicleSpeed": _mock_param("speed"),
+            "0C-EngineRPM": _mock_param("frequency"),
+            "05-EngineCoolantTemp": _mock_param("temperature"),
+        }
+        data = {"0D-VehicleSpeed": 65, "0C-EngineRPM": 2150, "05-EngineCoolantTemp": 90}
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        validator.db.execute = AsyncMock(return_value=mock_result)
+
+        valid, rejected = await validator.validate_batch("VIN123", data, params)
+        assert len(valid) == 3
+        assert rejected == []
+        assert validator.db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetched_value_drives_rate_rejection(self, validator):
+        """A prefetched previous value is used for the rate-of-change check."""
+        params = {"0D-VehicleSpeed": _mock_param("speed")}
+        prev_time = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=1)
+
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("0D-VehicleSpeed", 60.0, prev_time)]
+        validator.db.execute = AsyncMock(return_value=mock_result)
+
+        # 60 -> 200 km/h in 1s is far above the 15/s speed limit
+        valid, rejected = await validator.validate_batch("VIN123", {"0D-VehicleSpeed": 200}, params)
+        assert valid == {}
+        assert rejected[0]["param_key"] == "0D-VehicleSpeed"
+        assert "rate of change" in str(rejected[0]["reason"])
+
+    @pytest.mark.asyncio
+    async def test_no_query_without_rate_limited_keys(self, validator):
+        """Batches with no rate-limited numeric keys skip the prefetch entirely."""
+        params = {"CUSTOM_SENSOR": _mock_param("custom_class")}
+        data = {"CUSTOM_SENSOR": 42, "DIAGNOSTIC_TROUBLE_CODES": "P0300"}
+
+        valid, _ = await validator.validate_batch("VIN123", data, params)
+        assert valid == data
+        validator.db.execute.assert_not_called()
@@ -0,0 +1,129 @@
+"""Tests for the per-vehicle usage model shared by reminders and the calendar.
+
+Listing a vehicle's reminders costs a fixed number of queries however many
+smart reminders need an estimate, and odometer writes evict the cached model
+so the next estimate uses the new reading.
+"""
+
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models import HoursRecord, OdometerRecord, Reminder, Vehicle
+from app.models.user import User
+from app.services.auth import create_access_token
+from app.services.reminder_service import list_reminders
+from app.services.usage_model import UsageModel, get_usage_models
+
+
+async def _vehicle_with_history(db_session) -> tuple[str, dict[str, str]]:
+    """A fresh owner and vehicle with 50 km/day and 10 hr/day over 20 days."""
+    suffix = uuid.uuid4().hex[:12]
+    user = User(
+        username=f"usage_{suffix}",
+        email=f"usage_{suffix}@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_admin=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    vin = f"USAGE{suffix.upper()}"
+    start = date.today() - timedelta(days=20)
+    db_session.add(Vehicle(vin=vin, user_id=user.id, nickname="Usage", vehicle_type="Car"))
+    await db_session.flush()
+    db_session.add_all(
+        [
+            OdometerRecord(vin=vin, date=start, odometer_km=Decimal("10000")),
+            OdometerRecord(vin=vin, date=date.today(), odometer_km=Decimal("11000")),
+            HoursRecord(vin=vin, date=start, engine_hours=Decimal("800.0")),
+            HoursRecord(vin=vin, date=date.today(), engine_hours=Decimal("1000.0")),
+        ]
+    )
+    await db_session.commit()
+    token = create_access_token(data={"sub": str(user.id), "username": user.username})
+    return vin, {"Authorization": f"Bearer {token}"}
+
+
+def _smart_reminders(vin: str, count: int) -> list[Reminder]:
+    hard_date = date.today() + timedelta(days=365)
+    return [
+        Reminder(
+            vin=vin,
+            title=f"Smart {i}",
+            reminder_type="smart",
+            due_date=hard_date,
+            due_mileage_km=Decimal("13000") if i % 2 == 0 else None,
+            due_hours=None if i % 2 == 0 else Decimal("1300.0"),
+            status="pending",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUsageModel:
+    async def test_models_for_many_vins_use_a_fixed_number_of_queries(
+        self, db_session, query_counter
+    ):
+        first, _ = await _vehicle_with_history(db_session)
+        second, _ = await _vehicle_with_history(db_session)
+        query_counter.clear()
+
+        models = await get_usage_models(db_session, [first, second, "NOREADINGS0000000"])
+
+        assert len(query_counter) == 4
+        assert models[first] == UsageModel(
+            vin=first,
+            current_km=Decimal("11000"),
+            current_hours=Decimal("1000.0"),
+            km_per_day=50.0,
+            hours_per_day=10.0,
+        )
+        assert models["NOREADINGS0000000"] == UsageModel(vin="NOREADINGS0000000")
+
+        query_counter.clear()
+        assert (await get_usage_models(db_session, [second]))[second] == models[second]
+        assert query_counter == []
+
+    async def test_listing_reminders_is_constant_in_query_count(self, db_session, query_counter):
+        few_vin, _ = await _vehicle_with_history(db_session)
+        many_vin, _ = await _vehicle_with_history(db_session)
+        db_session.add_all(_smart_reminders(few_vin, 2) + _smart_reminders(many_vin, 50))
+        await db_session.commit()
+
+        query_counter.clear()
+        few = await list_reminders(few_vin, db_session)
+        few_queries = len(query_counter)
+
+        query_counter.clear()
+        many = await list_reminders(many_vin, db_session)
+
+        assert len(many) == 50
+        assert len(query_counter) == few_queries
+        estimates = {r.estimated_due_date for r in few + many}
+        # (13000 - 11000) / 50 km/day and (1300 - 1000) / 10 hr/day
+        assert estimates == {date.today() + timedelta(days=40), date.today() + timedelta(days=30)}
+
+    async def test_odometer_write_refreshes_the_estimate(self, client, db_session):
+        vin, headers = await _vehicle_with_history(db_session)
+        db_session.add_all(_smart_reminders(vin, 1))
+        await db_session.commit()
+
+        before = (await client.get(f"/api/vehicles/{vin}/reminders", headers=headers)).json()
+        assert before[0]["estimated_due_date"] == str(date.today() + timedelta(days=40))
+
+        response = await client.post(
+            f"/api/vehicles/{vin}/odometer",
+            json={"vin": vin, "date": str(date.today()), "odometer_km": 12500},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+        after = (await client.get(f"/api/vehicles/{vin}/reminders", headers=headers)).json()
+        # 12500 km is now the latest reading; 2500 km over 20 days = 125 km/day
+        assert after[0]["estimated_due_date"] == str(date.today() + timedelta(days=4))
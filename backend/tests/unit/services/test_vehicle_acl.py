@@ -0,0 +1,180 @@
+"""Tests for the in-memory vehicle ACL index.
+
+Access checks are answered from ``vin -> (owner, shares)`` after the first
+lookup; committed writes to vehicles or shares evict the VIN so revocations,
+permission changes and transfers take effect on the next request.
+"""
+
+import itertools
+import re
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.vehicle_share import VehicleShare
+from app.services.auth import check_vehicle_access, create_access_token
+from app.services.vehicle_acl import vehicle_acl
+
+_SEQ = itertools.count()
+
+
+def _headers(user: User) -> dict[str, str]:
+    token = create_access_token(data={"sub": str(user.id), "username": user.username})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _acl_queries(statements: list[str]) -> list[str]:
+    return [s for s in statements if re.search(r"\bFROM (vehicles|vehicle_shares)\b", s)]
+
+
+async def _make_shared_vehicle(db_session, permission: str = "read"):
+    """Create a non-admin owner, a sharee and a stranger; return (vin, owner, sharee, stranger)."""
+    n = next(_SEQ)
+    users = [
+        User(
+            username=f"acl_{role}_{n}",
+            email=f"acl_{role}_{n}@example.com",
+            hashed_password="x",
+            is_active=True,
+            is_admin=False,
+        )
+        for role in ("owner", "sharee", "stranger")
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    owner, sharee, stranger = users
+
+    vin = f"ACLCACHETEST{n:05d}"
+    db_session.add(Vehicle(vin=vin, user_id=owner.id, nickname="ACL Car", vehicle_type="Car"))
+    await db_session.flush()
+    db_session.add(
+        VehicleShare(vehicle_vin=vin, user_id=sharee.id, permission=permission, shared_by=owner.id)
+    )
+    await db_session.commit()
+    return vin, owner, sharee, stranger
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVehicleACL:
+    async def test_repeat_checks_skip_vehicle_and_share_queries(
+        self, client, db_session, query_counter
+    ):
+        vin, _, sharee, _ = await _make_shared_vehicle(db_session)
+        headers = _headers(sharee)
+
+        assert (await client.get(f"/api/vehicles/{vin}/photos", headers=headers)).status_code == 200
+        assert len(_acl_queries(query_counter)) == 2
+
+        query_counter.clear()
+        for _ in range(3):
+            response = await client.get(f"/api/vehicles/{vin}/photos", headers=headers)
+            assert response.status_code == 200
+        assert _acl_queries(query_counter) == []
+
+    async def test_stranger_is_rejected(self, client, db_session):
+        vin, _, _, stranger = await _make_shared_vehicle(db_session)
+        for _ in range(2):
+            response = await client.get(f"/api/vehicles/{vin}/photos", headers=_headers(stranger))
+            assert response.status_code == 403
+
+    async def test_unknown_vin_is_not_cached(self, client, auth_headers):
+        response = await client.get("/api/vehicles/NOSUCHVIN00000000/photos", headers=auth_headers)
+        assert response.status_code == 404
+        assert vehicle_acl._entries == {}
+
+    async def test_revoked_share_takes_effect_immediately(self, client, db_session):
+        vin, _, sharee, _ = await _make_shared_vehicle(db_session)
+        headers = _headers(sharee)
+        assert (await client.get(f"/api/vehicles/{vin}/photos", headers=headers)).status_code == 200
+
+        share = await db_session.scalar(
+            select(VehicleShare).where(
+                VehicleShare.vehicle_vin == vin, VehicleShare.user_id == sharee.id
+            )
+        )
+        await db_session.delete(share)
+        await db_session.commit()
+
+        response = await client.get(f"/api/vehicles/{vin}/photos", headers=headers)
+        assert response.status_code == 403
+
+    async def test_permission_downgrade_takes_effect_immediately(self, db_session):
+        vin, _, sharee, _ = await _make_shared_vehicle(db_session, permission="write")
+        await check_vehicle_access(vin, sharee, db_session, require_write=True)
+
+        await db_session.execute(
+            update(VehicleShare).where(VehicleShare.vehicle_vin == vin).values(permission="read")
+        )
+        await db_session.commit()
+
+        await check_vehicle_access(vin, sharee, db_session)
+        with pytest.raises(HTTPException) as exc:
+            await check_vehicle_access(vin, sharee, db_session, require_write=True)
+        assert exc.value.status_code == 403
+        assert exc.value.detail == "Write permission required for this action"
+
+    async def test_transfer_evicts_the_vin(self, client, db_session):
+        vin, owner, _, stranger = await _make_shared_vehicle(db_session)
+        assert (
+            await client.get(f"/api/vehicles/{vin}/photos", headers=_headers(owner))
+        ).status_code == 200
+
+        vehicle = await db_session.get(Vehicle, vin)
+        vehicle.user_id = stranger.id
+        await db_session.commit()
+
+        assert vin not in vehicle_acl._entries
+        old = await client.get(f"/api/vehicles/{vin}/photos", headers=_headers(owner))
+        assert old.status_code == 403
+        new = await client.get(f"/api/vehicles/{vin}/photos", headers=_headers(stranger))
+        assert new.status_code == 200
+
+    async def test_rolled_back_write_keeps_the_entry(self, db_session):
+        vin, _, _, stranger = await _make_shared_vehicle(db_session)
+        await vehicle_acl.get(db_session, vin)
+
+        vehicle = await db_session.get(Vehicle, vin)
+        vehicle.user_id = stranger.id
+        await db_session.flush()
+        await db_session.rollback()
+
+        assert vin in vehicle_acl._entries
+
+    async def test_revoke_during_a_load_is_not_cached(self, db_session, test_sessionmaker):
+        vin, _, sharee, _ = await _make_shared_vehicle(db_session)
+        sharee_id = sharee.id
+
+        async def revoke() -> None:
+            async with test_sessionmaker() as other:
+                share = await other.scalar(
+                    select(VehicleShare).where(VehicleShare.vehicle_vin == vin)
+                )
+                await other.delete(share)
+                await other.commit()
+
+        class RevokeAfterShareQuery:
+            """Commits the revoke once the load has read the shares, before it stores."""
+
+            def __init__(self) -> None:
+                self.queries = 0
+
+            async def execute(self, statement):
+                result = await db_session.execute(statement)
+                self.queries += 1
+                if self.queries == 2:
+                    await revoke()
+                return result
+
+        # The in-flight load read the share before the revoke committed...
+        entry = await vehicle_acl.get(RevokeAfterShareQuery(), vin)
+        assert sharee_id in entry.shares
+        # ...but does not cache it past the revoke's eviction
+        assert vin not in vehicle_acl._entries
+
+        await db_session.rollback()
+        entry = await vehicle_acl.get(db_session, vin)
+        assert sharee_id not in entry.shares
@@ -0,0 +1,300 @@
+"""Tests for the vehicle_rollup projection.
+
+The rollup must always equal what re-deriving the figures from the record
+tables would give: refreshed after every committed write (ORM flushes and
+bulk statements alike, nothing on rollback), recomputed on read once the day
+changes without the read writing anything, and repairable with a full
+rebuild.
+"""
+
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, update
+
+from app.models.document import Document
+from app.models.fuel import FuelRecord
+from app.models.hours import HoursRecord
+from app.models.note import Note
+from app.models.odometer import OdometerRecord
+from app.models.reminder import Reminder
+from app.models.service_line_item import ServiceLineItem
+from app.models.service_visit import ServiceVisit
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.vehicle_rollup import VehicleRollup
+from app.services.vehicle_rollup_service import (
+    get_vehicle_rollups,
+    rebuild_all_vehicle_rollups,
+    rollup_refresher,
+)
+
+
+@pytest_asyncio.fixture
+async def rollup_vin(db_session) -> str:
+    """A fresh vehicle (and owner) with no records."""
+    suffix = uuid.uuid4().hex[:8]
+    user = User(
+        username=f"rollup_{suffix}",
+        email=f"rollup_{suffix}@example.com",
+        hashed_password="x",
+        is_active=True,
+        is_admin=False,
+    )
+    db_session.add(user)
+    await db_session.flush()
+    vin = ("RLP" + uuid.uuid4().hex)[:17].upper()
+    db_session.add(Vehicle(vin=vin, user_id=user.id, nickname="Rollup", vehicle_type="Car"))
+    await db_session.commit()
+    return vin
+
+
+async def _stored(db_session, vin: str) -> VehicleRollup | None:
+    """The committed rollup row once queued refreshes ran (no refresh on read)."""
+    await rollup_refresher.drain()
+    return (
+        await db_session.execute(
+            select(VehicleRollup)
+            .where(VehicleRollup.vin == vin)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one_or_none()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVehicleRollup:
+    async def test_commit_refreshes_every_figure(self, db_session, rollup_vin):
+        vin = rollup_vin
+        today = date.today()
+        visit = ServiceVisit(
+            vin=vin, date=today - timedelta(days=3), tax_amount=Decimal("2.50"), notes="Visit"
+        )
+        db_session.add(visit)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                ServiceLineItem(visit_id=visit.id, description="Oil change", cost=Decimal("40")),
+                ServiceLineItem(visit_id=visit.id, description="Filter", cost=Decimal("10")),
+                FuelRecord(vin=vin, date=today - timedelta(days=1), cost=Decimal("55.25")),
+                OdometerRecord(vin=vin, date=today - timedelta(days=5), odometer_km=Decimal(900)),
+                OdometerRecord(vin=vin, date=today, odometer_km=Decimal(1000)),
+                HoursRecord(vin=vin, date=today, engine_hours=Decimal("120.0")),
+                Note(vin=vin, date=today, title="n", content="x"),
+                Document(
+                    vin=vin,
+                    file_path="p",
+                    file_name="f.pdf",
+                    file_size=1,
+                    mime_type="application/pdf",
+                    title="Doc",
+                ),
+                Reminder(
+                    vin=vin,
+                    title="Past",
+                    reminder_type="date",
+                    due_date=today - timedelta(days=1),
+                    status="pending",
+                ),
+                Reminder(
+                    vin=vin,
+                    title="Mileage",
+                    reminder_type="mileage",
+                    due_mileage_km=Decimal(950),
+                    status="pending",
+                ),
+                Reminder(
+                    vin=vin,
+                    title="Later",
+                    reminder_type="date",
+                    due_date=today + timedelta(days=30),
+                    status="pending",
+                ),
+                Reminder(
+                    vin=vin,
+                    title="Soon",
+                    reminder_type="date",
+                    due_date=today + timedelta(days=7),
+                    status="pending",
+                ),
+                Reminder(vin=vin, title="Done", reminder_type="date", status="done"),
+            ]
+        )
+        await db_session.commit()
+
+        rollup = await _stored(db_session, vin)
+        assert rollup is not None
+        assert rollup.computed_on == today
+        assert (rollup.service_count, rollup.fuel_count, rollup.odometer_count) == (1, 1, 2)
+        assert (rollup.reminder_count, rollup.document_count, rollup.note_count) == (5, 1, 1)
+        assert rollup.last_service_date == today - timedelta(days=3)
+        assert rollup.last_service_description == "Oil change"
+        assert rollup.last_fuel_date == today - timedelta(days=1)
+        assert rollup.latest_odometer_km == Decimal(1000)
+        assert rollup.latest_hours == Decimal("120.0")
+        # 40 + 10 + 2.50 tax + 55.25 fuel
+        assert rollup.total_spend == Decimal("107.75")
+        assert (rollup.overdue_count, rollup.upcoming_count) == (2, 2)
+        assert (rollup.next_due_title, rollup.next_due_date) == ("Soon", today + timedelta(days=7))
+
+    async def test_refresh_runs_after_the_commit(self, db_session, rollup_vin):
+        vin = rollup_vin
+        db_session.add(FuelRecord(vin=vin, date=date.today(), cost=Decimal(10)))
+        await db_session.commit()
+        await rollup_refresher.drain()
+
+        db_session.add(FuelRecord(vin=vin, date=date.today(), cost=Decimal(5)))
+        await db_session.commit()
+        # Queued, not refreshed inside the writer's commit; reads recompute
+        assert vin in rollup_refresher.pending
+        assert (await get_vehicle_rollups(db_session, [vin]))[vin].fuel_count == 2
+
+        await rollup_refresher.drain()
+        assert not rollup_refresher.pending
+        rollup = await _stored(db_session, vin)
+        assert rollup.fuel_count == 2
+        assert rollup.total_spend == Decimal("15.00")
+
+    async def test_line_item_and_delete_writes_refresh(self, db_session, rollup_vin):
+        vin = rollup_vin
+        visit = ServiceVisit(vin=vin, date=date.today())
+        odometer = OdometerRecord(vin=vin, date=date.today(), odometer_km=Decimal(500))
+        db_session.add_all([visit, odometer])
+        await db_session.commit()
+        assert (await _stored(db_session, vin)).total_spend == Decimal("0.00")
+
+        # A line item alone only knows its visit_id
+        db_session.add(ServiceLineItem(visit_id=visit.id, description="Wipers", cost=Decimal(20)))
+        await db_session.commit()
+        rollup = await _stored(db_session, vin)
+        assert rollup.total_spend == Decimal("20.00")
+        assert rollup.last_service_description == "Wipers"
+
+        await db_session.delete(odometer)
+        await db_session.commit()
+        rollup = await _stored(db_session, vin)
+        assert rollup.odometer_count == 0
+        assert rollup.latest_odometer_km is None
+
+    async def test_rollback_discards_the_refresh(self, db_session, rollup_vin):
+        vin = rollup_vin
+        db_session.add(FuelRecord(vin=vin, date=date.today(), cost=Decimal(10)))
+        await db_session.commit()
+
+        db_session.add(FuelRecord(vin=vin, date=date.today(), cost=Decimal(99)))
+        await db_session.flush()
+        await db_session.rollback()
+        db_session.add(Note(vin=vin, date=date.today(), title="n", content="x"))
+        await db_session.commit()
+
+        rollup = await _stored(db_session, vin)
+        assert rollup.fuel_count == 1
+        assert rollup.total_spend == Decimal("10.00")
+        assert rollup.note_count == 1
+
+    async def test_read_sees_flushed_uncommitted_writes(self, db_session, rollup_vin):
+        vin = rollup_vin
+        await get_vehicle_rollups(db_session, [vin])
+
+        db_session.add(OdometerRecord(vin=vin, date=date.today(), odometer_km=Decimal(321)))
+        await db_session.flush()
+
+        rollups = await get_vehicle_rollups(db_session, [vin])
+        assert rollups[vin].latest_odometer_km == Decimal(321)
+
+    async def test_row_from_an_earlier_day_is_recomputed_on_read(self, db_session, rollup_vin):
+        vin = rollup_vin
+        tomorrow = date.today() + timedelta(days=1)
+        db_session.add(
+            Reminder(
+                vin=vin,
+                title="Tomorrow",
+                reminder_type="date",
+                due_date=tomorrow,
+                status="pending",
+            )
+        )
+        await db_session.commit()
+        assert (await _stored(db_session, vin)).upcoming_count == 1
+
+        # Simulate a row computed yesterday, when the reminder was further out
+        await db_session.execute(
+            update(VehicleRollup)
+            .where(VehicleRollup.vin == vin)
+            .values(computed_on=date.today() - timedelta(days=1), upcoming_count=0)
+        )
+        await db_session.commit()
+
+        rollups = await get_vehicle_rollups(db_session, [vin])
+        assert rollups[vin].computed_on == date.today()
+        assert rollups[vin].upcoming_count == 1
+        # The read never writes; the nightly rebuild rolls the row over
+        assert (await _stored(db_session, vin)).upcoming_count == 0
+        await rebuild_all_vehicle_rollups(db_session)
+        assert (await _stored(db_session, vin)).computed_on == date.today()
+
+    async def test_read_leaves_the_callers_transaction_open(self, db_session, rollup_vin):
+        vin = rollup_vin
+        db_session.add(Note(vin=vin, date=date.today(), title="n", content="x"))
+        await db_session.commit()
+        db_session.add(OdometerRecord(vin=vin, date=date.today(), odometer_km=Decimal(777)))
+
+        rollups = await get_vehicle_rollups(db_session, [vin])
+        assert rollups[vin].odometer_count == 1
+
+        await db_session.rollback()
+        assert (
+            await db_session.scalar(select(OdometerRecord.id).where(OdometerRecord.vin == vin))
+        ) is None
+        assert (await _stored(db_session, vin)).odometer_count == 0
+
+    async def test_bulk_statements_refresh(self, db_session, rollup_vin):
+        vin = rollup_vin
+        visit = ServiceVisit(vin=vin, date=date.today())
+        db_session.add(visit)
+        await db_session.flush()
+        db_session.add_all(
+            [Note(vin=vin, date=date.today(), title=f"n{i}", content="x") for i in range(3)]
+            + [ServiceLineItem(visit_id=visit.id, description="Tires", cost=Decimal(400))]
+        )
+        await db_session.commit()
+        assert (await _stored(db_session, vin)).note_count == 3
+
+        await db_session.execute(delete(Note).where(Note.vin == vin))
+        await db_session.execute(
+            update(ServiceLineItem)
+            .where(ServiceLineItem.visit_id == visit.id)
+            .values(cost=Decimal(300))
+        )
+        await db_session.commit()
+
+        rollup = await _stored(db_session, vin)
+        assert rollup.note_count == 0
+        assert rollup.total_spend == Decimal("300.00")
+
+    async def test_rebuild_repairs_drift(self, db_session, rollup_vin):
+        vin = rollup_vin
+        db_session.add(Note(vin=vin, date=date.today(), title="n", content="x"))
+        await db_session.commit()
+        await db_session.execute(
+            update(VehicleRollup).where(VehicleRollup.vin == vin).values(note_count=9)
+        )
+        await db_session.commit()
+
+        assert await rebuild_all_vehicle_rollups(db_session) >= 1
+        assert (await _stored(db_session, vin)).note_count == 1
+
+    async def test_vehicle_delete_cascades_to_rollup(self, db_session, rollup_vin):
+        vin = rollup_vin
+        db_session.add(FuelRecord(vin=vin, date=date.today(), cost=Decimal(1)))
+        await db_session.commit()
+        assert await _stored(db_session, vin) is not None
+
+        vehicle = await db_session.get(Vehicle, vin)
+        await db_session.delete(vehicle)
+        await db_session.commit()
+
+        assert await _stored(db_session, vin) is None
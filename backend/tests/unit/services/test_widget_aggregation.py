@@ -32,6 +32,7 @@ from app.models.service_visit import ServiceVisit
 from app.models.user import User
 from app.models.vehicle import Vehicle
 from app.services.fuel_service import calculate_l_per_100km
+from app.services.vehicle_rollup_service import rollup_refresher
 from app.services.widget_aggregation import WidgetAggregationService
 
 
@@ -1006,14 +1007,12 @@ class TestVehicleV2HoursAwareOverdueCount:
 
     @pytest.mark.asyncio
     async def test_no_n_plus_one_on_current_hours_fetch(
-        self, db_session, aggregation_user, monkeypatch
+        self, db_session, aggregation_user, query_counter
     ):
-        """No N+1: `latest_engine_hours_and_date` is called exactly once for
-        `vehicle_v2()` regardless of how many pending hours reminders the
-        vehicle has — the value is fetched once for `latest_hours` and reused
-        for the overdue-count evaluation, not re-queried per reminder."""
-        import app.services.widget_aggregation as widget_aggregation_module
-
+        """No N+1: `vehicle_v2()` never queries `hours_records` on read,
+        however many pending hours reminders the vehicle has — the committed
+        rollup row already carries `latest_hours` and the overdue count
+        evaluated against it."""
         vehicle = await _make_vehicle(db_session, aggregation_user)
         vin = vehicle.vin
         db_session.add(HoursRecord(vin=vin, date=date.today(), engine_hours=Decimal("500.0")))
@@ -1043,20 +1042,14 @@ class TestVehicleV2HoursAwareOverdueCount:
             ]
         )
         await db_session.commit()
+        await rollup_refresher.drain()
 
-        calls: dict[str, int] = {"n": 0}
-        original = widget_aggregation_module.latest_engine_hours_and_date
-
-        async def counting(db, vin_arg):
-            calls["n"] += 1
-            return await original(db, vin_arg)
-
-        monkeypatch.setattr(widget_aggregation_module, "latest_engine_hours_and_date", counting)
-
+        query_counter.clear()
         svc = WidgetAggregationService(db_session)
         result = await svc.vehicle_v2(aggregation_user.id, vin, allowed_vins=None)
         assert result is not None
         # current hours = 500.0: due_hours 100/200 are overdue, 999 is not.
         assert result.overdue_maintenance == 2
         assert result.upcoming_maintenance == 1
-        assert calls["n"] == 1
+        assert result.latest_hours == Decimal("500.0")
+        assert not [q for q in query_counter if "hours_records" in q]
@@ -13,8 +13,8 @@ daily or (if long enough) swallow a fresh depletion after a refill.
 `app.tasks.scheduled.AsyncSessionLocal` to hand back the fixture-managed
 `db_session` wrapped in a no-op async context manager — this keeps seeded
 vehicles/DEF records and the job's own queries/commit on the same
-transaction while still exercising real DB fixtures end-to-end. Only
-`NotificationDispatcher.notify_def_low` is mocked.
+transaction while still exercising real DB fixtures end-to-end. Nothing is
+mocked: notices land in the notification outbox, which the tests read back.
 """
 
 from __future__ import annotations
@@ -23,17 +23,17 @@ from collections.abc import Awaitable, Callable
 from datetime import date
 from decimal import Decimal
 from typing import Any
-from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.def_record import DEFRecord
+from app.models.notification_outbox import NotificationOutbox
 from app.models.vehicle import Vehicle
 from app.services.settings_service import SettingsService
-from app.tasks.scheduled import _get_def_low_threshold_percent, check_def_levels
+from app.tasks.scheduled import _get_def_low_threshold_percent, check_def_levels, job_stats
 from app.utils.datetime_utils import utc_now
 
 # Every vehicle this module creates uses this VIN prefix, so the autouse
@@ -55,6 +55,9 @@ async def _clean_slate(db_session: AsyncSession) -> None:
     """
     await db_session.execute(delete(DEFRecord).where(DEFRecord.vin.like(f"{_VIN_PREFIX}%")))
     await db_session.execute(delete(Vehicle).where(Vehicle.vin.like(f"{_VIN_PREFIX}%")))
+    await db_session.execute(
+        delete(NotificationOutbox).where(NotificationOutbox.message.contains(f"({_VIN_PREFIX}"))
+    )
     await db_session.commit()
 
 
@@ -167,269 +170,214 @@ async def enable_def_low(db_session: AsyncSession) -> Callable[..., Awaitable[No
     return _enable
 
 
-def _def_calls(mock: AsyncMock) -> list[Any]:
-    """Filter notify_def_low awaits down to this module's vehicles.
+async def _queued(db_session: AsyncSession) -> list[NotificationOutbox]:
+    """def_low outbox rows queued for this module's vehicles.
 
     `check_def_levels()` scans the WHOLE vehicles table, and the test DB is
     session-scoped and shared across every test file in the run — other
     modules' committed diesel fixtures (e.g. test_def_fuel_type_gate.py's
-    vehicles with 0.50-0.75 fill levels) are visible to the sweep. Raw
-    `assert_awaited_once()` / `await_count` assertions would therefore be
-    hostage to whatever inbound rows happen to sit below this module's
-    thresholds. Scoping every count assertion to the `_VIN_PREFIX` keeps
-    them deterministic regardless of what other files leave behind.
+    vehicles with 0.50-0.75 fill levels) are visible to the sweep. Scoping
+    every count assertion to the `_VIN_PREFIX` (the message names the VIN)
+    keeps them deterministic regardless of what other files leave behind.
     """
-    return [
-        call
-        for call in mock.await_args_list
-        if str(call.kwargs.get("vin", "")).startswith(_VIN_PREFIX)
-    ]
-
-
-def _patch_notify_def_low(
-    monkeypatch: pytest.MonkeyPatch,
-    *,
-    side_effect: Any = None,
-) -> AsyncMock:
-    """Patch `NotificationDispatcher.notify_def_low` at the class level."""
-    mock = AsyncMock(
-        return_value={"ntfy": True} if side_effect is None else None,
-        side_effect=side_effect,
-    )
-    monkeypatch.setattr(
-        "app.services.notifications.dispatcher.NotificationDispatcher.notify_def_low",
-        mock,
+    rows = await db_session.scalars(
+        select(NotificationOutbox)
+        .where(
+            NotificationOutbox.event_type == "def_low",
+            NotificationOutbox.message.contains(f"({_VIN_PREFIX}"),
+        )
+        .order_by(NotificationOutbox.id)
     )
-    return mock
+    return list(rows.all())
 
 
 @pytest.mark.unit
 @pytest.mark.def_records
 @pytest.mark.asyncio
 class TestCheckDefLevels:
-    async def test_below_threshold_unstamped_dispatches_and_stamps(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+    async def test_below_threshold_unstamped_queues_and_stamps(
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle(capacity=Decimal("75.00"))
         await add_def_record(vehicle.vin, fill_level=Decimal("0.20"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        calls = _def_calls(mock)
-        assert len(calls) == 1
-        kwargs = calls[0].kwargs
-        assert kwargs["vin"] == vehicle.vin
-        assert kwargs["percent"] == Decimal("20.00")
-        assert kwargs["remaining_liters"] == Decimal("15.0000")
-        assert kwargs["as_of_date"] == date(2026, 7, 1)
+        queued = await _queued(patch_session)
+        assert len(queued) == 1
+        assert queued[0].title == f"DEF Low: {vehicle.nickname}"
+        assert queued[0].message == (
+            f"DEF level for {vehicle.nickname} ({vehicle.vin}) is at 20.0% "
+            "(15.00 L / 3.96 gal remaining), as of 2026-07-01."
+        )
+        assert queued[0].priority == "high"
+        assert queued[0].status == "pending"
         assert vehicle.def_low_notified_at is not None
 
-    async def test_below_threshold_already_stamped_no_dispatch(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+    async def test_below_threshold_already_stamped_not_queued(
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         stamp = utc_now()
         vehicle = await make_vehicle(def_low_notified_at=stamp)
         await add_def_record(vehicle.vin, fill_level=Decimal("0.10"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
         assert vehicle.def_low_notified_at == stamp
 
-    async def test_refill_above_threshold_clears_stamp_no_dispatch(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+    async def test_refill_above_threshold_clears_stamp_not_queued(
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle(def_low_notified_at=utc_now())
         await add_def_record(vehicle.vin, fill_level=Decimal("0.80"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
         assert vehicle.def_low_notified_at is None
 
-    async def test_dip_again_after_recovery_dispatches_again(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+    async def test_dip_again_after_recovery_queues_again(
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle()
-        mock = _patch_notify_def_low(monkeypatch)
 
-        # First dip below threshold — dispatches and stamps.
+        # First dip below threshold — queues and stamps.
         await add_def_record(vehicle.vin, fill_level=Decimal("0.10"), record_date=date(2026, 6, 1))
         await check_def_levels()
-        assert len(_def_calls(mock)) == 1
+        assert len(await _queued(patch_session)) == 1
         assert vehicle.def_low_notified_at is not None
 
-        # Refill above threshold — clears the stamp, no dispatch.
+        # Refill above threshold — clears the stamp, nothing queued.
         await add_def_record(vehicle.vin, fill_level=Decimal("0.90"), record_date=date(2026, 6, 15))
         await check_def_levels()
-        assert len(_def_calls(mock)) == 1
+        assert len(await _queued(patch_session)) == 1
         assert vehicle.def_low_notified_at is None
 
-        # Dip again — re-dispatches (crossing-based dedup, not cooldown).
+        # Dip again — queues again (crossing-based dedup, not cooldown).
         await add_def_record(vehicle.vin, fill_level=Decimal("0.15"), record_date=date(2026, 7, 1))
         await check_def_levels()
-        assert len(_def_calls(mock)) == 2
+        assert len(await _queued(patch_session)) == 2
         assert vehicle.def_low_notified_at is not None
 
+    async def test_latest_reading_wins_over_older_low_one(
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
+    ):
+        await enable_def_low(threshold="25")
+        vehicle = await make_vehicle()
+        await add_def_record(vehicle.vin, fill_level=Decimal("0.05"), record_date=date(2026, 6, 1))
+        await add_def_record(vehicle.vin, fill_level=Decimal("0.60"), record_date=date(2026, 7, 1))
+
+        await check_def_levels()
+
+        assert await _queued(patch_session) == []
+
     async def test_skips_vehicle_with_no_def_capacity(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle(capacity=None)
         await add_def_record(vehicle.vin, fill_level=Decimal("0.05"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
         assert vehicle.def_low_notified_at is None
 
     async def test_skips_vehicle_with_no_def_records(
-        self, patch_session, make_vehicle, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle()
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
         assert vehicle.def_low_notified_at is None
 
     async def test_skips_non_diesel_vehicle(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle(fuel_type="gasoline", fuel_type_secondary=None)
         await add_def_record(vehicle.vin, fill_level=Decimal("0.05"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
 
     async def test_skips_archived_vehicle(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle(archived=True)
         await add_def_record(vehicle.vin, fill_level=Decimal("0.05"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
 
     async def test_toggle_off_skips_even_when_below_threshold(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(notify="false", threshold="25")
         vehicle = await make_vehicle()
         await add_def_record(vehicle.vin, fill_level=Decimal("0.05"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert _def_calls(mock) == []
+        assert await _queued(patch_session) == []
         assert vehicle.def_low_notified_at is None
 
     async def test_garbage_threshold_falls_back_to_25(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="banana")
         vehicle = await make_vehicle()
         # 24% is below the fallback of 25% but above any degenerate parse
         # (e.g. 0) — proves the fallback landed on 25, not fail-closed.
         await add_def_record(vehicle.vin, fill_level=Decimal("0.24"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert len(_def_calls(mock)) == 1
+        assert len(await _queued(patch_session)) == 1
         assert vehicle.def_low_notified_at is not None
 
     async def test_boundary_percent_equals_threshold_notifies(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
         await enable_def_low(threshold="25")
         vehicle = await make_vehicle()
         await add_def_record(vehicle.vin, fill_level=Decimal("0.25"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch)
 
         await check_def_levels()
 
-        assert len(_def_calls(mock)) == 1
+        assert len(await _queued(patch_session)) == 1
         assert vehicle.def_low_notified_at is not None
 
-    async def test_all_backends_failed_no_stamp_retries_next_run(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
+    async def test_run_records_duration_and_row_counts(
+        self, patch_session, make_vehicle, add_def_record, enable_def_low
     ):
-        """An all-failed dispatch (e.g. a transient Discord outage) must not
-        stamp `def_low_notified_at` — mirrors TelemetryService.check_thresholds's
-        `any(dispatch_results.values())` guard. Crossing-based dedup means a
-        stamp here would otherwise silence the alert until the tank refills
-        and dips again, which can be weeks away; leaving it unstamped means
-        the next day's run retries the dispatch."""
         await enable_def_low(threshold="25")
-        vehicle = await make_vehicle()
-        await add_def_record(vehicle.vin, fill_level=Decimal("0.10"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(monkeypatch, side_effect=lambda **_kwargs: {"discord": False})
-
-        await check_def_levels()
-
-        assert len(_def_calls(mock)) == 1
-        assert vehicle.def_low_notified_at is None
-
-    async def test_at_least_one_backend_succeeded_stamps(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
-    ):
-        """A stamp lands as soon as at least one backend actually delivered,
-        even if another configured backend reported failure."""
-        await enable_def_low(threshold="25")
-        vehicle = await make_vehicle()
-        await add_def_record(vehicle.vin, fill_level=Decimal("0.10"), record_date=date(2026, 7, 1))
-        mock = _patch_notify_def_low(
-            monkeypatch, side_effect=lambda **_kwargs: {"discord": True, "ntfy": False}
-        )
-
-        await check_def_levels()
-
-        assert len(_def_calls(mock)) == 1
-        assert vehicle.def_low_notified_at is not None
-
-    async def test_per_vehicle_isolation_first_raises_second_still_processed(
-        self, patch_session, make_vehicle, add_def_record, enable_def_low, monkeypatch
-    ):
-        await enable_def_low(threshold="25")
-        vehicle_a = await make_vehicle()
-        vehicle_b = await make_vehicle()
+        low = await make_vehicle()
+        recovered = await make_vehicle(def_low_notified_at=utc_now())
+        await add_def_record(low.vin, fill_level=Decimal("0.10"), record_date=date(2026, 7, 1))
         await add_def_record(
-            vehicle_a.vin, fill_level=Decimal("0.10"), record_date=date(2026, 7, 1)
+            recovered.vin, fill_level=Decimal("0.90"), record_date=date(2026, 7, 1)
         )
-        await add_def_record(
-            vehicle_b.vin, fill_level=Decimal("0.10"), record_date=date(2026, 7, 1)
-        )
-
-        async def _side_effect(*args: Any, **kwargs: Any) -> dict[str, bool]:
-            if kwargs.get("vin") == vehicle_a.vin:
-                raise RuntimeError("boom")
-            return {"ntfy": True}
-
-        mock = _patch_notify_def_low(monkeypatch, side_effect=_side_effect)
 
         await check_def_levels()
 
-        # Both vehicles were attempted despite vehicle_a's dispatcher blowing up.
-        assert len(_def_calls(mock)) == 2
-        assert vehicle_a.def_low_notified_at is None
-        assert vehicle_b.def_low_notified_at is not None
+        stats = job_stats["check_def_levels"]
+        # Other modules' vehicles may also be swept, so only lower bounds
+        assert stats["queued"] >= 1
+        assert stats["cleared"] >= 1
+        assert stats["candidates"] >= stats["queued"] + stats["cleared"]
+        assert stats["duration_ms"] >= 0
 
 
 @pytest.mark.unit
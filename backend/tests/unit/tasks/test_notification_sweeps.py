@@ -0,0 +1,172 @@
+"""Unit tests for the expiring-document and odometer-milestone sweeps.
+
+Like `check_def_levels()` (see test_check_def_levels.py), both jobs open their
+own `AsyncSessionLocal()` session, so the job is routed onto the test's
+`db_session` and the notices it queues are read back from the notification
+outbox. Every vehicle here uses `_VIN_PREFIX` and every assertion is scoped to
+it, since the sweeps scan the whole shared test database.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import InsurancePolicy, OdometerRecord, Vehicle, WarrantyRecord
+from app.models.notification_outbox import NotificationOutbox
+from app.services.settings_service import SettingsService
+from app.tasks.scheduled import check_expiring_documents, check_odometer_milestones, job_stats
+from app.utils.datetime_utils import utc_now
+
+_VIN_PREFIX = "SWEEPTESTVIN"
+
+
+class _PassthroughSessionContext:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> AsyncSession:
+        return self._session
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        return False
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _clean_slate(db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop this module's leftovers and route the jobs onto `db_session`."""
+    for model in (OdometerRecord, InsurancePolicy, WarrantyRecord, Vehicle):
+        await db_session.execute(delete(model).where(model.vin.like(f"{_VIN_PREFIX}%")))
+    await db_session.execute(
+        delete(NotificationOutbox).where(NotificationOutbox.title.contains("Sweep Car"))
+    )
+    await SettingsService.set(db_session, "ntfy_enabled", "true")
+    await SettingsService.set(db_session, "notify_milestones", "true")
+    await db_session.commit()
+    monkeypatch.setattr(
+        "app.tasks.scheduled.AsyncSessionLocal",
+        lambda: _PassthroughSessionContext(db_session),
+    )
+
+
+async def _vehicle(db_session: AsyncSession, n: int, **fields) -> Vehicle:
+    vehicle = Vehicle(
+        vin=f"{_VIN_PREFIX}{n:02d}",
+        nickname=f"Sweep Car {n}",
+        vehicle_type="Car",
+        **fields,
+    )
+    db_session.add(vehicle)
+    await db_session.flush()
+    return vehicle
+
+
+async def _queued(db_session: AsyncSession, event_type: str) -> list[NotificationOutbox]:
+    rows = await db_session.scalars(
+        select(NotificationOutbox)
+        .where(
+            NotificationOutbox.event_type == event_type,
+            NotificationOutbox.title.contains("Sweep Car"),
+        )
+        .order_by(NotificationOutbox.title)
+    )
+    return list(rows.all())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCheckOdometerMilestones:
+    async def test_only_vehicles_past_a_new_milestone_are_queued(self, db_session):
+        crossed = await _vehicle(db_session, 1)
+        notified = await _vehicle(db_session, 2, last_milestone_notified_km=Decimal("20000"))
+        # Stamp carried over from the miles-to-km migration (10,000 mi)
+        legacy = await _vehicle(db_session, 3, last_milestone_notified_km=Decimal("16093.44"))
+        today = date.today()
+        db_session.add_all(
+            [
+                OdometerRecord(vin=crossed.vin, date=today, odometer_km=Decimal("31250")),
+                # An older, higher reading must not win over the latest one
+                OdometerRecord(
+                    vin=notified.vin, date=today - timedelta(days=30), odometer_km=Decimal("41000")
+                ),
+                OdometerRecord(vin=notified.vin, date=today, odometer_km=Decimal("29999")),
+                OdometerRecord(vin=legacy.vin, date=today, odometer_km=Decimal("20010")),
+            ]
+        )
+        await db_session.flush()
+
+        await check_odometer_milestones()
+
+        queued = await _queued(db_session, "odometer_milestone")
+        assert [row.message for row in queued] == [
+            "Congratulations! Sweep Car 1 has reached 30,000 miles!",
+            "Congratulations! Sweep Car 3 has reached 20,000 miles!",
+        ]
+        assert crossed.last_milestone_notified_km == 30000
+        assert notified.last_milestone_notified_km == Decimal("20000")
+        assert legacy.last_milestone_notified_km == 20000
+        assert job_stats["check_odometer_milestones"]["queued"] >= 2
+
+        # Already stamped: a second run queues nothing new
+        await check_odometer_milestones()
+        assert len(await _queued(db_session, "odometer_milestone")) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCheckExpiringDocuments:
+    async def test_documents_in_window_past_cooldown_are_queued(self, db_session):
+        vehicle = await _vehicle(db_session, 1)
+        today = date.today()
+        due = InsurancePolicy(
+            vin=vehicle.vin,
+            provider="Acme",
+            policy_number="P1",
+            policy_type="Full Coverage",
+            start_date=today - timedelta(days=300),
+            end_date=today + timedelta(days=10),
+        )
+        recently_notified = InsurancePolicy(
+            vin=vehicle.vin,
+            provider="Other",
+            policy_number="P2",
+            policy_type="Liability",
+            start_date=today - timedelta(days=300),
+            end_date=today + timedelta(days=5),
+            last_notified_at=utc_now() - timedelta(hours=2),
+        )
+        warranty = WarrantyRecord(
+            vin=vehicle.vin,
+            warranty_type="Powertrain",
+            start_date=today - timedelta(days=700),
+            end_date=today + timedelta(days=20),
+        )
+        far_off = WarrantyRecord(
+            vin=vehicle.vin,
+            warranty_type="Corrosion",
+            start_date=today - timedelta(days=700),
+            end_date=today + timedelta(days=400),
+        )
+        db_session.add_all([due, recently_notified, warranty, far_off])
+        await db_session.flush()
+
+        await check_expiring_documents()
+
+        insurance = await _queued(db_session, "insurance_expiring")
+        assert [row.message for row in insurance] == [
+            "Insurance policy 'Acme - Full Coverage' for Sweep Car 1 expires in 10 day(s)."
+        ]
+        warranties = await _queued(db_session, "warranty_expiring")
+        assert [row.message for row in warranties] == [
+            "Warranty 'Powertrain Warranty' for Sweep Car 1 expires in 20 day(s)."
+        ]
+        assert due.last_notified_at is not None
+        assert far_off.last_notified_at is None
+        stats = job_stats["check_expiring_documents"]
+        assert stats["queued"] == stats["insurance"] + stats["warranties"]
+        assert stats["duration_ms"] >= 0
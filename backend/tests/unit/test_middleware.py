@@ -8,7 +8,6 @@ calling a `dispatch` method.
 """
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -170,21 +169,10 @@ class TestRequestIDMiddleware:
         assert a["headers"]["x-request-id"] != b["headers"]["x-request-id"]
 
 
-def _patch_auth_mode(value: str):
-    """Patch both the auth-mode lookup and its DB context manager.
-
-    The middleware enters a DB context purely to inspect auth_mode, so we
-    swap the context manager for one that yields a dummy db and patch
-    `get_auth_mode` to return the desired value.
-    """
-    mock_db = AsyncMock()
-    ctx = MagicMock()
-    ctx.__aenter__ = AsyncMock(return_value=mock_db)
-    ctx.__aexit__ = AsyncMock(return_value=False)
-    return (
-        patch("app.middleware.get_db_context", return_value=ctx),
-        patch("app.services.auth.get_auth_mode", AsyncMock(return_value=value)),
-    )
+def _state(result: dict, name: str):
+    state = result["scope_state"]
+    # state can be dict (our default) or a State instance
+    return state.get(name) if isinstance(state, dict) else getattr(state, name, None)
 
 
 @pytest.mark.unit
@@ -232,93 +220,37 @@ class TestCSRFProtectionMiddleware:
         assert result["downstream_called"] is True
 
     @pytest.mark.asyncio
-    async def test_rejects_missing_csrf_token(self, middleware, monkeypatch):
+    async def test_flags_request_with_token(self, middleware, monkeypatch):
         monkeypatch.setenv("MYGARAGE_TEST_MODE", "false")
-        ctx_patch, auth_patch = _patch_auth_mode("local")
-        with ctx_patch, auth_patch:
-            result = await call_asgi(middleware, method="POST", path="/api/vehicles")
-        assert result["status"] == 403
-        assert result["downstream_called"] is False
-        assert b"CSRF token missing" in result["body"]
-
-    @pytest.mark.asyncio
-    async def test_rejects_invalid_csrf_token(self, middleware, monkeypatch):
-        monkeypatch.setenv("MYGARAGE_TEST_MODE", "false")
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute = AsyncMock(return_value=mock_result)
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=mock_db)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-
-        with (
-            patch("app.middleware.get_db_context", return_value=ctx),
-            patch("app.services.auth.get_auth_mode", AsyncMock(return_value="local")),
-        ):
-            result = await call_asgi(
-                middleware,
-                method="POST",
-                path="/api/vehicles",
-                headers={"X-CSRF-Token": "invalid-token-abc"},
-            )
-
-        assert result["status"] == 403
-        assert result["downstream_called"] is False
-        assert b"Invalid or expired CSRF token" in result["body"]
-
-    @pytest.mark.asyncio
-    async def test_accepts_valid_csrf_token(self, middleware, monkeypatch):
-        monkeypatch.setenv("MYGARAGE_TEST_MODE", "false")
-        token_record = MagicMock()
-        token_record.user_id = 42
-        mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = token_record
-        mock_db.execute = AsyncMock(return_value=mock_result)
-        ctx = MagicMock()
-        ctx.__aenter__ = AsyncMock(return_value=mock_db)
-        ctx.__aexit__ = AsyncMock(return_value=False)
-
-        with (
-            patch("app.middleware.get_db_context", return_value=ctx),
-            patch("app.services.auth.get_auth_mode", AsyncMock(return_value="local")),
-        ):
-            result = await call_asgi(
-                middleware,
-                method="POST",
-                path="/api/vehicles",
-                headers={"X-CSRF-Token": "valid-token-123"},
-            )
+        result = await call_asgi(
+            middleware,
+            method="POST",
+            path="/api/vehicles",
+            headers={"X-CSRF-Token": "valid-token-123"},
+        )
 
+        # Validation is left to the auth dependency; nothing is rejected here
         assert result["status"] == 200
         assert result["downstream_called"] is True
-        state = result["scope_state"]
-        validated_user_id = (
-            state["csrf_validated_user_id"]
-            if isinstance(state, dict)
-            else state.csrf_validated_user_id
-        )
-        assert validated_user_id == 42
+        assert _state(result, "csrf_required") is True
+        assert _state(result, "csrf_token") == "valid-token-123"
 
     @pytest.mark.asyncio
-    async def test_skips_csrf_when_auth_disabled(self, middleware, monkeypatch):
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE", "PATCH"])
+    async def test_flags_unsafe_methods_without_token(self, middleware, monkeypatch, method):
         monkeypatch.setenv("MYGARAGE_TEST_MODE", "false")
-        ctx_patch, auth_patch = _patch_auth_mode("none")
-        with ctx_patch, auth_patch:
-            result = await call_asgi(middleware, method="POST", path="/api/vehicles")
-        assert result["status"] == 200
+        result = await call_asgi(middleware, method=method, path="/api/vehicles/VIN123")
         assert result["downstream_called"] is True
+        assert _state(result, "csrf_required") is True
+        assert _state(result, "csrf_token") is None
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize("method", ["PUT", "DELETE", "PATCH"])
-    async def test_unsafe_methods_require_csrf(self, middleware, monkeypatch, method):
+    async def test_does_not_flag_safe_or_exempt_requests(self, middleware, monkeypatch):
         monkeypatch.setenv("MYGARAGE_TEST_MODE", "false")
-        ctx_patch, auth_patch = _patch_auth_mode("local")
-        with ctx_patch, auth_patch:
-            result = await call_asgi(middleware, method=method, path="/api/vehicles/VIN123")
-        assert result["status"] == 403
-        assert result["downstream_called"] is False
+        safe = await call_asgi(middleware, method="GET", path="/api/vehicles")
+        exempt = await call_asgi(middleware, method="POST", path="/api/auth/login")
+        assert _state(safe, "csrf_required") is None
+        assert _state(exempt, "csrf_required") is None
 
 
 @pytest.mark.unit
@@ -5,10 +5,18 @@ Tests cache operations, TTL expiration, decorator behavior, and statistics.
 """
 
 import asyncio
+from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.utils.cache import InMemoryCache, cache, cached, clear_analytics_cache
+from app.utils.cache import (
+    InMemoryCache,
+    cache,
+    cached,
+    clear_analytics_cache,
+    invalidate_cache_for_vehicle,
+)
 
 
 @pytest.mark.unit
@@ -191,6 +199,52 @@ class TestInMemoryCache:
         result = await test_cache.get("list_key")
         assert result == [1, 2, {"a": "b"}]
 
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted over the bound."""
+        small_cache = InMemoryCache(max_entries=2)
+        await small_cache.set("a", 1)
+        await small_cache.set("b", 2)
+
+        # Touch "a" so "b" becomes the least recently used entry
+        assert await small_cache.get("a") == 1
+        await small_cache.set("c", 3)
+
+        assert await small_cache.get("b") is None
+        assert await small_cache.get("a") == 1
+        assert await small_cache.get("c") == 3
+        assert small_cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_vin(self, test_cache):
+        """Test that invalidating a VIN leaves other vehicles' entries alone."""
+        await test_cache.set("a1", "x", vin="VIN_A")
+        await test_cache.set("a2", "y", vin="VIN_A")
+        await test_cache.set("b1", "z", vin="VIN_B")
+
+        assert test_cache.invalidate_vin("VIN_A") == 2
+
+        assert await test_cache.get("a1") is None
+        assert await test_cache.get("a2") is None
+        assert await test_cache.get("b1") == "z"
+        assert test_cache.get_stats()["invalidations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_stats(self, test_cache):
+        """Test hit/miss counters and hit rate."""
+        await test_cache.set("key", "value")
+        await test_cache.get("key")
+        await test_cache.get("key")
+        await test_cache.get("missing")
+
+        stats = test_cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.667
+
+        test_cache.reset_stats()
+        assert test_cache.get_stats()["hits"] == 0
+
 
 @pytest.mark.unit
 class TestCachedDecorator:
@@ -295,6 +349,56 @@ class TestCachedDecorator:
         assert result3 == 35
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_cached_ignores_session(self):
+        """Test that calls with different sessions share one entry."""
+        call_count = 0
+
+        @cached(ttl_seconds=300)
+        async def expensive_function(db, vin):
+            nonlocal call_count
+            call_count += 1
+            return vin
+
+        await expensive_function(MagicMock(spec=AsyncSession), "VIN1")
+        await expensive_function(MagicMock(spec=AsyncSession), "VIN1")
+        await expensive_function(MagicMock(spec=AsyncSession), vin="VIN1")
+
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_none_result(self):
+        """Test that a None result is cached rather than recomputed."""
+        call_count = 0
+
+        @cached(ttl_seconds=300)
+        async def expensive_function(vin):
+            nonlocal call_count
+            call_count += 1
+            return None
+
+        assert await expensive_function("VIN1") is None
+        assert await expensive_function("VIN1") is None
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_invalidated_per_vin(self):
+        """Test that invalidating one vehicle recomputes only that vehicle."""
+        calls: list[str] = []
+
+        @cached(ttl_seconds=300)
+        async def expensive_function(vin, exclude_hauling=True):
+            calls.append(vin)
+            return vin
+
+        await expensive_function("vin_a")
+        await expensive_function("VIN_B")
+        await invalidate_cache_for_vehicle("VIN_A")
+        await expensive_function("vin_a")
+        await expensive_function("VIN_B")
+
+        assert calls == ["vin_a", "VIN_B", "vin_a"]
+
 
 @pytest.mark.unit
 class TestCacheHelperFunctions:
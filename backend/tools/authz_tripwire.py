@@ -50,9 +50,10 @@ from pathlib import Path
 MUTATING_METHODS = {"post", "put", "patch", "delete"}
 
 # The vehicle-access primitives. ``get_vehicle_or_403`` is the READ/WRITE gate
-# (write via ``require_write=True``); ``check_vehicle_ownership`` and
-# ``get_vehicle_for_owner_or_403`` are the OWNER gate.
-READ_WRITE_GATE = "get_vehicle_or_403"
+# (write via ``require_write=True``), and ``check_vehicle_access`` is the same
+# gate for handlers that don't need the Vehicle row; ``check_vehicle_ownership``
+# and ``get_vehicle_for_owner_or_403`` are the OWNER gate.
+READ_WRITE_GATES = {"get_vehicle_or_403", "check_vehicle_access"}
 OWNER_GATES = {"check_vehicle_ownership", "get_vehicle_for_owner_or_403"}
 ADMIN_DEP = "get_current_admin_user"
 
@@ -66,6 +67,7 @@ VIN_COLUMN_NAMES = {"vin", "vehicle_vin"}
 # Adding a name here is the "security review" the plan calls for.
 WRAPPER_ALLOWLIST = {
     "get_vehicle_or_403",
+    "check_vehicle_access",
     "get_vehicle_for_owner_or_403",
     "check_vehicle_ownership",
     "verify_vehicle_access",
@@ -86,7 +88,11 @@ WRAPPER_ALLOWLIST = {
 
 # Functions exempt from rule 3 because they ARE the access primitives (they query
 # Vehicle by vin precisely to implement the gate).
-GATE_PRIMITIVE_NAMES = {"get_vehicle_or_403", "get_vehicle_for_owner_or_403"}
+GATE_PRIMITIVE_NAMES = {
+    "get_vehicle_or_403",
+    "check_vehicle_access",
+    "get_vehicle_for_owner_or_403",
+}
 
 PRAGMA_READ_ONLY = "# tripwire: read-only"
 PRAGMA_OPTIONAL_AUTH_OK = "# tripwire: optional-auth-ok"
@@ -228,7 +234,7 @@ def _analyze_function(node: ast.FunctionDef | ast.AsyncFunctionDef, lines: list[
         if rw_is_true:
             facts.has_g403_write = True
 
-        if cname == READ_WRITE_GATE:
+        if cname in READ_WRITE_GATES:
             if rw_kw is None:
                 # No require_write kwarg -> read gate (unless annotated read-only).
                 if not _has_pragma(lines, call.lineno, PRAGMA_READ_ONLY):
@@ -460,7 +466,7 @@ def _is_gated(facts: FuncFacts) -> bool:
         or facts.has_owner_gate
         or facts.has_admin_dep
         or facts.has_user_scope
-        or READ_WRITE_GATE in facts.called_names
+        or not READ_WRITE_GATES.isdisjoint(facts.called_names)
         or facts.name in GATE_PRIMITIVE_NAMES
     )
 
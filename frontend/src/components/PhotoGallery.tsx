@@ -225,6 +225,13 @@ function PhotoGallery({ vin, onAddClick }: PhotoGalleryProps) {
                 <div className="relative aspect-video bg-surface-2">
                   <img
                     src={withBase(photo.thumbnail_url ?? photo.path)}
+                    srcSet={
+                      photo.variants
+                        ? `${withBase(photo.variants.sm)} 480w, ${withBase(photo.variants.md)} 1280w, ${withBase(photo.variants.lg)} 2048w`
+                        : undefined
+                    }
+                    sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
+                    loading="lazy"
                     alt={photo.caption || t('photoGallery.misc.photoAlt')}
                     className="w-full h-full object-cover"
                     onError={(e) => {
@@ -23,6 +23,7 @@ interface BackupFile {
   size_mb: number
   created: string
   is_safety: boolean
+  format?: 'manifest' | 'snapshot'
 }
 
 interface BackupStats {
@@ -169,13 +170,11 @@ export default function SettingsBackupTab() {
   }
 
   const handleUpload = async (file: File) => {
-    const formData = new FormData()
-    formData.append('file', file)
-
     try {
-      const response = await api.post('/backup/upload', formData, {
+      // Sent as the raw body so the server can stream it straight to disk
+      const response = await api.put(`/backup/upload/${encodeURIComponent(file.name)}`, file, {
         headers: {
-          'Content-Type': 'multipart/form-data',
+          'Content-Type': 'application/octet-stream',
         },
       })
       setMessage({ type: 'success', text: response.data.message || t('backupTab.uploadSuccess') })
@@ -445,7 +444,7 @@ export default function SettingsBackupTab() {
           <input
             ref={fullFileInputRef}
             type="file"
-            accept=".tar.gz"
+            accept=".tar.gz,.tar"
             onChange={(e) => e.target.files?.[0] && handleUpload(e.target.files[0])}
             className="hidden"
           />
@@ -478,13 +477,15 @@ export default function SettingsBackupTab() {
                     <td className="p-3 text-garage-text-muted">{formatDate(backup.created)}</td>
                     <td className="p-3 text-right">
                       <div className="flex justify-end gap-2">
-                        <button
-                          onClick={() => handleDownload(backup.filename)}
-                          className="p-1 text-primary hover:bg-primary/10 rounded"
-                          title={t('backup.download')}
-                        >
-                          <Download size={16} />
-                        </button>
+                        {backup.format !== 'snapshot' && (
+                          <button
+                            onClick={() => handleDownload(backup.filename)}
+                            className="p-1 text-primary hover:bg-primary/10 rounded"
+                            title={t('backup.download')}
+                          >
+                            <Download size={16} />
+                          </button>
+                        )}
                         <button
                           onClick={() => handleRestore(backup.filename, true)}
                           className="p-1 text-danger-500 hover:bg-danger-500/10 rounded"
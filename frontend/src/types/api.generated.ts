@@ -842,7 +842,8 @@ export interface paths {
          * Create Full Backup
          * @description Create a full backup including database and all uploaded files.
          *
-         *     This may take several minutes depending on the size of your data.
+         *     Only files changed since the last backup are compressed, in a worker
+         *     thread; ``GET /api/backup/progress`` reports how far the backup is.
          *
          *     Returns:
          *         Metadata about the created backup file
@@ -906,6 +907,29 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/backup/progress": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Progress
+         * @description Progress of the running full backup or restore, or of the last one.
+         *
+         *     Returns:
+         *         ``{"progress": null}`` if none has run since startup
+         */
+        get: operations["get_progress_api_backup_progress_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/backup/restore/{filename}": {
         parameters: {
             query?: never;
@@ -920,7 +944,10 @@ export interface paths {
          * @description Restore settings from a backup file.
          *
          *     This creates a safety backup before restoring.
-         *     Full backup restore is only supported for SQLite databases.
+         *     Full backup restore is only supported for SQLite databases; it unpacks
+         *     into a staging directory that replaces the live data only once complete,
+         *     and reports its throughput. Afterwards the database connections and
+         *     in-process caches are dropped and the vehicle rollups are rebuilt.
          *
          *     Args:
          *         filename: Name of the backup file to restore from
@@ -972,9 +999,15 @@ export interface paths {
          * Upload Backup
          * @description Upload and save a backup file.
          *
+         *     Accepts a settings backup (``.json``), a full backup archive
+         *     (``.tar.gz``) or a downloaded manifest backup bundle (``.tar``). The
+         *     file is copied to the backup directory in chunks; prefer
+         *     ``PUT /api/backup/upload/{filename}`` for large full backups, which
+         *     streams the request body without a multipart copy.
+         *
          *     Args:
          *         file: Uploaded backup file
-         *         db: Database session (for validation)
+         *         sha256: Optional hex SHA-256 of the file; a mismatch rejects the upload
          *
          *     Returns:
          *         Metadata about the uploaded backup file
@@ -986,6 +1019,37 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/backup/upload/{filename}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        /**
+         * Upload Backup Stream
+         * @description Upload a backup file sent as the raw request body.
+         *
+         *     The body is written to disk (or, for a ``.tar`` bundle, unpacked into
+         *     the blob store) as it arrives, so uploads of any size use constant
+         *     memory.
+         *
+         *     Args:
+         *         filename: Original name of the file; its extension picks the backup type
+         *         x_content_sha256: Optional hex SHA-256 of the body; a mismatch rejects the upload
+         *
+         *     Returns:
+         *         Metadata about the uploaded backup file
+         */
+        put: operations["upload_backup_stream_api_backup_upload__filename__put"];
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/backup/{filename}": {
         parameters: {
             query?: never;
@@ -1917,6 +1981,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/insurance/parse-jobs/{job_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Insurance Parse Job
+         * @description Get the status (and, once done, the result) of a background parse.
+         */
+        get: operations["get_insurance_parse_job_api_insurance_parse_jobs__job_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/insurance/parsers": {
         parameters: {
             query?: never;
@@ -2426,6 +2510,31 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/livelink/telemetry/buffer": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Latest Buffer Status
+         * @description Get the latest-value write-behind buffer status.
+         *
+         *     Reports dirty (unflushed) entry count and flush lag for monitoring.
+         *
+         *     **Security:**
+         *     - Requires authentication
+         */
+        get: operations["get_latest_buffer_status_api_livelink_telemetry_buffer_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/livelink/token": {
         parameters: {
             query?: never;
@@ -3045,6 +3154,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/settings/system/cache": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Analytics Cache Stats
+         * @description Get analytics cache hit/miss/eviction statistics (admin only).
+         */
+        get: operations["get_analytics_cache_stats_api_settings_system_cache_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/settings/system/info": {
         parameters: {
             query?: never;
@@ -3065,6 +3194,46 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/settings/system/jobs": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Scheduled Job Stats
+         * @description Get the duration and row counts of each sweep's latest run (admin only).
+         */
+        get: operations["get_scheduled_job_stats_api_settings_system_jobs_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/settings/system/password-hashing": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Password Hashing Stats
+         * @description Get running, queued and rejected password hash counts (admin only).
+         */
+        get: operations["get_password_hashing_stats_api_settings_system_password_hashing_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/settings/{key}": {
         parameters: {
             query?: never;
@@ -4311,6 +4480,30 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/vehicles/{vin}/insurance/parse-jobs": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Create Insurance Parse Job
+         * @description Parse an insurance document in the background.
+         *
+         *     Returns a job at once; poll ``GET /api/insurance/parse-jobs/{job_id}``
+         *     until its status is ``done`` (``result`` is the parse-pdf response) or
+         *     ``failed``. Submitting the same document again returns the same job.
+         */
+        post: operations["create_insurance_parse_job_api_vehicles__vin__insurance_parse_jobs_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/vehicles/{vin}/insurance/parse-pdf": {
         parameters: {
             query?: never;
@@ -4508,12 +4701,17 @@ export interface paths {
         };
         /**
          * Export Telemetry
-         * @description Export telemetry data as CSV or JSON.
+         * @description Export telemetry data as CSV, JSON or NDJSON.
+         *
+         *     Rows are read in keyset-paginated pages and written to the response as
+         *     they are fetched, so memory stays flat and the range is never truncated.
          *
          *     **Query Parameters:**
          *     - **start**: Start timestamp
          *     - **end**: End timestamp
-         *     - **format**: 'csv' or 'json' (default csv)
+         *     - **format**: 'csv', 'json' or 'ndjson' (default csv)
+         *     - **layout**: 'long' or 'wide' (CSV only; wide has one row per timestamp
+         *       and one column per parameter)
          *     - **param_keys**: Comma-separated parameter keys (optional)
          *
          *     **Security:**
@@ -4631,6 +4829,11 @@ export interface paths {
          *     - **vin**: Vehicle VIN
          *     - **session_id**: Session ID
          *
+         *     **Query Parameters:**
+         *     - **format**: 'points' (default) or 'columnar', which adds the session's
+         *       telemetry as columnar series, bucketed to at most a few thousand points
+         *       per parameter
+         *
          *     **Security:**
          *     - Requires authentication
          */
@@ -4689,6 +4892,12 @@ export interface paths {
          * Get Vehicle Telemetry
          * @description Get historical telemetry data for a vehicle.
          *
+         *     With ``max_points`` or ``interval_seconds`` the readings are bucketed in
+         *     the database (avg/min/max per bucket) instead of returned raw. Ranges
+         *     starting before the raw retention window (whose raw readings have been
+         *     pruned) are always served from the daily summaries, one bucket per day or
+         *     wider.
+         *
          *     **Path Parameters:**
          *     - **vin**: Vehicle VIN
          *
@@ -4696,7 +4905,12 @@ export interface paths {
          *     - **start**: Start timestamp (required)
          *     - **end**: End timestamp (required)
          *     - **param_keys**: Comma-separated list of parameter keys (optional, all if not specified)
-         *     - **limit**: Maximum data points per parameter (default 10000)
+         *     - **limit**: Maximum raw data points (default 10000)
+         *     - **max_points**: Downsample to about this many points per parameter
+         *     - **interval_seconds**: Downsample to buckets of this width (the wider of
+         *       this and the ``max_points`` width wins)
+         *     - **format**: 'points' (one object per point, default) or 'columnar'
+         *       (per series: epoch-ms ``t`` and value ``v`` arrays)
          *
          *     **Security:**
          *     - Requires authentication
@@ -4828,6 +5042,10 @@ export interface paths {
          *     - **vin**: Vehicle VIN
          *     - **session_id**: Drive session ID
          *
+         *     **Query Parameters:**
+         *     - **format**: 'points' (one object per point, default) or 'columnar'
+         *       (parallel arrays, epoch-ms timestamps)
+         *
          *     **Security:**
          *     - Requires authentication
          */
@@ -5105,6 +5323,10 @@ export interface paths {
          * Get Vehicle Photo
          * @description Get a vehicle photo by filename.
          *
+         *     With ``size``, serves the rendered derivative in the best format the
+         *     client accepts (AVIF, WebP, else JPEG). Photos without derivatives yet
+         *     fall back to the original. Supports ``If-None-Match`` revalidation.
+         *
          *     **Security:**
          *     - Users can only view photos for their own vehicles
          *     - Admin users can view photos for all vehicles
@@ -6764,6 +6986,32 @@ export interface components {
             /** Unit Preference */
             unit_preference?: string | null;
         };
+        /**
+         * AnalyticsCacheStatsResponse
+         * @description Schema for analytics cache statistics.
+         */
+        AnalyticsCacheStatsResponse: {
+            /** Active Entries */
+            active_entries: number;
+            /** Evictions */
+            evictions: number;
+            /** Expirations */
+            expirations: number;
+            /** Expired Entries */
+            expired_entries: number;
+            /** Hit Rate */
+            hit_rate: number;
+            /** Hits */
+            hits: number;
+            /** Invalidations */
+            invalidations: number;
+            /** Max Entries */
+            max_entries: number;
+            /** Misses */
+            misses: number;
+            /** Total Entries */
+            total_entries: number;
+        };
         /**
          * AnomalyAlert
          * @description Alert for detected spending anomalies.
@@ -6897,6 +7145,11 @@ export interface components {
              */
             rows_skipped: number;
         };
+        /** Body_create_insurance_parse_job_api_vehicles__vin__insurance_parse_jobs_post */
+        Body_create_insurance_parse_job_api_vehicles__vin__insurance_parse_jobs_post: {
+            /** File */
+            file: string;
+        };
         /** Body_import_def_csv_api_import_vehicles__vin__def_csv_post */
         Body_import_def_csv_api_import_vehicles__vin__def_csv_post: {
             /** File */
@@ -7105,6 +7358,8 @@ export interface components {
         Body_upload_backup_api_backup_upload_post: {
             /** File */
             file: string;
+            /** Sha256 */
+            sha256?: string | null;
         };
         /** Body_upload_document_api_vehicles__vin__documents_post */
         Body_upload_document_api_vehicles__vin__documents_post: {
@@ -7923,6 +8178,135 @@ export interface components {
             /** Title */
             title?: string | null;
         };
+        /**
+         * DriveSessionColumnarDetailResponse
+         * @description Session detail with the session's telemetry as columnar series (``format=columnar``).
+         */
+        DriveSessionColumnarDetailResponse: {
+            /**
+             * Avg Coolant Temp
+             * @description Average coolant temp (°C)
+             */
+            avg_coolant_temp?: number | null;
+            /**
+             * Avg Fuel Level
+             * @description Average fuel level (%)
+             */
+            avg_fuel_level?: number | null;
+            /**
+             * Avg Rpm
+             * @description Average RPM
+             */
+            avg_rpm?: number | null;
+            /**
+             * Avg Speed
+             * @description Average speed (km/h)
+             */
+            avg_speed?: number | null;
+            /**
+             * Avg Throttle
+             * @description Average throttle (%)
+             */
+            avg_throttle?: number | null;
+            /**
+             * Bucket Seconds
+             * @description Bucket width of the series
+             */
+            bucket_seconds?: number | null;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Data Points Count
+             * @description Total telemetry points in session
+             * @default 0
+             */
+            data_points_count: number;
+            /** Device Id */
+            device_id: string;
+            /**
+             * Distance Km
+             * @description Distance traveled (km)
+             */
+            distance_km?: number | null;
+            /**
+             * Dtcs Appeared
+             * @description DTCs that appeared during session
+             */
+            dtcs_appeared?: string[];
+            /**
+             * Dtcs Cleared
+             * @description DTCs that cleared during session
+             */
+            dtcs_cleared?: string[];
+            /**
+             * Duration Seconds
+             * @description Session duration in seconds
+             */
+            duration_seconds?: number | null;
+            /**
+             * End Odometer
+             * @description Odometer at end (km)
+             */
+            end_odometer?: number | null;
+            /**
+             * Ended At
+             * @description Session end time
+             */
+            ended_at?: string | null;
+            /**
+             * Fuel Used Estimate
+             * @description Estimated fuel used (L)
+             */
+            fuel_used_estimate?: number | null;
+            /** Id */
+            id: number;
+            /**
+             * Max Coolant Temp
+             * @description Maximum coolant temp (°C)
+             */
+            max_coolant_temp?: number | null;
+            /**
+             * Max Rpm
+             * @description Maximum RPM
+             */
+            max_rpm?: number | null;
+            /**
+             * Max Speed
+             * @description Maximum speed (km/h)
+             */
+            max_speed?: number | null;
+            /**
+             * Max Throttle
+             * @description Maximum throttle (%)
+             */
+            max_throttle?: number | null;
+            /**
+             * Parameters Recorded
+             * @description Parameter keys recorded
+             */
+            parameters_recorded?: string[];
+            /**
+             * Series
+             * @description Session telemetry, bucketed per parameter
+             */
+            series?: components["schemas"]["TelemetryColumnarSeries"][];
+            /**
+             * Start Odometer
+             * @description Odometer at start (km)
+             */
+            start_odometer?: number | null;
+            /**
+             * Started At
+             * Format: date-time
+             * @description Session start time
+             */
+            started_at: string;
+            /** Vin */
+            vin: string;
+        };
         /**
          * DriveSessionDetailResponse
          * @description Schema for detailed session response with telemetry summary.
@@ -9617,6 +10001,37 @@ export interface components {
              */
             notes?: string | null;
         };
+        /**
+         * InsuranceParseJob
+         * @description Background insurance document parse (poll until done or failed).
+         */
+        InsuranceParseJob: {
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /** Error */
+            error?: string | null;
+            /** Finished At */
+            finished_at?: string | null;
+            /** Id */
+            id: string;
+            /**
+             * Result
+             * @description The parse-pdf response once done
+             */
+            result?: {
+                [key: string]: unknown;
+            } | null;
+            /** Started At */
+            started_at?: string | null;
+            /**
+             * Status
+             * @description queued, running, done or failed
+             */
+            status: string;
+        };
         /**
          * InsurancePolicy
          * @description Schema for insurance policy response.
@@ -9810,6 +10225,75 @@ export interface components {
              */
             timestamp: string;
         };
+        /**
+         * LatestBufferStatusResponse
+         * @description Schema for the latest-value write-behind buffer status.
+         */
+        LatestBufferStatusResponse: {
+            /**
+             * Dirty Entries
+             * @description Values not yet written to the database
+             * @default 0
+             */
+            dirty_entries: number;
+            /**
+             * Flush Errors
+             * @description Failed flushes since start
+             * @default 0
+             */
+            flush_errors: number;
+            /**
+             * Flush Interval Seconds
+             * @description Seconds between flushes
+             */
+            flush_interval_seconds: number;
+            /**
+             * Flush Lag Seconds
+             * @description Age of the oldest unflushed value
+             * @default 0
+             */
+            flush_lag_seconds: number;
+            /**
+             * Flushes
+             * @description Successful flushes since start
+             * @default 0
+             */
+            flushes: number;
+            /**
+             * Last Flush At
+             * @description Time of the last successful flush
+             */
+            last_flush_at?: string | null;
+            /**
+             * Last Flush Duration Ms
+             * @description Duration of the last successful flush
+             */
+            last_flush_duration_ms?: number | null;
+            /**
+             * Rows Flushed
+             * @description Rows written since start
+             * @default 0
+             */
+            rows_flushed: number;
+            /**
+             * Running
+             * @description Whether the periodic flush task is running
+             * @default false
+             */
+            running: boolean;
+            /**
+             * Tracked Entries
+             * @description Latest values held in memory
+             * @default 0
+             */
+            tracked_entries: number;
+            /**
+             * Tracked Vehicles
+             * @description Vehicles with values held in memory
+             * @default 0
+             */
+            tracked_vehicles: number;
+        };
         /**
          * LinkOIDCAccountRequest
          * @description Request to link OIDC account with password verification.
@@ -10973,6 +11457,18 @@ export interface components {
             /** Supported Makes */
             supported_makes: string[];
         };
+        /**
+         * PasswordHashingStatsResponse
+         * @description Schema for password hashing pool statistics.
+         */
+        PasswordHashingStatsResponse: {
+            /** Queued */
+            queued: number;
+            /** Rejected */
+            rejected: number;
+            /** Running */
+            running: number;
+        };
         /**
          * PeriodComparison
          * @description Comparison between two time periods.
@@ -11392,6 +11888,18 @@ export interface components {
             /** Title */
             title?: string | null;
         };
+        /**
+         * ScheduledJobStatsResponse
+         * @description Schema for the latest run of each scheduled notification sweep.
+         */
+        ScheduledJobStatsResponse: {
+            /** Jobs */
+            jobs: {
+                [key: string]: {
+                    [key: string]: unknown;
+                };
+            };
+        };
         /**
          * SdConfigResponse
          * @description Schema for SD-card config update response.
@@ -12897,6 +13405,113 @@ export interface components {
             /** Update Id */
             update_id?: number | null;
         };
+        /**
+         * TelemetryBucketDataPoint
+         * @description A downsampled point: bucket start, bucket average and bucket extremes.
+         */
+        TelemetryBucketDataPoint: {
+            /**
+             * Max Value
+             * @description Bucket maximum
+             */
+            max_value: number;
+            /**
+             * Min Value
+             * @description Bucket minimum
+             */
+            min_value: number;
+            /**
+             * Timestamp
+             * Format: date-time
+             */
+            timestamp: string;
+            /** Value */
+            value: number;
+        };
+        /**
+         * TelemetryColumnarResponse
+         * @description Schema for telemetry query response with columnar series.
+         */
+        TelemetryColumnarResponse: {
+            /**
+             * Bucket Seconds
+             * @description Bucket width when downsampled
+             */
+            bucket_seconds?: number | null;
+            /**
+             * End
+             * Format: date-time
+             */
+            end: string;
+            /**
+             * Resolution
+             * @description raw, bucketed (raw readings) or daily (daily summaries)
+             * @default raw
+             */
+            resolution: string;
+            /** Series */
+            series: components["schemas"]["TelemetryColumnarSeries"][];
+            /**
+             * Start
+             * Format: date-time
+             */
+            start: string;
+            /**
+             * Total Points
+             * @description Total data points returned
+             * @default 0
+             */
+            total_points: number;
+            /** Vin */
+            vin: string;
+        };
+        /**
+         * TelemetryColumnarSeries
+         * @description A parameter's time series as parallel arrays (``format=columnar``).
+         */
+        TelemetryColumnarSeries: {
+            /**
+             * Avg Value
+             * @description Average value in range
+             */
+            avg_value?: number | null;
+            /** Display Name */
+            display_name: string | null;
+            /**
+             * Max
+             * @description Bucket maximums (downsampled only)
+             */
+            max?: number[] | null;
+            /**
+             * Max Value
+             * @description Maximum value in range
+             */
+            max_value?: number | null;
+            /**
+             * Min
+             * @description Bucket minimums (downsampled only)
+             */
+            min?: number[] | null;
+            /**
+             * Min Value
+             * @description Minimum value in range
+             */
+            min_value?: number | null;
+            /** Param Key */
+            param_key: string;
+            /**
+             * T
+             * @description Timestamps, epoch milliseconds (UTC)
+             */
+            t: number[];
+            /** Unit */
+            unit: string | null;
+            /**
+             * V
+             * @description Values (bucket averages when downsampled)
+             */
+            v: number[];
+        };
         /**
          * TelemetryDataPoint
          * @description Schema for a single telemetry data point.
@@ -12963,11 +13578,22 @@ export interface components {
          * @description Schema for telemetry query response.
          */
         TelemetryQueryResponse: {
+            /**
+             * Bucket Seconds
+             * @description Bucket width when downsampled
+             */
+            bucket_seconds?: number | null;
             /**
              * End
              * Format: date-time
              */
             end: string;
+            /**
+             * Resolution
+             * @description raw, bucketed (raw readings) or daily (daily summaries)
+             * @default raw
+             */
+            resolution: string;
             /** Series */
             series: components["schemas"]["TelemetrySeriesResponse"][];
             /**
@@ -12995,7 +13621,7 @@ export interface components {
              */
             avg_value?: number | null;
             /** Data */
-            data: components["schemas"]["TelemetryDataPoint"][];
+            data: (components["schemas"]["TelemetryBucketDataPoint"] | components["schemas"]["TelemetryDataPoint"])[];
             /** Display Name */
             display_name: string | null;
             /**
@@ -13822,6 +14448,54 @@ export interface components {
              */
             trips?: components["schemas"]["TripSummary"][];
         };
+        /**
+         * TripPointsColumnarResponse
+         * @description Schema for GET .../livelink/trips/{session_id}/points?format=columnar.
+         *
+         *     The same points as ``TripPointsResponse``, as parallel arrays.
+         */
+        TripPointsColumnarResponse: {
+            /**
+             * Altitude
+             * @description Altitude (metres)
+             */
+            altitude?: (number | null)[];
+            /**
+             * Heading
+             * @description Heading (degrees)
+             */
+            heading?: (number | null)[];
+            /**
+             * Id
+             * @description Location point IDs
+             */
+            id?: number[];
+            /**
+             * Latitude
+             * @description Latitude (decimal degrees)
+             */
+            latitude?: number[];
+            /**
+             * Longitude
+             * @description Longitude (decimal degrees)
+             */
+            longitude?: number[];
+            /**
+             * Session Id
+             * @description Drive session ID
+             */
+            session_id: number;
+            /**
+             * Speed
+             * @description Speed (km/h)
+             */
+            speed?: (number | null)[];
+            /**
+             * T
+             * @description Timestamps, epoch milliseconds (UTC)
+             */
+            t?: number[];
+        };
         /**
          * TripPointsResponse
          * @description Schema for GET .../livelink/trips/{session_id}/points.
@@ -17553,6 +18227,28 @@ export interface operations {
             };
         };
     };
+    get_progress_api_backup_progress_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+        };
+    };
     restore_backup_api_backup_restore__filename__post: {
         parameters: {
             query?: never;
@@ -17643,6 +18339,41 @@ export interface operations {
             };
         };
     };
+    upload_backup_stream_api_backup_upload__filename__put: {
+        parameters: {
+            query?: never;
+            header?: {
+                "x-content-sha256"?: string | null;
+            };
+            path: {
+                filename: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": {
+                        [key: string]: unknown;
+                    };
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     delete_backup_api_backup__filename__delete: {
         parameters: {
             query?: never;
@@ -19054,6 +19785,37 @@ export interface operations {
             };
         };
     };
+    get_insurance_parse_job_api_insurance_parse_jobs__job_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                job_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InsuranceParseJob"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     list_insurance_parsers_api_insurance_parsers_get: {
         parameters: {
             query?: never;
@@ -19782,6 +20544,26 @@ export interface operations {
             };
         };
     };
+    get_latest_buffer_status_api_livelink_telemetry_buffer_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["LatestBufferStatusResponse"];
+                };
+            };
+        };
+    };
     regenerate_global_token_api_livelink_token_post: {
         parameters: {
             query?: never;
@@ -20510,6 +21292,26 @@ export interface operations {
             };
         };
     };
+    get_analytics_cache_stats_api_settings_system_cache_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["AnalyticsCacheStatsResponse"];
+                };
+            };
+        };
+    };
     get_system_info_api_settings_system_info_get: {
         parameters: {
             query?: never;
@@ -20530,6 +21332,46 @@ export interface operations {
             };
         };
     };
+    get_scheduled_job_stats_api_settings_system_jobs_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ScheduledJobStatsResponse"];
+                };
+            };
+        };
+    };
+    get_password_hashing_stats_api_settings_system_password_hashing_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PasswordHashingStatsResponse"];
+                };
+            };
+        };
+    };
     get_setting_api_settings__key__get: {
         parameters: {
             query?: never;
@@ -22667,6 +23509,44 @@ export interface operations {
             };
         };
     };
+    create_insurance_parse_job_api_vehicles__vin__insurance_parse_jobs_post: {
+        parameters: {
+            query?: {
+                /** @description Optional provider hint */
+                provider?: string | null;
+            };
+            header?: never;
+            path: {
+                vin: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "multipart/form-data": components["schemas"]["Body_create_insurance_parse_job_api_vehicles__vin__insurance_parse_jobs_post"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            202: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InsuranceParseJob"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     parse_insurance_pdf_api_vehicles__vin__insurance_parse_pdf_post: {
         parameters: {
             query?: {
@@ -23029,8 +23909,10 @@ export interface operations {
                 start: string;
                 /** @description End of export range */
                 end: string;
-                /** @description Export format: csv or json */
+                /** @description Export format: csv, json or ndjson */
                 format?: string;
+                /** @description CSV layout: long (one row per value) or wide (one column per param) */
+                layout?: string;
                 /** @description Comma-separated parameter keys */
                 param_keys?: string | null;
             };
@@ -23168,7 +24050,10 @@ export interface operations {
     };
     get_session_detail_api_vehicles__vin__livelink_sessions__session_id__get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description points or columnar (adds telemetry series) */
+                format?: string;
+            };
             header?: never;
             path: {
                 vin: string;
@@ -23184,7 +24069,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["DriveSessionDetailResponse"];
+                    "application/json": components["schemas"]["DriveSessionDetailResponse"] | components["schemas"]["DriveSessionColumnarDetailResponse"];
                 };
             };
             /** @description Validation Error */
@@ -23240,6 +24125,12 @@ export interface operations {
                 param_keys?: string | null;
                 /** @description Max data points per parameter */
                 limit?: number;
+                /** @description Downsample to about this many points */
+                max_points?: number | null;
+                /** @description Downsampling bucket width */
+                interval_seconds?: number | null;
+                /** @description points or columnar (parallel arrays) */
+                format?: string;
             };
             header?: never;
             path: {
@@ -23255,7 +24146,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["TelemetryQueryResponse"];
+                    "application/json": components["schemas"]["TelemetryQueryResponse"] | components["schemas"]["TelemetryColumnarResponse"];
                 };
             };
             /** @description Validation Error */
@@ -23401,7 +24292,10 @@ export interface operations {
     };
     get_trip_points_api_vehicles__vin__livelink_trips__session_id__points_get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description points or columnar (parallel arrays) */
+                format?: string;
+            };
             header?: never;
             path: {
                 vin: string;
@@ -23417,7 +24311,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["TripPointsResponse"];
+                    "application/json": components["schemas"]["TripPointsResponse"] | components["schemas"]["TripPointsColumnarResponse"];
                 };
             };
             /** @description Validation Error */
@@ -23895,7 +24789,10 @@ export interface operations {
     };
     get_vehicle_photo_api_vehicles__vin__photos__filename__get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description Resized rendition (480/1280/2048 px); the original if omitted */
+                size?: ("sm" | "md" | "lg") | null;
+            };
             header?: never;
             path: {
                 vin: string;
@@ -20,6 +20,8 @@ export interface Photo {
   filename: string
   path: string
   thumbnail_url?: string | null
+  // Resized renditions (480/1280/2048 px longest edge); null until rendered
+  variants?: Record<'sm' | 'md' | 'lg', string> | null
   size: number
   is_main: boolean
   caption?: string | null